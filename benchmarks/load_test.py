@@ -0,0 +1,189 @@
+"""Concurrent load test reporting throughput and tail latency.
+
+Two targets:
+
+- ``llm``: chat-completions requests straight at an OpenAI-compatible endpoint (the
+  mock server, or a real provider when you mean to pay for it);
+- ``api``: ``POST /kickoff`` on the Epic News API, then follow the run's SSE events
+  until ``run_finished``, so latency is end to end. Start the API with
+  ``OPENROUTER_BASE_URL`` pointing at the mock server.
+
+    uv run python -m benchmarks.load_test llm --url http://127.0.0.1:8765/v1 -n 500 -c 32
+    uv run python -m benchmarks.load_test api --url http://127.0.0.1:8000 -n 20 -c 4 \\
+        --request "get the rss weekly report"
+
+Results are printed and written to ``benchmarks/results/load-<target>-<timestamp>.json``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import math
+import sys
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+import httpx
+
+RESULTS_DIR = Path(__file__).resolve().parent / "results"
+
+
+@dataclass
+class Sample:
+    seconds: float
+    status: str
+
+
+@dataclass
+class LoadReport:
+    target: str
+    concurrency: int
+    wall_seconds: float
+    samples: list[Sample] = field(default_factory=list)
+
+    def summary(self) -> dict[str, Any]:
+        ok = sorted(s.seconds for s in self.samples if s.status == "ok")
+        return {
+            "target": self.target,
+            "requests": len(self.samples),
+            "concurrency": self.concurrency,
+            "wall_seconds": round(self.wall_seconds, 3),
+            "throughput_rps": round(len(ok) / self.wall_seconds, 2) if self.wall_seconds else 0.0,
+            "statuses": dict(Counter(s.status for s in self.samples)),
+            "latency_seconds": {
+                name: round(percentile(ok, q), 4)
+                for name, q in (("p50", 50), ("p90", 90), ("p95", 95), ("p99", 99), ("max", 100))
+            },
+        }
+
+
+def percentile(sorted_values: list[float], q: float) -> float:
+    """Nearest-rank percentile of an ascending list (0.0 when empty)."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(q / 100 * len(sorted_values)))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+async def _chat_once(client: httpx.AsyncClient, url: str, model: str, prompt: str) -> Sample:
+    started = time.perf_counter()
+    try:
+        response = await client.post(
+            f"{url.rstrip('/')}/chat/completions",
+            json={"model": model, "messages": [{"role": "user", "content": prompt}]},
+        )
+    except httpx.HTTPError as exc:
+        return Sample(time.perf_counter() - started, type(exc).__name__)
+    elapsed = time.perf_counter() - started
+    if response.status_code != 200:
+        return Sample(elapsed, f"http_{response.status_code}")
+    choices = response.json().get("choices")
+    if not choices:
+        return Sample(elapsed, "none_choices")
+    if not (choices[0].get("message") or {}).get("content") and not choices[0]["message"].get("tool_calls"):
+        return Sample(elapsed, "empty")
+    return Sample(elapsed, "ok")
+
+
+async def _kickoff_once(client: httpx.AsyncClient, url: str, user_request: str) -> Sample:
+    started = time.perf_counter()
+    try:
+        response = await client.post(f"{url.rstrip('/')}/kickoff", json={"user_request": user_request})
+        if response.status_code != 202:
+            return Sample(time.perf_counter() - started, f"http_{response.status_code}")
+        events_url = url.rstrip("/") + response.json()["events_url"]
+        status = "no_finish"
+        async with client.stream("GET", events_url) as stream:
+            event = None
+            async for line in stream.aiter_lines():
+                if line.startswith("event:"):
+                    event = line.partition(":")[2].strip()
+                elif line.startswith("data:") and event == "run_finished":
+                    data = json.loads(line.partition(":")[2]).get("data", {})
+                    status = "ok" if data.get("status") == "ok" else "failed"
+                    break
+    except httpx.HTTPError as exc:
+        return Sample(time.perf_counter() - started, type(exc).__name__)
+    return Sample(time.perf_counter() - started, status)
+
+
+async def run_load(
+    target: str,
+    url: str,
+    requests: int,
+    concurrency: int,
+    *,
+    model: str = "mock/mock-model",
+    prompt: str = "Say hello.",
+    user_request: str = "get the rss weekly report",
+    timeout: float = 600.0,
+    transport: httpx.AsyncBaseTransport | None = None,
+) -> LoadReport:
+    """Send ``requests`` calls with at most ``concurrency`` in flight."""
+    semaphore = asyncio.Semaphore(concurrency)
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+
+    async with httpx.AsyncClient(timeout=timeout, limits=limits, transport=transport) as client:
+
+        async def one() -> Sample:
+            async with semaphore:
+                if target == "api":
+                    return await _kickoff_once(client, url, user_request)
+                return await _chat_once(client, url, model, prompt)
+
+        started = time.perf_counter()
+        samples = await asyncio.gather(*(one() for _ in range(requests)))
+        wall = time.perf_counter() - started
+    return LoadReport(target, concurrency, wall, list(samples))
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("target", choices=["llm", "api"])
+    parser.add_argument("--url", default=None, help="base URL (llm: .../v1, api: the API root)")
+    parser.add_argument("-n", "--requests", type=int, default=100)
+    parser.add_argument("-c", "--concurrency", type=int, default=8)
+    parser.add_argument("--model", default="mock/mock-model")
+    parser.add_argument("--prompt", default="Say hello.")
+    parser.add_argument("--request", dest="user_request", default="get the rss weekly report")
+    parser.add_argument("--timeout", type=float, default=600.0)
+    args = parser.parse_args(argv)
+    url = args.url or ("http://127.0.0.1:8765/v1" if args.target == "llm" else "http://127.0.0.1:8000")
+
+    report = asyncio.run(
+        run_load(
+            args.target,
+            url,
+            args.requests,
+            args.concurrency,
+            model=args.model,
+            prompt=args.prompt,
+            user_request=args.user_request,
+            timeout=args.timeout,
+        )
+    )
+    summary = report.summary()
+    latency = summary["latency_seconds"]
+    print(
+        f"{summary['requests']} requests, concurrency {summary['concurrency']}, "
+        f"{summary['wall_seconds']}s: {summary['throughput_rps']} ok/s"
+    )
+    print("latency " + "  ".join(f"{name} {value:.3f}s" for name, value in latency.items()))
+    print(f"statuses {summary['statuses']}")
+
+    RESULTS_DIR.mkdir(exist_ok=True)
+    out = RESULTS_DIR / f"load-{args.target}-{time.strftime('%Y%m%d-%H%M%S')}.json"
+    out.write_text(json.dumps({"url": url, **summary}, indent=2), encoding="utf-8")
+    print(f"Results: {out}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,303 @@
+"""A local stand-in for OpenRouter's OpenAI-compatible chat-completions endpoint.
+
+It answers like a provider without spending tokens, so the API, the scheduler and
+the crews can be load tested against controlled latency and failures:
+
+    uv run python -m benchmarks.mock_llm_server --port 8765 --latency lognormal:1.5,0.6 \\
+        --error-rate 0.02 --empty-rate 0.01 --none-choices-rate 0.01
+
+    OPENROUTER_BASE_URL=http://127.0.0.1:8765/v1 OPENROUTER_API_KEY=mock uv run api
+
+Answers:
+
+- a request with ``response_format`` of type ``json_schema`` gets JSON synthesized
+  from that schema (``benchmarks.synthetic``);
+- a request with ``tools`` and no tool result yet gets a native ``tool_calls`` answer
+  for the first tool;
+- anything else gets a ReAct ``Final Answer:`` whose JSON is the canned output of the
+  ``output_pydantic`` model named in the prompt (CrewAI embeds its schema, so the
+  last ``"title": "<Model>"`` wins), or plain text when no model is recognized.
+
+Failure injection, as per-request probabilities (their sum should stay at most 1):
+
+- ``--error-rate``: HTTP 503, which LiteLLM surfaces as a service-unavailable error;
+- ``--empty-rate``: a completion with empty content (``_is_empty_llm_response``);
+- ``--none-choices-rate``: ``"choices": null``, which fails inside the client with
+  ``'NoneType' object is not iterable``, the case ``_TRANSIENT_ERROR_MARKERS`` retries.
+
+``GET /stats`` returns request, failure and per-model counters.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import random
+import re
+import threading
+import time
+import uuid
+from collections import Counter
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, StreamingResponse
+
+from benchmarks.synthetic import canned_outputs, from_schema
+
+_TITLE_RE = re.compile(r'"title"\s*:\s*"([A-Za-z_][A-Za-z0-9_]*)"')
+
+
+class Latency:
+    """A latency distribution parsed from ``none``, ``fixed:S``, ``uniform:A,B``,
+    ``normal:MEAN,SD``, ``lognormal:MEDIAN,SIGMA`` or ``exp:MEAN`` (seconds)."""
+
+    def __init__(self, spec: str = "none"):
+        self.spec = spec
+        kind, _, raw = spec.partition(":")
+        self.kind = kind.strip().lower()
+        self.params = [float(p) for p in raw.split(",") if p.strip()]
+        expected = {"none": 0, "fixed": 1, "uniform": 2, "normal": 2, "lognormal": 2, "exp": 1}
+        if self.kind not in expected or len(self.params) != expected[self.kind]:
+            raise ValueError(f"Invalid latency spec {spec!r}")
+
+    def sample(self, rng: random.Random) -> float:
+        p = self.params
+        if self.kind == "fixed":
+            value = p[0]
+        elif self.kind == "uniform":
+            value = rng.uniform(p[0], p[1])
+        elif self.kind == "normal":
+            value = rng.gauss(p[0], p[1])
+        elif self.kind == "lognormal":
+            value = p[0] * rng.lognormvariate(0.0, p[1])
+        elif self.kind == "exp":
+            value = rng.expovariate(1.0 / p[0]) if p[0] > 0 else 0.0
+        else:
+            value = 0.0
+        return max(0.0, value)
+
+
+@dataclass
+class MockSettings:
+    latency: Latency = field(default_factory=Latency)
+    error_rate: float = 0.0
+    empty_rate: float = 0.0
+    none_choices_rate: float = 0.0
+    seed: int | None = None
+    items: int = 2
+    canned: dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass
+class MockStats:
+    requests: int = 0
+    outcomes: Counter[str] = field(default_factory=Counter)
+    models: Counter[str] = field(default_factory=Counter)
+    started: float = field(default_factory=time.time)
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+    def record(self, outcome: str, model: str | None) -> None:
+        with self.lock:
+            self.requests += 1
+            self.outcomes[outcome] += 1
+            if model:
+                self.models[model] += 1
+
+    def to_dict(self) -> dict[str, Any]:
+        with self.lock:
+            return {
+                "requests": self.requests,
+                "outcomes": dict(self.outcomes),
+                "output_models": dict(self.models),
+                "uptime_seconds": round(time.time() - self.started, 1),
+            }
+
+
+def _message_text(messages: list[dict[str, Any]]) -> str:
+    parts = []
+    for message in messages:
+        content = message.get("content")
+        if isinstance(content, list):  # multi-part content
+            content = " ".join(str(p.get("text", "")) for p in content if isinstance(p, dict))
+        parts.append(str(content or ""))
+    return "\n".join(parts)
+
+
+def detect_output_model(messages: list[dict[str, Any]], known: dict[str, Any]) -> str | None:
+    """The output model a prompt asks for: the last schema title CrewAI embedded, else
+    the longest known class name mentioned anywhere."""
+    text = _message_text(messages)
+    for title in reversed(_TITLE_RE.findall(text)):
+        if title in known:
+            return title
+    mentioned = [name for name in known if name in text]
+    return max(mentioned, key=len) if mentioned else None
+
+
+def _estimate_tokens(text: str) -> int:
+    return max(1, len(text) // 4)
+
+
+def _completion(model: str, message: dict[str, Any], prompt: str, finish: str = "stop") -> dict[str, Any]:
+    completion_text = message.get("content") or json.dumps(message.get("tool_calls") or "")
+    prompt_tokens, completion_tokens = _estimate_tokens(prompt), _estimate_tokens(completion_text)
+    return {
+        "id": f"chatcmpl-mock-{uuid.uuid4().hex[:12]}",
+        "object": "chat.completion",
+        "created": int(time.time()),
+        "model": model,
+        "choices": [{"index": 0, "message": message, "finish_reason": finish}],
+        "usage": {
+            "prompt_tokens": prompt_tokens,
+            "completion_tokens": completion_tokens,
+            "total_tokens": prompt_tokens + completion_tokens,
+        },
+    }
+
+
+def answer(body: dict[str, Any], settings: MockSettings) -> tuple[dict[str, Any], str, str | None]:
+    """The assistant message for a chat-completions request, its kind and the output model used."""
+    messages = body.get("messages") or []
+    response_format = body.get("response_format") or {}
+    if response_format.get("type") == "json_schema":
+        spec = response_format.get("json_schema") or {}
+        name = spec.get("name")
+        content = settings.canned.get(name) if name else None
+        if content is None:
+            content = from_schema(spec.get("schema") or {}, items=settings.items)
+        return {"role": "assistant", "content": json.dumps(content)}, "structured", name
+
+    tools = body.get("tools") or []
+    if tools and not any(m.get("role") == "tool" for m in messages):
+        function = tools[0].get("function", {})
+        arguments = from_schema(function.get("parameters") or {"type": "object"}, items=1)
+        call = {
+            "id": f"call_{uuid.uuid4().hex[:12]}",
+            "type": "function",
+            "function": {"name": function.get("name", "tool"), "arguments": json.dumps(arguments)},
+        }
+        return {"role": "assistant", "content": None, "tool_calls": [call]}, "tool_call", None
+
+    model_name = detect_output_model(messages, settings.canned)
+    if model_name is None:
+        final = "Synthetic answer from the mock LLM server."
+    else:
+        final = json.dumps(settings.canned[model_name], ensure_ascii=False)
+    content = f"Thought: I now know the final answer\nFinal Answer: {final}"
+    return {"role": "assistant", "content": content}, "react", model_name
+
+
+def _stream(payload: dict[str, Any]) -> StreamingResponse:
+    """Replay a finished completion as one content chunk plus the terminator."""
+
+    def chunks():
+        choice = payload["choices"][0]
+        delta = {key: value for key, value in choice["message"].items() if value is not None}
+        chunk = {
+            "id": payload["id"],
+            "object": "chat.completion.chunk",
+            "created": payload["created"],
+            "model": payload["model"],
+            "choices": [{"index": 0, "delta": delta, "finish_reason": choice["finish_reason"]}],
+            "usage": payload["usage"],
+        }
+        yield f"data: {json.dumps(chunk)}\n\n"
+        yield "data: [DONE]\n\n"
+
+    return StreamingResponse(chunks(), media_type="text/event-stream")
+
+
+def create_app(settings: MockSettings | None = None) -> FastAPI:
+    """The mock server; ``settings.canned`` defaults to a validated instance of every output model."""
+    settings = settings or MockSettings()
+    if not settings.canned:
+        settings.canned = canned_outputs(settings.items)
+    rng = random.Random(settings.seed)
+    stats = MockStats()
+    app = FastAPI(title="Epic News mock LLM", version="0.1.0")
+    app.state.settings = settings
+    app.state.stats = stats
+
+    async def chat_completions(request: Request):
+        body = await request.json()
+        model = body.get("model", "mock")
+        delay = settings.latency.sample(rng)
+        if delay:
+            await asyncio.sleep(delay)
+
+        roll = rng.random()
+        if roll < settings.error_rate:
+            stats.record("error_503", None)
+            return JSONResponse(
+                {"error": {"message": "Mock provider overloaded", "code": 503}}, status_code=503
+            )
+        roll -= settings.error_rate
+        if roll < settings.none_choices_rate:
+            stats.record("none_choices", None)
+            return JSONResponse({"id": "chatcmpl-mock", "object": "chat.completion", "choices": None})
+        roll -= settings.none_choices_rate
+
+        prompt = _message_text(body.get("messages") or [])
+        if roll < settings.empty_rate:
+            stats.record("empty", None)
+            payload = _completion(model, {"role": "assistant", "content": ""}, prompt)
+        else:
+            message, kind, output_model = answer(body, settings)
+            stats.record(kind, output_model)
+            finish = "tool_calls" if kind == "tool_call" else "stop"
+            payload = _completion(model, message, prompt, finish)
+        return _stream(payload) if body.get("stream") else JSONResponse(payload)
+
+    for path in ("/v1/chat/completions", "/chat/completions", "/api/v1/chat/completions"):
+        app.add_api_route(path, chat_completions, methods=["POST"])
+
+    @app.get("/v1/models")
+    async def models() -> dict[str, Any]:
+        return {"object": "list", "data": [{"id": "mock/mock-model", "object": "model"}]}
+
+    @app.get("/stats")
+    async def get_stats() -> dict[str, Any]:
+        return stats.to_dict()
+
+    return app
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency", default="none", help="e.g. fixed:0.5, uniform:0.2,2, lognormal:1.5,0.6")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="probability of an HTTP 503")
+    parser.add_argument("--empty-rate", type=float, default=0.0, help="probability of an empty completion")
+    parser.add_argument("--none-choices-rate", type=float, default=0.0, help='probability of "choices": null')
+    parser.add_argument("--items", type=int, default=2, help="list length in synthesized outputs")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--canned", type=Path, help="JSON file of {ModelName: output} overrides")
+    args = parser.parse_args(argv)
+
+    import uvicorn
+
+    canned = canned_outputs(args.items)
+    if args.canned:
+        canned.update(json.loads(args.canned.read_text(encoding="utf-8")))
+    settings = MockSettings(
+        latency=Latency(args.latency),
+        error_rate=args.error_rate,
+        empty_rate=args.empty_rate,
+        none_choices_rate=args.none_choices_rate,
+        seed=args.seed,
+        items=args.items,
+        canned=canned,
+    )
+    print(f"Mock LLM: {len(canned)} canned output models, base_url http://{args.host}:{args.port}/v1")
+    uvicorn.run(create_app(settings), host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+"""Record whole ReceptionFlow runs once, then replay them offline to time the orchestration.
+
+Usage (from the repository root):
+
+    # once, with live keys: capture every LLM, tool and email call of a scenario
+    uv run python -m benchmarks.replay_flows record osint
+
+    # any time, no network: replay the recorded scenarios
+    uv run python -m benchmarks.replay_flows replay --repeat 3
+    uv run python -m benchmarks.replay_flows replay osint menu --latency 1
+
+A replay answers every LLM, tool, OPML fetch and email call from
+``benchmarks/cassettes/<scenario>/`` (see ``epic_news.utils.cassette``). Non-loopback
+connections are blocked for the whole replay; a scenario with any unrecorded call or
+blocked connection is reported as failed and the command exits with status 1. With the default ``--latency 0`` the measured wall
+time is the flow's own overhead: routing, parsing, JSON repair, rendering and DOCX
+assembly. ``--latency 1`` sleeps for the recorded duration of each call, which shows
+what an orchestration change saves against real provider timings. Results are printed
+and written to ``benchmarks/results/replay-<timestamp>.json``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+
+BENCH_DIR = Path(__file__).resolve().parent
+CASSETTE_DIR = BENCH_DIR / "cassettes"
+RESULTS_DIR = BENCH_DIR / "results"
+
+SCENARIOS = {
+    "osint": "Complete OSINT analysis of Mistral.AI",
+    "deep_research": (
+        "conduct a deep research study on the progress of quantum computing and its possible "
+        "applications in cryptography"
+    ),
+    "menu": "Generate a complete weekly menu planner with 30 recipes and shopping list for a family of 3 in French",
+    "rss": "get the rss weekly report",
+}
+
+
+def _configure(mode: str, scenario: str, latency: float = 0.0) -> None:
+    os.environ["EPIC_CASSETTE_MODE"] = mode
+    os.environ["EPIC_CASSETTE_DIR"] = str(CASSETTE_DIR / scenario)
+    os.environ["EPIC_CASSETTE_LATENCY"] = str(latency)
+
+
+def record(scenario: str) -> int:
+    from epic_news.main import run_flow
+    from epic_news.utils.cassette import get_cassette, reset_cassette
+
+    _configure("record", scenario)
+    reset_cassette()
+    started = time.perf_counter()
+    run_flow(SCENARIOS[scenario])
+    cassette = get_cassette()
+    if cassette is not None:
+        cassette.flush()
+    print(f"Recorded {scenario} in {time.perf_counter() - started:.1f}s -> {CASSETTE_DIR / scenario}")
+    return 0
+
+
+def replay(scenarios: list[str], repeat: int, latency: float) -> int:
+    from epic_news.main import run_flow
+    from epic_news.utils.cassette import CASSETTE_FILE, get_cassette, reset_cassette
+
+    results = {}
+    failed = []
+    for scenario in scenarios:
+        if not (CASSETTE_DIR / scenario / CASSETTE_FILE).exists():
+            print(f"{scenario:<15} skipped: no cassette, record it first")
+            continue
+        runs = []
+        for _ in range(repeat):
+            _configure("replay", scenario, latency)
+            reset_cassette()
+            started = time.perf_counter()
+            run_flow(SCENARIOS[scenario])
+            wall = time.perf_counter() - started
+            cassette = get_cassette()
+            runs.append(
+                {
+                    "wall_seconds": round(wall, 3),
+                    "recorded_external_seconds": round(cassette.replayed_seconds, 3) if cassette else None,
+                    "calls": dict(cassette.replayed_calls) if cassette else {},
+                    "misses": list(cassette.misses) if cassette else [],
+                }
+            )
+        reset_cassette()
+        walls = [run["wall_seconds"] for run in runs]
+        results[scenario] = {"runs": runs, "min": min(walls), "median": statistics.median(walls)}
+        external = runs[-1]["recorded_external_seconds"]
+        print(
+            f"{scenario:<15} median {results[scenario]['median']:8.2f}s  min {results[scenario]['min']:8.2f}s"
+            f"  (live external calls took {external}s; calls {runs[-1]['calls']})"
+        )
+        misses = sorted({miss for run in runs for miss in run["misses"]})
+        if misses:
+            failed.append(scenario)
+            print(f"{scenario:<15} FAILED: {len(misses)} call(s) not served by the cassette")
+            for miss in misses:
+                print(f"    {miss}")
+
+    RESULTS_DIR.mkdir(exist_ok=True)
+    out = RESULTS_DIR / f"replay-{time.strftime('%Y%m%d-%H%M%S')}.json"
+    out.write_text(
+        json.dumps({"latency": latency, "repeat": repeat, "results": results}, indent=2), encoding="utf-8"
+    )
+    print(f"Results: {out}")
+    return 1 if failed else 0
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    sub = parser.add_subparsers(dest="command", required=True)
+    rec = sub.add_parser("record", help="run a scenario live and record its cassette")
+    rec.add_argument("scenario", choices=sorted(SCENARIOS))
+    rep = sub.add_parser("replay", help="replay recorded scenarios offline")
+    rep.add_argument("scenarios", nargs="*", choices=sorted(SCENARIOS), help="default: all")
+    rep.add_argument("--repeat", type=int, default=3)
+    rep.add_argument("--latency", type=float, default=0.0, help="x recorded call duration slept on replay")
+    args = parser.parse_args(argv)
+
+    if args.command == "record":
+        return record(args.scenario)
+    return replay(args.scenarios or sorted(SCENARIOS), args.repeat, args.latency)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,148 @@
+"""Synthetic instances of the crews' pydantic output models, built from their JSON schema.
+
+Used by the mock LLM server to answer structured-output requests with something that
+validates, and by the benchmarks to build size-parameterized fixtures.
+"""
+
+from __future__ import annotations
+
+import importlib
+import inspect
+import json
+from pathlib import Path
+from typing import Any
+
+from pydantic import BaseModel, ValidationError
+
+_FORMATS = {
+    "date": "2026-01-15",
+    "date-time": "2026-01-15T08:00:00Z",
+    "time": "08:00:00",
+    "uri": "https://example.com/article",
+    "email": "contact@example.com",
+}
+
+
+def from_schema(
+    schema: dict[str, Any],
+    defs: dict[str, Any] | None = None,
+    items: int = 1,
+    name: str = "value",
+    depth: int = 0,
+) -> Any:
+    """A value matching ``schema``; arrays get ``items`` entries (at least ``minItems``)."""
+    defs = defs if defs is not None else schema.get("$defs", {})
+    if "$ref" in schema:
+        return from_schema(defs[schema["$ref"].rsplit("/", 1)[-1]], defs, items, name, depth)
+    if "const" in schema:
+        return schema["const"]
+    if schema.get("enum"):
+        return schema["enum"][0]
+    if "default" in schema and schema["default"] is not None and depth > 0:
+        return schema["default"]
+    for key in ("anyOf", "oneOf", "allOf"):
+        if key in schema:
+            options = [s for s in schema[key] if s.get("type") != "null"] or schema[key]
+            return from_schema(options[0], defs, items, name, depth)
+
+    kind = schema.get("type", "object" if "properties" in schema else "string")
+    if isinstance(kind, list):
+        kind = next((k for k in kind if k != "null"), "string")
+    if kind == "object":
+        properties = schema.get("properties", {})
+        if depth > 8:
+            return {}
+        return {prop: from_schema(sub, defs, items, prop, depth + 1) for prop, sub in properties.items()}
+    if kind == "array":
+        count = max(items if depth < 3 else 1, schema.get("minItems", 0))
+        if "maxItems" in schema:
+            count = min(count, schema["maxItems"])
+        item_schema = schema.get("items", {"type": "string"})
+        return [from_schema(item_schema, defs, items, name, depth + 1) for _ in range(count)]
+    if kind == "integer":
+        return int(max(schema.get("minimum", 1), schema.get("exclusiveMinimum", 0) + 1))
+    if kind == "number":
+        low = schema.get("minimum", schema.get("exclusiveMinimum", 0.0))
+        high = schema.get("maximum", low + 1.0)
+        return (low + high) / 2
+    if kind == "boolean":
+        return True
+    if kind == "null":
+        return None
+    if schema.get("format") in _FORMATS:
+        return _FORMATS[schema["format"]]
+    text = f"Synthetic {name.replace('_', ' ')} text for benchmarking."
+    min_length = schema.get("minLength", 0)
+    if len(text) < min_length:
+        text = (text + " ") * (min_length // len(text) + 1)
+    if "maxLength" in schema:
+        text = text[: schema["maxLength"]]
+    return text
+
+
+def build(model: type[BaseModel], items: int = 1) -> BaseModel:
+    """A validated ``model`` instance with ``items`` entries in each list."""
+    return model.model_validate(from_schema(model.model_json_schema(), items=items))
+
+
+def output_models(package: str = "epic_news.models") -> dict[str, type[BaseModel]]:
+    """Every pydantic model defined under ``package``, by class name."""
+    found: dict[str, type[BaseModel]] = {}
+    base = Path(importlib.import_module(package).__path__[0])
+    # rglob rather than pkgutil: models/crews is a namespace package (no __init__.py).
+    for path in sorted(base.rglob("*.py")):
+        relative = path.relative_to(base).with_suffix("")
+        name = ".".join((package, *relative.parts)).removesuffix(".__init__")
+        try:
+            module = importlib.import_module(name)
+        except Exception:  # noqa: S112 - a model module with an optional dependency
+            continue
+        for class_name, obj in inspect.getmembers(module, inspect.isclass):
+            if issubclass(obj, BaseModel) and obj.__module__ == module.__name__:
+                found.setdefault(class_name, obj)
+    return found
+
+
+def canned_outputs(items: int = 2) -> dict[str, dict[str, Any]]:
+    """JSON for each output model that validates; models the synthesizer cannot satisfy are skipped."""
+    canned = {}
+    for name, model in output_models().items():
+        try:
+            canned[name] = json.loads(build(model, items).model_dump_json())
+        except (ValidationError, ValueError, TypeError, KeyError):
+            continue
+    return canned
+
+
+def resize(data: dict[str, Any], path: str, count: int) -> dict[str, Any]:
+    """Grow or shrink the list at dotted ``path`` to ``count`` entries, in place.
+
+    ``*`` walks every element of a list, so ``"feeds.*.articles"`` resizes the articles
+    of each feed. New entries are copies of the first, with string fields numbered so
+    renderers that deduplicate by title or URL still see distinct items (dates and
+    other formatted strings are left as is).
+    """
+    head, _, rest = path.partition(".")
+    if head == "*":
+        for element in data:  # type: ignore[attr-defined]
+            resize(element, rest, count)
+        return data
+    if rest:
+        resize(data[head], rest, count)
+        return data
+    items = data[head]
+    template = items[0] if items else ""
+    data[head] = [_numbered(template, i) for i in range(count)]
+    return data
+
+
+def _numbered(value: Any, index: int) -> Any:
+    if isinstance(value, str):
+        if not index or value in _FORMATS.values():
+            return f"{value}/{index}" if index and value == _FORMATS["uri"] else value
+        return f"{value} #{index}"
+    if isinstance(value, dict):
+        return {key: _numbered(item, index) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_numbered(item, index) for item in value]
+    return value
@@ -1,7 +1,10 @@
-from fastapi import BackgroundTasks, FastAPI
+from fastapi import BackgroundTasks, FastAPI, HTTPException
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 
 from epic_news.main import kickoff
+from epic_news.utils.email_outbox import email_outbox_enabled, get_email_outbox
+from epic_news.utils.progress import get_progress_bus, new_run_id, sse_stream
 
 app = FastAPI(
     title="Epic News API",
@@ -32,6 +35,42 @@ async def kickoff_endpoint(request: KickoffRequest, background_tasks: Background
     This endpoint accepts a user request, adds the main `kickoff` function
     to a background task queue, and immediately returns a confirmation.
     This non-blocking approach is ideal for webhooks or other automated triggers.
+    The returned ``run_id`` can be followed live on ``/runs/{run_id}/events``.
     """
-    background_tasks.add_task(kickoff, user_input=request.user_request)
-    return {"message": "Crew kickoff initiated successfully.", "user_request": request.user_request}
+    run_id = new_run_id()
+    # Register the run now so a client can subscribe before the background task starts.
+    get_progress_bus().open_run(run_id)
+    background_tasks.add_task(kickoff, user_input=request.user_request, run_id=run_id)
+    return {
+        "message": "Crew kickoff initiated successfully.",
+        "user_request": request.user_request,
+        "run_id": run_id,
+        "events_url": f"/runs/{run_id}/events",
+    }
+
+
+@app.get("/runs/{run_id}/events")
+async def run_events(run_id: str) -> StreamingResponse:
+    """Stream a run's progress as Server-Sent Events.
+
+    Events already emitted are replayed first, so connecting late loses nothing; the
+    stream closes after the ``run_finished`` event.
+    """
+    if not get_progress_bus().has_run(run_id):
+        raise HTTPException(status_code=404, detail=f"Unknown run_id: {run_id}")
+    return StreamingResponse(
+        sse_stream(run_id),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@app.get("/runs/{run_id}/email")
+async def run_email(run_id: str) -> dict:
+    """Delivery status of the emails a run queued in the outbox (queued, sending, sent, failed)."""
+    if not email_outbox_enabled():
+        raise HTTPException(status_code=404, detail="The email outbox is disabled (EPIC_EMAIL_OUTBOX)")
+    entries = get_email_outbox().status(run_id)
+    if not entries:
+        raise HTTPException(status_code=404, detail=f"No email queued for run_id: {run_id}")
+    return {"run_id": run_id, "emails": [entry.to_dict() for entry in entries]}
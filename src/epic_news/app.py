@@ -1,4 +1,6 @@
 import os
+import time
+from collections import deque
 from queue import Empty, Queue
 from threading import Thread
 
@@ -7,6 +9,12 @@ from bs4 import BeautifulSoup
 from loguru import logger
 
 from epic_news.main import kickoff
+from epic_news.utils.progress import ProgressEvent, get_progress_bus, new_run_id
+
+# Only the tail of the log is shown; the full log lives in the configured log files.
+LOG_TAIL_LINES = 200
+# Minimum delay between two refreshes of the log tail widget.
+LOG_REFRESH_SECONDS = 0.5
 
 # --- Streamlit UI Configuration ---
 st.set_page_config(page_title="Epic News CrewAI Orchestrator", layout="wide")
@@ -23,6 +31,8 @@ if "final_report" not in st.session_state:
     st.session_state.final_report = None
 if "final_report_md" not in st.session_state:
     st.session_state.final_report_md = None
+if "run_id" not in st.session_state:
+    st.session_state.run_id = None
 
 
 # --- Real-time Logging Setup ---
@@ -55,20 +65,48 @@ def html_to_markdown(html: str) -> str:
         return html
 
 
+def format_progress_event(event: ProgressEvent) -> str | None:
+    """Render a progress bus event as a single status line (None to hide it)."""
+    data = event.data
+    if event.kind == "step_started":
+        return f"▶️ {data.get('step')}"
+    if event.kind == "step_finished":
+        icon = "✅" if data.get("success") else "❌"
+        return f"{icon} {data.get('step')} ({data.get('duration', 0):.1f}s)"
+    if event.kind == "crew_attempt":
+        return f"🚀 {data.get('crew')} — tentative {data.get('attempt')}/{data.get('attempts')}"
+    if event.kind == "task_completed":
+        return f"☑️ {data.get('crew')}: {data.get('task')}"
+    if event.kind == "token_usage":
+        return f"🔢 {data.get('crew')}: {data.get('total_tokens')} tokens"
+    if event.kind == "artefact_written":
+        return f"📄 {data.get('path')}"
+    return None
+
+
+def _report_path(run_id: str) -> str | None:
+    """Return the final report path announced on the progress bus for ``run_id``."""
+    for event in reversed(get_progress_bus().history(run_id)):
+        if event.kind == "report_ready":
+            return event.data.get("output_file")
+    return None
+
+
 # --- Crew Execution Logic ---
-def run_crew_thread(user_request: str, log_queue: Queue):
+def run_crew_thread(user_request: str, log_queue: Queue, run_id: str | None = None):
     """Runs the ReceptionFlow in a separate thread to avoid blocking the UI."""
+    run_id = run_id or new_run_id()
     try:
-        # The kickoff function will run the flow. The flow's state will hold the output path.
-        flow = kickoff(user_input=user_request)
+        # kickoff returns None; the final report path is announced on the progress bus.
+        kickoff(user_input=user_request, run_id=run_id)
+        output_file = _report_path(run_id)
 
-        # After running, put the result into the queue
-        if flow and flow.state.output_file and os.path.exists(flow.state.output_file):
-            with open(flow.state.output_file, encoding="utf-8") as f:
+        if output_file and os.path.exists(output_file):
+            with open(output_file, encoding="utf-8") as f:
                 report_content = f.read()
             log_queue.put(("REPORT", report_content))
         else:
-            error_message = f"Flow finished, but no output file was found at '{flow.state.output_file if flow else 'N/A'}'"
+            error_message = f"Flow finished, but no output file was found at '{output_file or 'N/A'}'"
             log_queue.put(("ERROR", error_message))
 
     except Exception as e:
@@ -92,36 +130,64 @@ if st.button("🔎 Start Research", disabled=st.session_state.crew_running):
     st.session_state.final_report = None
     st.session_state.final_report_md = None
 
+    # Subscribe before the thread starts so no progress event is missed.
+    st.session_state.run_id = new_run_id()
+    get_progress_bus().open_run(st.session_state.run_id)
+    st.session_state.progress_sub = get_progress_bus().subscribe(st.session_state.run_id)
+
     # Start the crew thread
-    st.session_state.thread = Thread(target=run_crew_thread, args=(user_request, log_queue))
+    st.session_state.thread = Thread(
+        target=run_crew_thread, args=(user_request, log_queue, st.session_state.run_id)
+    )
     st.session_state.thread.start()
 
 # --- Display Logic for Running Crew ---
 if st.session_state.crew_running:
     with st.status("ReceptionFlow is running...", expanded=True) as status:
+        # Progress lines are appended as new elements; only the bounded log tail is redrawn.
+        progress_container = st.container()
         log_placeholder = st.empty()
+        log_tail: deque[str] = deque(maxlen=LOG_TAIL_LINES)
+        progress_sub = st.session_state.progress_sub
+        last_refresh = 0.0
+        log_dirty = False
+        finished = False
+
+        while not finished:
+            while (event := progress_sub.get(timeout=0)) is not None:
+                line = format_progress_event(event)
+                if line:
+                    progress_container.write(line)
 
-        # Poll the queue for updates
-        while st.session_state.thread.is_alive() or not log_queue.empty():
             try:
                 message = log_queue.get(timeout=0.1)
-                if isinstance(message, tuple):
-                    msg_type, content = message
-                    if msg_type == "REPORT":
-                        st.session_state.final_report = content
-                    elif msg_type == "ERROR":
-                        st.session_state.log_messages.append(f"❌ ERROR: {content}")
-                    elif msg_type == "END":
-                        st.session_state.crew_running = False
-                        break  # Exit the loop
-                else:
-                    st.session_state.log_messages.append(message)
-
-                # Update the log display inside the status box
-                log_placeholder.code("\n".join(st.session_state.log_messages), language="log")
-
             except Empty:
-                continue  # Continue polling
+                if not st.session_state.thread.is_alive() and log_queue.empty():
+                    finished = True
+                message = None
+
+            if isinstance(message, tuple):
+                msg_type, content = message
+                if msg_type == "REPORT":
+                    st.session_state.final_report = content
+                elif msg_type == "ERROR":
+                    log_tail.append(f"❌ ERROR: {content}")
+                    st.session_state.log_messages.append(f"❌ ERROR: {content}")
+                    log_dirty = True
+                elif msg_type == "END":
+                    finished = True
+            elif message is not None:
+                log_tail.append(message)
+                st.session_state.log_messages.append(message)
+                log_dirty = True
+
+            now = time.monotonic()
+            if log_dirty and (finished or now - last_refresh >= LOG_REFRESH_SECONDS):
+                log_placeholder.code("\n".join(log_tail), language="log")
+                last_refresh = now
+                log_dirty = False
+
+        progress_sub.close()
 
         # Final state update after loop
         st.session_state.crew_running = False
@@ -0,0 +1,239 @@
+"""Batch mode: run many requests through one ReceptionFlow process.
+
+The nightly job used to start ``kickoff`` once per request, so every request paid for
+interpreter start-up, the CrewAI import, crew and tool imports, template parsing and
+fresh provider/HTTP connections. ``kickoff-batch`` reads a file of requests and runs
+them in one process with bounded concurrency. Everything that is process-wide is then
+shared: imported crews, the LiteLLM client cache, ``epic_news.utils.http`` clients,
+the template and renderer caches.
+
+Usage::
+
+    kickoff-batch nightly.txt --concurrency 4
+
+The requests file holds one request per line (blank lines and ``#`` comments are
+ignored); a ``.jsonl`` file holds one ``{"request": "..."}`` object per line.
+Identical requests (case and whitespace aside) run once.
+
+Crews write their reports to fixed paths (``output/news_daily/final_report.html``, ...),
+so two requests routed to the same crew must not overlap. ``determine_crew`` calls
+:func:`claim_outputs` with its route: inside a batch that takes a per-route lock held
+until the request finishes, outside a batch it does nothing. Each report is copied to
+the batch directory before the lock is released, next to ``summary.json``.
+"""
+
+from __future__ import annotations
+
+import datetime
+import json
+import os
+import re
+import shutil
+import threading
+import time
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any
+
+from loguru import logger
+
+from epic_news.utils.interrupt import cancellation_requested
+from epic_news.utils.progress import new_run_id
+
+DEFAULT_CONCURRENCY = 4
+DEFAULT_OUTPUT_DIR = "output/batch"
+
+# (request, run_id) -> the finished flow (anything with a ``state``), or raises.
+Runner = Callable[[str, str], Any]
+
+
+@dataclass
+class BatchResult:
+    """Outcome of one line of the requests file."""
+
+    index: int
+    request: str
+    status: str  # ok | error | duplicate | cancelled
+    run_id: str | None = None
+    duration_seconds: float = 0.0
+    selected_crew: str | None = None
+    output_file: str | None = None
+    archived_file: str | None = None
+    error: str | None = None
+    duplicate_of: int | None = None
+
+
+@dataclass
+class _Slot:
+    """Locks held by the request running in the current context."""
+
+    locks: list[threading.Lock] = field(default_factory=list)
+
+
+_current_slot: ContextVar[_Slot | None] = ContextVar("epic_news_batch_slot", default=None)
+_route_locks: dict[str, threading.Lock] = {}
+_route_locks_guard = threading.Lock()
+
+
+def batch_concurrency() -> int:
+    """Requests run at once (``EPIC_BATCH_CONCURRENCY``, default 4, at least 1)."""
+    try:
+        return max(1, int(os.getenv("EPIC_BATCH_CONCURRENCY", str(DEFAULT_CONCURRENCY))))
+    except ValueError:
+        return DEFAULT_CONCURRENCY
+
+
+def normalize_request(text: str) -> str:
+    """Key used to detect duplicate requests: case-folded, whitespace collapsed."""
+    return re.sub(r"\s+", " ", text).strip().casefold()
+
+
+def read_requests(path: str | Path) -> list[str]:
+    """Read the requests of a batch file (plain text, or JSON lines for ``.jsonl``)."""
+    path = Path(path)
+    requests: list[str] = []
+    for number, line in enumerate(path.read_text(encoding="utf-8").splitlines(), start=1):
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        if path.suffix == ".jsonl":
+            try:
+                line = str(json.loads(line)["request"]).strip()
+            except (ValueError, KeyError, TypeError) as exc:
+                raise ValueError(f"{path}:{number}: expected a JSON object with a 'request' key") from exc
+        requests.append(line)
+    return requests
+
+
+def claim_outputs(route: str) -> None:
+    """Serialize batch requests that write the same crew's output files.
+
+    No-op outside a batch. Inside one, blocks until no other request of the batch holds
+    ``route`` and keeps it until this request is finished.
+    """
+    slot = _current_slot.get()
+    if slot is None:
+        return
+    with _route_locks_guard:
+        lock = _route_locks.setdefault(route, threading.Lock())
+    if lock in slot.locks:
+        return
+    if not lock.acquire(blocking=False):
+        logger.info("⏳ Waiting for another batch request routed to {} to finish", route)
+        lock.acquire()
+    slot.locks.append(lock)
+
+
+def _archive(output_file: str | None, batch_dir: Path, index: int) -> str | None:
+    if not output_file or not Path(output_file).is_file():
+        return None
+    target = batch_dir / f"{index:03d}-{Path(output_file).name}"
+    shutil.copy2(output_file, target)
+    return str(target)
+
+
+def _run_one(index: int, request: str, runner: Runner, batch_dir: Path) -> BatchResult:
+    if cancellation_requested():
+        return BatchResult(index=index, request=request, status="cancelled")
+
+    run_id = new_run_id()
+    slot = _Slot()
+    token = _current_slot.set(slot)
+    started = time.perf_counter()
+    result = BatchResult(index=index, request=request, status="ok", run_id=run_id)
+    try:
+        flow = runner(request, run_id)
+        state = getattr(flow, "state", None)
+        result.selected_crew = getattr(state, "selected_crew", None)
+        result.output_file = getattr(state, "output_file", None)
+        # Copy while the route lock is still held: the next request of the same crew
+        # overwrites the same path.
+        result.archived_file = _archive(result.output_file, batch_dir, index)
+    except Exception as exc:
+        logger.exception("❌ Batch request #{} failed: {}", index, exc)
+        result.status = "error"
+        result.error = f"{type(exc).__name__}: {exc}"
+    finally:
+        result.duration_seconds = round(time.perf_counter() - started, 3)
+        _current_slot.reset(token)
+        for lock in reversed(slot.locks):
+            lock.release()
+    logger.info(
+        "{} Batch request #{} {} in {:.1f}s",
+        "✅" if result.status == "ok" else "❌",
+        index,
+        result.status,
+        result.duration_seconds,
+    )
+    return result
+
+
+def run_batch(
+    requests: Iterable[str],
+    runner: Runner,
+    concurrency: int | None = None,
+    output_dir: str | Path = DEFAULT_OUTPUT_DIR,
+) -> dict[str, Any]:
+    """Run ``requests`` through ``runner`` and write ``summary.json``; return the summary."""
+    requests = list(requests)
+    concurrency = concurrency or batch_concurrency()
+    started_at = datetime.datetime.now(datetime.UTC)
+    batch_id = started_at.strftime("%Y%m%dT%H%M%SZ")
+    batch_dir = Path(output_dir) / batch_id
+    batch_dir.mkdir(parents=True, exist_ok=True)
+
+    first_seen: dict[str, int] = {}
+    unique: list[tuple[int, str]] = []
+    duplicates: list[tuple[int, str, int]] = []
+    for index, request in enumerate(requests, start=1):
+        key = normalize_request(request)
+        if key in first_seen:
+            duplicates.append((index, request, first_seen[key]))
+        else:
+            first_seen[key] = index
+            unique.append((index, request))
+    logger.info(
+        "📦 Batch {}: {} requests ({} duplicates skipped), concurrency {}",
+        batch_id,
+        len(requests),
+        len(duplicates),
+        concurrency,
+    )
+
+    clock = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="epic-batch") as pool:
+        futures = [pool.submit(_run_one, index, request, runner, batch_dir) for index, request in unique]
+        results = {r.index: r for r in (f.result() for f in futures)}
+
+    for index, request, original in duplicates:
+        source = results[original]
+        results[index] = BatchResult(
+            index=index,
+            request=request,
+            status="duplicate",
+            run_id=source.run_id,
+            selected_crew=source.selected_crew,
+            output_file=source.output_file,
+            archived_file=source.archived_file,
+            duplicate_of=original,
+        )
+
+    ordered = [results[index] for index in sorted(results)]
+    counts: dict[str, int] = {}
+    for result in ordered:
+        counts[result.status] = counts.get(result.status, 0) + 1
+    summary = {
+        "batch_id": batch_id,
+        "started_at": started_at.isoformat(),
+        "duration_seconds": round(time.perf_counter() - clock, 3),
+        "concurrency": concurrency,
+        "counts": counts,
+        "results": [asdict(result) for result in ordered],
+    }
+    summary_file = batch_dir / "summary.json"
+    summary_file.write_text(json.dumps(summary, indent=2, ensure_ascii=False), encoding="utf-8")
+    logger.info("📦 Batch {} finished: {} → {}", batch_id, counts, summary_file)
+    return summary
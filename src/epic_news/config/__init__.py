@@ -1,7 +1,32 @@
-"""Configuration package for epic_news."""
+"""Configuration package for epic_news.
 
-from epic_news.config.composio_config import ComposioConfig
-from epic_news.config.llm_config import LLMConfig
-from epic_news.config.mcp_config import MCPConfig
+Exports are resolved on first access: importing a light submodule such as
+``epic_news.config.ui_theme`` must not pull in Composio, MCP and CrewAI.
+"""
+
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from epic_news.config.composio_config import ComposioConfig
+    from epic_news.config.llm_config import LLMConfig
+    from epic_news.config.mcp_config import MCPConfig
 
 __all__ = ["LLMConfig", "MCPConfig", "ComposioConfig"]
+
+_EXPORTS = {
+    "ComposioConfig": "epic_news.config.composio_config",
+    "LLMConfig": "epic_news.config.llm_config",
+    "MCPConfig": "epic_news.config.mcp_config",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
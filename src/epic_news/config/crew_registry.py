@@ -0,0 +1,296 @@
+"""Declarative registry of the crews ReceptionFlow can dispatch to.
+
+One ``CrewSpec`` per classifier category replaces the ``determine_crew`` if-chain and
+the near-identical ``generate_*`` bodies: the router looks the category up here, and
+every crew whose pipeline is the standard one (kickoff → load/parse the JSON model →
+render HTML, DOCX on request) is run by ``ReceptionFlow._run_registered_crew`` from
+its spec. Crews with bespoke pipelines (OSINT fan-out, RSS fetch/translate, menu
+recipes, ...) only register their route and keep a dedicated flow method.
+
+Adding a standard crew is one entry below plus a one-line ``@listen`` method on
+ReceptionFlow (CrewAI needs a real method per listener).
+
+Crew, model and assembler references are lazy: nothing is imported until a run uses it.
+"""
+
+from __future__ import annotations
+
+import os
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from loguru import logger
+
+from epic_news.models.content_state import CrewCategories
+from epic_news.utils.lazy_import import lazy_import
+
+# Enrichers receive a copy of the inputs returned by ContentState.to_crew_inputs() and
+# add the crew-specific keys. They run in order and mutate the dict in place.
+InputEnricher = Callable[[dict[str, Any]], None]
+
+UNKNOWN_ROUTE = "go_unknown"
+
+
+def with_portfolio_csv_paths(inputs: dict[str, Any]) -> None:
+    """FinDaily reads the portfolio CSVs through file tools, which need absolute paths."""
+    inputs["stock_csv_path"] = os.path.abspath("data/stock.csv")
+    inputs["etf_csv_path"] = os.path.abspath("data/etf.csv")
+
+
+def with_portfolio_analytics(inputs: dict[str, Any]) -> None:
+    """Precompute prices and risk metrics in one bulk fetch so the analysts need not."""
+    from epic_news.utils.portfolio_analytics import build_portfolio_context
+
+    inputs["portfolio_analytics"] = build_portfolio_context(inputs["stock_csv_path"], inputs["etf_csv_path"])
+
+
+def with_french_report(inputs: dict[str, Any]) -> None:
+    inputs["report_language"] = "French"
+
+
+def with_company_fallback(inputs: dict[str, Any]) -> None:
+    """Meeting prep needs a company; fall back to the topic when none was extracted."""
+    if not inputs.get("company"):
+        inputs["company"] = inputs.get("topic")
+        logger.warning(
+            f"⚠️ No company specified for meeting prep, using topic as company: {inputs['company']}"
+        )
+
+
+@dataclass(frozen=True)
+class CrewSpec:
+    """Everything ReceptionFlow needs to route to, run and render one crew."""
+
+    category: str
+    route: str
+    method: str
+    crew: Any = None
+    # Standard pipeline only (see ``is_standard``).
+    model: Any = None
+    template: str | None = None
+    json_path: str | None = None
+    html_path: str | None = None
+    # Defaults to html_path with a .docx suffix.
+    docx_path: str | None = None
+    docx_assembler: Any = None
+    label: str = ""
+    output_attr: str | None = None
+    model_attr: str | None = None
+    enrichers: tuple[InputEnricher, ...] = ()
+    # Point state.output_file at the crew JSON while the crew runs (most crews do).
+    track_json_output: bool = True
+    # Name of the crew output dump (see ``dump_crewai_state``) when it is not the category.
+    dump_as: str | None = None
+
+    @property
+    def is_standard(self) -> bool:
+        """True when ReceptionFlow._run_registered_crew can run this crew from the spec."""
+        return self.model is not None
+
+    @property
+    def docx_output(self) -> str | None:
+        if self.docx_path:
+            return self.docx_path
+        return str(Path(self.html_path).with_suffix(".docx")) if self.html_path else None
+
+    @property
+    def dump_name(self) -> str:
+        return self.dump_as or self.category
+
+
+def _crew(module: str, name: str) -> Any:
+    return lazy_import(f"epic_news.crews.{module}", name)
+
+
+def _model(module: str, name: str) -> Any:
+    return lazy_import(f"epic_news.models.crews.{module}", name)
+
+
+def _docx(module: str, name: str) -> Any:
+    return lazy_import(f"epic_news.utils.docx_report.crews.{module}", name)
+
+
+_SPECS: tuple[CrewSpec, ...] = (
+    # --- Standard pipeline ---------------------------------------------------------
+    CrewSpec(
+        category=CrewCategories.POEM,
+        route="go_generate_poem",
+        method="generate_poem",
+        crew=_crew("poem.poem_crew", "PoemCrew"),
+        model=_model("poem_report", "PoemJSONOutput"),
+        template="POEM",
+        json_path="output/poem/poem.json",
+        html_path="output/poem/poem.html",
+        label="poem",
+    ),
+    CrewSpec(
+        category=CrewCategories.COMPANY_NEWS,
+        route="go_generate_news_company",
+        method="generate_news_company",
+        crew=_crew("company_news.company_news_crew", "CompanyNewsCrew"),
+        model=_model("company_news_report", "CompanyNewsReport"),
+        template="COMPANY_NEWS",
+        json_path="output/company_news/report.json",
+        html_path="output/company_news/report.html",
+        docx_assembler=_docx("company_news", "assemble_company_news_docx"),
+        label="company news",
+        output_attr="company_news_report",
+        dump_as="NEWS_COMPANY",
+    ),
+    CrewSpec(
+        category=CrewCategories.FINDAILY,
+        route="go_generate_findaily",
+        method="generate_findaily",
+        crew=_crew("fin_daily.fin_daily", "FinDailyCrew"),
+        model=_model("financial_report", "FinancialReport"),
+        template="FINDAILY",
+        json_path="output/findaily/report.json",
+        html_path="output/findaily/report.html",
+        docx_assembler=_docx("fin_daily", "assemble_fin_daily_docx"),
+        label="financial report",
+        output_attr="fin_daily_report",
+        enrichers=(with_portfolio_csv_paths, with_portfolio_analytics),
+        dump_as="FIN_DAILY",
+    ),
+    CrewSpec(
+        category=CrewCategories.NEWSDAILY,
+        route="go_generate_news_daily",
+        method="generate_news_daily",
+        crew=_crew("news_daily.news_daily", "NewsDailyCrew"),
+        model=_model("news_daily_report", "NewsDailyReport"),
+        template="NEWSDAILY",
+        json_path="output/news_daily/news_data.json",
+        html_path="output/news_daily/final_report.html",
+        docx_path="output/news_daily/report.docx",
+        docx_assembler=_docx("news_daily", "assemble_news_daily_docx"),
+        label="news daily",
+        output_attr="news_daily_report",
+        model_attr="news_daily_model",
+        enrichers=(with_french_report,),
+    ),
+    CrewSpec(
+        category=CrewCategories.SAINT,
+        route="go_generate_saint_daily",
+        method="generate_saint_daily",
+        crew=_crew("saint_daily.saint_daily", "SaintDailyCrew"),
+        model=_model("saint_daily_report", "SaintData"),
+        template="SAINT",
+        json_path="output/saint_daily/report.json",
+        html_path="output/saint_daily/report.html",
+        docx_assembler=_docx("saint", "assemble_saint_docx"),
+        label="saint daily",
+        output_attr="saint_daily_report",
+        model_attr="saint_daily_model",
+        dump_as="SAINT_DAILY",
+    ),
+    CrewSpec(
+        category=CrewCategories.BOOK_SUMMARY,
+        route="go_generate_book_summary",
+        method="generate_book_summary",
+        crew=_crew("library.library_crew", "LibraryCrew"),
+        model=_model("book_summary_report", "BookSummaryReport"),
+        template="BOOK_SUMMARY",
+        json_path="output/library/book_summary.json",
+        html_path="output/library/book_summary.html",
+        docx_assembler=_docx("book_summary", "assemble_book_summary_docx"),
+        label="book summary",
+        output_attr="book_summary",
+        track_json_output=False,
+    ),
+    CrewSpec(
+        category=CrewCategories.MEETING_PREP,
+        route="go_generate_meeting_prep",
+        method="generate_meeting_prep",
+        crew=_crew("meeting_prep.meeting_prep_crew", "MeetingPrepCrew"),
+        model=_model("meeting_prep_report", "MeetingPrepReport"),
+        template="MEETING_PREP",
+        json_path="output/meeting/meeting_preparation.json",
+        html_path="output/meeting/meeting_preparation.html",
+        docx_assembler=_docx("meeting_prep", "assemble_meeting_prep_docx"),
+        label="meeting prep",
+        model_attr="meeting_prep_report",
+        enrichers=(with_company_fallback,),
+        track_json_output=False,
+    ),
+    CrewSpec(
+        category=CrewCategories.SALES_PROSPECTING,
+        route="go_generate_sales_prospecting_report",
+        method="generate_sales_prospecting_report",
+        crew=_crew("sales_prospecting.sales_prospecting_crew", "SalesProspectingCrew"),
+        model=_model("sales_prospecting_report", "SalesProspectingReport"),
+        template="SALES_PROSPECTING",
+        json_path="output/sales_prospecting/report.json",
+        html_path="output/sales_prospecting/report.html",
+        docx_assembler=_docx("sales_prospecting", "assemble_sales_prospecting_docx"),
+        label="sales prospecting",
+    ),
+    # --- Bespoke pipelines (dedicated ReceptionFlow methods) ------------------------
+    CrewSpec(
+        category=CrewCategories.HOLIDAY_PLANNER,
+        route="go_generate_holiday_plan",
+        method="generate_holiday_plan",
+        crew=_crew("holiday_planner.holiday_planner_crew", "HolidayPlannerCrew"),
+    ),
+    CrewSpec(
+        category=CrewCategories.COOKING,
+        route="go_generate_recipe",
+        method="generate_recipe",
+        crew=_crew("cooking.cooking_crew", "CookingCrew"),
+    ),
+    CrewSpec(
+        category=CrewCategories.MENU,
+        route="go_generate_menu_designer",
+        method="generate_menu_designer",
+        crew=_crew("menu_designer.menu_designer", "MenuDesignerCrew"),
+    ),
+    CrewSpec(
+        category=CrewCategories.SHOPPING,
+        route="go_generate_shopping_advice",
+        method="generate_shopping_advice",
+        crew=_crew("shopping_advisor.shopping_advisor", "ShoppingAdvisorCrew"),
+    ),
+    CrewSpec(
+        category=CrewCategories.OPEN_SOURCE_INTELLIGENCE,
+        route="go_generate_osint",
+        method="generate_osint",
+        crew=_crew("company_profiler.company_profiler_crew", "CompanyProfilerCrew"),
+    ),
+    CrewSpec(
+        category=CrewCategories.RSS,
+        route="go_generate_rss_weekly",
+        method="generate_rss_weekly",
+        crew=_crew("rss_weekly.rss_weekly_crew", "RssWeeklyCrew"),
+    ),
+    CrewSpec(
+        category=CrewCategories.DEEPRESEARCH,
+        route="go_generate_deep_research",
+        method="generate_deep_research",
+        crew=_crew("deep_research.deep_research", "DeepResearchCrew"),
+    ),
+    CrewSpec(
+        category=CrewCategories.PESTEL,
+        route="go_generate_pestel",
+        method="generate_pestel",
+        crew=_crew("pestel.pestel_crew", "PestelCrew"),
+    ),
+)
+
+CREW_REGISTRY: dict[str, CrewSpec] = {spec.category: spec for spec in _SPECS}
+
+
+def get_crew_spec(category: str | None) -> CrewSpec | None:
+    """Return the spec registered for a classifier category, or None."""
+    return CREW_REGISTRY.get(category or "")
+
+
+def route_for(category: str | None) -> str:
+    """Router label for a category; ``go_unknown`` when nothing is registered."""
+    spec = get_crew_spec(category)
+    return spec.route if spec else UNKNOWN_ROUTE
+
+
+def report_methods() -> tuple[str, ...]:
+    """Names of the flow methods that produce a report (what send_email waits on)."""
+    return tuple(spec.method for spec in _SPECS)
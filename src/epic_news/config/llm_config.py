@@ -9,8 +9,12 @@ from crewai.llms.base_llm import BaseLLM
 from dotenv import load_dotenv
 from loguru import logger
 
+from epic_news.utils.cassette import get_cassette, llm_request
+
 load_dotenv()
 
+DEFAULT_OPENROUTER_BASE_URL = "https://openrouter.ai/api/v1"
+
 
 def _is_empty_llm_response(result: object) -> bool:
     """True when an ``LLM.call`` result carries no usable text.
@@ -236,6 +240,9 @@ def _wrap_call_for_react_safety(cls: type) -> None:
 
     *Native tool calls on a ReAct step.* See ``_coerce_tool_calls_to_react_text``.
 
+    With ``EPIC_CASSETTE_MODE`` set, the guarded call is also recorded to, or replayed
+    from, a cassette (see ``epic_news.utils.cassette``).
+
     Both entry points are wrapped: tasks with ``async_execution=True`` reach the provider
     through ``acall`` (``agent_utils.aget_llm_response``), which carries the identical
     ``if tool_calls and not available_functions: return tool_calls`` return as ``call``.
@@ -248,12 +255,19 @@ def _wrap_call_for_react_safety(cls: type) -> None:
     if original_call is not None and not getattr(original_call, "_epic_news_react_safe", False):
 
         def call(self, *args, **kwargs):
-            result = _call_with_empty_retry(
-                lambda: original_call(self, *args, **kwargs),
-                int(os.getenv("LLM_EMPTY_RETRIES", "6")),
-                getattr(self, "model", "?"),
-            )
-            return _react_safe_text(self, result)
+            def guarded_call():
+                result = _call_with_empty_retry(
+                    lambda: original_call(self, *args, **kwargs),
+                    int(os.getenv("LLM_EMPTY_RETRIES", "6")),
+                    getattr(self, "model", "?"),
+                )
+                return _react_safe_text(self, result)
+
+            cassette = get_cassette()
+            if cassette is None:
+                return guarded_call()
+            request = llm_request(self, args, kwargs)
+            return cassette.play("llm", str(request["model"]), request, guarded_call)
 
         call._epic_news_react_safe = True  # type: ignore[attr-defined]
         cls.call = call  # type: ignore[attr-defined]
@@ -262,12 +276,19 @@ def _wrap_call_for_react_safety(cls: type) -> None:
     if original_acall is not None and not getattr(original_acall, "_epic_news_react_safe", False):
 
         async def acall(self, *args, **kwargs):
-            result = await _acall_with_empty_retry(
-                lambda: original_acall(self, *args, **kwargs),
-                int(os.getenv("LLM_EMPTY_RETRIES", "6")),
-                getattr(self, "model", "?"),
-            )
-            return _react_safe_text(self, result)
+            async def guarded_acall():
+                result = await _acall_with_empty_retry(
+                    lambda: original_acall(self, *args, **kwargs),
+                    int(os.getenv("LLM_EMPTY_RETRIES", "6")),
+                    getattr(self, "model", "?"),
+                )
+                return _react_safe_text(self, result)
+
+            cassette = get_cassette()
+            if cassette is None:
+                return await guarded_acall()
+            request = llm_request(self, args, kwargs)
+            return await cassette.aplay("llm", str(request["model"]), request, guarded_acall)
 
         acall._epic_news_react_safe = True  # type: ignore[attr-defined]
         cls.acall = acall  # type: ignore[attr-defined]
@@ -348,6 +369,7 @@ class LLMConfig:
     Environment Variables:
         MODEL: Model identifier (default: "openrouter/mistralai/mistral-small-2603")
         OPENROUTER_API_KEY: OpenRouter API key
+        OPENROUTER_BASE_URL: OpenRouter endpoint (default: "https://openrouter.ai/api/v1")
         LLM_TEMPERATURE: Response randomness (0.0-2.0, default: 0.7)
         LLM_MAX_TOKENS: Maximum response tokens (optional)
         LLM_TIMEOUT_QUICK: Timeout for quick tasks (default: 120s)
@@ -468,7 +490,9 @@ class LLMConfig:
         # would break it. Leave both unset and let LiteLLM take the native route.
         if resolved_model.startswith("openrouter/"):
             api_key: str | None = os.getenv("OPENROUTER_API_KEY")
-            base_url: str | None = "https://openrouter.ai/api/v1"
+            # Overridable so load tests can point every crew at a local OpenAI-compatible
+            # stand-in (benchmarks/mock_llm_server.py) instead of paying for tokens.
+            base_url: str | None = os.getenv("OPENROUTER_BASE_URL") or DEFAULT_OPENROUTER_BASE_URL
         else:
             api_key = None
             base_url = None
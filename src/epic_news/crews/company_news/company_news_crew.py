@@ -8,6 +8,7 @@ from loguru import logger
 from epic_news.config.llm_config import LLMConfig
 from epic_news.models.crews.company_news_report import CompanyNewsReport
 from epic_news.utils.observability import get_observability_tools, trace_task
+from epic_news.utils.search_cache import cache_tools
 
 # Load environment variables
 load_dotenv()
@@ -53,8 +54,9 @@ class CompanyNewsCrew:
         composio = ComposioConfig()
 
         # Get search tools from Reddit, Twitter, and HackerNews (5 tools total)
-        # These replace the deprecated COMPOSIO_SEARCH_* actions that no longer exist
-        self.search_tools = composio.get_search_tools()
+        # These replace the deprecated COMPOSIO_SEARCH_* actions that no longer exist.
+        # Queries close to one answered recently are served from the search cache.
+        self.search_tools = cache_tools(composio.get_search_tools())
 
         # Pass observability tools to instance
         self.tracer = tracer
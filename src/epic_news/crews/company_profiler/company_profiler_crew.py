@@ -1,15 +1,16 @@
 from crewai import Agent, Crew, Process, Task
 from crewai.project import CrewBase, agent, crew, task
-from crewai_custom_tools import HybridSearchTool
 from crewai_tools import PDFSearchTool
 from dotenv import load_dotenv
 
 from epic_news.config.llm_config import LLMConfig
 from epic_news.models.crews.company_profiler_report import CompanyProfileReport
 from epic_news.tools.finance_tools import get_yahoo_finance_tools
-from epic_news.tools.html_to_pdf_tool import HtmlToPdfTool
 from epic_news.tools.report_tools import get_report_tools
 from epic_news.tools.scraper_factory import get_scraper
+from epic_news.tools.web_search_factory import WebSearchFactory
+from epic_news.utils.cassette import wrap_tool
+from epic_news.utils.context_packer import PackedContextTask
 
 load_dotenv()
 
@@ -23,11 +24,10 @@ class CompanyProfilerCrew:
     def company_researcher(self) -> Agent:
         """Creates the company researcher agent with tools for data gathering"""
         # Get all tools
-        search_tools = [HybridSearchTool(), get_scraper(), PDFSearchTool()]
+        search_tools = [WebSearchFactory.create("hybrid"), get_scraper(), wrap_tool(PDFSearchTool())]
         finance_tools = get_yahoo_finance_tools()
-        html_to_pdf_tool = HtmlToPdfTool()
 
-        all_tools = search_tools + finance_tools + [html_to_pdf_tool] + get_report_tools()
+        all_tools = search_tools + finance_tools + get_report_tools(include_pdf=False)
 
         return Agent(
             config=self.agents_config["company_researcher"],  # type: ignore
@@ -121,8 +121,8 @@ class CompanyProfilerCrew:
 
     @task
     def format_report_task(self) -> Task:
-        """Format the comprehensive company profile report"""
-        return Task(
+        """Format the comprehensive company profile report; its context is packed to the token budget."""
+        return PackedContextTask(
             config=self.tasks_config["format_report_task"],  # type: ignore
             agent=self.company_reporter(),  # type: ignore
             context=[
@@ -4,9 +4,9 @@ from crewai_tools import DirectoryReadTool, FileReadTool, PDFSearchTool
 
 from epic_news.config.llm_config import LLMConfig
 from epic_news.models.crews.cross_reference_report import CrossReferenceReport
-from epic_news.tools.html_to_pdf_tool import HtmlToPdfTool
 from epic_news.tools.report_tools import get_report_tools
 from epic_news.tools.web_tools import get_scrape_tools, get_search_tools
+from epic_news.utils.cassette import wrap_tool
 
 
 @CrewBase
@@ -22,16 +22,15 @@ class CrossReferenceReportCrew:
         # Get all tools
         search_tools = get_search_tools()
         scrape_tools = get_scrape_tools()
-        html_to_pdf_tool = HtmlToPdfTool()
         directory_read_tool = DirectoryReadTool("output/osint")
         file_read_tool = FileReadTool()
-        pdf_search_tool = PDFSearchTool()
+        pdf_search_tool = wrap_tool(PDFSearchTool())
 
         all_tools = (
             search_tools
             + scrape_tools
-            + [html_to_pdf_tool, directory_read_tool, file_read_tool, pdf_search_tool]
-            + get_report_tools()
+            + [directory_read_tool, file_read_tool, pdf_search_tool]
+            + get_report_tools(include_pdf=False)
         )
 
         return Agent(
@@ -1,6 +1,5 @@
 from crewai import Agent, Crew, Process, Task
 from crewai.project import CrewBase, agent, crew, task
-from crewai_custom_tools import HybridSearchTool
 from crewai_tools import (
     FileReadTool,
     MCPServerAdapter,
@@ -10,6 +9,9 @@ from crewai_tools import (
 from epic_news.config.llm_config import LLMConfig
 from epic_news.config.mcp_config import MCPConfig
 from epic_news.models.crews.deep_research_report import DeepResearchReport
+from epic_news.tools.web_search_factory import WebSearchFactory
+from epic_news.utils.cassette import wrap_tool, wrap_tools
+from epic_news.utils.context_packer import PackedContextTask
 
 
 @CrewBase
@@ -35,7 +37,7 @@ class DeepResearchCrew:
         if self._wikipedia_mcp is None:
             wikipedia_params = MCPConfig.get_wikipedia_mcp()
             self._wikipedia_mcp = MCPServerAdapter(wikipedia_params)
-        return self._wikipedia_mcp.tools
+        return wrap_tools(self._wikipedia_mcp.tools)
 
     # Research Strategist - Planning and methodology
     @agent
@@ -57,8 +59,8 @@ class DeepResearchCrew:
             config=self.agents_config["information_collector"],  # type: ignore[index]
             tools=[
                 # Hybrid search (Perplexity → Brave → Serper cascading fallback)
-                HybridSearchTool(),
-                ScrapeWebsiteTool(),
+                WebSearchFactory.create("hybrid"),
+                wrap_tool(ScrapeWebsiteTool()),
                 FileReadTool(),
                 # Wikipedia MCP tools (encyclopedic research)
                 *self.wikipedia_tools,  # Adds search and fetch tools from Wikipedia MCP
@@ -154,8 +156,8 @@ class DeepResearchCrew:
     # Task 4: Report Writing (formerly Task 5)
     @task
     def report_writing_task(self) -> Task:
-        """Report writing task."""
-        return Task(
+        """Report writing task; its context is packed to the token budget."""
+        return PackedContextTask(
             config=self.tasks_config["report_writing_task"],  # type: ignore[arg-type, index]
             verbose=True,  # type: ignore[call-arg]
             context=[
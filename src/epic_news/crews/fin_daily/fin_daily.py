@@ -7,6 +7,7 @@ from epic_news.config.llm_config import LLMConfig
 from epic_news.models.crews.financial_report import FinancialReport
 from epic_news.tools.finance_tools import get_crypto_research_tools, get_stock_research_tools
 from epic_news.tools.scraper_factory import get_scraper
+from epic_news.utils.context_packer import PackedContextTask
 
 
 @CrewBase
@@ -116,7 +117,7 @@ class FinDailyCrew:
 
     @task
     def final_report_generation_task(self) -> Task:
-        return Task(  # type: ignore[call-arg]
+        return PackedContextTask(  # type: ignore[call-arg]
             config=self.tasks_config["final_report_generation_task"],  # type: ignore[index, arg-type]
             context=[
                 self.stock_portfolio_analysis_task(),  # type: ignore[call-arg]
@@ -1,16 +1,16 @@
 from crewai import Agent, Crew, Process, Task
 from crewai.project import CrewBase, agent, crew, task
-from crewai_custom_tools import HybridSearchTool
 from crewai_tools import PDFSearchTool
 from dotenv import load_dotenv
 
 from epic_news.config.llm_config import LLMConfig
 from epic_news.models.crews.legal_analysis_report import LegalAnalysisReport
-from epic_news.tools.html_to_pdf_tool import HtmlToPdfTool
 
 # Import RAG tools
 from epic_news.tools.report_tools import get_report_tools
 from epic_news.tools.scraper_factory import get_scraper
+from epic_news.tools.web_search_factory import WebSearchFactory
+from epic_news.utils.cassette import wrap_tool
 
 load_dotenv()
 
@@ -24,10 +24,9 @@ class LegalAnalysisCrew:
     def legal_researcher(self) -> Agent:
         """Creates the legal researcher agent with tools for data gathering"""
         # Get all tools
-        search_tools = [HybridSearchTool(), get_scraper(), PDFSearchTool()]
-        html_to_pdf_tool = HtmlToPdfTool()
+        search_tools = [WebSearchFactory.create("hybrid"), get_scraper(), wrap_tool(PDFSearchTool())]
 
-        all_tools = search_tools + [html_to_pdf_tool] + get_report_tools()
+        all_tools = search_tools + get_report_tools(include_pdf=False)
 
         return Agent(
             config=self.agents_config["legal_researcher"],  # type: ignore[index]
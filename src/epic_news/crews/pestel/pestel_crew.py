@@ -9,12 +9,13 @@ from __future__ import annotations
 
 from crewai import Agent, Crew, Process, Task
 from crewai.project import CrewBase, agent, crew, task
-from crewai_custom_tools import HybridSearchTool
 from crewai_tools import MCPServerAdapter, ScrapeWebsiteTool
 
 from epic_news.config.llm_config import LLMConfig
 from epic_news.config.mcp_config import MCPConfig
 from epic_news.models.crews.pestel_report import PestelReport
+from epic_news.tools.web_search_factory import WebSearchFactory
+from epic_news.utils.cassette import wrap_tool, wrap_tools
 
 
 @CrewBase
@@ -33,7 +34,7 @@ class PestelCrew:
         if adapter is None:
             adapter = MCPServerAdapter(MCPConfig.get_wikipedia_mcp())
             self._wikipedia_mcp = adapter
-        return adapter.tools
+        return wrap_tools(adapter.tools)
 
     def close(self) -> None:
         """Stop the Wikipedia MCP server process to release resources.
@@ -54,8 +55,8 @@ class PestelCrew:
         return Agent(
             config=self.agents_config[config_key],  # type: ignore[index]
             tools=[
-                HybridSearchTool(),
-                ScrapeWebsiteTool(),
+                WebSearchFactory.create("hybrid"),
+                wrap_tool(ScrapeWebsiteTool()),
                 *self.wikipedia_tools,
             ],
             llm=LLMConfig.get_openrouter_llm(),
@@ -1,6 +1,5 @@
 from crewai import Agent, Crew, Process, Task
 from crewai.project import CrewBase, agent, crew, task
-from crewai_custom_tools import HybridSearchTool
 from crewai_tools import DirectoryReadTool, FileReadTool, ScrapeWebsiteTool
 from dotenv import load_dotenv
 
@@ -8,6 +7,8 @@ from epic_news.config.llm_config import LLMConfig
 from epic_news.models.crews.sales_prospecting_report import SalesProspectingReport
 from epic_news.tools.data_centric_tools import get_data_centric_tools
 from epic_news.tools.report_tools import get_report_tools
+from epic_news.tools.web_search_factory import WebSearchFactory
+from epic_news.utils.cassette import wrap_tool
 
 load_dotenv()
 
@@ -24,8 +25,8 @@ class SalesProspectingCrew:
         return Agent(
             config=self.agents_config["company_researcher"],  # type: ignore[index]
             tools=[
-                HybridSearchTool(),
-                ScrapeWebsiteTool(),
+                WebSearchFactory.create("hybrid"),
+                wrap_tool(ScrapeWebsiteTool()),
                 FileReadTool(),
                 DirectoryReadTool("output/sales_prospecting"),
             ]
@@ -43,8 +44,8 @@ class SalesProspectingCrew:
         return Agent(
             config=self.agents_config["org_structure_analyst"],  # type: ignore[index]
             tools=[
-                HybridSearchTool(),
-                ScrapeWebsiteTool(),
+                WebSearchFactory.create("hybrid"),
+                wrap_tool(ScrapeWebsiteTool()),
                 FileReadTool(),
                 DirectoryReadTool("output/sales_prospecting"),
             ]
@@ -62,8 +63,8 @@ class SalesProspectingCrew:
         return Agent(
             config=self.agents_config["contact_finder"],  # type: ignore[index]
             tools=[
-                HybridSearchTool(),
-                ScrapeWebsiteTool(),
+                WebSearchFactory.create("hybrid"),
+                wrap_tool(ScrapeWebsiteTool()),
                 FileReadTool(),
                 DirectoryReadTool("output/sales_prospecting"),
             ]
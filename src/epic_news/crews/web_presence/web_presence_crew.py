@@ -1,6 +1,5 @@
 from crewai import Agent, Crew, Process, Task
 from crewai.project import CrewBase, agent, crew, task
-from crewai_custom_tools import HybridSearchTool
 from crewai_tools import PDFSearchTool
 from dotenv import load_dotenv
 
@@ -8,6 +7,8 @@ from epic_news.config.llm_config import LLMConfig
 from epic_news.models.crews.web_presence_report import WebPresenceReport
 from epic_news.tools.report_tools import get_report_tools
 from epic_news.tools.scraper_factory import get_scraper
+from epic_news.tools.web_search_factory import WebSearchFactory
+from epic_news.utils.cassette import wrap_tool
 
 load_dotenv()
 
@@ -20,10 +21,10 @@ class WebPresenceCrew:
     @agent
     def web_researcher(self) -> Agent:
         """Creates the web researcher agent with tools for data gathering"""
-        # get_report_tools() already includes HtmlToPdfTool; don't add it twice.
-        search_tools = [HybridSearchTool(), get_scraper(), PDFSearchTool()]
+        # PDFs are rendered by the flow once the HTML is written, not by the agent.
+        search_tools = [WebSearchFactory.create("hybrid"), get_scraper(), wrap_tool(PDFSearchTool())]
 
-        all_tools = search_tools + get_report_tools()
+        all_tools = search_tools + get_report_tools(include_pdf=False)
 
         return Agent(
             config=self.agents_config["web_researcher"],  # type: ignore[index]
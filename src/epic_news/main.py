@@ -16,7 +16,8 @@ Key functionalities include:
       the corresponding crews (e.g., SalesProspectingCrew, CookingCrew, CompanyNewsCrew).
     - Manages the state of the operation, including input data and output files.
     - Handles the final step of sending an email report with the generated content.
-- Utility functions to kickoff the flow (`kickoff`) and plot its structure (`plot`).
+- Utility functions to kickoff the flow (`kickoff`), run a file of requests in one
+  process (`batch`) and plot its structure (`plot`).
 """
 
 # Set environment variables for WeasyPrint library dependencies on macOS
@@ -41,91 +42,96 @@ from dotenv import load_dotenv
 from loguru import logger
 from pydantic import PydanticDeprecatedSince20, PydanticDeprecatedSince211, ValidationError
 
-# Patch CrewAI's Pydantic schema parser to support Python 3.10 ``X | Y`` unions
-from epic_news.crews.classify.classify_crew import ClassifyCrew
-from epic_news.crews.company_news.company_news_crew import CompanyNewsCrew
-from epic_news.crews.company_profiler.company_profiler_crew import CompanyProfilerCrew
-from epic_news.crews.cooking.cooking_crew import CookingCrew
-from epic_news.crews.cross_reference_report_crew.cross_reference_report_crew import CrossReferenceReportCrew
-from epic_news.crews.deep_research.deep_research import DeepResearchCrew
-from epic_news.crews.fin_daily.fin_daily import FinDailyCrew
-from epic_news.crews.geospatial_analysis.geospatial_analysis_crew import GeospatialAnalysisCrew
-from epic_news.crews.holiday_planner.holiday_planner_crew import HolidayPlannerCrew
-from epic_news.crews.hr_intelligence.hr_intelligence_crew import HRIntelligenceCrew
-from epic_news.crews.information_extraction.information_extraction_crew import InformationExtractionCrew
-from epic_news.crews.legal_analysis.legal_analysis_crew import LegalAnalysisCrew
-from epic_news.crews.library.library_crew import LibraryCrew
-from epic_news.crews.meeting_prep.meeting_prep_crew import MeetingPrepCrew
-from epic_news.crews.menu_designer.menu_designer import MenuDesignerCrew
-from epic_news.crews.news_daily.news_daily import NewsDailyCrew
-from epic_news.crews.pestel.pestel_crew import PestelCrew
-from epic_news.crews.poem.poem_crew import PoemCrew
-from epic_news.crews.rss_weekly.rss_weekly_crew import RssWeeklyCrew
-from epic_news.crews.saint_daily.saint_daily import SaintDailyCrew
-from epic_news.crews.sales_prospecting.sales_prospecting_crew import SalesProspectingCrew
-from epic_news.crews.shopping_advisor.shopping_advisor import ShoppingAdvisorCrew
-from epic_news.crews.tech_stack.tech_stack_crew import TechStackCrew
-from epic_news.crews.web_presence.web_presence_crew import WebPresenceCrew
-from epic_news.models.content_state import ContentState
-from epic_news.models.crews.book_summary_report import BookSummaryReport
-from epic_news.models.crews.company_news_report import CompanyNewsReport
+from epic_news.batch import claim_outputs, read_requests, run_batch
+from epic_news.config.crew_registry import CREW_REGISTRY, UNKNOWN_ROUTE, report_methods, route_for
+from epic_news.models.content_state import ContentState, CrewCategories
 from epic_news.models.crews.company_profiler_report import CompanyProfileReport
 from epic_news.models.crews.cooking_recipe import PaprikaRecipe
 from epic_news.models.crews.cross_reference_report import CrossReferenceReport
 from epic_news.models.crews.deep_research import DeepResearchReport
-from epic_news.models.crews.financial_report import FinancialReport
 from epic_news.models.crews.geospatial_analysis_report import GeospatialAnalysisReport
 from epic_news.models.crews.hr_intelligence_report import HRIntelligenceReport
 from epic_news.models.crews.legal_analysis_report import LegalAnalysisReport
-from epic_news.models.crews.meeting_prep_report import MeetingPrepReport
-from epic_news.models.crews.news_daily_report import NewsDailyReport
 from epic_news.models.crews.pestel_report import PestelDimension, PestelReport
-from epic_news.models.crews.poem_report import PoemJSONOutput
-from epic_news.models.crews.saint_daily_report import SaintData
-from epic_news.models.crews.sales_prospecting_report import SalesProspectingReport
 from epic_news.models.crews.tech_stack_report import TechStackReport
 from epic_news.models.crews.web_presence_report import WebPresenceReport
-from epic_news.services.menu_designer_service import MenuDesignerService
+from epic_news.utils.blob_store import prune_runs
 
 # Import the normalization utility
 from epic_news.utils.diagnostics import dump_crewai_state, parse_crewai_output
 from epic_news.utils.directory_utils import ensure_output_directories
-from epic_news.utils.docx_report.crews.book_summary import assemble_book_summary_docx
-from epic_news.utils.docx_report.crews.company_news import assemble_company_news_docx
-from epic_news.utils.docx_report.crews.cooking import assemble_cooking_docx
-from epic_news.utils.docx_report.crews.deep_research import assemble_deep_research_docx
-from epic_news.utils.docx_report.crews.fin_daily import assemble_fin_daily_docx
-from epic_news.utils.docx_report.crews.meeting_prep import assemble_meeting_prep_docx
-from epic_news.utils.docx_report.crews.menu import assemble_menu_docx
-from epic_news.utils.docx_report.crews.news_daily import assemble_news_daily_docx
-from epic_news.utils.docx_report.crews.osint import assemble_osint_docx
-from epic_news.utils.docx_report.crews.pestel import assemble_pestel_docx
-from epic_news.utils.docx_report.crews.rss_weekly import assemble_rss_docx
-from epic_news.utils.docx_report.crews.saint import assemble_saint_docx
-from epic_news.utils.docx_report.crews.sales_prospecting import assemble_sales_prospecting_docx
-from epic_news.utils.docx_report.crews.shopping import assemble_shopping_docx
 from epic_news.utils.docx_report.dispatch import emit_report
 from epic_news.utils.docx_report.format_selection import parse_output_format
+from epic_news.utils.docx_report.fragment_cache import disable_fragment_cache
+from epic_news.utils.email_outbox import email_outbox_enabled, get_email_outbox
 from epic_news.utils.email_sender import EmailDeliveryError, send_report_email
 from epic_news.utils.extractors.deep_research import DeepResearchExtractor
 from epic_news.utils.extractors.factory import ContentExtractorFactory
 from epic_news.utils.flow_enforcement import akickoff_flow, kickoff_flow
 from epic_news.utils.flow_helpers import load_or_parse_model, render_and_write_html
 from epic_news.utils.holiday_report import assemble_holiday_docx
+from epic_news.utils.html.report_css import prepare_email_html
+from epic_news.utils.html.report_writer import stream_report_html, write_report_stream
 from epic_news.utils.html.template_manager import TemplateManager
 from epic_news.utils.html.template_renderers.pestel_markdown import pestel_to_markdown
+from epic_news.utils.html.template_renderers.renderer_factory import RendererFactory
 from epic_news.utils.interrupt import install_force_quit_handler
+from epic_news.utils.lazy_import import lazy_import, resolve
 from epic_news.utils.logger import setup_logging
 from epic_news.utils.menu_generator import MenuGenerator
 from epic_news.utils.observability import get_observability_tools, trace_task
+from epic_news.utils.pdf_renderer import render_pdfs
+from epic_news.utils.profiling import enable_profiling, profile_run
+from epic_news.utils.progress import current_run_id, run_scope
+from epic_news.utils.progress import emit as emit_progress
 from epic_news.utils.report_utils import (
-    generate_rss_weekly_html_report,
-    load_rss_weekly_report,
     prepare_email_params,
+    write_rss_weekly_html_report,
 )
+from epic_news.utils.rss_articles import ArticleTable
 from epic_news.utils.rss_utils import fetch_articles_from_opml
+from epic_news.utils.search_cache import disable_search_cache
+from epic_news.utils.spans import span
 from epic_news.utils.string_utils import create_topic_slug
 
+# Crews and DOCX assemblers are resolved on first use: importing them eagerly pulled in
+# every crew's tools (Composio, MCP, custom tool packages) before a request was even read.
+# See epic_news.utils.lazy_import.
+ClassifyCrew = lazy_import("epic_news.crews.classify.classify_crew", "ClassifyCrew")
+CompanyProfilerCrew = lazy_import(
+    "epic_news.crews.company_profiler.company_profiler_crew", "CompanyProfilerCrew"
+)
+CookingCrew = lazy_import("epic_news.crews.cooking.cooking_crew", "CookingCrew")
+CrossReferenceReportCrew = lazy_import(
+    "epic_news.crews.cross_reference_report_crew.cross_reference_report_crew", "CrossReferenceReportCrew"
+)
+DeepResearchCrew = lazy_import("epic_news.crews.deep_research.deep_research", "DeepResearchCrew")
+GeospatialAnalysisCrew = lazy_import(
+    "epic_news.crews.geospatial_analysis.geospatial_analysis_crew", "GeospatialAnalysisCrew"
+)
+HolidayPlannerCrew = lazy_import("epic_news.crews.holiday_planner.holiday_planner_crew", "HolidayPlannerCrew")
+HRIntelligenceCrew = lazy_import("epic_news.crews.hr_intelligence.hr_intelligence_crew", "HRIntelligenceCrew")
+InformationExtractionCrew = lazy_import(
+    "epic_news.crews.information_extraction.information_extraction_crew", "InformationExtractionCrew"
+)
+LegalAnalysisCrew = lazy_import("epic_news.crews.legal_analysis.legal_analysis_crew", "LegalAnalysisCrew")
+MenuDesignerCrew = lazy_import("epic_news.crews.menu_designer.menu_designer", "MenuDesignerCrew")
+MenuDesignerService = lazy_import("epic_news.services.menu_designer_service", "MenuDesignerService")
+PestelCrew = lazy_import("epic_news.crews.pestel.pestel_crew", "PestelCrew")
+RssWeeklyCrew = lazy_import("epic_news.crews.rss_weekly.rss_weekly_crew", "RssWeeklyCrew")
+ShoppingAdvisorCrew = lazy_import("epic_news.crews.shopping_advisor.shopping_advisor", "ShoppingAdvisorCrew")
+TechStackCrew = lazy_import("epic_news.crews.tech_stack.tech_stack_crew", "TechStackCrew")
+WebPresenceCrew = lazy_import("epic_news.crews.web_presence.web_presence_crew", "WebPresenceCrew")
+assemble_cooking_docx = lazy_import("epic_news.utils.docx_report.crews.cooking", "assemble_cooking_docx")
+assemble_deep_research_docx = lazy_import(
+    "epic_news.utils.docx_report.crews.deep_research", "assemble_deep_research_docx"
+)
+assemble_menu_docx = lazy_import("epic_news.utils.docx_report.crews.menu", "assemble_menu_docx")
+assemble_osint_docx = lazy_import("epic_news.utils.docx_report.crews.osint", "assemble_osint_docx")
+assemble_pestel_docx = lazy_import("epic_news.utils.docx_report.crews.pestel", "assemble_pestel_docx")
+assemble_rss_docx = lazy_import("epic_news.utils.docx_report.crews.rss_weekly", "assemble_rss_docx")
+assemble_shopping_docx = lazy_import("epic_news.utils.docx_report.crews.shopping", "assemble_shopping_docx")
+
 # Import function explicitly to ensure availability during runtime
 
 # Suppress the specific Pydantic deprecation warnings globally
@@ -271,7 +277,7 @@ class ReceptionFlow(Flow[ContentState]):
         self.state.output_file = CLASSIFY_DECISION_FILE
 
         # Prepare input data for classification using the centralized method from ContentState.
-        inputs = self.state.to_crew_inputs()
+        inputs = self.state.to_crew_inputs().copy()
 
         # Instantiate and run the classification crew (kickoff-only)
         classify_crew = ClassifyCrew()
@@ -307,47 +313,61 @@ class ReceptionFlow(Flow[ContentState]):
         """
         Routes the flow to the appropriate crew handler based on classification.
 
-        This router inspects `self.state.selected_crew` (determined by the
-        `classify` step) and returns the name of the next flow step/method
-        to execute (e.g., 'go_generate_sales_prospecting_report').
-        If the crew type is not recognized, it defaults to 'go_unknown'.
+        Looks `self.state.selected_crew` (determined by the `classify` step) up in
+        the crew registry and returns the route label of its flow method
+        (e.g. 'go_generate_sales_prospecting_report').
+        If the crew type is not registered, it defaults to 'go_unknown'.
+        """
+        route = route_for(self.state.selected_crew)
+        if route == UNKNOWN_ROUTE:
+            self.logger.warning(f"⚠️ Unknown crew type: {self.state.selected_crew}. Routing to 'go_unknown'.")
+        else:
+            # In batch mode, wait until no other request is writing this crew's outputs.
+            claim_outputs(route)
+        return route
+
+    def _run_registered_crew(self, category: str) -> None:
+        """Run a crew through the standard pipeline declared in the crew registry.
+
+        kickoff → dump state → load the crew's JSON model (or parse the raw output) →
+        render the HTML report (or the DOCX on request) and point `state.output_file`
+        at it. See `epic_news.config.crew_registry`.
         """
-        if self.state.selected_crew == "HOLIDAY_PLANNER":
-            return "go_generate_holiday_plan"
-        if self.state.selected_crew == "MEETING_PREP":
-            return "go_generate_meeting_prep"
-        if self.state.selected_crew == "BOOK_SUMMARY":
-            return "go_generate_book_summary"
-        if self.state.selected_crew == "COOKING":
-            return "go_generate_recipe"
-        if self.state.selected_crew == "MENU":
-            return "go_generate_menu_designer"
-        if self.state.selected_crew == "SHOPPING":
-            return "go_generate_shopping_advice"
-        if self.state.selected_crew == "POEM":
-            return "go_generate_poem"
-        if self.state.selected_crew == "COMPANY_NEWS":
-            return "go_generate_news_company"
-        if self.state.selected_crew == "OPEN_SOURCE_INTELLIGENCE":
-            return "go_generate_osint"
-        if self.state.selected_crew == "RSS":
-            return "go_generate_rss_weekly"
-        if self.state.selected_crew == "FINDAILY":
-            return "go_generate_findaily"
-        if self.state.selected_crew == "NEWSDAILY":
-            return "go_generate_news_daily"
-        if self.state.selected_crew == "SAINT":
-            return "go_generate_saint_daily"
-        if self.state.selected_crew == "SALES_PROSPECTING":
-            return "go_generate_sales_prospecting_report"
-        if self.state.selected_crew == "DEEPRESEARCH":
-            return "go_generate_deep_research"
-        if self.state.selected_crew == "PESTEL":
-            return "go_generate_pestel"
-        # Fallback for unhandled or unknown crew types.
-        # Consider logging this event for monitoring.
-        self.logger.warning(f"⚠️ Unknown crew type: {self.state.selected_crew}. Routing to 'go_unknown'.")
-        return "go_unknown"
+        spec = CREW_REGISTRY[category]
+        if spec.track_json_output:
+            self.state.output_file = spec.json_path
+        inputs = self.state.to_crew_inputs().copy()
+        for enrich in spec.enrichers:
+            enrich(inputs)
+        inputs["output_file"] = spec.json_path
+        self.logger.info(f"🚀 Generating {spec.label} for: {inputs.get('topic', 'N/A')}")
+
+        output = kickoff_flow(spec.crew(), inputs)
+        dump_crewai_state(output, spec.dump_name)
+        if spec.output_attr:
+            setattr(self.state, spec.output_attr, output)
+
+        model = load_or_parse_model(spec.json_path, resolve(spec.model), output, inputs, spec.label)
+        if spec.model_attr:
+            setattr(self.state, spec.model_attr, model)
+
+        def _render_html() -> str:
+            return str(render_and_write_html(spec.template, model, spec.html_path))
+
+        if spec.docx_assembler is None:
+            self.state.output_file = _render_html()
+        else:
+            # emit_report points output_file at the rendered report (was the intermediate
+            # JSON) so the email attaches — and the UI displays — the report, not raw JSON.
+            emit_report(
+                self.state,
+                spec.template,
+                _render_html,
+                assemble_docx=lambda: spec.docx_assembler(
+                    model, self.state.to_crew_inputs(), spec.docx_output
+                ),
+            )
+        self.logger.info(f"✅ {spec.label.capitalize()} report generated → {self.state.output_file}")
 
     @listen("go_unknown")
     @trace_task(tracer)
@@ -371,54 +391,14 @@ class ReceptionFlow(Flow[ContentState]):
     @listen("go_generate_poem")
     @trace_task(tracer)
     def generate_poem(self):
-        """
-        Handles requests classified for the 'PoemCrew'.
-
-        Invokes the `PoemCrew` to generate a poem based on the provided topic.
-        Sets `output_file` to `output/poem/poem.html` and stores the generated
-        poem in `self.state.poem`.
-        """
-        self.state.output_file = "output/poem/poem.json"
-        inputs = self.state.to_crew_inputs()
-        self.logger.info(f"Generating poem about: {inputs.get('topic', 'N/A')}")
-
-        output = kickoff_flow(PoemCrew(), inputs)
-        dump_crewai_state(output, "POEM")
-
-        poem_model = load_or_parse_model(self.state.output_file, PoemJSONOutput, output, inputs, "poem")
-        html_file = "output/poem/poem.html"
-        render_and_write_html("POEM", poem_model, html_file)
-        self.state.output_file = html_file
+        """Handles requests classified for the 'PoemCrew' (standard registry pipeline)."""
+        self._run_registered_crew(CrewCategories.POEM)
 
     @listen("go_generate_news_company")
     @trace_task(tracer)
     def generate_news_company(self):
-        """
-        Handles requests classified for the 'CompanyNewsCrew'.
-        Invokes the `CompanyNewsCrew` to generate news content related to the given topic.
-        """
-        # Import function explicitly to ensure availability during runtime
-
-        self.state.output_file = "output/company_news/report.json"
-        crew_inputs = self.state.to_crew_inputs()
-        self.logger.info(f"Generating news about: {crew_inputs.get('topic', 'N/A')}")
-
-        output = kickoff_flow(CompanyNewsCrew(), crew_inputs)
-        dump_crewai_state(output, "NEWS_COMPANY")
-
-        news_model = load_or_parse_model(
-            self.state.output_file, CompanyNewsReport, output, crew_inputs, "company news"
-        )
-        html_file = "output/company_news/report.html"
-        emit_report(
-            self.state,
-            "COMPANY_NEWS",
-            lambda: str(render_and_write_html("COMPANY_NEWS", news_model, html_file)),
-            assemble_docx=lambda: assemble_company_news_docx(
-                news_model, self.state.to_crew_inputs(), str(Path(html_file).with_suffix(".docx"))
-            ),
-        )
-        self.state.company_news_report = output
+        """Handles requests classified for the 'CompanyNewsCrew' (standard registry pipeline)."""
+        self._run_registered_crew(CrewCategories.COMPANY_NEWS)
 
     @listen("go_generate_rss_weekly")
     @trace_task(tracer)
@@ -443,6 +423,13 @@ class ReceptionFlow(Flow[ContentState]):
         # Step 1: Fetch articles from OPML
         self.logger.info("Step 1: Fetching articles...")
         await fetch_articles_from_opml(opml_file_path=opml_path, output_file_path=str(raw_report_path))
+        fetched: ArticleTable | None
+        try:
+            fetched = ArticleTable.load(raw_report_path)
+            self.logger.info(f"Fetched {len(fetched)} articles from {len(fetched.feed_urls)} feeds")
+        except (OSError, ValueError) as e:
+            self.logger.warning(f"⚠️ Could not read fetched articles from {raw_report_path}: {e}")
+            fetched = None
 
         # Step 2: Translate articles using the refactored crew
         self.logger.info("Step 2: Translating articles...")
@@ -482,36 +469,14 @@ class ReceptionFlow(Flow[ContentState]):
                 # Normal case - the output is already JSON
                 translated_data = json.loads(raw_output)
 
-            # Post-process the data to match the expected RssFeeds model structure
-            # If the data only has 'articles' but no 'rss_feeds', transform it
-            if "articles" in translated_data and "rss_feeds" not in translated_data:
-                # Create a wrapper with the expected structure
-                processed_data = {
-                    "rss_feeds": [
-                        {
-                            "feed_url": "translated_feed",  # Placeholder feed URL
-                            "articles": [],
-                        }
-                    ]
-                }
-
-                # Add link and published fields if they don't exist
-                for article in translated_data["articles"]:
-                    if "link" not in article:
-                        article["link"] = ""  # Add empty link if missing
-                    if "published" not in article:
-                        article["published"] = ""  # Add empty published date if missing
-
-                # Add the articles to the feed
-                processed_data["rss_feeds"][0]["articles"] = translated_data["articles"]
-
-                # Replace the translated data with the processed data
-                translated_data = processed_data
-
-            with open(translated_report_path, "w", encoding="utf-8") as f:
-                json.dump(translated_data, f, ensure_ascii=False, indent=2)
+            # Any shape the translator returns goes into one article table; the links,
+            # dates and feeds it dropped are taken back from the fetched articles.
+            translated = ArticleTable.from_payload(translated_data)
+            if fetched is not None:
+                translated.fill_from(fetched)
+            translated.save(translated_report_path)
             self.logger.info("✅ Successfully saved translated report.")
-        except (json.JSONDecodeError, TypeError) as e:
+        except (json.JSONDecodeError, TypeError, ValueError) as e:
             self.logger.error(f"❌ Failed to decode or save translated JSON from crew result: {e}")
             # If we can't save the file, there's no point in continuing.
             return
@@ -520,19 +485,18 @@ class ReceptionFlow(Flow[ContentState]):
         self.logger.info("Step 3: Generating report...")
 
         def _render_rss_html() -> str:
-            generate_rss_weekly_html_report(
-                json_file_path=str(translated_report_path),
-                output_html_path=str(html_report_path),
-            )
+            write_rss_weekly_html_report(report_model, str(html_report_path))
             return str(html_report_path)
 
         try:
+            # The report model is built once, for the HTML and the DOCX alike
+            report_model = translated.to_report()
             emit_report(
                 self.state,
                 "RSS",
                 _render_rss_html,
                 assemble_docx=lambda: assemble_rss_docx(
-                    load_rss_weekly_report(str(translated_report_path)),
+                    report_model,
                     self.state.to_crew_inputs(),
                     "output/rss_weekly/report.docx",
                 ),
@@ -550,126 +514,20 @@ class ReceptionFlow(Flow[ContentState]):
     @listen("go_generate_findaily")
     @trace_task(tracer)
     def generate_findaily(self):
-        """
-        Handles requests classified for the 'FinDailyCrew'.
-
-        Invokes the `FinDailyCrew` to generate a daily financial analysis report
-        including stock portfolio analysis, crypto portfolio analysis, and new
-        investment suggestions. Sets `output_file` to `output/findaily/report.html`
-        and stores the report in `self.state.fin_daily_report`.
-        """
-
-        self.logger.info("💰 Generating daily financial analysis report...")
-
-        # Prepare inputs for the crew
-        inputs = self.state.to_crew_inputs()
-        stock_csv_file = "data/stock.csv"
-        etf_csv_file = "data/etf.csv"
-        inputs["stock_csv_path"] = os.path.abspath(stock_csv_file)
-        inputs["etf_csv_path"] = os.path.abspath(etf_csv_file)
-        inputs["current_date"] = datetime.datetime.now().strftime("%Y-%m-%d")
-        self.state.output_file = "output/findaily/report.json"
-        inputs["output_file"] = self.state.output_file
-
-        # Kickoff-only orchestration
-        output = kickoff_flow(FinDailyCrew(), inputs)
-        dump_crewai_state(output, "FIN_DAILY")
-        self.state.fin_daily_report = output
-
-        financial_report_model = load_or_parse_model(
-            self.state.output_file, FinancialReport, output, inputs, "financial report"
-        )
-        emit_report(
-            self.state,
-            "FINDAILY",
-            lambda: str(
-                render_and_write_html("FINDAILY", financial_report_model, "output/findaily/report.html")
-            ),
-            assemble_docx=lambda: assemble_fin_daily_docx(
-                financial_report_model, self.state.to_crew_inputs(), "output/findaily/report.docx"
-            ),
-        )
-        self.logger.info(f"✅ Financial report generated → {self.state.output_file}")
+        """Handles requests classified for the 'FinDailyCrew' (standard registry pipeline)."""
+        self._run_registered_crew(CrewCategories.FINDAILY)
 
     @listen("go_generate_news_daily")
     @trace_task(tracer)
     def generate_news_daily(self):
-        """
-        Handles requests classified for the 'NewsDailyCrew'.
-
-        Invokes the `NewsDailyCrew` to generate a daily news report in French
-        covering top 10 news items for Suisse Romande, Suisse, France, Europe,
-        World, Wars, and Economy. Sets `output_file` to `output/news_daily/final_report.html`
-        and stores the report in `self.state.news_daily_report`.
-        """
-        # Persisted JSON for deterministic parsing
-        self.state.output_file = "output/news_daily/news_data.json"
-        self.logger.info("📰 Generating daily news report in French...")
-
-        # Prepare inputs for the crew
-        inputs = self.state.to_crew_inputs()
-        inputs["current_date"] = datetime.datetime.now().strftime("%Y-%m-%d")
-        inputs["report_language"] = "French"
-        inputs["output_file"] = self.state.output_file
-
-        # Kickoff-only orchestration
-        output = kickoff_flow(NewsDailyCrew(), inputs)
-        self.state.news_daily_report = output
-        dump_crewai_state(output, "NEWSDAILY")
-
-        news_daily_model = load_or_parse_model(
-            self.state.output_file, NewsDailyReport, output, inputs, "news daily"
-        )
-        # emit_report points output_file at the rendered report (was the intermediate
-        # JSON) so the email attaches — and the UI displays — the report, not raw JSON.
-        emit_report(
-            self.state,
-            "NEWSDAILY",
-            lambda: str(
-                render_and_write_html("NEWSDAILY", news_daily_model, "output/news_daily/final_report.html")
-            ),
-            assemble_docx=lambda: assemble_news_daily_docx(
-                news_daily_model, self.state.to_crew_inputs(), "output/news_daily/report.docx"
-            ),
-        )
-        self.state.news_daily_model = news_daily_model
-        self.logger.info(f"✅ News content generated → {self.state.output_file}")
+        """Handles requests classified for the 'NewsDailyCrew' (standard registry pipeline)."""
+        self._run_registered_crew(CrewCategories.NEWSDAILY)
 
     @listen("go_generate_saint_daily")
     @trace_task(tracer)
     def generate_saint_daily(self):
-        """
-        Handles requests classified for the 'SaintDailyCrew'.
-
-        Invokes the `SaintDailyCrew` to generate a daily saint report in French
-        covering the saint of the day in Switzerland, including biography,
-        significance, and connection to Swiss Catholic traditions.
-        Sets `output_file` to `output/saint_daily/report.html`
-        and stores the report in `self.state.saint_daily_report`.
-        """
-        self.state.output_file = "output/saint_daily/report.json"
-        self.logger.info("⛪ Generating daily saint report in French...")
-
-        # Prepare inputs for the crew
-        inputs = self.state.to_crew_inputs()
-
-        # Kick off the crew (kickoff-only orchestration)
-        output = kickoff_flow(SaintDailyCrew(), inputs)
-        dump_crewai_state(output, "SAINT_DAILY")
-        self.state.saint_daily_report = output
-
-        saint_model = load_or_parse_model(self.state.output_file, SaintData, output, inputs, "saint daily")
-        self.state.saint_daily_model = saint_model
-        html_file = "output/saint_daily/report.html"
-        emit_report(
-            self.state,
-            "SAINT",
-            lambda: str(render_and_write_html("SAINT", saint_model, html_file)),
-            assemble_docx=lambda: assemble_saint_docx(
-                saint_model, self.state.to_crew_inputs(), str(Path(html_file).with_suffix(".docx"))
-            ),
-        )
-        self.logger.info(f"✅ Saint content generated → {self.state.output_file}")
+        """Handles requests classified for the 'SaintDailyCrew' (standard registry pipeline)."""
+        self._run_registered_crew(CrewCategories.SAINT)
 
     @listen("go_generate_recipe")
     @trace_task(tracer)
@@ -685,7 +543,7 @@ class ReceptionFlow(Flow[ContentState]):
 
         # Get crew inputs - to_crew_inputs() already handles mapping extracted_info fields
         # main_subject_or_activity → topic and user_preferences_and_constraints → special_needs
-        crew_inputs = self.state.to_crew_inputs()
+        crew_inputs = self.state.to_crew_inputs().copy()
 
         # CRITICAL: Update topic_slug after crew_inputs mapping is applied
         # This ensures topic_slug reflects the mapped topic value from main_subject_or_activity
@@ -751,7 +609,7 @@ class ReceptionFlow(Flow[ContentState]):
         menu_generator = MenuGenerator()
 
         # Extract user preferences from state using to_crew_inputs
-        crew_inputs = self.state.to_crew_inputs()
+        crew_inputs = self.state.to_crew_inputs().copy()
         output_dir = "output/menu_designer"
 
         # Use MenuDesignerService with validation
@@ -886,36 +744,8 @@ class ReceptionFlow(Flow[ContentState]):
     @listen("go_generate_book_summary")
     @trace_task(tracer)
     def generate_book_summary(self):
-        """
-        Handles requests classified for the 'LibraryCrew'.
-
-        Invokes the `LibraryCrew` to generate a book summary. Sets the main output
-        to `output/library/book_summary.json`. The summary is stored in
-        `self.state.book_summary`.
-        """
-
-        inputs = self.state.to_crew_inputs()
-        inputs["output_file"] = "output/library/book_summary.json"
-        self.logger.info(f"Generating book summary for: {inputs.get('topic', 'N/A')}")
-
-        output = kickoff_flow(LibraryCrew(), inputs)
-        dump_crewai_state(output, "BOOK_SUMMARY")
-        self.state.book_summary = output
-
-        book_summary_model = load_or_parse_model(
-            inputs["output_file"], BookSummaryReport, output, inputs, "book summary"
-        )
-        html_file = "output/library/book_summary.html"
-        # emit_report records the rendered report path in state.output_file so the
-        # Streamlit UI / API (app.py reads flow.state.output_file) can locate it.
-        emit_report(
-            self.state,
-            "BOOK_SUMMARY",
-            lambda: str(render_and_write_html("BOOK_SUMMARY", book_summary_model, html_file)),
-            assemble_docx=lambda: assemble_book_summary_docx(
-                book_summary_model, self.state.to_crew_inputs(), str(Path(html_file).with_suffix(".docx"))
-            ),
-        )
+        """Handles requests classified for the 'LibraryCrew' (standard registry pipeline)."""
+        self._run_registered_crew(CrewCategories.BOOK_SUMMARY)
 
     @listen("go_generate_shopping_advice")
     @trace_task(tracer)
@@ -932,7 +762,7 @@ class ReceptionFlow(Flow[ContentState]):
         self.logger.info(f"🛒 Generating shopping advice for: {self.state.user_request}")
 
         # Prepare inputs for ShoppingAdvisorCrew
-        crew_inputs = self.state.to_crew_inputs()
+        crew_inputs = self.state.to_crew_inputs().copy()
         crew_inputs["output_file"] = "output/shopping_advisor/shopping_advice.json"
 
         # Generate structured shopping advice data (kickoff-only)
@@ -976,86 +806,14 @@ class ReceptionFlow(Flow[ContentState]):
     @listen("go_generate_meeting_prep")
     @trace_task(tracer)
     def generate_meeting_prep(self):
-        """
-        Handles requests classified for the 'MeetingPrepCrew'.
-
-        Invokes `MeetingPrepCrew` to generate meeting preparation materials.
-        It expects a 'company' name in the inputs, falling back to 'topic' if
-        'company' is not available.
-        """
-        # No need to create directories as ensure_output_directories() is called at init
-
-        # Prepare inputs and handle company fallback
-        current_inputs = self.state.to_crew_inputs()
-        company = current_inputs.get("company")
-        if not company:
-            company = current_inputs.get("topic")  # Fallback to topic if company is not specified
-            current_inputs["company"] = company  # Ensure 'company' key is in inputs for the crew
-            self.logger.warning(f"⚠️ No company specified for meeting prep, using topic as company: {company}")
-
-        self.logger.info(f"Generating meeting prep for company: {company or 'N/A'}")
-
-        current_inputs["output_file"] = "output/meeting/meeting_preparation.json"
-        output = kickoff_flow(MeetingPrepCrew(), current_inputs)
-        dump_crewai_state(output, "MEETING_PREP")
-
-        meeting_model = load_or_parse_model(
-            current_inputs["output_file"], MeetingPrepReport, output, current_inputs, "meeting prep"
-        )
-        self.state.meeting_prep_report = meeting_model
-        html_file = "output/meeting/meeting_preparation.html"
-        emit_report(
-            self.state,
-            "MEETING_PREP",
-            lambda: str(render_and_write_html("MEETING_PREP", meeting_model, html_file)),
-            assemble_docx=lambda: assemble_meeting_prep_docx(
-                meeting_model, self.state.to_crew_inputs(), str(Path(html_file).with_suffix(".docx"))
-            ),
-        )
+        """Handles requests classified for the 'MeetingPrepCrew' (standard registry pipeline)."""
+        self._run_registered_crew(CrewCategories.MEETING_PREP)
 
     @listen("go_generate_sales_prospecting_report")
     @trace_task(tracer)
     def generate_sales_prospecting_report(self):
-        """
-        Handles requests classified for the 'SalesProspectingCrew'.
-
-        Invokes the `SalesProspectingCrew` to generate a sales prospecting report,
-        including contact information and an approach strategy. Sets `output_file`
-        to `output/sales_prospecting/report.html` and stores the report
-        in `self.state.contact_info_report`.
-        """
-        self.state.output_file = "output/sales_prospecting/report.json"
-        company = self.state.to_crew_inputs().get("target_company")  # Expects 'target_company' from inputs
-        our_product = self.state.to_crew_inputs().get(
-            "our_product", "our product/service"
-        )  # Default if not specified
-        self.logger.info(
-            f"Generating sales prospecting report for: {company or 'N/A'} regarding {our_product}"
-        )
-
-        # Kickoff-only orchestration with JSON-first parsing
-        inputs = self.state.to_crew_inputs()
-        self.state.output_file = "output/sales_prospecting/report.json"
-        inputs["output_file"] = self.state.output_file
-        output = kickoff_flow(SalesProspectingCrew(), inputs)
-        dump_crewai_state(output, "SALES_PROSPECTING")
-
-        report_model = load_or_parse_model(
-            self.state.output_file, SalesProspectingReport, output, inputs, "sales prospecting"
-        )
-        emit_report(
-            self.state,
-            "SALES_PROSPECTING",
-            lambda: str(
-                render_and_write_html(
-                    "SALES_PROSPECTING", report_model, "output/sales_prospecting/report.html"
-                )
-            ),
-            assemble_docx=lambda: assemble_sales_prospecting_docx(
-                report_model, self.state.to_crew_inputs(), "output/sales_prospecting/report.docx"
-            ),
-        )
-        self.logger.info(f"✅ Sales prospecting report generated → {self.state.output_file}")
+        """Handles requests classified for the 'SalesProspectingCrew' (standard registry pipeline)."""
+        self._run_registered_crew(CrewCategories.SALES_PROSPECTING)
 
     @listen("go_generate_deep_research")
     @trace_task(tracer)
@@ -1075,7 +833,7 @@ class ReceptionFlow(Flow[ContentState]):
         self.logger.info(f"🔍 Generating deep research report for: {topic}")
 
         # Prepare inputs for the crew
-        inputs = self.state.to_crew_inputs()
+        inputs = self.state.to_crew_inputs().copy()
         inputs["current_date"] = datetime.datetime.now().strftime("%Y-%m-%d")
         inputs["output_file"] = output_file
 
@@ -1116,14 +874,8 @@ class ReceptionFlow(Flow[ContentState]):
             }
             # Extract structured content using ContentExtractorFactory
             extracted_content = ContentExtractorFactory.extract_content(state_data, "DEEPRESEARCH")
-            # Render via TemplateManager (extracted_content is a dict, not a Pydantic model)
-            template_manager = TemplateManager()
-            html_content = template_manager.render_report(
-                selected_crew="DEEPRESEARCH", content_data=extracted_content
-            )
-            html_out = Path(html_file)
-            html_out.parent.mkdir(parents=True, exist_ok=True)
-            html_out.write_text(html_content, encoding="utf-8")
+            # Stream via TemplateManager (extracted_content is a dict, not a Pydantic model)
+            stream_report_html("DEEPRESEARCH", extracted_content, html_file)
             return html_file
 
         emit_report(
@@ -1148,7 +900,7 @@ class ReceptionFlow(Flow[ContentState]):
         kept as a human-readable fallback.
         """
         self.state.output_file = "output/pestel/report.json"
-        inputs = self.state.to_crew_inputs()
+        inputs = self.state.to_crew_inputs().copy()
         info = self.state.extracted_info
         if info is not None:
             entity = info.target_company or info.destination_location
@@ -1309,6 +1061,9 @@ class ReceptionFlow(Flow[ContentState]):
             ),
         ]
 
+        # Data key -> (validated model dump, rendered body), kept for the consolidated report
+        sections: dict[str, tuple[dict[str, Any], str]] = {}
+
         # Create async tasks for all 6 crews
         async def run_crew(
             crew_name: str,
@@ -1336,11 +1091,11 @@ class ReceptionFlow(Flow[ContentState]):
             except Exception:
                 model = parse_crewai_output(output, model_class, crew_inputs)
 
-            html_content = template_manager.render_report(
-                selected_crew=template_id, content_data=model.model_dump()
-            )
-            with open(html_file, "w", encoding="utf-8") as f:
-                f.write(html_content)
+            content = model.model_dump()
+            body = template_manager.generate_contextual_body(content, template_id)
+            head, tail = template_manager.render_frame(template_id, content)
+            write_report_stream(head, [body], tail, html_file)
+            sections[crew_name] = (content, body)
 
             self.logger.info(f"✅ {crew_name} completed and HTML written to {html_file}")
             return (state_attr, output)
@@ -1366,13 +1121,22 @@ class ReceptionFlow(Flow[ContentState]):
 
         # Now run cross-reference report sequentially (depends on all parallel crews)
         self.logger.info("🔗 Running cross-reference report...")
-        await self._run_cross_reference_report(inputs, template_manager)
+        await self._run_cross_reference_report(inputs, template_manager, sections)
+
+        # All eight HTML reports are final now; convert them at once on the warm workers.
+        await render_pdfs(
+            [html_f for _, _, html_f, *_ in parallel_crews]
+            + ["output/osint/global_report.html", "output/osint/consolidated_report.html"]
+        )
 
         total_elapsed = time.perf_counter() - start_time
         self.logger.info(f"✅ Full OSINT pipeline completed in {total_elapsed:.2f}s")
 
     async def _run_cross_reference_report(
-        self, inputs: dict[str, Any], template_manager: TemplateManager
+        self,
+        inputs: dict[str, Any],
+        template_manager: TemplateManager,
+        sections: dict[str, tuple[dict[str, Any], str]],
     ) -> None:
         """Run cross-reference report after all parallel crews complete."""
         json_file = "output/osint/global_report.json"
@@ -1398,59 +1162,38 @@ class ReceptionFlow(Flow[ContentState]):
         except Exception:
             report_model = parse_crewai_output(output, CrossReferenceReport, crew_inputs)
 
-        html_content = template_manager.render_report(
-            selected_crew="CROSS_REFERENCE_REPORT",
-            content_data=report_model.model_dump(),
-        )
-        with open(html_file, "w", encoding="utf-8") as f:
-            f.write(html_content)
+        content = report_model.model_dump()
+        body = template_manager.generate_contextual_body(content, "CROSS_REFERENCE_REPORT")
+        head, tail = template_manager.render_frame("CROSS_REFERENCE_REPORT", content)
+        write_report_stream(head, [body], tail, html_file)
+        sections["cross_reference"] = (content, body)
 
         self.logger.info(f"✅ Cross reference report generated: {html_file}")
 
-        # Generate consolidated global OSINT report from all individual JSON files
-        self._generate_osint_consolidated_report(company)
+        # Assemble the consolidated global OSINT report from the sections of this run
+        self._generate_osint_consolidated_report(company, sections, template_manager)
 
-    def _generate_osint_consolidated_report(self, company_name: str | None) -> None:
-        """Generate a consolidated OSINT report from all individual JSON files."""
-        osint_dir = Path("output/osint")
-        consolidated_html = osint_dir / "consolidated_report.html"
-
-        # Load all individual OSINT JSON files
-        osint_data: dict[str, Any] = {"company_name": company_name or "Unknown"}
-
-        json_mappings = [
-            ("company_profile.json", "company_profile", CompanyProfileReport),
-            ("tech_stack.json", "tech_stack", TechStackReport),
-            ("web_presence.json", "web_presence", WebPresenceReport),
-            ("hr_intelligence.json", "hr_intelligence", HRIntelligenceReport),
-            ("legal_analysis.json", "legal_analysis", LegalAnalysisReport),
-            ("geospatial_analysis.json", "geospatial_analysis", GeospatialAnalysisReport),
-            ("global_report.json", "cross_reference", CrossReferenceReport),
-        ]
+    def _generate_osint_consolidated_report(
+        self,
+        company_name: str | None,
+        sections: dict[str, tuple[dict[str, Any], str]],
+        template_manager: TemplateManager,
+    ) -> None:
+        """Assemble the consolidated OSINT report from the sub-reports of this run.
 
-        for json_file, data_key, model_class in json_mappings:
-            json_path = osint_dir / json_file
-            if json_path.exists():
-                try:
-                    with open(json_path, encoding="utf-8") as f:
-                        data = json.load(f)
-                    validated_data = model_class.model_validate(data)  # type: ignore[attr-defined]
-                    osint_data[data_key] = validated_data.model_dump()
-                    self.logger.debug(f"✅ Loaded {json_file} for consolidated report")
-                except Exception as e:
-                    self.logger.warning(f"⚠️ Could not load {json_file}: {e}")
-            else:
-                self.logger.debug(f"📄 {json_file} not found, skipping")
+        Each section reuses the model validated and the body rendered for its own page:
+        nothing is read back from disk, validated again or rendered twice. A crew that
+        failed in this run has no section.
+        """
+        consolidated_html = Path("output/osint") / "consolidated_report.html"
 
-        # Render consolidated report
-        template_manager = TemplateManager()
-        html_content = template_manager.render_report(
-            selected_crew="OSINT_GLOBAL",
-            content_data=osint_data,
-        )
+        osint_data: dict[str, Any] = {"company_name": company_name or "Unknown"}
+        osint_data.update({data_key: content for data_key, (content, _) in sections.items()})
+        bodies = {data_key: body for data_key, (_, body) in sections.items()}
 
-        with open(consolidated_html, "w", encoding="utf-8") as f:
-            f.write(html_content)
+        body = RendererFactory.create_renderer("OSINT_GLOBAL").render(osint_data, rendered_sections=bodies)
+        head, tail = template_manager.render_frame("OSINT_GLOBAL", osint_data)
+        write_report_stream(head, [body], tail, consolidated_html)
 
         self.logger.info(f"✅ Consolidated OSINT report generated: {consolidated_html}")
 
@@ -1467,7 +1210,7 @@ class ReceptionFlow(Flow[ContentState]):
         `output_file` to `output/holiday/itinerary.docx` and stores the crew
         result in `self.state.holiday_plan`.
         """
-        current_inputs = self.state.to_crew_inputs()
+        current_inputs = self.state.to_crew_inputs().copy()
         current_inputs["output_file"] = "output/holiday/itinerary.json"
 
         if not current_inputs.get("destination"):
@@ -1504,26 +1247,7 @@ class ReceptionFlow(Flow[ContentState]):
         self.state.holiday_plan = crew_result
         return "generate_holiday_plan"
 
-    @listen(
-        or_(
-            "generate_poem",
-            "generate_news_company",
-            "generate_recipe",
-            "generate_book_summary",
-            "generate_shopping_advice",
-            "generate_meeting_prep",
-            "generate_sales_prospecting_report",
-            "generate_osint",
-            "generate_holiday_plan",
-            "generate_rss_weekly",
-            "generate_findaily",
-            "generate_news_daily",
-            "generate_saint_daily",
-            "generate_menu_designer",
-            "generate_pestel",
-            "generate_deep_research",
-        )
-    )
+    @listen(or_(*report_methods()))
     @trace_task(tracer)
     def send_email(self):
         """
@@ -1591,7 +1315,9 @@ class ReceptionFlow(Flow[ContentState]):
             body_file = email_inputs.get("output_file")
             if body_file:
                 try:
-                    html_body = Path(body_file).read_text(encoding="utf-8")
+                    html_body = prepare_email_html(
+                        Path(body_file).read_text(encoding="utf-8"), Path(body_file).parent
+                    )
                 except OSError as e:
                     self.logger.error("❌ Cannot read report {} for email body: {}", body_file, e)
                     self.state.email_sent = False
@@ -1609,6 +1335,24 @@ class ReceptionFlow(Flow[ContentState]):
                 # report is attached.
                 html_body = email_inputs.get("body", "")
 
+            if email_outbox_enabled():
+                # Gmail latency and transient failures belong to the background sender:
+                # queue the email durably and let the flow finish.
+                try:
+                    entry = get_email_outbox().enqueue(
+                        recipient=email_inputs["recipient_email"],
+                        subject=email_inputs["subject"],
+                        html_body=html_body,
+                        attachment_path=email_inputs.get("attachment_path"),
+                        run_id=current_run_id(),
+                    )
+                except EmailDeliveryError as e:
+                    self.logger.error("❌ Email NOT queued: {}", e)
+                else:
+                    self.state.email_outbox_key = entry.key
+                    self.state.email_sent = entry.status == "sent"
+                return "send_email"
+
             try:
                 send_report_email(
                     recipient=email_inputs["recipient_email"],
@@ -1629,7 +1373,7 @@ class ReceptionFlow(Flow[ContentState]):
         return "send_email"  # Implicitly returns method name
 
 
-def kickoff(user_input: str | None = None):
+def kickoff(user_input: str | None = None, run_id: str | None = None, profile: bool = False):
     """
     Initializes and runs the ReceptionFlow.
 
@@ -1638,6 +1382,21 @@ def kickoff(user_input: str | None = None):
     invokes its `run()` method to start the sequence of tasks.
     It can optionally take a user_input string to override the default.
 
+    The run is bound to ``run_id`` (generated when omitted) on the progress bus, so
+    the API's SSE endpoint and the Streamlit UI can follow it live.
+
+    ``profile=True``, ``kickoff --profile`` or ``EPIC_PROFILE=1`` samples every step and
+    crew kickoff and writes flamegraphs under ``traces/<run_id>/`` (see
+    `epic_news.utils.profiling`).
+
+    ``kickoff --no-fragment-cache`` (or ``EPIC_FRAGMENT_CACHE=false``) re-narrates every
+    DOCX section instead of reusing unchanged ones (see
+    `epic_news.utils.docx_report.fragment_cache`).
+
+    ``kickoff --no-search-cache`` (or ``EPIC_SEARCH_CACHE=false``) sends every web search
+    to its provider instead of reusing results for close queries answered recently (see
+    `epic_news.utils.search_cache`).
+
     Returns:
         None. The flow runs for its side effects; the console entry point runs
         ``sys.exit(kickoff())``, which needs None/int — not the flow object.
@@ -1646,6 +1405,12 @@ def kickoff(user_input: str | None = None):
     # A single Ctrl+C cannot stop a flow method: CrewAI runs it in a worker thread that
     # keeps calling the provider and writing report files. Second Ctrl+C exits for real.
     install_force_quit_handler()
+    if profile or "--profile" in sys.argv[1:]:
+        enable_profiling()
+    if "--no-fragment-cache" in sys.argv[1:]:
+        disable_fragment_cache()
+    if "--no-search-cache" in sys.argv[1:]:
+        disable_search_cache()
     # Sweep/automation hook: let EPIC_NEWS_REQUEST drive the request without
     # editing the hardcoded query below. An explicit user_input arg still wins.
     # Log loudly when it fires (after setup_logging, so it lands in the configured
@@ -1688,21 +1453,92 @@ def kickoff(user_input: str | None = None):
         #
     )
 
-    reception_flow = ReceptionFlow(user_request=request)
-    try:
-        reception_flow.kickoff()
-    except Exception:
-        # Without this, an unhandled flow exception exits with a bare status 1:
-        # loguru never captures it and `crewai flow kickoff` swallows the subprocess
-        # stderr, so the real traceback is written nowhere. Log it, then re-raise.
-        logger.exception("❌ Flow kickoff failed — full traceback follows")
-        raise
+    run_flow(request, run_id)
     # The console entry runs `sys.exit(kickoff())`; sys.exit() treats a non-None,
     # non-int arg as an error message (prints its repr, exits 1). Returning the
     # flow object made every successful run exit 1. Return None so success exits 0.
     return
 
 
+def run_flow(request: str, run_id: str | None = None) -> ReceptionFlow:
+    """Run one request through a fresh ReceptionFlow bound to ``run_id``; return the flow.
+
+    Shared by `kickoff` and `batch`: process set-up (logging, signal handling) is the
+    caller's job, so a batch pays it once. Blob stores of runs older than
+    ``EPIC_BLOB_MAX_AGE_DAYS`` are removed first.
+    """
+    prune_runs()
+    reception_flow = ReceptionFlow(user_request=request)
+    with (
+        run_scope(run_id, user_request=request),
+        span("flow:reception", "flow", run_id=current_run_id()),
+        profile_run(),
+    ):
+        try:
+            reception_flow.kickoff()
+        except Exception:
+            # Without this, an unhandled flow exception exits with a bare status 1:
+            # loguru never captures it and `crewai flow kickoff` swallows the subprocess
+            # stderr, so the real traceback is written nowhere. Log it, then re-raise.
+            logger.exception("❌ Flow kickoff failed — full traceback follows")
+            raise
+        emit_progress(
+            "report_ready",
+            selected_crew=reception_flow.state.selected_crew,
+            output_file=reception_flow.state.output_file,
+        )
+    return reception_flow
+
+
+def batch(argv: list[str] | None = None) -> int:
+    """
+    Runs every request of a file through ReceptionFlow in this one process.
+
+    Console entry point: ``kickoff-batch REQUESTS_FILE [--concurrency N] [--output-dir DIR]``.
+    Identical requests run once, at most N requests (``EPIC_BATCH_CONCURRENCY``, default 4)
+    run at a time, and a ``summary.json`` with per-request status and timing is written
+    under ``output/batch/<batch id>/``. See `epic_news.batch`.
+
+    Returns:
+        0 when every request succeeded, 1 otherwise.
+    """
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        prog="kickoff-batch", description="Run a file of requests in one process."
+    )
+    parser.add_argument("requests_file", help="one request per line, or JSON lines with a 'request' key")
+    parser.add_argument("--concurrency", type=int, default=None, help="requests run at once")
+    parser.add_argument("--output-dir", default="output/batch", help="where the batch summary is written")
+    parser.add_argument("--profile", action="store_true", help="write per-step flamegraphs to traces/")
+    parser.add_argument(
+        "--no-fragment-cache", action="store_true", help="re-narrate every DOCX section, ignoring the cache"
+    )
+    parser.add_argument(
+        "--no-search-cache",
+        action="store_true",
+        help="send every web search to its provider, ignoring the cache",
+    )
+    args = parser.parse_args(sys.argv[1:] if argv is None else argv)
+
+    setup_logging()
+    install_force_quit_handler()
+    if args.profile:
+        enable_profiling()
+    if args.no_fragment_cache:
+        disable_fragment_cache()
+    if args.no_search_cache:
+        disable_search_cache()
+    summary = run_batch(
+        read_requests(args.requests_file),
+        runner=run_flow,
+        concurrency=args.concurrency,
+        output_dir=args.output_dir,
+    )
+    failed = sum(n for status, n in summary["counts"].items() if status not in {"ok", "duplicate"})
+    return 1 if failed else 0
+
+
 def plot(output_path: str = "flow.png"):
     """
     Generates a visual plot of the `ReceptionFlow`.
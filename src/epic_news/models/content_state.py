@@ -4,12 +4,14 @@ This module defines the ContentState class which stores all state information
 for the application during execution.
 """
 
+import copy
 import datetime
 import os
-from typing import Any, Optional
+from types import MappingProxyType
+from typing import Any
 
 from loguru import logger
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 
 from epic_news.models.crews.book_summary_report import BookSummaryReport
 from epic_news.models.crews.company_news_report import CompanyNewsReport
@@ -33,6 +35,7 @@ from epic_news.models.crews.shopping_advice_report import ShoppingAdviceOutput
 from epic_news.models.crews.tech_stack_report import TechStackReport
 from epic_news.models.crews.web_presence_report import WebPresenceReport
 from epic_news.models.extracted_info import ExtractedInfo
+from epic_news.utils.blob_store import Spilled, SpilledAny, resolve, spill
 from epic_news.utils.menu_generator import MenuGenerator
 from epic_news.utils.string_utils import create_topic_slug
 
@@ -43,6 +46,46 @@ from epic_news.utils.string_utils import create_topic_slug
 # constrain the model, so the cap is enforced deterministically in code instead.
 MAX_FREETEXT_CHARS = 1500
 
+# Crew result fields whose large values are spilled to the run's blob store on
+# assignment, leaving a BlobRef in the state (see epic_news.utils.blob_store).
+SPILLABLE_FIELDS = frozenset(
+    {
+        "company_profile",
+        "tech_stack",
+        "tech_stack_report",
+        "contact_info_report",
+        "lead_score_report",
+        "geospatial_analysis",
+        "osint_report",
+        "hr_intelligence_report",
+        "legal_analysis_report",
+        "web_presence_report",
+        "cross_reference_report",
+        "pestel_report",
+        "news_report",
+        "company_news_report",
+        "deep_research_report",
+        "rss_weekly_report",
+        "fin_daily_report",
+        "news_daily_report",
+        "saint_daily_report",
+        "post_report",
+        "location_report",
+        "holiday_plan",
+        "recipe",
+        "menu_designer_report",
+        "menu_plan",
+        "book_summary",
+        "shopping_advice_report",
+        "shopping_advice_model",
+        "poem",
+        "meeting_prep_report",
+        "financial_report_model",
+        "news_daily_model",
+        "saint_daily_model",
+    }
+)
+
 
 # Constants for crew categories
 class CrewCategories:
@@ -92,6 +135,55 @@ DEFAULT_PARTICIPANTS = [
 MENU_REPORT_TEMPLATE = "templates/menu_report_template.html"
 
 
+def _read_only(self, *args: Any, **kwargs: Any) -> Any:
+    raise TypeError("crew inputs are shared and read-only; copy a value before changing it")
+
+
+class _FrozenDict(dict):
+    """A dict of the cached crew inputs: read-only, still a dict for CrewAI; copies are plain."""
+
+    __setitem__ = __delitem__ = __ior__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
+
+    def copy(self) -> dict:
+        return dict(self)
+
+    __copy__ = copy
+
+    def __deepcopy__(self, memo: dict) -> dict:
+        return copy.deepcopy(dict(self), memo)
+
+    def __reduce__(self) -> tuple:
+        return dict, (dict(self),)
+
+
+class _FrozenList(list):
+    """A list of the cached crew inputs: read-only, still a list for CrewAI; copies are plain."""
+
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _read_only
+    append = extend = insert = pop = remove = clear = sort = reverse = _read_only
+
+    def copy(self) -> list:
+        return list(self)
+
+    __copy__ = copy
+
+    def __deepcopy__(self, memo: dict) -> list:
+        return copy.deepcopy(list(self), memo)
+
+    def __reduce__(self) -> tuple:
+        return list, (list(self),)
+
+
+def _freeze(value: Any) -> Any:
+    """``value`` with its nested dicts and lists made read-only."""
+    if isinstance(value, dict):
+        return _FrozenDict({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return _FrozenList(_freeze(item) for item in value)
+    return value
+
+
 class ContentState(BaseModel):
     """
     Central state management for Epic News application.
@@ -102,6 +194,10 @@ class ContentState(BaseModel):
     - Crew Results: Output from various crew executions
     - Communication: Email and notification settings
     - Meeting Preparation: Specific parameters for meeting prep crews
+
+    A large crew result assigned to one of the SPILLABLE_FIELDS is stored in the run's
+    blob store and the field holds a ``BlobRef``, which dumps and validates as such;
+    ``state.report("field")`` returns the object either way.
     """
 
     # ============================================================================
@@ -131,53 +227,55 @@ class ContentState(BaseModel):
     error_message: str = ""
 
     # Business Intelligence Reports
-    company_profile: Optional["CompanyProfileReport"] = None
-    tech_stack: Optional["TechStackReport"] = None
-    tech_stack_report: Optional["TechStackReport"] = None
-    contact_info_report: Any | None = None
-    lead_score_report: Any | None = None
+    company_profile: Spilled[CompanyProfileReport] = None
+    tech_stack: Spilled[TechStackReport] = None
+    tech_stack_report: Spilled[TechStackReport] = None
+    contact_info_report: SpilledAny = None
+    lead_score_report: SpilledAny = None
 
     # Analysis Reports
-    geospatial_analysis: Optional["GeospatialAnalysisReport"] = None
-    osint_report: Optional["CrossReferenceReport"] = None
-    hr_intelligence_report: Optional["HRIntelligenceReport"] = None
-    legal_analysis_report: Optional["LegalAnalysisReport"] = None
-    web_presence_report: Optional["WebPresenceReport"] = None
-    cross_reference_report: Optional["CrossReferenceReport"] = None
-    pestel_report: Optional["PestelReport"] = None
+    geospatial_analysis: Spilled[GeospatialAnalysisReport] = None
+    osint_report: Spilled[CrossReferenceReport] = None
+    hr_intelligence_report: Spilled[HRIntelligenceReport] = None
+    legal_analysis_report: Spilled[LegalAnalysisReport] = None
+    web_presence_report: Spilled[WebPresenceReport] = None
+    cross_reference_report: Spilled[CrossReferenceReport] = None
+    pestel_report: Spilled[PestelReport] = None
 
     # Content Reports
-    news_report: Optional["NewsDailyReport"] = None
-    company_news_report: Optional["CompanyNewsReport"] = None
-    deep_research_report: Optional["DeepResearchReport"] = None
-    rss_weekly_report: Optional["RssWeeklyReport"] = None
-    fin_daily_report: Optional["FinancialReport"] = None
-    news_daily_report: Optional["NewsDailyReport"] = None
-    saint_daily_report: Optional["SaintData"] = None
-    post_report: Any | None = None
+    news_report: Spilled[NewsDailyReport] = None
+    company_news_report: Spilled[CompanyNewsReport] = None
+    deep_research_report: Spilled[DeepResearchReport] = None
+    rss_weekly_report: Spilled[RssWeeklyReport] = None
+    fin_daily_report: Spilled[FinancialReport] = None
+    news_daily_report: Spilled[NewsDailyReport] = None
+    saint_daily_report: Spilled[SaintData] = None
+    post_report: SpilledAny = None
 
     # Specialized Reports
-    location_report: Any | None = None
-    holiday_plan: Optional["HolidayPlannerReport"] = None
-    recipe: Optional["PaprikaRecipe"] = None
-    menu_designer_report: Optional["WeeklyMenuPlan"] = None
-    menu_plan: Optional["WeeklyMenuPlan"] = None
-    book_summary: Optional["BookSummaryReport"] = None
-    shopping_advice_report: Optional["ShoppingAdviceOutput"] = None
-    shopping_advice_model: ShoppingAdviceOutput | None = None
-    poem: Optional["PoemJSONOutput"] = None
-    meeting_prep_report: Optional["MeetingPrepReport"] = None
+    location_report: SpilledAny = None
+    holiday_plan: Spilled[HolidayPlannerReport] = None
+    recipe: Spilled[PaprikaRecipe] = None
+    menu_designer_report: Spilled[WeeklyMenuPlan] = None
+    menu_plan: Spilled[WeeklyMenuPlan] = None
+    book_summary: Spilled[BookSummaryReport] = None
+    shopping_advice_report: Spilled[ShoppingAdviceOutput] = None
+    shopping_advice_model: Spilled[ShoppingAdviceOutput] = None
+    poem: Spilled[PoemJSONOutput] = None
+    meeting_prep_report: Spilled[MeetingPrepReport] = None
 
     # NEW: Model-based state fields for refactored architecture
-    financial_report_model: Optional["FinancialReport"] = None
-    news_daily_model: Optional["NewsDailyReport"] = None
-    saint_daily_model: Optional["SaintData"] = None
+    financial_report_model: Spilled[FinancialReport] = None
+    news_daily_model: Spilled[NewsDailyReport] = None
+    saint_daily_model: Spilled[SaintData] = None
 
     # ============================================================================
     # COMMUNICATION SETTINGS
     # ============================================================================
     sendto: str = DEFAULT_EMAIL
     email_sent: bool = False
+    # Outbox entry of this run's report email; email_sent stays False until delivered.
+    email_outbox_key: str | None = None
 
     # ============================================================================
     # MEETING PREPARATION PARAMETERS
@@ -188,6 +286,21 @@ class ContentState(BaseModel):
     objective: str = ""
     prior_interactions: str = ""
 
+    # Cache for to_crew_inputs(): bumped on every field assignment, see __setattr__.
+    _inputs_version: int = PrivateAttr(default=0)
+    _inputs_cache: tuple[Any, ...] | None = PrivateAttr(default=None)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name in SPILLABLE_FIELDS:
+            value = spill(value)
+        super().__setattr__(name, value)
+        if name in type(self).model_fields:
+            self._inputs_version += 1
+
+    def report(self, name: str) -> Any:
+        """The value of a report field, loaded back from the blob store if it was spilled."""
+        return resolve(getattr(self, name))
+
     def _clean_brief_text(self, value: Any) -> str:
         """Return clean, length-bounded free text for a crew input.
 
@@ -201,16 +314,34 @@ class ContentState(BaseModel):
             text = text[:MAX_FREETEXT_CHARS].rstrip()
         return text
 
-    def to_crew_inputs(self) -> dict:
+    def to_crew_inputs(self) -> MappingProxyType[str, Any]:
         """
-        Prepares a flattened dictionary of state properties suitable for CrewAI task inputs.
+        Prepares a flattened, read-only view of state properties for CrewAI task inputs.
 
         This method combines top-level state attributes with nested data from the
         'extracted_info' model, providing a simple, flat key-value structure.
 
+        The view is built once and reused until a state field is assigned or the day
+        changes (season and current_date are part of it). Mutating a nested model in
+        place does not invalidate it; assign the field instead. Callers that add
+        crew-specific keys take a copy: ``inputs = state.to_crew_inputs().copy()``.
+        Every view shares its nested dicts and lists, so those are read-only too
+        (``TypeError`` on change); ``copy()`` one to get a plain, writable value.
+
         Returns:
-            dict: Flattened dictionary with all necessary inputs for crew execution
+            MappingProxyType: Flattened, read-only mapping with all necessary inputs for crew execution
         """
+        stamp = (self._inputs_version, datetime.date.today().isoformat())
+        cached = self._inputs_cache
+        # A model_copy() carries the private cache over but gets a new __dict__.
+        if cached is not None and cached[0] == stamp and cached[1] is self.__dict__:
+            return cached[2]
+        view = MappingProxyType({key: _freeze(value) for key, value in self._build_crew_inputs().items()})
+        self._inputs_cache = (stamp, self.__dict__, view)
+        return view
+
+    def _build_crew_inputs(self) -> dict:
+        """Build the dictionary behind :meth:`to_crew_inputs`."""
         # Start with a dump of the top-level model, excluding the nested part
         inputs = self.model_dump(exclude={"extracted_info"})
 
@@ -297,11 +428,10 @@ class ContentState(BaseModel):
 
     def _add_computed_fields(self) -> dict:
         """Add computed fields like season and current date."""
-        menu_generator = MenuGenerator()
         current_date = datetime.datetime.now()
 
         return {
-            "season": menu_generator.calculate_season(),
+            "season": MenuGenerator.calculate_season(),
             "current_date": current_date.strftime("%Y-%m-%d"),
         }
 
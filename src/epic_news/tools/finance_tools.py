@@ -2,7 +2,8 @@
 Finance tool initialization module for epic_news crews.
 
 This module provides convenient functions to initialize and register
-financial data tools for use in epic_news crews.
+financial data tools for use in epic_news crews. Under ``EPIC_CASSETTE_MODE``
+their calls are recorded or replayed (see epic_news.utils.cassette).
 """
 
 from crewai.tools import BaseTool
@@ -16,6 +17,8 @@ from crewai_custom_tools import (
     YahooFinanceTickerInfoTool,
 )
 
+from epic_news.utils.cassette import wrap_tools
+
 
 def get_yahoo_finance_tools() -> list[BaseTool]:
     """
@@ -25,13 +28,15 @@ def get_yahoo_finance_tools() -> list[BaseTool]:
         list[BaseTool]: A list of initialized Yahoo Finance tools ready for crew usage.
 
     """
-    return [
-        YahooFinanceTickerInfoTool(),
-        YahooFinanceHistoryTool(),
-        YahooFinanceCompanyInfoTool(),
-        YahooFinanceETFHoldingsTool(),
-        YahooFinanceNewsTool(),
-    ]
+    return wrap_tools(
+        [
+            YahooFinanceTickerInfoTool(),
+            YahooFinanceHistoryTool(),
+            YahooFinanceCompanyInfoTool(),
+            YahooFinanceETFHoldingsTool(),
+            YahooFinanceNewsTool(),
+        ]
+    )
 
 
 def get_stock_research_tools() -> list[BaseTool]:
@@ -42,13 +47,15 @@ def get_stock_research_tools() -> list[BaseTool]:
         list[BaseTool]: A list of tools focused on stock analysis.
 
     """
-    return [
-        YahooFinanceTickerInfoTool(),
-        YahooFinanceHistoryTool(),
-        YahooFinanceCompanyInfoTool(),
-        YahooFinanceNewsTool(),
-        AlphaVantageOverviewTool(),
-    ]
+    return wrap_tools(
+        [
+            YahooFinanceTickerInfoTool(),
+            YahooFinanceHistoryTool(),
+            YahooFinanceCompanyInfoTool(),
+            YahooFinanceNewsTool(),
+            AlphaVantageOverviewTool(),
+        ]
+    )
 
 
 def get_crypto_research_tools() -> list[BaseTool]:
@@ -59,12 +66,14 @@ def get_crypto_research_tools() -> list[BaseTool]:
         list[BaseTool]: A list of tools focused on crypto analysis.
 
     """
-    return [
-        YahooFinanceHistoryTool(),
-        YahooFinanceNewsTool(),
-        YahooFinanceTickerInfoTool(),
-        KrakenTickerInfoTool(),
-    ]
+    return wrap_tools(
+        [
+            YahooFinanceHistoryTool(),
+            YahooFinanceNewsTool(),
+            YahooFinanceTickerInfoTool(),
+            KrakenTickerInfoTool(),
+        ]
+    )
 
 
 def get_etf_research_tools() -> list[BaseTool]:
@@ -75,9 +84,11 @@ def get_etf_research_tools() -> list[BaseTool]:
         list[BaseTool]: A list of tools focused on ETF analysis.
 
     """
-    return [
-        YahooFinanceTickerInfoTool(),
-        YahooFinanceHistoryTool(),
-        YahooFinanceETFHoldingsTool(),
-        YahooFinanceNewsTool(),
-    ]
+    return wrap_tools(
+        [
+            YahooFinanceTickerInfoTool(),
+            YahooFinanceHistoryTool(),
+            YahooFinanceETFHoldingsTool(),
+            YahooFinanceNewsTool(),
+        ]
+    )
@@ -17,9 +17,13 @@ except ImportError:  # pragma: no cover
     HtmlToPdfTool = None  # type: ignore
 
 
-def get_report_tools() -> list:
-    """Return list of report-related tools available in this environment."""
+def get_report_tools(include_pdf: bool = True) -> list:
+    """Return list of report-related tools available in this environment.
+
+    Crews whose PDFs the flow renders itself (see ``epic_news.utils.pdf_renderer``)
+    pass ``include_pdf=False``.
+    """
     tools: list = [RenderReportTool()]
-    if HtmlToPdfTool is not None:
+    if include_pdf and HtmlToPdfTool is not None:
         tools.append(HtmlToPdfTool())
     return tools
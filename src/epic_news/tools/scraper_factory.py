@@ -17,23 +17,26 @@ from typing import Any
 
 from crewai_custom_tools import ScrapeNinjaTool
 
+from epic_news.utils.cassette import wrap_tool
+
 
 def get_scraper() -> Any:
     """
     Return a scraper tool instance based on the WEB_SCRAPER_PROVIDER env var.
 
-    Defaults to ScrapeNinjaTool. Unsupported providers raise a clear error.
+    Defaults to ScrapeNinjaTool. Unsupported providers raise a clear error. Under
+    ``EPIC_CASSETTE_MODE`` the tool's calls are recorded or replayed.
     """
     provider = os.getenv("WEB_SCRAPER_PROVIDER", "scrapeninja").strip().lower()
 
     if provider in ("", "scrapeninja", "scrape_ninja", "ninja"):
-        return ScrapeNinjaTool()
+        return wrap_tool(ScrapeNinjaTool())
 
     if provider == "firecrawl":
         # Lazy import to avoid requiring Firecrawl SDK when not used
         from crewai_custom_tools import FirecrawlTool
 
-        return FirecrawlTool()
+        return wrap_tool(FirecrawlTool())
 
     if provider == "composio":
         # No dedicated Composio scraping adapter exists in the project.
@@ -2,17 +2,31 @@ import os
 from typing import Literal, cast
 
 from crewai.tools import BaseTool
-from crewai_custom_tools import PerplexitySearchTool, SerpApiTool, TavilyTool
+from crewai_custom_tools import HybridSearchTool, PerplexitySearchTool, SerpApiTool, TavilyTool
+
+from epic_news.utils.cassette import wrap_tool
+from epic_news.utils.search_cache import cache_tool
 
 
 class WebSearchFactory:
     """Factory for creating web search tools."""
 
     @staticmethod
-    def create(provider: Literal["perplexity", "serpapi", "tavily"]) -> BaseTool:
-        """Create a web search tool based on the provider."""
+    def create(provider: Literal["hybrid", "perplexity", "serpapi", "tavily"]) -> BaseTool:
+        """Create a web search tool based on the provider.
+
+        Results are served from the semantic search cache when a close enough query was
+        answered recently (see ``epic_news.utils.search_cache``), and recorded/replayed
+        under ``EPIC_CASSETTE_MODE``.
+        """
+        return wrap_tool(cache_tool(WebSearchFactory._build(provider)))
+
+    @staticmethod
+    def _build(provider: str) -> BaseTool:
         # crewai_custom_tools ships without a py.typed marker, so mypy sees its
         # exports as `Any`; cast() documents that these are BaseTool subclasses.
+        if provider == "hybrid":
+            return cast(BaseTool, HybridSearchTool())
         if provider == "perplexity":
             if not os.getenv("PERPLEXITY_API_KEY"):
                 return cast(BaseTool, TavilyTool())
@@ -14,6 +14,8 @@ from crewai_tools import (
     YoutubeVideoSearchTool,
 )
 
+from epic_news.utils.cassette import wrap_tool
+
 
 def get_search_tools():
     """
@@ -50,7 +52,7 @@ def get_scrape_tools():
 
     return [
         get_scraper(),  # Primary scraping tool - selected via WEB_SCRAPER_PROVIDER
-        ScrapeWebsiteTool(),  # Backup scraper from crewai_tools
+        wrap_tool(ScrapeWebsiteTool()),  # Backup scraper from crewai_tools
     ]
 
 
@@ -117,7 +119,7 @@ def get_pdf_tools():
         list: A list of PDF search tool instances.
     """
     return [
-        PDFSearchTool(),  # Can search within PDF documents
+        wrap_tool(PDFSearchTool()),  # Can search within PDF documents
     ]
 
 
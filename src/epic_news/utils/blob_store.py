@@ -0,0 +1,205 @@
+"""Content-addressed storage for large crew outputs, so the flow state stays small.
+
+``ContentState`` keeps every crew's result (``CrewOutput`` objects and parsed report
+models) for the whole flow, and CrewAI copies and serializes that state between steps.
+When a result assigned to one of the report fields serializes to at least
+``EPIC_BLOB_SPILL_BYTES`` (default 65536; ``0`` disables spilling), it is written once
+to the run's blob store and the field keeps a :class:`BlobRef` instead: a handle of a
+few hundred bytes that loads the object back on :meth:`BlobRef.load`.
+
+Blobs are gzipped JSON named by the SHA-256 of their content, under
+``<EPIC_BLOB_DIR>/<run_id>/blobs/`` (default ``output/runs``), so the same output stored
+twice costs one file. The ``pydantic`` payload of a ``CrewOutput`` and of its task
+outputs is stored with its class and restored on load.
+
+Fields that may be spilled are typed :data:`Spilled`, so a dumped state keeps the
+handle and validates back to it. Run directories older than
+``EPIC_BLOB_MAX_AGE_DAYS`` (default 7) are removed by :func:`prune_runs`, which each
+flow run calls before it starts.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import gzip
+import hashlib
+import importlib
+import json
+import os
+import shutil
+import time
+import uuid
+from pathlib import Path
+from typing import Annotated, Any
+
+from loguru import logger
+from pydantic import BaseModel, BeforeValidator, ConfigDict, Field
+
+from epic_news.utils.progress import current_run_id
+
+DEFAULT_BLOB_DIR = "output/runs"
+DEFAULT_SPILL_BYTES = 65536
+DEFAULT_MAX_AGE_DAYS = 7.0
+
+
+def _type_path(cls: type) -> str:
+    return f"{cls.__module__}:{cls.__qualname__}"
+
+
+def _import_model(path: str) -> type[BaseModel]:
+    module, _, qualname = path.partition(":")
+    obj: Any = importlib.import_module(module)
+    for part in qualname.split("."):
+        obj = getattr(obj, part)
+    if not (isinstance(obj, type) and issubclass(obj, BaseModel)):
+        raise TypeError(f"{path} is not a Pydantic model")
+    return obj
+
+
+class BlobStore:
+    """A directory of immutable blobs addressed by the SHA-256 of their bytes."""
+
+    def __init__(self, root: str | os.PathLike[str]):
+        self.root = Path(root)
+
+    @classmethod
+    def for_run(cls, run_id: str | None = None) -> BlobStore:
+        """The store of ``run_id`` (the current run by default) under ``EPIC_BLOB_DIR``."""
+        base = Path(os.getenv("EPIC_BLOB_DIR", DEFAULT_BLOB_DIR))
+        return cls(base / (run_id or current_run_id() or "local") / "blobs")
+
+    def path(self, digest: str) -> Path:
+        return self.root / digest[:2] / f"{digest}.json.gz"
+
+    def put(self, data: bytes) -> str:
+        """Store ``data`` unless an identical blob exists; return its digest."""
+        digest = hashlib.sha256(data).hexdigest()
+        target = self.path(digest)
+        if target.exists():
+            return digest
+        target.parent.mkdir(parents=True, exist_ok=True)
+        tmp = target.with_name(f".{target.name}.{uuid.uuid4().hex[:8]}.tmp")
+        tmp.write_bytes(gzip.compress(data, compresslevel=5))
+        os.replace(tmp, target)
+        return digest
+
+    def get(self, digest: str) -> bytes:
+        return gzip.decompress(self.path(digest).read_bytes())
+
+
+class BlobRef(BaseModel):
+    """A lightweight handle on a model spilled to a :class:`BlobStore`."""
+
+    model_config = ConfigDict(frozen=True)
+
+    digest: str
+    size: int
+    type: str
+    root: str
+
+    def load(self) -> BaseModel:
+        """Read the object back; each call returns a fresh copy."""
+        payload = json.loads(BlobStore(self.root).get(self.digest))
+        return _decode(payload)
+
+    def __repr__(self) -> str:
+        return f"BlobRef({self.type.rpartition(':')[2]}, {self.size} bytes, {self.digest[:12]})"
+
+
+# A field holding a ``T``, the BlobRef it was spilled to, or None. The handle is tried
+# first, so a dumped handle validates back to a handle and never as an empty ``T``.
+type Spilled[T] = Annotated[BlobRef | T | None, Field(union_mode="left_to_right")]
+
+
+def _ref_or_value(value: Any) -> Any:
+    """Turn a dumped handle back into a :class:`BlobRef`; leave anything else untouched."""
+    if isinstance(value, dict) and value.keys() == BlobRef.model_fields.keys():
+        return BlobRef.model_validate(value)
+    return value
+
+
+# ``Spilled[Any]`` would collapse to ``Any``, which validates a dumped handle as a plain dict.
+type SpilledAny = Annotated[Any, BeforeValidator(_ref_or_value)]
+
+
+def _nested_models(value: BaseModel) -> dict[str, str]:
+    """Classes of the ``pydantic`` payloads a ``CrewOutput`` (and its task outputs) carry."""
+    nested: dict[str, str] = {}
+    inner = getattr(value, "pydantic", None)
+    if isinstance(inner, BaseModel):
+        nested[""] = _type_path(type(inner))
+    for index, task in enumerate(getattr(value, "tasks_output", None) or []):
+        task_inner = getattr(task, "pydantic", None)
+        if isinstance(task_inner, BaseModel):
+            nested[str(index)] = _type_path(type(task_inner))
+    return nested
+
+
+def _encode(value: BaseModel) -> bytes:
+    payload = {
+        "type": _type_path(type(value)),
+        "data": value.model_dump(mode="json", serialize_as_any=True, fallback=str),
+        "nested": _nested_models(value),
+    }
+    return json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _decode(payload: dict[str, Any]) -> BaseModel:
+    data = payload["data"]
+    for key, type_path in payload.get("nested", {}).items():
+        holder = data if key == "" else data["tasks_output"][int(key)]
+        if holder.get("pydantic") is not None:
+            holder["pydantic"] = _import_model(type_path).model_validate(holder["pydantic"])
+    return _import_model(payload["type"]).model_validate(data)
+
+
+def spill_threshold() -> int:
+    return int(os.getenv("EPIC_BLOB_SPILL_BYTES", str(DEFAULT_SPILL_BYTES)))
+
+
+def spill(value: Any, store: BlobStore | None = None, min_bytes: int | None = None) -> Any:
+    """Return a :class:`BlobRef` for a large Pydantic ``value``, else ``value`` itself.
+
+    Values that are not models, are below the threshold or fail to serialize stay in
+    memory; spilling is an optimization and never loses a result.
+    """
+    min_bytes = spill_threshold() if min_bytes is None else min_bytes
+    if min_bytes <= 0 or not isinstance(value, BaseModel) or isinstance(value, BlobRef):
+        return value
+    try:
+        data = _encode(value)
+        if len(data) < min_bytes:
+            return value
+        store = store or BlobStore.for_run()
+        digest = store.put(data)
+    except Exception as e:
+        logger.warning(f"⚠️ Keeping {type(value).__name__} in memory, spill failed: {e}")
+        return value
+    logger.debug(f"📦 Spilled {type(value).__name__} ({len(data) / 1024:.0f} KiB) to {store.path(digest)}")
+    return BlobRef(digest=digest, size=len(data), type=_type_path(type(value)), root=str(store.root))
+
+
+def resolve(value: Any) -> Any:
+    """``value`` itself, or the object behind it when it is a :class:`BlobRef`."""
+    return value.load() if isinstance(value, BlobRef) else value
+
+
+def prune_runs(max_age_days: float | None = None, base: str | os.PathLike[str] | None = None) -> int:
+    """Remove the blob stores of runs untouched for ``max_age_days``; returns how many."""
+    if max_age_days is None:
+        max_age_days = float(os.getenv("EPIC_BLOB_MAX_AGE_DAYS", str(DEFAULT_MAX_AGE_DAYS)))
+    root = Path(base or os.getenv("EPIC_BLOB_DIR", DEFAULT_BLOB_DIR))
+    cutoff = time.time() - max_age_days * 86400
+    removed = 0
+    for blobs in root.glob("*/blobs"):
+        try:
+            newest = max((p.stat().st_mtime for p in blobs.rglob("*")), default=blobs.stat().st_mtime)
+        except FileNotFoundError:
+            continue  # removed meanwhile, e.g. by a concurrent run
+        if newest >= cutoff:
+            continue
+        shutil.rmtree(blobs, ignore_errors=True)
+        with contextlib.suppress(OSError):
+            blobs.parent.rmdir()  # the run directory, when nothing else lives in it
+        removed += 1
+    return removed
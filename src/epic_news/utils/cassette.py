@@ -0,0 +1,367 @@
+"""Record-and-replay of LLM, tool and email calls, for offline flow benchmarks.
+
+``EPIC_CASSETTE_MODE`` selects the mode (default ``off``, where nothing here runs):
+
+- ``record``: calls go out as usual; each request, its response (or error) and its
+  duration are appended to ``<EPIC_CASSETTE_DIR>/interactions.jsonl``.
+- ``replay``: nothing goes out. Each call is answered from the cassette, optionally
+  after sleeping ``EPIC_CASSETTE_LATENCY`` x the recorded duration (default 0, i.e. as
+  fast as possible; 1 replays real timings). A call with no recording raises
+  :class:`CassetteMissError`, and so does any socket connection to a non-loopback
+  address: a call site the hooks below miss fails loudly instead of going live.
+
+Calls are matched on a hash of their request (model and messages for an LLM, tool name
+and arguments for a tool). Identical requests are served in recorded order. A request
+that hashes to nothing recorded, typically a prompt that embeds today's date, gets the
+next unused recording for the same call site (same model or tool), so a flow replays
+as the sequence it was recorded as.
+
+The hooks sit at the LLM call wrapper (``epic_news.config.llm_config``), on tools
+handed out by ``WebSearchFactory``, ``get_scraper``, the finance and web tool getters
+and the crews' own scraper, PDF and MCP tools (:func:`wrap_tool`), around the OPML
+fetch of the RSS flow, and around the Composio call in ``send_report_email``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import importlib
+import ipaddress
+import json
+import os
+import socket
+import threading
+import time
+from collections import defaultdict, deque
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+from typing import Any
+
+from loguru import logger
+from pydantic import BaseModel
+
+from epic_news.utils.spans import get_background_writer
+
+DEFAULT_CASSETTE_DIR = os.path.join("benchmarks", "cassettes", "default")
+CASSETTE_FILE = "interactions.jsonl"
+MODES = {"off", "record", "replay"}
+
+
+class CassetteMissError(LookupError):
+    """Replay found no recording for a call."""
+
+
+class ReplayedError(RuntimeError):
+    """A recorded call that failed, raised again on replay with the original message."""
+
+
+def _canonical(value: Any) -> Any:
+    """A JSON-safe, order-stable view of a request, for hashing and storage."""
+    if isinstance(value, BaseModel):
+        return _canonical(value.model_dump(mode="json"))
+    if isinstance(value, dict):
+        return {str(k): _canonical(v) for k, v in sorted(value.items(), key=lambda kv: str(kv[0]))}
+    if isinstance(value, list | tuple):
+        return [_canonical(v) for v in value]
+    if isinstance(value, type):
+        return f"{value.__module__}.{value.__qualname__}"
+    if value is None or isinstance(value, str | int | float | bool):
+        return value
+    return f"<{type(value).__name__}>"
+
+
+def request_key(kind: str, name: str, request: Any) -> str:
+    payload = json.dumps([kind, name, _canonical(request)], sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:32]
+
+
+def _encode(value: Any) -> dict[str, Any]:
+    if isinstance(value, str):
+        return {"type": "str", "value": value}
+    if isinstance(value, BaseModel):
+        cls = type(value)
+        return {
+            "type": "model",
+            "class": f"{cls.__module__}:{cls.__qualname__}",
+            "value": value.model_dump(mode="json"),
+        }
+    try:
+        json.dumps(value)
+    except (TypeError, ValueError):
+        logger.warning("⚠️ Cassette stores a {} response as text", type(value).__name__)
+        return {"type": "str", "value": str(value)}
+    return {"type": "json", "value": value}
+
+
+def _decode(data: dict[str, Any]) -> Any:
+    if data["type"] == "model":
+        module, _, qualname = data["class"].partition(":")
+        cls: Any = importlib.import_module(module)
+        for part in qualname.split("."):
+            cls = getattr(cls, part)
+        return cls.model_validate(data["value"])
+    return data["value"]
+
+
+class Cassette:
+    """One directory of recorded interactions, in ``record`` or ``replay`` mode."""
+
+    def __init__(self, directory: str | os.PathLike[str], mode: str, latency_scale: float = 0.0):
+        if mode not in {"record", "replay"}:
+            raise ValueError(f"Cassette mode must be 'record' or 'replay', not {mode!r}")
+        self.directory = Path(directory)
+        self.path = self.directory / CASSETTE_FILE
+        self.mode = mode
+        self.latency_scale = latency_scale
+        self._lock = threading.Lock()
+        self._seq = 0
+        self._by_key: dict[str, deque[dict[str, Any]]] = defaultdict(deque)
+        self._by_site: dict[tuple[str, str], deque[dict[str, Any]]] = defaultdict(deque)
+        self._used: set[int] = set()
+        self._last: dict[str, dict[str, Any]] = {}
+        # Replay bookkeeping for benchmarks: calls served and the time they took live.
+        self.replayed_calls: dict[str, int] = defaultdict(int)
+        self.replayed_seconds = 0.0
+        # Calls replay could not serve. Tools often turn exceptions into text for the agent,
+        # so the benchmark checks this list rather than trusting the run to crash.
+        self.misses: list[str] = []
+        if mode == "replay":
+            self._load()
+        else:
+            get_background_writer().replace(self.path, "")  # a recording starts a fresh cassette
+
+    def _load(self) -> None:
+        if not self.path.exists():
+            raise FileNotFoundError(f"No cassette to replay at {self.path}")
+        with open(self.path, encoding="utf-8") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                entry = json.loads(line)
+                self._by_key[entry["key"]].append(entry)
+                self._by_site[(entry["kind"], entry["name"])].append(entry)
+
+    # --- replay ------------------------------------------------------------------
+
+    def _take(self, kind: str, name: str, key: str) -> dict[str, Any]:
+        with self._lock:
+            for queue_ in (self._by_key.get(key), self._by_site.get((kind, name))):
+                while queue_:
+                    entry = queue_.popleft()
+                    if entry["seq"] not in self._used:
+                        self._used.add(entry["seq"])
+                        self._last[key] = entry
+                        return self._served(entry)
+            if key in self._last:  # asked again more often than recorded: same answer
+                return self._served(self._last[key])
+        message = f"No recorded {kind} call for {name!r} (key {key}) in {self.path}"
+        self.misses.append(message)
+        raise CassetteMissError(message)
+
+    def _served(self, entry: dict[str, Any]) -> dict[str, Any]:
+        self.replayed_calls[entry["kind"]] += 1
+        self.replayed_seconds += entry["duration"]
+        return entry
+
+    def _replay(self, entry: dict[str, Any]) -> Any:
+        if entry.get("error"):
+            raise ReplayedError(entry["error"])
+        return _decode(entry["response"])
+
+    # --- record ------------------------------------------------------------------
+
+    def _save(
+        self,
+        kind: str,
+        name: str,
+        key: str,
+        request: Any,
+        started: float,
+        response: Any = None,
+        error: BaseException | None = None,
+    ) -> None:
+        with self._lock:
+            self._seq += 1
+            seq = self._seq
+        entry = {
+            "seq": seq,
+            "kind": kind,
+            "name": name,
+            "key": key,
+            "request": _canonical(request),
+            "duration": round(time.perf_counter() - started, 4),
+        }
+        if error is not None:
+            entry["error"] = f"{type(error).__name__}: {error}"
+        else:
+            entry["response"] = _encode(response)
+        get_background_writer().append_json(self.path, entry)
+
+    # --- entry points ------------------------------------------------------------
+
+    def play[T](self, kind: str, name: str, request: Any, produce: Callable[[], T]) -> T:
+        """Record ``produce()`` or answer it from the cassette."""
+        key = request_key(kind, name, request)
+        if self.mode == "replay":
+            entry = self._take(kind, name, key)
+            if self.latency_scale:
+                time.sleep(entry["duration"] * self.latency_scale)
+            return self._replay(entry)  # type: ignore[no-any-return]
+        started = time.perf_counter()
+        try:
+            response = produce()
+        except Exception as exc:
+            self._save(kind, name, key, request, started, error=exc)
+            raise
+        self._save(kind, name, key, request, started, response=response)
+        return response
+
+    async def aplay[T](self, kind: str, name: str, request: Any, produce: Callable[[], Awaitable[T]]) -> T:
+        """Async :meth:`play`: the replay latency is an ``asyncio.sleep``."""
+        key = request_key(kind, name, request)
+        if self.mode == "replay":
+            entry = self._take(kind, name, key)
+            if self.latency_scale:
+                await asyncio.sleep(entry["duration"] * self.latency_scale)
+            return self._replay(entry)  # type: ignore[no-any-return]
+        started = time.perf_counter()
+        try:
+            response = await produce()
+        except Exception as exc:
+            self._save(kind, name, key, request, started, error=exc)
+            raise
+        self._save(kind, name, key, request, started, response=response)
+        return response
+
+    def flush(self) -> bool:
+        return get_background_writer().flush()
+
+
+_cassette: Cassette | None = None
+_configured: tuple[str, str, str] | None = None
+_cassette_lock = threading.Lock()
+_socket_connect: tuple[Any, Any] | None = None
+
+
+def _is_local(sock: socket.socket, address: Any) -> bool:
+    if sock.family not in (socket.AF_INET, socket.AF_INET6):
+        return True  # Unix sockets and the like never leave the machine
+    host = str(address[0])
+    try:
+        return host == "localhost" or ipaddress.ip_address(host.split("%")[0]).is_loopback
+    except ValueError:
+        return False
+
+
+def _blocked(sock: socket.socket, address: Any) -> None:
+    if not _is_local(sock, address):
+        message = (
+            f"Replay blocked a live connection to {address[0]}:{address[1]}: its call site is not "
+            "recorded (route it through wrap_tool or Cassette.play)"
+        )
+        logger.error("❌ {}", message)
+        if _cassette is not None:
+            _cassette.misses.append(message)
+        raise CassetteMissError(message)
+
+
+def block_network() -> None:
+    """Make every non-loopback socket connection raise :class:`CassetteMissError`.
+
+    Installed for the whole replay, so a tool or client the hooks miss cannot reach the
+    network and silently make the run non-deterministic. Loopback stays open for
+    ``benchmarks/mock_llm_server.py``.
+    """
+    global _socket_connect
+    if _socket_connect is not None:
+        return
+    connect, connect_ex = socket.socket.connect, socket.socket.connect_ex
+
+    def guarded_connect(self: socket.socket, address: Any) -> None:
+        _blocked(self, address)
+        return connect(self, address)
+
+    def guarded_connect_ex(self: socket.socket, address: Any) -> int:
+        _blocked(self, address)
+        return connect_ex(self, address)
+
+    _socket_connect = (connect, connect_ex)
+    socket.socket.connect = guarded_connect  # type: ignore[method-assign]
+    socket.socket.connect_ex = guarded_connect_ex  # type: ignore[method-assign]
+
+
+def unblock_network() -> None:
+    """Undo :func:`block_network`."""
+    global _socket_connect
+    if _socket_connect is not None:
+        socket.socket.connect, socket.socket.connect_ex = _socket_connect  # type: ignore[method-assign]
+        _socket_connect = None
+
+
+def get_cassette() -> Cassette | None:
+    """The cassette selected by ``EPIC_CASSETTE_*``, or None when the mode is ``off``."""
+    global _cassette, _configured
+    mode = os.getenv("EPIC_CASSETTE_MODE", "off").strip().lower() or "off"
+    if mode == "off":
+        if _configured is not None:
+            reset_cassette()
+        return None
+    if mode not in MODES:
+        raise ValueError(f"EPIC_CASSETTE_MODE must be one of {sorted(MODES)}, not {mode!r}")
+    settings = (
+        mode,
+        os.getenv("EPIC_CASSETTE_DIR", DEFAULT_CASSETTE_DIR),
+        os.getenv("EPIC_CASSETTE_LATENCY", "0"),
+    )
+    if _configured != settings:
+        with _cassette_lock:
+            if _configured != settings:
+                _cassette = Cassette(settings[1], mode, float(settings[2] or 0))
+                _configured = settings
+                if mode == "replay":
+                    block_network()
+                else:
+                    unblock_network()
+                logger.info("📼 Cassette {} mode: {}", mode, _cassette.path)
+    return _cassette
+
+
+def reset_cassette() -> None:
+    """Drop the current cassette, so the next call reloads it (one replay per benchmark run)."""
+    global _cassette, _configured
+    with _cassette_lock:
+        _cassette = None
+        _configured = None
+        unblock_network()
+
+
+def llm_request(llm: Any, args: tuple[Any, ...], kwargs: dict[str, Any]) -> dict[str, Any]:
+    """What identifies an ``LLM.call``: model, messages and structured-output model."""
+    messages = kwargs.get("messages", args[0] if args else None)
+    return {
+        "model": getattr(llm, "model", None),
+        "messages": messages,
+        "response_model": kwargs.get("response_model"),
+    }
+
+
+def wrap_tool[T](tool: T) -> T:
+    """Route a CrewAI tool's ``_run`` through the cassette; returns the tool unchanged when off."""
+    cassette = get_cassette()
+    if cassette is None or getattr(tool, "_epic_news_cassette", False):
+        return tool
+    original_run = tool._run  # type: ignore[attr-defined]
+    name = getattr(tool, "name", type(tool).__name__)
+
+    def _run(*args: Any, **kwargs: Any) -> Any:
+        request = {"args": list(args), "kwargs": kwargs}
+        return cassette.play("tool", name, request, lambda: original_run(*args, **kwargs))
+
+    object.__setattr__(tool, "_run", _run)
+    object.__setattr__(tool, "_epic_news_cassette", True)
+    return tool
+
+
+def wrap_tools[T](tools: list[T]) -> list[T]:
+    return [wrap_tool(tool) for tool in tools]
@@ -0,0 +1,247 @@
+"""Token-budgeted packing of the context a synthesis task receives from its upstream tasks.
+
+CrewAI hands a task the raw output of every task in its ``context=[...]``, concatenated.
+In the long crews (deep research, fin daily, company profiler) that reaches 100k+
+tokens for the final synthesis step. A :class:`PackedContextTask` rebuilds that context
+when it starts, each upstream output packed into a share of its budget:
+
+1. passages (blank-line separated, long ones cut at sentence boundaries) already seen
+   in another upstream output are dropped;
+2. if the rest still exceeds the share, passages are ranked with BM25 against the
+   consumer's description and expected output; passages carrying citations (URLs,
+   ``[n]`` markers, "Source:" lines) or figures go first; the kept passages stay in
+   their original order, followed by a one-line note of what was omitted.
+
+JSON outputs are only minified, never cut. The share is what remains of the budget
+divided by the upstream outputs not packed yet, so unused tokens roll over. Only the
+consumer's view is packed: the upstream tasks keep their full output, which is what
+every other task reading them as context, their ``output_file`` and the crew's
+``tasks_output`` get. Each packing logs its compression ratio.
+
+Environment:
+    EPIC_CONTEXT_BUDGET_TOKENS: budget per consumer task (default 32000; 0 disables)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import math
+import os
+import re
+from collections import Counter
+from dataclasses import dataclass
+from typing import Any
+
+from crewai import Task
+from crewai.utilities.formatter import DIVIDERS
+from loguru import logger
+from pydantic import Field
+
+DEFAULT_BUDGET_TOKENS = 32000
+MAX_PASSAGE_TOKENS = 300
+
+_WORD_RE = re.compile(r"\w+", re.UNICODE)
+_SENTENCE_RE = re.compile(r"(?<=[.!?])\s+")
+_CITATION_RE = re.compile(r"https?://|\[\d+\]|\bsources?\s*:|\bref(?:erence)?s?\s*:", re.IGNORECASE)
+_FIGURE_RE = re.compile(r"\d[\d.,]*\s*(?:%|[kKmMbB]\b|bn\b|USD|EUR|CHF|\$|€)|[$€£]\s*\d|\b(?:19|20)\d{2}\b")
+_STOPWORDS = frozenset(
+    {"a", "an", "and", "are", "as", "at", "be", "by", "for", "from", "in", "is", "it", "of", "on", "or"}
+    | {"that", "the", "this", "to", "with", "de", "des", "du", "en", "et", "la", "le", "les", "un", "une"}
+)
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count (4 characters per token), enough to enforce a budget."""
+    return (len(text) + 3) // 4
+
+
+def _terms(text: str) -> list[str]:
+    return [w for w in _WORD_RE.findall(text.lower()) if w not in _STOPWORDS and len(w) > 1]
+
+
+def _fingerprint(passage: str) -> str:
+    normalized = " ".join(passage.lower().split())
+    return hashlib.blake2b(normalized.encode("utf-8"), digest_size=12).hexdigest()
+
+
+def split_passages(text: str, max_tokens: int = MAX_PASSAGE_TOKENS) -> list[str]:
+    """Blank-line separated passages; longer ones are cut into sentence groups."""
+    passages: list[str] = []
+    for block in re.split(r"\n\s*\n", text):
+        block = block.strip()
+        if not block:
+            continue
+        if estimate_tokens(block) <= max_tokens:
+            passages.append(block)
+            continue
+        chunk = ""
+        for sentence in _SENTENCE_RE.split(block):
+            if chunk and estimate_tokens(chunk) + estimate_tokens(sentence) > max_tokens:
+                passages.append(chunk)
+                chunk = ""
+            chunk = f"{chunk} {sentence}" if chunk else sentence
+        if chunk:
+            passages.append(chunk)
+    return passages
+
+
+def bm25_scores(passages: list[str], query: str, k1: float = 1.5, b: float = 0.75) -> list[float]:
+    """Okapi BM25 of each passage against ``query``, the passages being the corpus."""
+    docs = [_terms(p) for p in passages]
+    if not docs:
+        return []
+    avg_len = sum(len(d) for d in docs) / len(docs) or 1.0
+    df = Counter(term for doc in docs for term in set(doc))
+    query_terms = set(_terms(query))
+    scores = []
+    for doc in docs:
+        tf = Counter(doc)
+        score = 0.0
+        for term in query_terms & tf.keys():
+            idf = math.log(1 + (len(docs) - df[term] + 0.5) / (df[term] + 0.5))
+            freq = tf[term]
+            score += idf * freq * (k1 + 1) / (freq + k1 * (1 - b + b * len(doc) / avg_len))
+        scores.append(score)
+    return scores
+
+
+def is_protected(passage: str) -> bool:
+    """Passages with citations or figures are kept before any other."""
+    return bool(_CITATION_RE.search(passage) or _FIGURE_RE.search(passage))
+
+
+@dataclass
+class PackResult:
+    text: str
+    original_tokens: int
+    packed_tokens: int
+    fingerprints: set[str]
+    duplicates: int = 0
+    omitted: int = 0
+
+    @property
+    def ratio(self) -> float:
+        return self.packed_tokens / self.original_tokens if self.original_tokens else 1.0
+
+
+def _as_json(text: str) -> Any:
+    stripped = text.strip()
+    if stripped.startswith("```"):
+        stripped = re.sub(r"^```(?:json)?\s*|\s*```$", "", stripped)
+    if not stripped.startswith(("{", "[")):
+        return None
+    try:
+        return json.loads(stripped)
+    except ValueError:
+        return None
+
+
+def pack(
+    text: str, query: str, budget_tokens: int, seen: set[str] | frozenset[str] = frozenset()
+) -> PackResult:
+    """Pack ``text`` into ``budget_tokens``, ranking its passages against ``query``.
+
+    ``seen`` holds fingerprints of passages already in the context; they are dropped.
+    """
+    original = estimate_tokens(text)
+    data = _as_json(text)
+    if data is not None:
+        minified = json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+        return PackResult(minified, original, estimate_tokens(minified), {_fingerprint(minified)})
+
+    passages, fingerprints, duplicates = [], set(), 0
+    for passage in split_passages(text):
+        fingerprint = _fingerprint(passage)
+        if fingerprint in seen or fingerprint in fingerprints:
+            duplicates += 1
+            continue
+        fingerprints.add(fingerprint)
+        passages.append(passage)
+
+    if sum(estimate_tokens(p) for p in passages) + 2 * len(passages) <= budget_tokens:
+        packed = "\n\n".join(passages)
+        return PackResult(packed, original, estimate_tokens(packed), fingerprints, duplicates)
+
+    scores = bm25_scores(passages, query)
+    order = sorted(range(len(passages)), key=lambda i: (not is_protected(passages[i]), -scores[i], i))
+    kept, used = set(), 0
+    for index in order:
+        cost = estimate_tokens(passages[index]) + 2
+        if used + cost <= budget_tokens:
+            kept.add(index)
+            used += cost
+    omitted = len(passages) - len(kept)
+    packed = "\n\n".join(passages[i] for i in sorted(kept))
+    if omitted:
+        packed += f"\n\n[… {omitted} lower-relevance passages omitted to fit the context budget]"
+    return PackResult(
+        packed,
+        original,
+        estimate_tokens(packed),
+        {_fingerprint(passages[i]) for i in kept},
+        duplicates,
+        omitted,
+    )
+
+
+def budget_from_env() -> int:
+    return int(os.getenv("EPIC_CONTEXT_BUDGET_TOKENS", str(DEFAULT_BUDGET_TOKENS)))
+
+
+def pack_outputs(outputs: list[str], query: str, budget_tokens: int) -> list[PackResult]:
+    """Pack upstream outputs, in order, into one budget they share.
+
+    Each output gets what remains of the budget divided by the outputs not packed yet;
+    passages already kept from an earlier output are dropped.
+    """
+    results: list[PackResult] = []
+    seen: set[str] = set()
+    used = 0
+    for index, text in enumerate(outputs):
+        share = max(0, budget_tokens - used) // (len(outputs) - index)
+        result = pack(text, query, share, seen)
+        seen |= result.fingerprints
+        used += result.packed_tokens
+        results.append(result)
+    return results
+
+
+class PackedContextTask(Task):
+    """A task that reads its ``context`` tasks packed into a token budget.
+
+    The packed text is built when this task runs and handed to it alone: the upstream
+    tasks keep their full output for any other task that reads them.
+    """
+
+    context_budget_tokens: int | None = Field(
+        default=None,
+        description="Token budget of the packed context; None reads EPIC_CONTEXT_BUDGET_TOKENS, 0 disables.",
+    )
+
+    def packed_context(self, context: str | None) -> str | None:
+        """The context CrewAI built for this task, packed from the upstream outputs."""
+        budget = budget_from_env() if self.context_budget_tokens is None else self.context_budget_tokens
+        if budget <= 0 or not context or not isinstance(self.context, list):
+            return context
+        upstream = [task for task in self.context if task.output is not None]
+        try:
+            query = f"{self.description}\n{self.expected_output or ''}"
+            results = pack_outputs([task.output.raw or "" for task in upstream], query, budget)
+        except Exception as e:
+            logger.warning(f"⚠️ Context packing skipped: {e}")
+            return context
+        for task, result in zip(upstream, results, strict=True):
+            logger.info(
+                f"🗜️ Context for {self.name or 'task'} from {task.name or 'task'}: "
+                f"{result.original_tokens} → {result.packed_tokens} tokens ({result.ratio:.0%}, "
+                f"{result.duplicates} duplicate and {result.omitted} omitted passages)"
+            )
+        return DIVIDERS.join(result.text for result in results)
+
+    # CrewAI runs every execution path (sync, async, threaded) through these two.
+    def _execute_core(self, agent: Any, context: str | None, tools: Any) -> Any:
+        return super()._execute_core(agent, self.packed_context(context), tools)
+
+    async def _aexecute_core(self, agent: Any, context: str | None, tools: Any) -> Any:
+        return await super()._aexecute_core(agent, self.packed_context(context), tools)
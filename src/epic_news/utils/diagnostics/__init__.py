@@ -1,10 +1,11 @@
 from .analysis import analyze_crewai_output, log_state_keys
-from .dumping import dump_crewai_state, make_serializable
+from .dumping import dump_crewai_state, load_crewai_state, make_serializable
 from .parsing import parse_crewai_output
 
 __all__ = [
     "parse_crewai_output",
     "dump_crewai_state",
+    "load_crewai_state",
     "make_serializable",
     "analyze_crewai_output",
     "log_state_keys",
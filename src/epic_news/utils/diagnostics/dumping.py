@@ -2,84 +2,279 @@
 
 Public API:
 - dump_crewai_state
+- load_crewai_state
 - make_serializable
+
+With ``DEBUG_STATE=true`` every crew's output is dumped for post-mortems. The flow
+thread only takes a bounded, JSON-safe snapshot (strings, lists and nesting are
+capped, cycles are cut, Pydantic models go through ``model_dump``); encoding,
+compression, the write and the ``debug/`` retention sweep run on the shared
+background writer (``epic_news.utils.spans``).
+
+Environment:
+    DEBUG_STATE: "true" to dump (default "false")
+    EPIC_DEBUG_COMPRESSION: "zstd", "gzip" or "none" (default: zstd when available, else gzip)
+    EPIC_DEBUG_MAX_STRING: characters kept per string field (default 20000)
+    EPIC_DEBUG_MAX_ITEMS: items kept per list or dict (default 1000)
+    EPIC_DEBUG_MAX_FILES: dumps kept in the debug directory (default 200)
+    EPIC_DEBUG_MAX_AGE_DAYS: dumps older than this are deleted (default 7)
+    EPIC_DEBUG_MAX_MB: total size kept in the debug directory (default 500)
 """
 
 from __future__ import annotations
 
+import gzip
 import json
 import os
 import time
+from dataclasses import dataclass
+from pathlib import Path
 from typing import Any
 
 from loguru import logger
 
 from epic_news.utils.directory_utils import ensure_output_directory
+from epic_news.utils.spans import get_background_writer
+
+# zstd is optional: the stdlib module on Python 3.14+, else the zstandard package.
+try:
+    from compression import zstd as _zstd  # type: ignore[import-not-found]
+
+    def _zstd_compress(data: bytes) -> bytes:
+        return _zstd.compress(data, level=3)
+
+    def _zstd_decompress(data: bytes) -> bytes:
+        return _zstd.decompress(data)
+
+    ZSTD_AVAILABLE = True
+except ImportError:
+    try:
+        import zstandard as _zstd  # type: ignore[import-not-found, no-redef]
+
+        def _zstd_compress(data: bytes) -> bytes:
+            return _zstd.ZstdCompressor(level=3).compress(data)
+
+        def _zstd_decompress(data: bytes) -> bytes:
+            return _zstd.ZstdDecompressor().decompress(data)
+
+        ZSTD_AVAILABLE = True
+    except ImportError:
+        ZSTD_AVAILABLE = False
+
+STATE_FILE_PREFIX = "crewai_state_"
+MAX_DEPTH = 12
+_SUFFIXES = {"zstd": ".json.zst", "gzip": ".json.gz", "none": ".json"}
+
+
+@dataclass(frozen=True)
+class DumpLimits:
+    """Caps applied while snapshotting, so one runaway field cannot bloat a dump."""
+
+    max_string: int | None = None
+    max_items: int | None = None
+    max_depth: int = MAX_DEPTH
+
+    @classmethod
+    def from_env(cls) -> DumpLimits:
+        return cls(
+            max_string=int(os.getenv("EPIC_DEBUG_MAX_STRING", "20000")),
+            max_items=int(os.getenv("EPIC_DEBUG_MAX_ITEMS", "1000")),
+        )
+
+
+_UNLIMITED = DumpLimits(max_depth=10_000)
+
+
+def _clip_string(value: str, limits: DumpLimits) -> str:
+    if limits.max_string is None or len(value) <= limits.max_string:
+        return value
+    return f"{value[: limits.max_string]}… [truncated {len(value) - limits.max_string} chars]"
+
+
+def _clip(value: Any, limits: DumpLimits, depth: int) -> Any:
+    """Apply ``limits`` to an already JSON-safe value (a ``model_dump(mode="json")``)."""
+    if isinstance(value, str):
+        return _clip_string(value, limits)
+    if depth >= limits.max_depth and isinstance(value, dict | list):
+        return f"<{type(value).__name__} of {len(value)} items, max depth reached>"
+    if isinstance(value, dict):
+        items = list(value.items())
+        clipped = {str(k): _clip(v, limits, depth + 1) for k, v in items[: limits.max_items]}
+        if limits.max_items is not None and len(items) > limits.max_items:
+            clipped["…"] = f"{len(items) - limits.max_items} more keys"
+        return clipped
+    if isinstance(value, list):
+        clipped_list = [_clip(v, limits, depth + 1) for v in value[: limits.max_items]]
+        if limits.max_items is not None and len(value) > limits.max_items:
+            clipped_list.append(f"… {len(value) - limits.max_items} more items")
+        return clipped_list
+    return value
+
+
+def _serialize(obj: Any, limits: DumpLimits, depth: int, path: set[int]) -> Any:
+    if obj is None or isinstance(obj, bool | int | float):
+        return obj
+    if isinstance(obj, str):
+        return _clip_string(obj, limits)
+    if isinstance(obj, type):
+        return f"{obj.__module__}.{obj.__qualname__}"
+    if depth >= limits.max_depth:
+        return f"<{type(obj).__name__}, max depth reached>"
+    if id(obj) in path:
+        return f"<cycle: {type(obj).__name__}>"
+    path.add(id(obj))
+    try:
+        if hasattr(obj, "model_dump"):
+            # Pydantic fast path: the core serializer walks the model, we only clip it.
+            try:
+                dumped = obj.model_dump(mode="json", fallback=str)
+                return dumped if limits is _UNLIMITED else _clip(dumped, limits, depth)
+            except Exception:  # noqa: S110 - a model with an unserializable field; walk it instead
+                pass
+        if isinstance(obj, dict):
+            items = list(obj.items())
+            result = {str(k): _serialize(v, limits, depth + 1, path) for k, v in items[: limits.max_items]}
+            if limits.max_items is not None and len(items) > limits.max_items:
+                result["…"] = f"{len(items) - limits.max_items} more keys"
+            return result
+        if isinstance(obj, list | tuple | set | frozenset):
+            values = list(obj)
+            result_list = [_serialize(v, limits, depth + 1, path) for v in values[: limits.max_items]]
+            if limits.max_items is not None and len(values) > limits.max_items:
+                result_list.append(f"… {len(values) - limits.max_items} more items")
+            return result_list
+        if hasattr(obj, "__dict__"):
+            # Arbitrary objects: public attributes only, so clients, locks and caches stay out.
+            public = {k: v for k, v in vars(obj).items() if not k.startswith("_")}
+            return _serialize(public, limits, depth, path)
+        return str(obj)
+    finally:
+        path.discard(id(obj))
 
 
-def make_serializable(obj: Any) -> Any:
+def make_serializable(obj: Any, limits: DumpLimits | None = None) -> Any:
     """
     Convert any object to a JSON-serializable format.
 
     Args:
         obj: Object to convert
+        limits: Optional caps on string length, collection size and nesting depth
 
     Returns:
-        JSON-serializable representation of the object
+        JSON-serializable representation of the object; reference cycles become
+        ``"<cycle: Type>"`` markers
     """
-    if obj is None:
-        return None
-    if hasattr(obj, "model_dump"):
-        # Pydantic models
-        return obj.model_dump()
-    if hasattr(obj, "__dict__"):
-        # Custom objects with attributes
-        return {k: make_serializable(v) for k, v in obj.__dict__.items()}
-    if isinstance(obj, list | tuple):
-        # Lists and tuples
-        return [make_serializable(item) for item in obj]
-    if isinstance(obj, dict):
-        # Dictionaries
-        return {k: make_serializable(v) for k, v in obj.items()}
-    if isinstance(obj, str | int | float | bool):
-        # Basic types
-        return obj
-    # Fallback to string representation
-    return str(obj)
+    return _serialize(obj, limits or _UNLIMITED, 0, set())
+
+
+def _compression() -> str:
+    configured = os.getenv("EPIC_DEBUG_COMPRESSION", "").strip().lower()
+    if configured in _SUFFIXES and (configured != "zstd" or ZSTD_AVAILABLE):
+        return configured
+    return "zstd" if ZSTD_AVAILABLE else "gzip"
+
+
+def _encode(snapshot: Any, compression: str) -> bytes:
+    data = json.dumps(snapshot, ensure_ascii=False, default=str).encode("utf-8")
+    if compression == "zstd":
+        return _zstd_compress(data)
+    if compression == "gzip":
+        return gzip.compress(data, compresslevel=6)
+    return data
+
+
+def prune_debug_dir(
+    debug_dir: str | os.PathLike[str],
+    max_files: int | None = None,
+    max_age_days: float | None = None,
+    max_bytes: int | None = None,
+) -> list[Path]:
+    """Delete old state dumps in ``debug_dir``; returns the removed paths.
+
+    Dumps older than ``max_age_days`` go first, then the oldest ones until at most
+    ``max_files`` remain and they total at most ``max_bytes``. Defaults come from
+    ``EPIC_DEBUG_MAX_FILES``, ``EPIC_DEBUG_MAX_AGE_DAYS`` and ``EPIC_DEBUG_MAX_MB``.
+    """
+    max_files = max_files if max_files is not None else int(os.getenv("EPIC_DEBUG_MAX_FILES", "200"))
+    if max_age_days is None:
+        max_age_days = float(os.getenv("EPIC_DEBUG_MAX_AGE_DAYS", "7"))
+    if max_bytes is None:
+        max_bytes = int(float(os.getenv("EPIC_DEBUG_MAX_MB", "500")) * 1024 * 1024)
+
+    dumps = []
+    for path in Path(debug_dir).glob(f"{STATE_FILE_PREFIX}*"):
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            continue
+        dumps.append((stat.st_mtime, stat.st_size, path))
+    dumps.sort(reverse=True)  # newest first
+
+    cutoff = time.time() - max_age_days * 86400
+    removed, kept_bytes, kept = [], 0, 0
+    for mtime, size, path in dumps:
+        if mtime < cutoff or kept >= max_files or kept_bytes + size > max_bytes:
+            path.unlink(missing_ok=True)
+            removed.append(path)
+        else:
+            kept += 1
+            kept_bytes += size
+    return removed
 
 
-def dump_crewai_state(state_data: dict[str, Any], crew_name: str, debug_dir: str = "debug") -> str:
+def _write_dump(path: Path, snapshot: Any, compression: str, debug_dir: str) -> None:
+    """Writer-thread half of :func:`dump_crewai_state`."""
+    try:
+        payload = _encode(snapshot, compression)
+        tmp = path.with_name(f".{path.name}.tmp")
+        tmp.write_bytes(payload)
+        os.replace(tmp, path)
+        logger.info(f"🐛 CrewAI state dumped to: {path} ({len(payload) / 1024:.0f} KiB)")
+        prune_debug_dir(debug_dir)
+    except Exception as e:
+        logger.warning(f"⚠️ Failed to dump state to JSON: {e}")
+
+
+def dump_crewai_state(state_data: Any, crew_name: str, debug_dir: str = "debug") -> str:
     """
-    Dump CrewAI state to a JSON file for debugging purposes.
+    Dump CrewAI state to a compressed JSON file for debugging purposes.
+
+    The snapshot is taken now; the file is written in the background.
 
     Args:
-        state_data: The state data dictionary to dump
+        state_data: The state data (dict, CrewOutput, Pydantic model...) to dump
         crew_name: Name of the crew (used in filename)
         debug_dir: Directory to save debug files (default: "debug")
 
     Returns:
-        str: Path to the created debug file, or empty string if failed
+        str: Path of the debug file being written, or empty string if disabled or failed
     """
     if os.environ.get("DEBUG_STATE", "false").lower() != "true":
         return ""
     try:
-        # Create debug directory if it doesn't exist
         ensure_output_directory(debug_dir)
-
-        # Generate timestamped filename
-        timestamp = int(time.time())
-        debug_file = os.path.join(debug_dir, f"crewai_state_{crew_name.lower()}_{timestamp}.json")
-
-        # Convert state_data to JSON-serializable format
-        serializable_state = make_serializable(state_data)
-
-        # Write to file with proper encoding
-        with open(debug_file, "w", encoding="utf-8") as f:
-            json.dump(serializable_state, f, indent=2, ensure_ascii=False)
-
-        logger.info(f"🐛 CrewAI state dumped to: {debug_file}")
-        return debug_file
+        compression = _compression()
+        timestamp = int(time.time() * 1000)
+        debug_file = Path(debug_dir) / (
+            f"{STATE_FILE_PREFIX}{crew_name.lower()}_{timestamp}{_SUFFIXES[compression]}"
+        )
+        snapshot = make_serializable(state_data, DumpLimits.from_env())
+        get_background_writer().submit(lambda: _write_dump(debug_file, snapshot, compression, debug_dir))
+        return str(debug_file)
 
     except Exception as e:
         logger.warning(f"⚠️ Failed to dump state to JSON: {e}")
         return ""
+
+
+def load_crewai_state(path: str | os.PathLike[str]) -> Any:
+    """Read back a dump written by :func:`dump_crewai_state`, whatever its compression."""
+    data = Path(path).read_bytes()
+    name = os.fspath(path)
+    if name.endswith(".zst"):
+        if not ZSTD_AVAILABLE:
+            raise RuntimeError(f"{name} is zstd-compressed; install zstandard to read it")
+        data = _zstd_decompress(data)
+    elif name.endswith(".gz"):
+        data = gzip.decompress(data)
+    return json.loads(data.decode("utf-8"))
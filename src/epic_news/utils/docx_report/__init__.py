@@ -1,6 +1,14 @@
 from epic_news.utils.docx_report.assemble import assemble_fragments
 from epic_news.utils.docx_report.docx_builder import build_docx
+from epic_news.utils.docx_report.fragment_cache import FragmentCache, disable_fragment_cache
 from epic_news.utils.docx_report.fragments import generate_fragment
 from epic_news.utils.docx_report.sections import Section
 
-__all__ = ["Section", "assemble_fragments", "build_docx", "generate_fragment"]
+__all__ = [
+    "FragmentCache",
+    "Section",
+    "assemble_fragments",
+    "build_docx",
+    "disable_fragment_cache",
+    "generate_fragment",
+]
@@ -5,6 +5,7 @@ from typing import Any
 from loguru import logger
 
 from epic_news.utils.docx_report.docx_builder import build_docx
+from epic_news.utils.docx_report.fragment_cache import get_fragment_cache
 from epic_news.utils.docx_report.fragments import generate_fragment, placeholder_for
 from epic_news.utils.docx_report.sections import Section
 
@@ -40,4 +41,9 @@ def assemble_fragments(
             f"refusing to write {output_path}"
         )
 
-    return build_docx(fragments, meta, output_path)
+    path = build_docx(fragments, meta, output_path)
+    if cache := get_fragment_cache():
+        evicted = cache.prune()
+        if evicted:
+            logger.debug("🧹 Evicted {} stale fragment cache entries", evicted)
+    return path
@@ -1,5 +1,6 @@
 """BOOK_SUMMARY → DOCX: narrated prose + deterministic lists (TOC, chapters, references)."""
 
+from collections.abc import Mapping
 from typing import Any
 
 from epic_news.config.llm_config import LLMConfig
@@ -17,7 +18,7 @@ def _bullets(items: list[str]) -> str:
 
 
 def assemble_book_summary_docx(
-    model: BookSummaryReport, inputs: dict, output_path: str, llm: Any = None
+    model: BookSummaryReport, inputs: Mapping[str, Any], output_path: str, llm: Any = None
 ) -> str:
     """Build the BOOK_SUMMARY report as a DOCX: narrated prose + deterministic lists."""
     llm = llm or LLMConfig.get_openrouter_llm()
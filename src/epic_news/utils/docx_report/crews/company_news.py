@@ -1,5 +1,6 @@
 """COMPANY_NEWS → DOCX: narrated summary + deterministic per-section article bullets."""
 
+from collections.abc import Mapping
 from typing import Any
 
 from epic_news.config.llm_config import LLMConfig
@@ -20,7 +21,7 @@ def _articles_body(articles: list[ArticleItem]) -> str:
 
 
 def assemble_company_news_docx(
-    model: CompanyNewsReport, inputs: dict, output_path: str, llm: Any = None
+    model: CompanyNewsReport, inputs: Mapping[str, Any], output_path: str, llm: Any = None
 ) -> str:
     """Build the COMPANY_NEWS report as a DOCX: narrated summary + deterministic article bullets."""
     llm = llm or LLMConfig.get_openrouter_llm()
@@ -5,6 +5,7 @@ verbatim, split line-by-line. The LLM is NEVER used to rewrite them — only the
 optional Notes section is narrated.
 """
 
+from collections.abc import Mapping
 from typing import Any
 
 from epic_news.config.llm_config import LLMConfig
@@ -30,7 +31,9 @@ def _directions_block(directions: str) -> str:
     return "\n\n".join(lines) if lines else "_Aucune étape._"
 
 
-def assemble_cooking_docx(model: PaprikaRecipe, inputs: dict, output_path: str, llm: Any = None) -> str:
+def assemble_cooking_docx(
+    model: PaprikaRecipe, inputs: Mapping[str, Any], output_path: str, llm: Any = None
+) -> str:
     """Build the COOKING report as a DOCX: deterministic recipe + narrated notes."""
     llm = llm or LLMConfig.get_openrouter_llm()
     info_rows = [
@@ -6,6 +6,7 @@ produce. (An earlier draft targeted the parallel ``deep_research_report.py`` mod
 which the flow never emits; see the Task 5/7 integration fix.)
 """
 
+from collections.abc import Mapping
 from typing import Any
 
 from loguru import logger
@@ -35,7 +36,7 @@ def _sources_block(sources: list[ResearchSource]) -> str:
 
 
 def assemble_deep_research_docx(
-    model: DeepResearchReport, inputs: dict, output_path: str, llm: Any = None
+    model: DeepResearchReport, inputs: Mapping[str, Any], output_path: str, llm: Any = None
 ) -> str:
     """Build the DEEPRESEARCH report as a DOCX: narrated prose + deterministic findings/sources."""
     llm = llm or LLMConfig.get_openrouter_llm()
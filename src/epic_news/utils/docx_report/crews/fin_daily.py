@@ -1,5 +1,6 @@
 """FINDAILY → DOCX: narrated summary + deterministic analysis/suggestion tables (exact figures)."""
 
+from collections.abc import Mapping
 from typing import Any
 
 from epic_news.config.llm_config import LLMConfig
@@ -13,7 +14,9 @@ _PERSONA = (
 )
 
 
-def assemble_fin_daily_docx(model: FinancialReport, inputs: dict, output_path: str, llm: Any = None) -> str:
+def assemble_fin_daily_docx(
+    model: FinancialReport, inputs: Mapping[str, Any], output_path: str, llm: Any = None
+) -> str:
     """Build the FINDAILY report as a DOCX: narrated summary + deterministic tables."""
     llm = llm or LLMConfig.get_openrouter_llm()
     analyses_rows = [
@@ -1,5 +1,6 @@
 """MEETING_PREP → DOCX: narrated summary/overview + deterministic profile/table/lists."""
 
+from collections.abc import Mapping
 from typing import Any
 
 from epic_news.config.llm_config import LLMConfig
@@ -18,7 +19,7 @@ def _bullets(items: list[str]) -> str:
 
 
 def assemble_meeting_prep_docx(
-    model: MeetingPrepReport, inputs: dict, output_path: str, llm: Any = None
+    model: MeetingPrepReport, inputs: Mapping[str, Any], output_path: str, llm: Any = None
 ) -> str:
     """Build the MEETING_PREP report as a DOCX: narrated summary/overview + deterministic rest."""
     llm = llm or LLMConfig.get_openrouter_llm()
@@ -6,6 +6,7 @@ dish names, descriptions, or ingredients. Only the analytical sections
 (nutritional balance, gustative coherence, adaptations) are narrated.
 """
 
+from collections.abc import Mapping
 from typing import Any
 
 from epic_news.config.llm_config import LLMConfig
@@ -47,7 +48,9 @@ def _day_block(dm: DailyMenu) -> str:
     return f"## {dm.day} — {dm.date}\n\n**Déjeuner**\n{lunch_lines}\n\n**Dîner**\n{dinner_lines}"
 
 
-def assemble_menu_docx(model: WeeklyMenuPlan, inputs: dict, output_path: str, llm: Any = None) -> str:
+def assemble_menu_docx(
+    model: WeeklyMenuPlan, inputs: Mapping[str, Any], output_path: str, llm: Any = None
+) -> str:
     """Build the MENU report as a DOCX: deterministic weekly plan + narrated analysis."""
     llm = llm or LLMConfig.get_openrouter_llm()
     daily_menus_body = (
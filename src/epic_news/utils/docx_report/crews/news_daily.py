@@ -1,5 +1,6 @@
 """NEWSDAILY → DOCX: narrated summary + deterministic, union-aware region sections."""
 
+from collections.abc import Mapping
 from typing import Any
 
 from epic_news.config.llm_config import LLMConfig
@@ -49,7 +50,9 @@ def _methodology_body(m: object) -> str | None:
     return str(m).strip()
 
 
-def assemble_news_daily_docx(model: NewsDailyReport, inputs: dict, output_path: str, llm: Any = None) -> str:
+def assemble_news_daily_docx(
+    model: NewsDailyReport, inputs: Mapping[str, Any], output_path: str, llm: Any = None
+) -> str:
     """Build the NEWSDAILY report as a DOCX: narrated summary + deterministic region sections."""
     llm = llm or LLMConfig.get_openrouter_llm()
     sections: list[Section] = []
@@ -9,6 +9,7 @@ recursive nested-bullet renderer (its fields are NOT hardcoded).
 """
 
 import json
+from collections.abc import Mapping
 from pathlib import Path
 from typing import Any
 
@@ -89,7 +90,7 @@ def _load_json(path: Path) -> dict | None:
 
 
 def assemble_osint_docx(
-    inputs: dict, output_path: str, llm: Any = None, osint_dir: str = "output/osint"
+    inputs: Mapping[str, Any], output_path: str, llm: Any = None, osint_dir: str = "output/osint"
 ) -> str:
     """Build the consolidated OSINT report as a DOCX from the raw JSON files.
 
@@ -5,6 +5,7 @@ Consumes the flow's ``PestelReport`` (``models/crews/pestel_report.py``) — the
 there is no deterministic verbatim section in this report.
 """
 
+from collections.abc import Mapping
 from typing import Any
 
 from epic_news.config.llm_config import LLMConfig
@@ -49,7 +50,9 @@ def _sources_section(model: PestelReport) -> Section | None:
     return Section("Sources", body="\n\n".join(blocks))
 
 
-def assemble_pestel_docx(model: PestelReport, inputs: dict, output_path: str, llm: Any = None) -> str:
+def assemble_pestel_docx(
+    model: PestelReport, inputs: Mapping[str, Any], output_path: str, llm: Any = None
+) -> str:
     """Build the PESTEL report as a DOCX: fully narrated strategic analysis prose."""
     llm = llm or LLMConfig.get_openrouter_llm()
     sections: list[Section] = [
@@ -1,5 +1,6 @@
 """RSS_WEEKLY → DOCX: narrated summary + deterministic overview and per-feed digests."""
 
+from collections.abc import Mapping
 from typing import Any
 
 from epic_news.config.llm_config import LLMConfig
@@ -18,7 +19,9 @@ def _feed_body(feed) -> str:
     return "\n".join(f"- **{a.title}** ({a.published}) : {a.summary} — {a.link}" for a in feed.articles)
 
 
-def assemble_rss_docx(model: RssWeeklyReport, inputs: dict, output_path: str, llm: Any = None) -> str:
+def assemble_rss_docx(
+    model: RssWeeklyReport, inputs: Mapping[str, Any], output_path: str, llm: Any = None
+) -> str:
     """Build the RSS_WEEKLY report as a DOCX: narrated summary + deterministic digests."""
     llm = llm or LLMConfig.get_openrouter_llm()
     sections: list[Section] = []
@@ -1,5 +1,6 @@
 """SAINT → DOCX: narrated prose + deterministic sources."""
 
+from collections.abc import Mapping
 from typing import Any
 
 from epic_news.config.llm_config import LLMConfig
@@ -16,7 +17,9 @@ def _bullets(items: list[str]) -> str:
     return "\n".join(f"- {i}" for i in items) if items else "_Aucune._"
 
 
-def assemble_saint_docx(model: SaintData, inputs: dict, output_path: str, llm: Any = None) -> str:
+def assemble_saint_docx(
+    model: SaintData, inputs: Mapping[str, Any], output_path: str, llm: Any = None
+) -> str:
     """Build the SAINT report as a DOCX: narrated prose + deterministic sources."""
     llm = llm or LLMConfig.get_openrouter_llm()
     sections: list[Section] = [
@@ -1,5 +1,6 @@
 """SALES_PROSPECTING → DOCX: narrated overview/strategy/insights + deterministic contacts table."""
 
+from collections.abc import Mapping
 from typing import Any
 
 from epic_news.config.llm_config import LLMConfig
@@ -14,7 +15,7 @@ _PERSONA = (
 
 
 def assemble_sales_prospecting_docx(
-    model: SalesProspectingReport, inputs: dict, output_path: str, llm: Any = None
+    model: SalesProspectingReport, inputs: Mapping[str, Any], output_path: str, llm: Any = None
 ) -> str:
     """Build the SALES_PROSPECTING report as a DOCX: narrated sections + deterministic contacts table."""
     llm = llm or LLMConfig.get_openrouter_llm()
@@ -1,5 +1,6 @@
 """SHOPPING → DOCX: narrated summary/recommendations + deterministic product/price/competitor tables."""
 
+from collections.abc import Mapping
 from typing import Any
 
 from epic_news.config.llm_config import LLMConfig
@@ -48,7 +49,7 @@ def _price_rows(prices: list) -> list[dict]:
 
 
 def assemble_shopping_docx(
-    model: ShoppingAdviceOutput, inputs: dict, output_path: str, llm: Any = None
+    model: ShoppingAdviceOutput, inputs: Mapping[str, Any], output_path: str, llm: Any = None
 ) -> str:
     """Build the SHOPPING report as a DOCX: narrated prose + deterministic product/price/competitor tables."""
     llm = llm or LLMConfig.get_openrouter_llm()
@@ -1,18 +1,31 @@
-"""Deterministic assembly of Markdown fragments into a single DOCX via Pandoc."""
+"""Deterministic assembly of Markdown fragments into a single DOCX.
 
+Two backends write the same layout (title block, TOC, one H1 per fragment):
+
+- ``native`` (default): python-docx in process, see `native_writer`.
+- ``pandoc``: ``pypandoc.convert_text``, one Pandoc subprocess per report.
+
+``EPIC_DOCX_BACKEND`` picks one; a native failure falls back to Pandoc.
+"""
+
+import os
 from pathlib import Path
 
-import pypandoc
 from loguru import logger
 
+from epic_news.utils.progress import emit
+
 _REFERENCE_DOC = Path(__file__).parent / "reference.docx"
+_BACKENDS = ("native", "pandoc")
 
 
-def build_docx(fragments: list[tuple[str, str]], meta: dict[str, str], output_path: str) -> str:
-    """Assemble ordered (heading, markdown_body) fragments into a DOCX with a TOC.
+def _reference_doc() -> Path | None:
+    return _REFERENCE_DOC if _REFERENCE_DOC.exists() else None
+
+
+def _build_with_pandoc(fragments: list[tuple[str, str]], meta: dict[str, str], output_path: str) -> None:
+    import pypandoc
 
-    Each fragment becomes a top-level (H1) section. Deterministic: no LLM, no network.
-    """
     title = meta.get("title", "Rapport")
     date = meta.get("date", "")
     parts: list[str] = [f"% {title}", f"% {meta.get('author', 'Epic News')}", f"% {date}", ""]
@@ -21,18 +34,50 @@ def build_docx(fragments: list[tuple[str, str]], meta: dict[str, str], output_pa
         parts.append((body or "").strip() + "\n")
     markdown = "\n".join(parts)
 
-    Path(output_path).parent.mkdir(parents=True, exist_ok=True)
     extra_args = ["--toc", "--standalone"]
-    if _REFERENCE_DOC.exists():
-        extra_args += ["--reference-doc", str(_REFERENCE_DOC)]
+    if reference_doc := _reference_doc():
+        extra_args += ["--reference-doc", str(reference_doc)]
     # LLM fragment bodies use `---` as separators. Disable yaml_metadata_block so every
     # `---` stays a thematic break (otherwise Pandoc dies with exitcode 64).
+    # Assemblers write "**Label :**" straight above a list; without
+    # lists_without_preceding_blankline Pandoc folds the items into that paragraph.
     pypandoc.convert_text(
         markdown,
         to="docx",
-        format="markdown-yaml_metadata_block",
+        format="markdown-yaml_metadata_block+lists_without_preceding_blankline",
         outputfile=output_path,
         extra_args=extra_args,
     )
-    logger.info("📄 DOCX written to {}", output_path)
+
+
+def _build_native(fragments: list[tuple[str, str]], meta: dict[str, str], output_path: str) -> None:
+    from epic_news.utils.docx_report.native_writer import write_docx
+
+    write_docx(fragments, meta, output_path, reference_doc=_reference_doc())
+
+
+def build_docx(
+    fragments: list[tuple[str, str]], meta: dict[str, str], output_path: str, backend: str | None = None
+) -> str:
+    """Assemble ordered (heading, markdown_body) fragments into a DOCX with a TOC.
+
+    Each fragment becomes a top-level (H1) section. Deterministic: no LLM, no network.
+    ``backend`` overrides ``EPIC_DOCX_BACKEND`` (``native`` or ``pandoc``).
+    """
+    backend = (backend or os.getenv("EPIC_DOCX_BACKEND", "native")).strip().lower()
+    if backend not in _BACKENDS:
+        logger.warning("⚠️ Unknown EPIC_DOCX_BACKEND {!r}; using native", backend)
+        backend = "native"
+
+    Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+    if backend == "native":
+        try:
+            _build_native(fragments, meta, output_path)
+        except Exception as exc:  # noqa: BLE001 - Pandoc is the fallback, never lose the report
+            logger.warning("⚠️ Native DOCX writer failed ({}); falling back to Pandoc", exc)
+            backend = "pandoc"
+    if backend == "pandoc":
+        _build_with_pandoc(fragments, meta, output_path)
+    logger.info("📄 DOCX written to {} ({})", output_path, backend)
+    emit("artefact_written", path=str(output_path), format="docx")
     return output_path
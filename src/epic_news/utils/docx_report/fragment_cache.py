@@ -0,0 +1,109 @@
+"""Persistent cache of narrated DOCX fragments.
+
+Re-generating a DOCX after a template tweak or a failed final step used to re-narrate
+every section. :func:`generate_fragment` now looks each section up by the SHA-256 of
+(persona, heading, instruction, context, model) first, so only sections whose inputs
+changed cost an LLM call. Placeholders are never stored.
+
+Entries are one Markdown file each under ``EPIC_FRAGMENT_CACHE_DIR`` (default
+``output/.cache/fragments``); a hit refreshes the file's mtime, and after each
+assembled document the least recently used entries are evicted beyond
+``EPIC_FRAGMENT_CACHE_MAX_ENTRIES`` (default 5000) or
+``EPIC_FRAGMENT_CACHE_MAX_AGE_DAYS`` (default 30).
+
+Disable with ``EPIC_FRAGMENT_CACHE=false`` or the ``--no-fragment-cache`` flag of
+``kickoff`` and ``kickoff-batch``.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import time
+import uuid
+from pathlib import Path
+from typing import Any
+
+from loguru import logger
+
+DEFAULT_CACHE_DIR = "output/.cache/fragments"
+_FALSY = {"0", "false", "no", "off"}
+
+_disabled = False
+
+
+def disable_fragment_cache(disabled: bool = True) -> None:
+    """Bypass the cache for this process (the ``--no-fragment-cache`` flag)."""
+    global _disabled
+    _disabled = disabled
+
+
+def fragment_cache_enabled() -> bool:
+    return not _disabled and os.getenv("EPIC_FRAGMENT_CACHE", "true").strip().lower() not in _FALSY
+
+
+def model_name(llm: Any) -> str:
+    """The model an LLM object narrates with, part of the cache key."""
+    return str(getattr(llm, "model", None) or getattr(llm, "model_name", None) or type(llm).__name__)
+
+
+class FragmentCache:
+    """Narrated fragments on disk, addressed by a hash of everything that shapes them."""
+
+    def __init__(self, root: str | os.PathLike[str] | None = None):
+        self.root = Path(root or os.getenv("EPIC_FRAGMENT_CACHE_DIR", DEFAULT_CACHE_DIR))
+
+    @staticmethod
+    def key(persona: str, heading: str, instruction: str, context: str, model: str) -> str:
+        payload = json.dumps([persona, heading, instruction, context, model], ensure_ascii=False)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.root / key[:2] / f"{key}.md"
+
+    def get(self, key: str) -> str | None:
+        path = self._path(key)
+        try:
+            text = path.read_text(encoding="utf-8")
+            os.utime(path)  # eviction is least recently used
+        except OSError:
+            return None
+        return text or None
+
+    def put(self, key: str, fragment: str) -> None:
+        path = self._path(key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_name(f".{path.name}.{uuid.uuid4().hex[:8]}.tmp")
+            tmp.write_text(fragment, encoding="utf-8")
+            os.replace(tmp, path)
+        except OSError as e:
+            logger.warning(f"⚠️ Could not cache fragment {key[:12]}: {e}")
+
+    def prune(self, max_entries: int | None = None, max_age_days: float | None = None) -> int:
+        """Evict entries unused for ``max_age_days``, then the least recently used beyond
+        ``max_entries``; returns how many were removed."""
+        if max_entries is None:
+            max_entries = int(os.getenv("EPIC_FRAGMENT_CACHE_MAX_ENTRIES", "5000"))
+        if max_age_days is None:
+            max_age_days = float(os.getenv("EPIC_FRAGMENT_CACHE_MAX_AGE_DAYS", "30"))
+        entries = []
+        for path in self.root.glob("*/*.md"):
+            try:
+                entries.append((path.stat().st_mtime, path))
+            except FileNotFoundError:
+                continue
+        entries.sort(reverse=True)  # most recently used first
+        cutoff = time.time() - max_age_days * 86400
+        removed = 0
+        for kept, (mtime, path) in enumerate(entries):
+            if mtime < cutoff or kept >= max_entries:
+                path.unlink(missing_ok=True)
+                removed += 1
+        return removed
+
+
+def get_fragment_cache() -> FragmentCache | None:
+    """The cache, or None when it is disabled."""
+    return FragmentCache() if fragment_cache_enabled() else None
@@ -4,6 +4,7 @@ from typing import Any
 
 from loguru import logger
 
+from epic_news.utils.docx_report.fragment_cache import get_fragment_cache, model_name
 from epic_news.utils.interrupt import raise_if_cancelled
 
 # Raised by concurrent.futures once the interpreter starts tearing down (e.g. after a
@@ -29,6 +30,10 @@ def _is_fatal(exc: Exception) -> bool:
 def generate_fragment(heading: str, instruction: str, context: str, llm: Any, system: str) -> str:
     """Generate one Markdown section. On an isolated failure, return a placeholder.
 
+    A fragment already narrated from the same persona, heading, instruction, context
+    and model is served from the fragment cache without an LLM call; placeholders are
+    never cached (see `epic_news.utils.docx_report.fragment_cache`).
+
     Raises:
         RunCancelledError: the user interrupted the run before this section started.
         Exception: re-raised unchanged when the failure is unrecoverable for the whole
@@ -37,6 +42,11 @@ def generate_fragment(heading: str, instruction: str, context: str, llm: Any, sy
     """
     # Outside the try: a cancelled run must abort, never degrade to a placeholder.
     raise_if_cancelled(f"narration of section '{heading}'")
+    cache = get_fragment_cache()
+    key = cache.key(system, heading, instruction, context, model_name(llm)) if cache else ""
+    if cache and (cached := cache.get(key)) is not None:
+        logger.debug("♻️ Fragment '{}' served from cache", heading)
+        return cached
     messages = [
         {"role": "system", "content": system},
         {"role": "user", "content": f"Section: {heading}\n\nConsigne: {instruction}\n\nContexte:\n{context}"},
@@ -44,6 +54,8 @@ def generate_fragment(heading: str, instruction: str, context: str, llm: Any, sy
     try:
         md = (llm.call(messages) or "").strip()
         if md:
+            if cache:
+                cache.put(key, md)
             return md
         logger.warning("⚠️ Fragment '{}' returned empty; using placeholder", heading)
     except Exception as exc:  # noqa: BLE001 - degrade gracefully, never crash the report
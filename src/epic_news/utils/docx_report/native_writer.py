@@ -0,0 +1,449 @@
+"""In-process Markdown fragments → DOCX writer (python-docx + markdown-it).
+
+The default backend of :func:`~epic_news.utils.docx_report.docx_builder.build_docx`:
+no Pandoc subprocess, no Markdown round trip, so many reports can be written at once.
+It covers the Markdown the fragments actually contain (headings, paragraphs, emphasis,
+inline code, links, nested lists, GFM tables, block quotes, code blocks, thematic
+breaks) and maps it onto the same styles Pandoc uses, so ``reference.docx`` styles
+both backends alike. Raw HTML is dropped, as Pandoc does for DOCX.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from docx import Document
+from docx.enum.text import WD_BREAK
+from docx.opc.constants import RELATIONSHIP_TYPE as RT
+from docx.oxml import OxmlElement, parse_xml
+from docx.oxml.ns import nsdecls, qn
+from docx.shared import Pt, RGBColor
+from docx.styles import BabelFish
+from docx.text.paragraph import Paragraph
+from markdown_it import MarkdownIt
+from markdown_it.token import Token
+
+# Style names tried in order; the first one the document defines wins. Pandoc's
+# reference.docx names come first, python-docx's default template ones after.
+_STYLES: dict[str, tuple[str, ...]] = {
+    "title": ("Title",),
+    "author": ("Author", "Subtitle"),
+    "date": ("Date", "Subtitle"),
+    "toc_heading": ("TOC Heading",),
+    "first": ("First Paragraph", "Body Text", "Normal"),
+    "body": ("Body Text", "Normal"),
+    "quote": ("Block Text", "Quote", "Normal"),
+    "code": ("Source Code", "No Spacing", "Normal"),
+    "list": ("Compact", "List Paragraph", "Normal"),
+    "cell": ("Compact",),
+    "table": ("Table", "Table Grid"),
+    "link": ("Hyperlink",),
+    "verbatim": ("Verbatim Char",),
+}
+
+_INDENT_PT = 36  # one numbering level: w:ind left="720" twips
+_BULLETS = ("•", "◦", "▪")
+
+
+def _markdown() -> MarkdownIt:
+    # Pandoc's markdown reader has `smart` on: straight quotes become curly (markdown-it's
+    # smartquotes) and dashes/ellipses are substituted by `_smart`. markdown-it's own
+    # `replacements` rule is broader ("..", "(c)", "+-") than Pandoc's, so it stays off.
+    return MarkdownIt("commonmark", {"html": True, "typographer": True}).enable(
+        ["table", "strikethrough", "smartquotes"]
+    )
+
+
+def _smart(text: str) -> str:
+    return text.replace("---", "—").replace("--", "–").replace("...", "…")
+
+
+@dataclass
+class _Inline:
+    """Formatting state while walking an inline token stream."""
+
+    bold: int = 0
+    italic: int = 0
+    strike: int = 0
+    link: Any = None  # the open <w:hyperlink> element, if any
+
+
+@dataclass
+class _Block:
+    """Container state while walking the block token stream."""
+
+    lists: list[int] = field(default_factory=list)  # numId of each open list, outermost first
+    quote: int = 0
+    item_first: bool = False  # next paragraph is the first of a list item
+    first: bool = True  # next body paragraph is a "First Paragraph"
+
+
+class _Writer:
+    def __init__(self, reference_doc: Path | None):
+        self.doc = Document(str(reference_doc)) if reference_doc else Document()
+        body = self.doc.element.body
+        # A reference document ships sample content; keep only its section properties.
+        for child in list(body):
+            if child.tag != qn("w:sectPr"):
+                body.remove(child)
+        # Style ids resolved once: python-docx resolves a style name with a linear scan
+        # of styles.xml on every assignment, which dominated the run time.
+        by_name = {
+            BabelFish.internal2ui(style.name_val): style.styleId
+            for style in self.doc.styles.element.style_lst
+            if style.name_val
+        }
+        self.styles = {
+            role: next((n for n in candidates if n in by_name), None) for role, candidates in _STYLES.items()
+        }
+        self._ids = {role: by_name[name] for role, name in self.styles.items() if name}
+        self._ids.update(
+            {f"h{n}": by_name[f"Heading {n}"] for n in range(1, 10) if f"Heading {n}" in by_name}
+        )
+        self.md = _markdown()
+        self._abstracts: dict[str, int] = {}
+        self._bullet_num: int | None = None
+
+    # -- document skeleton ---------------------------------------------------------
+
+    def title_block(self, meta: dict[str, str]) -> None:
+        title = meta.get("title", "Rapport")
+        author = meta.get("author", "Epic News")
+        date = meta.get("date", "")
+        self.doc.core_properties.title = title
+        self.doc.core_properties.author = author
+        for role, text in (("title", title), ("author", author), ("date", date)):
+            if text:
+                self._inline(self._paragraph(role), self._inline_tokens(text))
+
+    def toc(self) -> None:
+        """A Word TOC field, wrapped like Pandoc's; Word fills it in when the file opens."""
+        sdt = OxmlElement("w:sdt")
+        sdt_pr = OxmlElement("w:sdtPr")
+        gallery = OxmlElement("w:docPartObj")
+        part = OxmlElement("w:docPartGallery")
+        part.set(qn("w:val"), "Table of Contents")
+        unique = OxmlElement("w:docPartUnique")
+        gallery.extend([part, unique])
+        sdt_pr.append(gallery)
+        content = OxmlElement("w:sdtContent")
+        sdt.extend([sdt_pr, content])
+
+        heading = self._detached_paragraph("toc_heading")
+        heading.add_run("Table of Contents")  # Pandoc's title, for identical output
+        p = self._detached_paragraph(None)
+        run = p.add_run()._r
+        begin = OxmlElement("w:fldChar")
+        begin.set(qn("w:fldCharType"), "begin")
+        begin.set(qn("w:dirty"), "true")
+        instr = OxmlElement("w:instrText")
+        instr.set(qn("xml:space"), "preserve")
+        instr.text = r'TOC \o "1-3" \h \z \u'
+        separate = OxmlElement("w:fldChar")
+        separate.set(qn("w:fldCharType"), "separate")
+        end = OxmlElement("w:fldChar")
+        end.set(qn("w:fldCharType"), "end")
+        run.extend([begin, instr, separate, end])
+        content.extend([heading._p, p._p])
+        self._append(sdt)
+
+        settings = self.doc.settings.element
+        if settings.find(qn("w:updateFields")) is None:
+            update = OxmlElement("w:updateFields")
+            update.set(qn("w:val"), "true")
+            settings.append(update)
+
+    def section(self, heading: str, body: str) -> None:
+        p = self._paragraph("h1")
+        self._inline(p, self._inline_tokens(heading))
+        self._blocks(self.md.parse((body or "").strip()))
+
+    def save(self, output_path: str) -> None:
+        self.doc.save(output_path)
+
+    # -- block level ---------------------------------------------------------------
+
+    def _blocks(self, tokens: list[Token]) -> None:
+        state = _Block()
+        i = 0
+        while i < len(tokens):
+            tok = tokens[i]
+            kind = tok.type
+            if kind == "heading_open":
+                p = self._paragraph(tok.tag)
+                self._inline(p, tokens[i + 1].children or [])
+                state.first = True
+                i += 3
+                continue
+            if kind == "paragraph_open":
+                p = self._paragraph(self._paragraph_role(state))
+                if state.lists and state.item_first:
+                    self._number(p, state.lists[-1], len(state.lists) - 1)
+                else:
+                    self._indent(p, state)
+                self._inline(p, tokens[i + 1].children or [])
+                state.item_first = False
+                state.first = False
+                i += 3
+                continue
+            if kind == "bullet_list_open":
+                state.lists.append(self._bullets())
+            elif kind == "ordered_list_open":
+                state.lists.append(self._numbered(len(state.lists), int(tok.attrs.get("start", 1))))
+            elif kind == "list_item_open":
+                state.item_first = True
+            elif kind == "blockquote_open":
+                state.quote += 1
+            elif kind in ("fence", "code_block"):
+                self._code(tok.content, state)
+            elif kind == "hr":
+                self._rule()
+            elif kind == "table_open":
+                i = self._table(tokens, i)
+                state.first = True
+                continue
+            if kind in ("bullet_list_close", "ordered_list_close"):
+                state.lists.pop()
+            elif kind == "blockquote_close":
+                state.quote -= 1
+            # Like Pandoc, the paragraph after any other block is a "First Paragraph".
+            if kind.endswith("_close") or kind in ("fence", "code_block", "hr"):
+                state.first = True
+            i += 1
+
+    def _paragraph_role(self, state: _Block) -> str:
+        if state.lists:
+            return "list"
+        if state.quote:
+            return "quote"
+        return "first" if state.first else "body"
+
+    def _indent(self, p: Paragraph, state: _Block) -> None:
+        """Indent list continuation paragraphs and nested quotes to their level."""
+        depth = len(state.lists) + max(state.quote - 1, 0)
+        if depth:
+            p.paragraph_format.left_indent = Pt(_INDENT_PT * depth)
+
+    # -- numbering -----------------------------------------------------------------
+
+    def _abstract(self, kind: str) -> int:
+        """Id of this document's bullet or decimal multi-level definition (created once)."""
+        if kind not in self._abstracts:
+            numbering = self.doc.part.numbering_part.element
+            used = [int(a.get(qn("w:abstractNumId"))) for a in numbering.findall(qn("w:abstractNum"))]
+            abstract_id = max(used, default=0) + 1
+            levels = "".join(
+                f'<w:lvl w:ilvl="{lvl}"><w:start w:val="1"/>'
+                + (
+                    f'<w:numFmt w:val="bullet"/><w:lvlText w:val="{_BULLETS[lvl % len(_BULLETS)]}"/>'
+                    if kind == "bullet"
+                    else f'<w:numFmt w:val="decimal"/><w:lvlText w:val="%{lvl + 1}."/>'
+                )
+                + f'<w:lvlJc w:val="left"/><w:pPr><w:ind w:left="{720 * (lvl + 1)}" w:hanging="360"/>'
+                "</w:pPr></w:lvl>"
+                for lvl in range(9)
+            )
+            abstract = parse_xml(
+                f'<w:abstractNum {nsdecls("w")} w:abstractNumId="{abstract_id}">'
+                f'<w:multiLevelType w:val="multilevel"/>{levels}</w:abstractNum>'
+            )
+            # Schema order: every <w:abstractNum> precedes the first <w:num>.
+            first_num = numbering.find(qn("w:num"))
+            if first_num is not None:
+                first_num.addprevious(abstract)
+            else:
+                numbering.append(abstract)
+            self._abstracts[kind] = abstract_id
+        return self._abstracts[kind]
+
+    def _new_num(self, abstract_id: int, level: int | None = None, start: int = 1) -> int:
+        numbering = self.doc.part.numbering_part.element
+        num = numbering.add_num(abstract_id)
+        if level is not None:
+            num.append(
+                parse_xml(
+                    f'<w:lvlOverride {nsdecls("w")} w:ilvl="{level}">'
+                    f'<w:startOverride w:val="{start}"/></w:lvlOverride>'
+                )
+            )
+        return int(num.numId)
+
+    def _bullets(self) -> int:
+        """The numId every bullet list shares."""
+        if self._bullet_num is None:
+            self._bullet_num = self._new_num(self._abstract("bullet"))
+        return self._bullet_num
+
+    def _numbered(self, level: int, start: int) -> int:
+        """A fresh numId per ordered list, so each one restarts at ``start``."""
+        return self._new_num(self._abstract("number"), level, start)
+
+    @staticmethod
+    def _number(p: Paragraph, num_id: int, level: int) -> None:
+        num_pr = p._p.get_or_add_pPr().get_or_add_numPr()
+        num_pr.get_or_add_ilvl().val = level
+        num_pr.get_or_add_numId().val = num_id
+
+    def _code(self, text: str, state: _Block) -> None:
+        p = self._paragraph("code")
+        self._indent(p, state)
+        lines = text.rstrip("\n").split("\n")
+        for n, line in enumerate(lines):
+            run = p.add_run(line)
+            if not self.styles["code"] or self.styles["code"] == "Normal":
+                run.font.name = "Consolas"
+            if n < len(lines) - 1:
+                run.add_break(WD_BREAK.LINE)
+
+    def _rule(self) -> None:
+        p = self._paragraph(None)
+        borders = OxmlElement("w:pBdr")
+        bottom = OxmlElement("w:bottom")
+        for attr, value in (("val", "single"), ("sz", "6"), ("space", "1"), ("color", "auto")):
+            bottom.set(qn(f"w:{attr}"), value)
+        borders.append(bottom)
+        p._p.get_or_add_pPr().append(borders)
+
+    def _table(self, tokens: list[Token], i: int) -> int:
+        """Write the GFM table starting at ``tokens[i]``; return the index after it."""
+        rows: list[list[list[Token]]] = []
+        header_rows = 0
+        in_head = False
+        while tokens[i].type != "table_close":
+            tok = tokens[i]
+            if tok.type == "thead_open":
+                in_head = True
+            elif tok.type == "thead_close":
+                in_head = False
+            elif tok.type == "tr_open":
+                rows.append([])
+                header_rows += in_head
+            elif tok.type == "inline":
+                rows[-1].append(tok.children or [])
+            i += 1
+        if not rows:
+            return i + 1
+        cols = max(len(r) for r in rows)
+        table = self.doc.add_table(rows=len(rows), cols=cols)
+        if "table" in self._ids:
+            table._tbl.tblStyle_val = self._ids["table"]
+        for r, row in enumerate(rows):
+            for c, children in enumerate(row):
+                cell = table.cell(r, c)
+                p = cell.paragraphs[0]
+                if "cell" in self._ids:
+                    p._p.style = self._ids["cell"]
+                self._inline(p, children, _Inline(bold=int(r < header_rows)))
+        return i + 1
+
+    # -- inline level --------------------------------------------------------------
+
+    def _inline_tokens(self, text: str) -> list[Token]:
+        tokens = self.md.parseInline(text)
+        return (tokens[0].children or []) if tokens else []
+
+    def _inline(self, p: Paragraph, children: list[Token], fmt: _Inline | None = None) -> None:
+        fmt = fmt or _Inline()
+        for tok in children:
+            kind = tok.type
+            if kind == "text":
+                self._run(p, _smart(tok.content), fmt)
+            elif kind == "code_inline":
+                self._run(p, tok.content, fmt, code=True)
+            elif kind == "softbreak":
+                self._run(p, " ", fmt)
+            elif kind == "hardbreak":
+                self._run(p, "", fmt).add_break(WD_BREAK.LINE)
+            elif kind == "strong_open":
+                fmt.bold += 1
+            elif kind == "strong_close":
+                fmt.bold -= 1
+            elif kind == "em_open":
+                fmt.italic += 1
+            elif kind == "em_close":
+                fmt.italic -= 1
+            elif kind == "s_open":
+                fmt.strike += 1
+            elif kind == "s_close":
+                fmt.strike -= 1
+            elif kind == "link_open":
+                fmt.link = self._hyperlink(p, str(tok.attrs.get("href", "")))
+            elif kind == "link_close":
+                fmt.link = None
+            elif kind == "image":
+                # Images are never fetched: keep the alt text, like an offline Pandoc run.
+                self._run(p, tok.content, fmt)
+
+    def _run(self, p: Paragraph, text: str, fmt: _Inline, code: bool = False) -> Any:
+        run = p.add_run(text)
+        if fmt.bold:
+            run.bold = True
+        if fmt.italic:
+            run.italic = True
+        if fmt.strike:
+            run.font.strike = True
+        if code:
+            if "verbatim" in self._ids:
+                run._r.style = self._ids["verbatim"]
+            else:
+                run.font.name = "Consolas"
+        if fmt.link is not None:
+            if "link" in self._ids:
+                run._r.style = self._ids["link"]
+            else:
+                run.font.underline = True
+                run.font.color.rgb = RGBColor(0x05, 0x63, 0xC1)
+            fmt.link.append(run._r)  # moves the run inside <w:hyperlink>
+        return run
+
+    def _hyperlink(self, p: Paragraph, href: str) -> Any:
+        link = OxmlElement("w:hyperlink")
+        if href.startswith("#"):
+            link.set(qn("w:anchor"), href[1:])
+        elif href:
+            link.set(qn("r:id"), p.part.relate_to(href, RT.HYPERLINK, is_external=True))
+        p._p.append(link)
+        return link
+
+    # -- helpers -------------------------------------------------------------------
+
+    def _paragraph(self, role: str | None) -> Paragraph:
+        p = self.doc.add_paragraph()
+        if role in self._ids:
+            p._p.style = self._ids[role]
+        return p
+
+    def _detached_paragraph(self, role: str | None) -> Paragraph:
+        p = self._paragraph(role)
+        p._p.getparent().remove(p._p)
+        return p
+
+    def _append(self, element: Any) -> None:
+        body = self.doc.element.body
+        sect_pr = body.find(qn("w:sectPr"))
+        if sect_pr is not None:
+            sect_pr.addprevious(element)
+        else:
+            body.append(element)
+
+
+def write_docx(
+    fragments: list[tuple[str, str]],
+    meta: dict[str, str],
+    output_path: str,
+    reference_doc: Path | None = None,
+) -> str:
+    """Write ordered (heading, markdown_body) fragments to ``output_path`` as a DOCX.
+
+    Same layout as the Pandoc backend: title block, TOC field, then one Heading 1
+    section per fragment, styled from ``reference_doc`` when given.
+    """
+    writer = _Writer(reference_doc)
+    writer.title_block(meta)
+    writer.toc()
+    for heading, body in fragments:
+        writer.section(heading, body)
+    writer.save(output_path)
+    return output_path
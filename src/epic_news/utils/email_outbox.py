@@ -0,0 +1,451 @@
+"""Durable outbox for report emails, delivered by a background sender.
+
+``send_report_email`` blocks on the Composio upload and the Gmail API, and a transient
+failure used to drop the email. ``ReceptionFlow.send_email`` now enqueues the message
+here and returns; a dispatcher thread delivers it with ``send_report_email``:
+
+- Messages live in a SQLite table under ``EPIC_EMAIL_OUTBOX_DIR`` (default
+  ``<EPIC_OUTPUT_DIR>/.outbox``), so a message queued by a process that exits or dies
+  is sent by the next one. Attachments are copied next to it at enqueue time: later
+  runs of the same crew overwrite the original file.
+- The idempotency key is the SHA-256 of the run id, recipient, subject, body and
+  attachment bytes. Enqueuing the same email twice returns the existing entry, and
+  an email marked ``sent`` is never sent again.
+- At most ``EPIC_EMAIL_CONCURRENCY`` (default 2) sends run at once. A failed send is
+  retried after ``EPIC_EMAIL_RETRY_BASE_SECONDS`` (default 30) doubled per attempt,
+  capped at one hour, up to ``EPIC_EMAIL_MAX_ATTEMPTS`` (default 6); then ``failed``.
+- An attachment over ``EPIC_EMAIL_MAX_ATTACHMENT_MB`` (default 18: Gmail caps the
+  message at 25 MB after base64) is left out and the entry says so.
+
+Sent and failed entries, with their attachment copies, are removed once untouched for
+``EPIC_EMAIL_OUTBOX_RETENTION_DAYS`` (default 7); the sender checks hourly.
+
+A send is claimed with a lease: a sender that dies mid-send leaves the entry to be
+retried once the lease expires, so delivery is at-least-once across crashes.
+``EPIC_EMAIL_OUTBOX=false`` restores the synchronous send.
+"""
+
+from __future__ import annotations
+
+import atexit
+import hashlib
+import json
+import os
+import random
+import shutil
+import sqlite3
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any
+
+from loguru import logger
+
+from epic_news.utils.email_sender import EmailDeliveryError, send_report_email
+from epic_news.utils.progress import emit, get_progress_bus
+
+_FALSY = {"0", "false", "no", "off"}
+_LEASE_SECONDS = 600.0
+_MAX_BACKOFF_SECONDS = 3600.0
+_IDLE_POLL_SECONDS = 5.0
+_PRUNE_INTERVAL_SECONDS = 3600.0
+
+QUEUED, SENDING, SENT, FAILED = "queued", "sending", "sent", "failed"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS outbox (
+    key TEXT PRIMARY KEY,
+    run_id TEXT,
+    recipient TEXT NOT NULL,
+    subject TEXT NOT NULL,
+    body TEXT NOT NULL,
+    attachment TEXT,
+    status TEXT NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    next_attempt REAL NOT NULL,
+    last_error TEXT,
+    note TEXT,
+    created REAL NOT NULL,
+    updated REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS outbox_due ON outbox (status, next_attempt);
+CREATE INDEX IF NOT EXISTS outbox_run ON outbox (run_id);
+"""
+
+
+def email_outbox_enabled() -> bool:
+    return os.getenv("EPIC_EMAIL_OUTBOX", "true").strip().lower() not in _FALSY
+
+
+@dataclass(frozen=True)
+class OutboxEntry:
+    """One queued email and its delivery state."""
+
+    key: str
+    run_id: str | None
+    recipient: str
+    subject: str
+    attachment: str | None
+    status: str
+    attempts: int
+    next_attempt: float
+    last_error: str | None
+    note: str | None
+    created: float
+    updated: float
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+
+_ENTRY_COLUMNS = (
+    "key, run_id, recipient, subject, attachment, status, attempts, next_attempt, "
+    "last_error, note, created, updated"
+)
+
+
+def _file_digest(path: Path) -> str:
+    digest = hashlib.sha256()
+    with path.open("rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def idempotency_key(
+    run_id: str | None, recipient: str, subject: str, html_body: str, attachment: Path | None
+) -> str:
+    parts = [
+        run_id,
+        recipient.strip().lower(),
+        subject,
+        hashlib.sha256(html_body.encode("utf-8")).hexdigest(),
+        _file_digest(attachment) if attachment else None,
+    ]
+    return hashlib.sha256(json.dumps(parts).encode("utf-8")).hexdigest()
+
+
+class EmailOutbox:
+    """SQLite-backed queue of report emails with a bounded background sender."""
+
+    def __init__(
+        self,
+        root: str | os.PathLike[str],
+        *,
+        send: Callable[..., Any] = send_report_email,
+        concurrency: int | None = None,
+        max_attempts: int | None = None,
+        retry_base_seconds: float | None = None,
+        max_attachment_bytes: int | None = None,
+        retention_days: float | None = None,
+    ):
+        self.root = Path(root)
+        self.path = self.root / "outbox.sqlite3"
+        self.send = send
+        self.concurrency = concurrency or int(os.getenv("EPIC_EMAIL_CONCURRENCY", "2"))
+        self.max_attempts = max_attempts or int(os.getenv("EPIC_EMAIL_MAX_ATTEMPTS", "6"))
+        self.retry_base_seconds = (
+            retry_base_seconds
+            if retry_base_seconds is not None
+            else float(os.getenv("EPIC_EMAIL_RETRY_BASE_SECONDS", "30"))
+        )
+        self.max_attachment_bytes = max_attachment_bytes or int(
+            float(os.getenv("EPIC_EMAIL_MAX_ATTACHMENT_MB", "18")) * 1024 * 1024
+        )
+        self.retention_days = (
+            retention_days
+            if retention_days is not None
+            else float(os.getenv("EPIC_EMAIL_OUTBOX_RETENTION_DAYS", "7"))
+        )
+        self.root.mkdir(parents=True, exist_ok=True)
+        with closing(self._connect()) as db:
+            db.execute("PRAGMA journal_mode=WAL")
+            db.executescript(_SCHEMA)
+
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._idle = threading.Condition()
+        self._in_flight = 0
+        self._pool: ThreadPoolExecutor | None = None
+        self._thread: threading.Thread | None = None
+
+    def _connect(self) -> sqlite3.Connection:
+        db = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+        db.row_factory = sqlite3.Row
+        return db
+
+    # -- queue -----------------------------------------------------------------------
+
+    def enqueue(
+        self,
+        *,
+        recipient: str,
+        subject: str,
+        html_body: str,
+        attachment_path: str | Path | None = None,
+        run_id: str | None = None,
+    ) -> OutboxEntry:
+        """Queue an email; return its entry (the existing one if already queued).
+
+        Raises:
+            EmailDeliveryError: on an invalid recipient or an empty body, which no
+                retry would fix.
+        """
+        if not recipient or "@" not in recipient:
+            raise EmailDeliveryError(f"Refusing to send: {recipient!r} is not a valid email address")
+        if not html_body or not html_body.strip():
+            raise EmailDeliveryError("Refusing to send an empty report body")
+
+        attachment = Path(attachment_path).resolve() if attachment_path else None
+        note = None
+        if attachment is not None and not attachment.is_file():
+            note, attachment = f"attachment {attachment} does not exist; sent without it", None
+        elif attachment is not None and attachment.stat().st_size > self.max_attachment_bytes:
+            size_mb = attachment.stat().st_size / (1024 * 1024)
+            note = f"attachment {attachment.name} ({size_mb:.1f} MB) over the size limit; sent without it"
+            attachment = None
+        if note:
+            logger.warning("📎 {}", note)
+
+        key = idempotency_key(run_id, recipient, subject, html_body, attachment)
+        if existing := self.get(key):
+            logger.info("📮 Email {} already in the outbox ({})", key[:12], existing.status)
+            return existing
+
+        stored = None
+        if attachment is not None:
+            target = self.root / "files" / key[:16] / attachment.name
+            target.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copyfile(attachment, target)
+            stored = str(target)
+
+        now = time.time()
+        with closing(self._connect()) as db:
+            db.execute(
+                "INSERT OR IGNORE INTO outbox (key, run_id, recipient, subject, body, attachment, "
+                "status, next_attempt, note, created, updated) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (key, run_id, recipient, subject, html_body, stored, QUEUED, now, note, now, now),
+            )
+        logger.info("📮 Email to {} queued ({})", recipient, key[:12])
+        self._publish(run_id, "email_queued", key=key, recipient=recipient)
+        self._wake.set()
+        return self.get(key)  # type: ignore[return-value]
+
+    def get(self, key: str) -> OutboxEntry | None:
+        with closing(self._connect()) as db:
+            row = db.execute(f"SELECT {_ENTRY_COLUMNS} FROM outbox WHERE key = ?", (key,)).fetchone()
+        return OutboxEntry(**dict(row)) if row else None
+
+    def status(self, run_id: str) -> list[OutboxEntry]:
+        """Every email queued by ``run_id``, oldest first."""
+        with closing(self._connect()) as db:
+            rows = db.execute(
+                f"SELECT {_ENTRY_COLUMNS} FROM outbox WHERE run_id = ? ORDER BY created", (run_id,)
+            ).fetchall()
+        return [OutboxEntry(**dict(row)) for row in rows]
+
+    def prune(self, now: float | None = None) -> int:
+        """Remove sent and failed entries older than the retention, and their files; return how many."""
+        cutoff = (time.time() if now is None else now) - self.retention_days * 86400
+        with closing(self._connect()) as db:
+            keys = [
+                key
+                for (key,) in db.execute(
+                    "SELECT key FROM outbox WHERE status IN (?, ?) AND updated < ?", (SENT, FAILED, cutoff)
+                ).fetchall()
+            ]
+            db.executemany("DELETE FROM outbox WHERE key = ?", [(key,) for key in keys])
+        for key in keys:
+            shutil.rmtree(self.root / "files" / key[:16], ignore_errors=True)
+        if keys:
+            logger.info("🧹 Removed {} delivered or failed emails from the outbox", len(keys))
+        return len(keys)
+
+    # -- delivery --------------------------------------------------------------------
+
+    def _claim(self, limit: int) -> list[sqlite3.Row]:
+        """Lease up to ``limit`` due entries; an expired ``sending`` lease is due again."""
+        now = time.time()
+        claimed = []
+        with closing(self._connect()) as db:
+            keys = db.execute(
+                "SELECT key FROM outbox WHERE status IN (?, ?) AND next_attempt <= ? "
+                "ORDER BY next_attempt LIMIT ?",
+                (QUEUED, SENDING, now, limit),
+            ).fetchall()
+            for (key,) in keys:
+                cursor = db.execute(
+                    "UPDATE outbox SET status = ?, attempts = attempts + 1, next_attempt = ?, updated = ? "
+                    "WHERE key = ? AND status IN (?, ?) AND next_attempt <= ?",
+                    (SENDING, now + _LEASE_SECONDS, now, key, QUEUED, SENDING, now),
+                )
+                if cursor.rowcount:  # another process may have claimed it first
+                    claimed.append(db.execute("SELECT * FROM outbox WHERE key = ?", (key,)).fetchone())
+        return claimed
+
+    def _deliver(self, row: sqlite3.Row) -> None:
+        try:
+            self.send(
+                recipient=row["recipient"],
+                subject=row["subject"],
+                html_body=row["body"],
+                attachment_path=row["attachment"],
+            )
+        except Exception as exc:  # noqa: BLE001 - every failure is recorded and retried
+            self._failed(row, exc)
+        else:
+            self._update(row["key"], status=SENT, last_error=None)
+            logger.info("📨 Outbox email {} delivered to {}", row["key"][:12], row["recipient"])
+            self._publish(row["run_id"], "email_sent", key=row["key"], recipient=row["recipient"])
+        finally:
+            with self._idle:
+                self._in_flight -= 1
+                self._idle.notify_all()
+            self._wake.set()
+
+    def _failed(self, row: sqlite3.Row, exc: Exception) -> None:
+        attempts = row["attempts"]
+        if attempts >= self.max_attempts:
+            self._update(row["key"], status=FAILED, last_error=str(exc))
+            logger.error("❌ Email {} failed after {} attempts: {}", row["key"][:12], attempts, exc)
+            self._publish(row["run_id"], "email_failed", key=row["key"], error=str(exc))
+            return
+        delay = min(self.retry_base_seconds * 2 ** (attempts - 1), _MAX_BACKOFF_SECONDS)
+        delay *= 0.5 + random.random() / 2  # jitter: retries of one outage do not align
+        self._update(row["key"], status=QUEUED, last_error=str(exc), next_attempt=time.time() + delay)
+        logger.warning(
+            "⚠️ Email {} attempt {}/{} failed ({}); retrying in {:.0f}s",
+            row["key"][:12],
+            attempts,
+            self.max_attempts,
+            exc,
+            delay,
+        )
+        self._publish(row["run_id"], "email_retry", key=row["key"], attempt=attempts, error=str(exc))
+
+    def _update(self, key: str, **fields: Any) -> None:
+        fields["updated"] = time.time()
+        assignments = ", ".join(f"{name} = ?" for name in fields)
+        with closing(self._connect()) as db:
+            db.execute(f"UPDATE outbox SET {assignments} WHERE key = ?", (*fields.values(), key))
+
+    @staticmethod
+    def _publish(run_id: str | None, kind: str, **data: Any) -> None:
+        # A run's event history is dropped some time after it finishes; do not revive it.
+        if run_id and get_progress_bus().has_run(run_id):
+            emit(kind, run_id=run_id, **data)
+
+    def dispatch(self) -> int:
+        """Hand every due entry the pool has room for to a sender; return how many."""
+        with self._idle:
+            free = self.concurrency - self._in_flight
+        if free <= 0:
+            return 0
+        rows = self._claim(free)
+        if rows:
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(self.concurrency, thread_name_prefix="email-outbox")
+            with self._idle:
+                self._in_flight += len(rows)
+            for row in rows:
+                self._pool.submit(self._deliver, row)
+        return len(rows)
+
+    def _next_due_in(self) -> float:
+        with closing(self._connect()) as db:
+            (due,) = db.execute(
+                "SELECT MIN(next_attempt) FROM outbox WHERE status IN (?, ?)", (QUEUED, SENDING)
+            ).fetchone()
+        return _IDLE_POLL_SECONDS if due is None else max(0.0, due - time.time())
+
+    def _run(self) -> None:
+        next_prune = 0.0
+        while not self._stop.is_set():
+            try:
+                if time.monotonic() >= next_prune:
+                    self.prune()
+                    next_prune = time.monotonic() + _PRUNE_INTERVAL_SECONDS
+                self.dispatch()
+                wait = min(self._next_due_in(), _IDLE_POLL_SECONDS)
+            except sqlite3.Error as exc:
+                logger.warning("⚠️ Email outbox unavailable: {}", exc)
+                wait = _IDLE_POLL_SECONDS
+            self._wake.wait(wait)
+            self._wake.clear()
+
+    def start(self) -> EmailOutbox:
+        """Start the dispatcher thread; entries left by earlier processes are sent too."""
+        if self._thread is None or not self._thread.is_alive():
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="email-outbox", daemon=True)
+            self._thread.start()
+        return self
+
+    def drain(self, timeout: float | None = None) -> bool:
+        """Wait until nothing is being sent and nothing is due; False on timeout.
+
+        Entries waiting for a later retry stay queued for the next sender.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            with self._idle:
+                idle = self._in_flight == 0
+            if idle and self._next_due_in() > 0:
+                return True
+            remaining = None if deadline is None else deadline - time.monotonic()
+            if remaining is not None and remaining <= 0:
+                return False
+            self._wake.set()
+            with self._idle:
+                self._idle.wait(0.1 if remaining is None else min(0.1, remaining))
+
+    def close(self, timeout: float | None = None) -> None:
+        """Drain, then stop the dispatcher and the sender pool."""
+        self.drain(timeout)
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
+            self._thread = None
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+
+_outbox: EmailOutbox | None = None
+_outbox_lock = threading.Lock()
+
+
+def _default_root() -> Path:
+    default = Path(os.getenv("EPIC_OUTPUT_DIR", "output")) / ".outbox"
+    return Path(os.getenv("EPIC_EMAIL_OUTBOX_DIR", str(default)))
+
+
+def _drain_timeout() -> float:
+    return float(os.getenv("EPIC_EMAIL_DRAIN_SECONDS", "60"))
+
+
+def get_email_outbox() -> EmailOutbox:
+    """The process-wide outbox, its sender started; drained for a while at exit."""
+    global _outbox
+    with _outbox_lock:
+        if _outbox is None:
+            _outbox = EmailOutbox(_default_root()).start()
+            atexit.register(_close_at_exit)
+        return _outbox
+
+
+def _close_at_exit() -> None:
+    if _outbox is not None:
+        _outbox.close(_drain_timeout())
+
+
+def drain_email_outbox(timeout: float | None = None) -> bool:
+    """Drain the process-wide outbox if one was started (e.g. before ``os._exit``)."""
+    if _outbox is None:
+        return True
+    return _outbox.drain(_drain_timeout() if timeout is None else timeout)
@@ -3,7 +3,7 @@ Flow enforcement utilities for Epic News crews.
 
 This module provides a small wrapper around CrewAI kickoff calls to:
 - Centralize orchestration entrypoints.
-- Add lightweight tracing/logging around runs.
+- Record a crew span around runs (see epic_news.utils.spans) and log timings.
 - Avoid ad-hoc direct calls to internal crew or renderer methods from outside flows.
 
 Usage:
@@ -21,17 +21,10 @@ from typing import Any
 from loguru import logger
 
 from .interrupt import raise_if_cancelled
-
-try:
-    # Local, optional tracing (no hard dependency)
-    from .tracing import trace_span
-except Exception:  # pragma: no cover - fallback if tracing is unavailable
-    from contextlib import contextmanager
-
-    @contextmanager
-    def trace_span(name: str, attrs: dict[str, Any] | None = None):
-        yield
-
+from .profiling import profile_block
+from .progress import current_run_id, emit
+from .spans import install_crewai_listener
+from .tracing import trace_span
 
 # Substrings identifying provider-side hiccups that are worth retrying. A crew run is
 # expensive (deep_research takes ~19 min), so we only retry failures that are known to
@@ -86,12 +79,55 @@ def _get_crew_instance(crew_or_factory: Any) -> Any:
     return crew_or_factory
 
 
+def _instrument_crew(crew: Any, crew_name: str) -> None:
+    """Chain a task callback that reports each finished task on the progress bus.
+
+    The run id is captured here because CrewAI may invoke task callbacks from its own
+    worker threads, outside the context that carries it.
+    """
+    run_id = current_run_id()
+    if run_id is None or not hasattr(crew, "task_callback"):
+        return
+    previous = crew.task_callback
+
+    def _on_task_completed(output: Any) -> None:
+        emit(
+            "task_completed",
+            run_id=run_id,
+            crew=crew_name,
+            task=getattr(output, "name", None) or getattr(output, "description", "")[:80],
+            agent=getattr(output, "agent", None),
+        )
+        if previous is not None:
+            previous(output)
+
+    try:
+        crew.task_callback = _on_task_completed
+    except Exception as exc:  # pragma: no cover - defensive: exotic crew objects
+        logger.debug("Could not attach progress task callback to {}: {}", crew_name, exc)
+
+
+def _emit_token_usage(crew_name: str, result: Any) -> None:
+    """Publish the token totals a finished crew reports, when it reports any."""
+    usage = getattr(result, "token_usage", None)
+    if usage is None:
+        return
+    emit(
+        "token_usage",
+        crew=crew_name,
+        total_tokens=getattr(usage, "total_tokens", 0),
+        prompt_tokens=getattr(usage, "prompt_tokens", 0),
+        completion_tokens=getattr(usage, "completion_tokens", 0),
+        successful_requests=getattr(usage, "successful_requests", 0),
+    )
+
+
 def kickoff_flow(crew_or_factory: Any, context: dict[str, Any]) -> Any:
     """Kick off a CrewAI run in a consistent, traceable way.
 
     - Accepts either a Crew factory (with .crew()) or a Crew instance.
     - Ensures context is a dict.
-    - Adds basic timing + optional tracing via trace_span.
+    - Adds basic timing and a crew span (task, LLM and tool spans nest under it).
     - Retries transient provider failures (see ``_TRANSIENT_ERROR_MARKERS``) so a single
       empty completion cannot discard an entire multi-agent run.
     """
@@ -102,7 +138,12 @@ def kickoff_flow(crew_or_factory: Any, context: dict[str, Any]) -> Any:
     attempts, backoff = _retry_settings()
     start = time.perf_counter()
 
-    with trace_span("kickoff_flow", {"crew": crew_name, "keys": sorted(context.keys())}):
+    # Task, LLM and tool spans come from CrewAI's event bus and nest under this crew span.
+    install_crewai_listener()
+    with (
+        trace_span(f"crew:{crew_name}", {"crew": crew_name, "keys": sorted(context.keys())}, kind="crew"),
+        profile_block(f"crew:{crew_name}"),
+    ):
         logger.info(
             "🚀 Kicking off crew {} with context keys: {}", crew_name, ", ".join(sorted(context.keys()))
         )
@@ -115,6 +156,8 @@ def kickoff_flow(crew_or_factory: Any, context: dict[str, Any]) -> Any:
             crew = _get_crew_instance(crew_or_factory)
             if not hasattr(crew, "kickoff"):
                 raise AttributeError(f"Object {crew!r} does not support kickoff()")
+            _instrument_crew(crew, crew_name)
+            emit("crew_attempt", crew=crew_name, attempt=attempt, attempts=attempts)
 
             try:
                 result = crew.kickoff(inputs=context)
@@ -146,6 +189,7 @@ def kickoff_flow(crew_or_factory: Any, context: dict[str, Any]) -> Any:
             else:
                 elapsed = time.perf_counter() - start
                 logger.info("✅ Crew {} finished in {:.2f}s", crew_name, elapsed)
+                _emit_token_usage(crew_name, result)
                 return result
 
         # Unreachable: every iteration either returns or raises.
@@ -162,7 +206,7 @@ async def akickoff_flow(crew_or_factory: Any, context: dict[str, Any]) -> Any:
 
     - Accepts either a Crew factory (with .crew()) or a Crew instance.
     - Ensures context is a dict.
-    - Adds basic timing + optional tracing via trace_span.
+    - Adds basic timing and a crew span (task, LLM and tool spans nest under it).
     - Retries transient provider failures, mirroring kickoff_flow. This path runs the
       parallel OSINT crews, so a single empty completion must not drop the whole fan-out.
     """
@@ -173,7 +217,12 @@ async def akickoff_flow(crew_or_factory: Any, context: dict[str, Any]) -> Any:
     attempts, backoff = _retry_settings()
     start = time.perf_counter()
 
-    with trace_span("akickoff_flow", {"crew": crew_name, "keys": sorted(context.keys())}):
+    # Task, LLM and tool spans come from CrewAI's event bus and nest under this crew span.
+    install_crewai_listener()
+    with (
+        trace_span(f"crew:{crew_name}", {"crew": crew_name, "keys": sorted(context.keys())}, kind="crew"),
+        profile_block(f"crew:{crew_name}"),
+    ):
         logger.info(
             "🚀 Async kicking off crew {} with context keys: {}",
             crew_name,
@@ -188,6 +237,8 @@ async def akickoff_flow(crew_or_factory: Any, context: dict[str, Any]) -> Any:
             crew = _get_crew_instance(crew_or_factory)
             if not hasattr(crew, "akickoff"):
                 raise AttributeError(f"Object {crew!r} does not support akickoff()")
+            _instrument_crew(crew, crew_name)
+            emit("crew_attempt", crew=crew_name, attempt=attempt, attempts=attempts)
 
             try:
                 result = await crew.akickoff(inputs=context)
@@ -219,6 +270,7 @@ async def akickoff_flow(crew_or_factory: Any, context: dict[str, Any]) -> Any:
             else:
                 elapsed = time.perf_counter() - start
                 logger.info("✅ Crew {} finished in {:.2f}s", crew_name, elapsed)
+                _emit_token_usage(crew_name, result)
                 return result
 
         # Unreachable: every iteration either returns or raises.
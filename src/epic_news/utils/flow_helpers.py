@@ -3,8 +3,8 @@
 Two module-level helpers:
 - load_or_parse_model: try deterministic JSON load → model_validate, fallback to
   parse_crewai_output for robust JSON extraction from crew raw output.
-- render_and_write_html: render via TemplateManager and persist to disk, creating
-  the parent directory once (replaces inline os.makedirs usage).
+- render_and_write_html: render via TemplateManager and stream it to disk atomically,
+  creating the parent directory once (replaces inline os.makedirs usage).
 """
 
 from __future__ import annotations
@@ -16,7 +16,8 @@ from loguru import logger
 from pydantic import BaseModel, ValidationError
 
 from epic_news.utils.diagnostics.parsing import parse_crewai_output
-from epic_news.utils.html.template_manager import TemplateManager
+from epic_news.utils.html.report_writer import stream_report_html
+from epic_news.utils.progress import emit
 
 
 def load_or_parse_model[T: BaseModel](
@@ -53,7 +54,7 @@ def render_and_write_html(
     model: BaseModel,
     html_path: str | Path,
 ) -> Path:
-    """Render the model via TemplateManager and write the resulting HTML to disk.
+    """Render the model via TemplateManager and stream the HTML to disk atomically.
 
     Args:
         selected_crew: Crew identifier used by TemplateManager for title/body routing.
@@ -63,11 +64,6 @@ def render_and_write_html(
     Returns:
         The final output path.
     """
-    html = TemplateManager().render_report(
-        selected_crew=selected_crew,
-        content_data=model.model_dump(),
-    )
-    out = Path(html_path)
-    out.parent.mkdir(parents=True, exist_ok=True)
-    out.write_text(html, encoding="utf-8")
+    out = stream_report_html(selected_crew, model.model_dump(), html_path)
+    emit("artefact_written", path=str(out), format="html", crew=selected_crew)
     return out
@@ -1,5 +1,6 @@
 """Turn holiday research outputs into a DOCX via bounded fragments."""
 
+from collections.abc import Mapping
 from typing import Any
 
 from loguru import logger
@@ -7,6 +8,12 @@ from loguru import logger
 from epic_news.config.llm_config import LLMConfig
 from epic_news.utils.docx_report import Section, assemble_fragments
 from epic_news.utils.holiday_report.skeleton import generate_skeleton
+from epic_news.utils.holiday_report.slicer import (
+    SliceStats,
+    slice_itinerary,
+    split_lodging_dining,
+    trip_outline,
+)
 
 MAX_ITINERARY_DAYS = 31
 
@@ -24,7 +31,7 @@ def _task_raw(crew_result: Any, index: int) -> str:
         return ""
 
 
-def _trip_summary(inputs: dict) -> str:
+def _trip_summary(inputs: Mapping[str, Any]) -> str:
     return (
         f"Voyage: {inputs.get('family', '')} — {inputs.get('origin', '')} — "
         f"{inputs.get('duration', '')} — {inputs.get('destination', '')}. "
@@ -32,7 +39,9 @@ def _trip_summary(inputs: dict) -> str:
     )
 
 
-def assemble_holiday_docx(crew_result: Any, inputs: dict, output_path: str, llm: Any = None) -> str:
+def assemble_holiday_docx(
+    crew_result: Any, inputs: Mapping[str, Any], output_path: str, llm: Any = None
+) -> str:
     """Build the holiday DOCX from research outputs using bounded fragment calls."""
     llm = llm or LLMConfig.get_openrouter_llm()
     summary = _trip_summary(inputs)
@@ -60,30 +69,40 @@ def assemble_holiday_docx(crew_result: Any, inputs: dict, output_path: str, llm:
             MAX_ITINERARY_DAYS,
             len(skeleton.days) - MAX_ITINERARY_DAYS,
         )
-    for i, day in enumerate(skeleton.days[:MAX_ITINERARY_DAYS], start=1):
+    # Each day gets its slice of the research plus a shared outline, not the whole text.
+    days = skeleton.days[:MAX_ITINERARY_DAYS]
+    outline = trip_outline(days)
+    stats = SliceStats()
+    full_itinerary_context = f"{summary}\n\nRecherche itinéraire:\n{itinerary}"
+    for i, (day, research) in enumerate(zip(days, slice_itinerary(itinerary, days), strict=True), start=1):
         heading = f"Itinéraire — Jour {i}" + (f" ({day.date})" if day.date else "")
+        context = f"{summary}\n\nProgramme du voyage:\n{outline}\n\nRecherche pour ce jour:\n{research}"
+        stats.add(heading, full_itinerary_context, context)
         sections.append(
             Section(
                 heading,
                 f"Détaille cette journée: {day.label}. Étapes: {', '.join(day.stops) or 'à préciser'}.",
-                f"{summary}\n\nRecherche itinéraire:\n{itinerary}",
+                context,
             )
         )
 
-    sections.append(
-        Section(
-            "Hébergements",
-            "Liste les hébergements recommandés avec adresse et fourchette de prix.",
-            f"{summary}\n\n{lodging_dining}",
-        )
-    )
-    sections.append(
-        Section(
-            "Restauration",
-            "Recommande restaurants et spécialités par étape.",
-            f"{summary}\n\n{lodging_dining}",
-        )
+    lodging, dining = split_lodging_dining(lodging_dining)
+    for heading, instruction, research in (
+        ("Hébergements", "Liste les hébergements recommandés avec adresse et fourchette de prix.", lodging),
+        ("Restauration", "Recommande restaurants et spécialités par étape.", dining),
+    ):
+        context = f"{summary}\n\n{research}"
+        stats.add(heading, f"{summary}\n\n{lodging_dining}", context)
+        sections.append(Section(heading, instruction, context))
+    logger.info(
+        "🗜️ Holiday context slicing: {} → {} tokens over {} sections ({} saved, {:.0%})",
+        stats.full_tokens,
+        stats.sliced_tokens,
+        len(stats.per_section),
+        stats.saved_tokens,
+        stats.saved_tokens / stats.full_tokens if stats.full_tokens else 0.0,
     )
+
     sections.append(
         Section(
             "Budget",
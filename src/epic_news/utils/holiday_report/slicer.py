@@ -0,0 +1,144 @@
+"""Give each holiday fragment only the research it needs, not the whole blob.
+
+Without slicing, every per-day fragment re-sends the full itinerary research and both
+lodging and dining fragments re-send the full lodging/dining text, so narration cost
+grows as days × research size. The slicer aligns the skeleton days with the research
+paragraphs locally (no LLM call):
+
+- a paragraph opening with a day marker ("Jour 3", "Day 3", "J3") or the day's date
+  starts that day's block, which runs until the next marker;
+- paragraphs that BM25 ranks against the day's label and stops are added, unless
+  they sit in another day's block;
+- each day's slice is capped at ``DAY_BUDGET_TOKENS`` (block first, then best matches)
+  and keeps the research order.
+
+A day nothing matches gets the head of the research. Every day also gets :func:`trip_outline`, a one-line-per-day view of the whole trip.
+Lodging and dining text is split by keyword, with a heading carrying its topic to the
+paragraphs under it; paragraphs matching neither go to both sections.
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass, field
+
+from epic_news.models.holiday_report import ItineraryDay
+from epic_news.utils.context_packer import bm25_scores, estimate_tokens, split_passages
+
+DAY_BUDGET_TOKENS = 800
+
+_DAY_MARKER_RE = re.compile(r"^[\W_]*(?:jour|day|j)\s*(\d{1,2})\b", re.IGNORECASE)
+_DAY_WORD_RE = re.compile(r"\b(?:jour|day|j)\s*\d{1,2}\b", re.IGNORECASE)
+_LODGING_RE = re.compile(
+    r"h[ôo]tel|h[ée]bergement|logement|lodging|accommodation|airbnb|camping|auberge|chambre|g[îi]te",
+    re.IGNORECASE,
+)
+_DINING_RE = re.compile(
+    r"restaurant|dining|cuisine|sp[ée]cialit[ée]|gastronom|caf[ée]|bistro|brasserie|repas|menu|d[îi]ner|d[ée]jeuner",
+    re.IGNORECASE,
+)
+
+
+@dataclass
+class SliceStats:
+    """Context tokens the sliced sections send, against sending the full texts."""
+
+    full_tokens: int = 0
+    sliced_tokens: int = 0
+    per_section: dict[str, int] = field(default_factory=dict)
+
+    def add(self, heading: str, full: str, sliced: str) -> None:
+        self.full_tokens += estimate_tokens(full)
+        self.sliced_tokens += estimate_tokens(sliced)
+        self.per_section[heading] = estimate_tokens(sliced)
+
+    @property
+    def saved_tokens(self) -> int:
+        return self.full_tokens - self.sliced_tokens
+
+
+def trip_outline(days: list[ItineraryDay]) -> str:
+    """One compact line per day, shared by every day fragment."""
+    lines = []
+    for i, day in enumerate(days, start=1):
+        when = f" ({day.date})" if day.date else ""
+        stops = f" — {', '.join(day.stops)}" if day.stops else ""
+        lines.append(f"J{i}{when}: {day.label}{stops}")
+    return "\n".join(lines)
+
+
+def _day_blocks(passages: list[str], days: list[ItineraryDay]) -> dict[int, list[int]]:
+    """Passage indexes under each day's marker (1-based day numbers)."""
+    dates = {day.date.strip().lower(): i for i, day in enumerate(days, start=1) if day.date.strip()}
+    blocks: dict[int, list[int]] = {}
+    current = None
+    for index, passage in enumerate(passages):
+        match = _DAY_MARKER_RE.match(passage)
+        first_line = passage.split("\n", 1)[0].lower()
+        dated = next((number for date, number in dates.items() if date in first_line), None)
+        if match and 1 <= int(match.group(1)) <= len(days):
+            current = int(match.group(1))
+        elif dated is not None:
+            current = dated
+        if current is not None:
+            blocks.setdefault(current, []).append(index)
+    return blocks
+
+
+def slice_itinerary(
+    research: str, days: list[ItineraryDay], budget_tokens: int = DAY_BUDGET_TOKENS
+) -> list[str]:
+    """The research paragraphs relevant to each day, in research order."""
+    passages = split_passages(research)
+    if len(days) <= 1 or not passages:
+        return [research] * len(days)
+    blocks = _day_blocks(passages, days)
+    owner = {index: number for number, indexes in blocks.items() for index in indexes}
+    slices = []
+    for number, day in enumerate(days, start=1):
+        # "Jour 3" in a label would match every day's heading; rank on the words only.
+        query = _DAY_WORD_RE.sub(" ", " ".join([day.label, day.date, *day.stops]))
+        scores = bm25_scores(passages, query)
+        ranked = [
+            i
+            for i in sorted(range(len(passages)), key=lambda i: -scores[i])
+            if scores[i] > 0 and owner.get(i, number) == number  # not another day's block
+        ]
+        # Nothing matched: the head of the research is the best generic context.
+        candidates = list(dict.fromkeys(blocks.get(number, []) + ranked)) or list(range(len(passages)))
+        kept, used = [], 0
+        for index in candidates:
+            cost = estimate_tokens(passages[index])
+            if kept and used + cost > budget_tokens:
+                continue
+            kept.append(index)
+            used += cost
+        slices.append("\n\n".join(passages[i] for i in sorted(kept)))
+    return slices
+
+
+def _topic(text: str) -> str | None:
+    lodging, dining = bool(_LODGING_RE.search(text)), bool(_DINING_RE.search(text))
+    if lodging and dining:
+        return "both"
+    return "lodging" if lodging else "dining" if dining else None
+
+
+def split_lodging_dining(text: str) -> tuple[str, str]:
+    """(lodging, dining) paragraphs of the combined research text.
+
+    A Markdown heading sets the topic of the paragraphs under it; elsewhere each
+    paragraph's own keywords decide. Paragraphs with no topic go to both.
+    """
+    lodging, dining = [], []
+    section_topic = None
+    for passage in split_passages(text):
+        first_line = passage.split("\n", 1)[0]
+        if first_line.lstrip().startswith("#"):
+            section_topic = _topic(first_line)
+        target = section_topic or _topic(passage)
+        if target != "dining":
+            lodging.append(passage)
+        if target != "lodging":
+            dining.append(passage)
+    return "\n\n".join(lodging), "\n\n".join(dining)
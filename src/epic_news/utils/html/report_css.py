@@ -0,0 +1,396 @@
+"""Per-report CSS tree-shaking and minification.
+
+``TemplateManager.render_report`` inlines the full theme variables and
+``templates/css/report.css`` (~51 KB) into every report, although a single report
+uses a small part of it. ``EPIC_REPORT_CSS`` selects what reaches the file:
+
+- ``shaken`` (default): keep only the rules whose selectors can match the tags,
+  classes and ids of this document, minify the CSS and collapse whitespace.
+- ``full``: the previous behaviour, the whole stylesheet as written.
+- ``shared``: ``report_writer.write_report_html`` writes the minified stylesheet once to
+  ``EPIC_SHARED_CSS_DIR`` (default ``output/assets``) and links it from each report.
+
+Emails always get a self-contained, shaken body (:func:`prepare_email_html`): Gmail
+drops ``<link>`` stylesheets.
+
+Shaking is conservative: pseudo-classes, pseudo-elements and attribute selectors never
+remove a rule, only the tags, classes and ids a selector requires do. At-rules other
+than ``@media``/``@supports`` (``@keyframes``, ``@font-face``, ``@page``) are kept.
+"""
+
+from __future__ import annotations
+
+import os
+import re
+from functools import lru_cache
+from pathlib import Path
+from typing import NamedTuple
+
+_MODES = ("shaken", "full", "shared")
+_THEME_STYLE = re.compile(r'(<style id="theme-styles">)(.*?)(</style>)', re.DOTALL)
+_SHARED_LINK = re.compile(r'<link rel="stylesheet" id="theme-styles" href="([^"]+)">')
+
+_STRING = re.compile(r""""(?:\\.|[^"\\])*"|'(?:\\.|[^'\\])*'""")
+_COMMENT_OR_STRING = re.compile(r"""/\*.*?\*/|"(?:\\.|[^"\\])*"|'(?:\\.|[^'\\])*'""", re.DOTALL)
+_PSEUDO = re.compile(r"::?[\w-]+(\((?:[^()]|\([^()]*\))*\))?")
+_ATTRIBUTE = re.compile(r"\[[^\]]*\]")
+_COMBINATOR = re.compile(r"[\s>+~]+")
+_CLASS = re.compile(r"\.(-?[_a-zA-Z][\w-]*)")
+_ID = re.compile(r"#(-?[_a-zA-Z][\w-]*)")
+_TAG = re.compile(r"^[a-zA-Z][\w-]*")
+_NESTING_AT_RULES = ("@media", "@supports", "@container", "@layer")
+
+_HTML_CLASS = re.compile(r"""\sclass\s*=\s*(?:"([^"]*)"|'([^']*)')""", re.IGNORECASE)
+_HTML_ID = re.compile(r"""\sid\s*=\s*(?:"([^"]*)"|'([^']*)')""", re.IGNORECASE)
+_HTML_TAG = re.compile(r"<([a-zA-Z][\w-]*)")
+
+
+class UsedSelectors(NamedTuple):
+    """The tags, classes and ids present in one document."""
+
+    tags: frozenset[str]
+    classes: frozenset[str]
+    ids: frozenset[str]
+
+
+class _Selector(NamedTuple):
+    text: str
+    tags: frozenset[str]
+    classes: frozenset[str]
+    ids: frozenset[str]
+
+    def matches(self, used: UsedSelectors) -> bool:
+        return self.tags <= used.tags and self.classes <= used.classes and self.ids <= used.ids
+
+
+class _Rule(NamedTuple):
+    selectors: tuple[_Selector, ...]
+    body: str
+
+
+class _AtRule(NamedTuple):
+    prelude: str
+    children: tuple | None  # nested rules for @media/@supports, else None
+    raw: str  # block or statement as written, after minification
+
+
+def report_css_mode() -> str:
+    mode = os.getenv("EPIC_REPORT_CSS", "shaken").strip().lower()
+    return mode if mode in _MODES else "shaken"
+
+
+# -- CSS -----------------------------------------------------------------------------
+
+
+def _outside_strings(text: str, transform) -> str:
+    """Apply ``transform`` to every part of ``text`` that is not a quoted string."""
+    parts: list[str] = []
+    last = 0
+    for match in _STRING.finditer(text):
+        parts.append(transform(text[last : match.start()]))
+        parts.append(match.group(0))
+        last = match.end()
+    parts.append(transform(text[last:]))
+    return "".join(parts)
+
+
+def _squeeze(text: str) -> str:
+    text = re.sub(r"\s+", " ", text)
+    text = re.sub(r"\s*([{};,>])\s*", r"\1", text)
+    text = re.sub(r":\s+", ":", text)
+    return text.replace(";}", "}")
+
+
+def minify_css(css: str) -> str:
+    """Drop comments and redundant whitespace; strings are left untouched."""
+    css = _COMMENT_OR_STRING.sub(lambda m: m.group(0) if m.group(0)[0] in "\"'" else " ", css)
+    return _outside_strings(css, _squeeze).strip()
+
+
+def _selector(text: str) -> _Selector:
+    text = text.strip()
+    if "\\" in text:  # escaped identifiers: not worth parsing, always keep
+        return _Selector(text, frozenset(), frozenset(), frozenset())
+    bare = _PSEUDO.sub("", _ATTRIBUTE.sub("", text))
+    tags = set()
+    for compound in _COMBINATOR.split(bare):
+        if match := _TAG.match(compound):
+            tags.add(match.group(0).lower())
+    return _Selector(
+        text,
+        frozenset(tags),
+        frozenset(_CLASS.findall(bare)),
+        frozenset(_ID.findall(bare)),
+    )
+
+
+def _split_selectors(prelude: str) -> list[str]:
+    """Split a selector list on its top-level commas (not those inside ``:is(a, b)``)."""
+    parts, depth, start = [], 0, 0
+    for i, char in enumerate(prelude):
+        if char in "([":
+            depth += 1
+        elif char in ")]":
+            depth -= 1
+        elif char == "," and depth == 0:
+            parts.append(prelude[start:i])
+            start = i + 1
+    parts.append(prelude[start:])
+    return [p for p in parts if p.strip()]
+
+
+def _block_end(css: str, start: int) -> int:
+    """Index of the ``}`` closing the block opened at ``css[start]``."""
+    depth = 0
+    i = start
+    while i < len(css):
+        char = css[i]
+        if char in "\"'":
+            match = _STRING.match(css, i)
+            i = match.end() if match else i + 1
+            continue
+        if char == "{":
+            depth += 1
+        elif char == "}":
+            depth -= 1
+            if depth == 0:
+                return i
+        i += 1
+    return len(css)
+
+
+def _parse_block(css: str) -> tuple:
+    nodes: list = []
+    i = 0
+    while i < len(css):
+        brace = css.find("{", i)
+        semicolon = css.find(";", i)
+        if brace == -1 and semicolon == -1:
+            break
+        if (
+            semicolon != -1
+            and (brace == -1 or semicolon < brace)
+            and css[i:semicolon].lstrip().startswith("@")
+        ):
+            statement = css[i : semicolon + 1].strip()
+            nodes.append(_AtRule(statement, None, statement))
+            i = semicolon + 1
+            continue
+        if brace == -1:
+            break
+        end = _block_end(css, brace)
+        prelude = css[i:brace].strip().lstrip(";").strip()
+        body = css[brace + 1 : end]
+        if prelude.startswith("@"):
+            if prelude.lower().startswith(_NESTING_AT_RULES):
+                nodes.append(_AtRule(prelude, _parse_block(body), ""))
+            else:
+                nodes.append(_AtRule(prelude, None, f"{prelude}{{{body}}}"))
+        elif prelude:
+            nodes.append(_Rule(tuple(_selector(s) for s in _split_selectors(prelude)), body))
+        i = end + 1
+    return tuple(nodes)
+
+
+@lru_cache(maxsize=8)
+def _parse(css: str) -> tuple:
+    return _parse_block(minify_css(css))
+
+
+def _emit(nodes: tuple, used: UsedSelectors) -> str:
+    out: list[str] = []
+    for node in nodes:
+        if isinstance(node, _Rule):
+            selectors = [s.text for s in node.selectors if s.matches(used)]
+            if selectors and node.body:
+                out.append(f"{','.join(selectors)}{{{node.body}}}")
+        elif node.children is None:
+            out.append(node.raw)
+        elif inner := _emit(node.children, used):
+            out.append(f"{node.prelude}{{{inner}}}")
+    return "".join(out)
+
+
+@lru_cache(maxsize=128)
+def shake_css(css: str, used: UsedSelectors) -> str:
+    """The rules of ``css`` that can apply to a document using ``used``, minified.
+
+    Memoized per (stylesheet, selector set): reports of the same crew share the result.
+    """
+    return _emit(_parse(css), used)
+
+
+@lru_cache(maxsize=8)
+def _preserving_selectors(css: str) -> tuple[frozenset[str], frozenset[str]]:
+    """Tags and classes styled ``white-space: pre*``; their text must keep its spacing."""
+    tags: set[str] = {"pre", "textarea"}
+    classes: set[str] = set()
+
+    def visit(nodes: tuple) -> None:
+        for node in nodes:
+            if isinstance(node, _Rule):
+                if re.search(r"white-space:(pre|break-spaces)", node.body):
+                    for selector in node.selectors:
+                        tags.update(selector.tags)
+                        classes.update(selector.classes)
+            elif node.children:
+                visit(node.children)
+
+    visit(_parse(css))
+    return frozenset(tags), frozenset(classes)
+
+
+# -- HTML ----------------------------------------------------------------------------
+
+
+def used_selectors(html: str) -> UsedSelectors:
+    """Collect the tags, classes and ids of ``html`` (outside its theme stylesheet)."""
+    html = _THEME_STYLE.sub("", html)
+    classes: set[str] = set()
+    for match in _HTML_CLASS.finditer(html):
+        classes.update((match.group(1) or match.group(2) or "").split())
+    ids = {(m.group(1) or m.group(2) or "").strip() for m in _HTML_ID.finditer(html)}
+    tags = {t.lower() for t in _HTML_TAG.findall(html)}
+    return UsedSelectors(frozenset(tags), frozenset(classes), frozenset(ids))
+
+
+_TOKEN = re.compile(r"<!--.*?-->|<(/?)([a-zA-Z][\w-]*)([^>]*)>", re.DOTALL)
+_RAW_TEXT = ("script", "style", "textarea", "title")
+_VOID = {"area", "base", "br", "col", "embed", "hr", "img", "input", "link", "meta", "source", "track", "wbr"}
+_SPACES = re.compile(r"[ \t\n\r\f]+")  # not \s: a no-break space is content
+
+
+def _collapse(text: str) -> str:
+    return _SPACES.sub(lambda m: "\n" if "\n" in m.group(0) else " ", text)
+
+
+_TRAILING_SPACES = re.compile(r"[ \t\n\r\f]+\Z")
+
+
+def minify_html(html: str, css: str = "") -> str:
+    """Collapse whitespace runs in text, keeping any that CSS or ``<pre>`` makes visible.
+
+    Elements styled ``white-space: pre*`` by ``css`` (or inline), raw-text elements
+    and their descendants are copied verbatim; comments other than conditional ones
+    are dropped.
+    """
+    minifier = HtmlMinifier(css)
+    return minifier.feed(html) + minifier.close()
+
+
+class HtmlMinifier:
+    """:func:`minify_html` over a document that arrives in pieces.
+
+    The open elements, an open raw-text element and a tag, comment or whitespace run
+    cut by a piece boundary carry over to the next piece, so feeding a document in any
+    split and then calling ``close`` gives the output of ``minify_html`` on the whole.
+    """
+
+    def __init__(self, css: str = ""):
+        self._pre_tags, self._pre_classes = _preserving_selectors(css)
+        self._stack: list[tuple[str, bool]] = []  # (tag, preserves whitespace)
+        self._raw: str | None = None  # the raw-text element being copied
+        self._pending = ""
+
+    def feed(self, html: str) -> str:
+        """Minify the next piece; what may depend on the following one is held back."""
+        return self._run(self._pending + html, final=False)
+
+    def close(self) -> str:
+        """Minify whatever was held back by the last ``feed``."""
+        return self._run(self._pending, final=True)
+
+    def _run(self, html: str, final: bool) -> str:
+        self._pending = ""
+        out: list[str] = []
+        i = 0
+        while True:
+            if self._raw is not None:
+                end = re.compile(rf"</{self._raw}\s*>", re.IGNORECASE).search(html, i)
+                if end is None:
+                    cut = html.rfind("<", i)  # maybe the start of the end tag
+                    stop = len(html) if final or cut == -1 else cut
+                    out.append(html[i:stop])
+                    self._pending = html[stop:]
+                    break
+                out.append(html[i : end.start()])
+                i = end.start()
+                self._raw = None
+            match = _TOKEN.search(html, i)
+            preserving = bool(self._stack) and self._stack[-1][1]
+            if not final:
+                # Stop before a tag or comment the boundary may have cut, and keep a
+                # trailing whitespace run: the next piece may extend either.
+                hold = html.find("<", i) if match is None else html.find("<!--", i, match.start())
+                if match is None or hold != -1:
+                    stop = len(html) if hold == -1 else hold
+                    text = html[i:stop]
+                    if not preserving and stop == len(html) and (space := _TRAILING_SPACES.search(text)):
+                        stop -= len(space.group(0))
+                        text = text[: space.start()]
+                    out.append(text if preserving else _collapse(text))
+                    self._pending = html[stop:]
+                    break
+            text = html[i : match.start() if match else len(html)]
+            out.append(text if preserving else _collapse(text))
+            if not match:
+                break
+            i = match.end()
+            closing, tag, attrs = match.group(1), (match.group(2) or "").lower(), match.group(3)
+            if not tag:  # comment
+                if match.group(0).startswith("<!--[if"):
+                    out.append(match.group(0))
+                continue
+            out.append(match.group(0))
+            if closing:
+                for depth in range(len(self._stack) - 1, -1, -1):
+                    if self._stack[depth][0] == tag:
+                        del self._stack[depth:]
+                        break
+                continue
+            if tag in _RAW_TEXT:
+                self._raw = tag
+                continue
+            if tag in _VOID or attrs.rstrip().endswith("/"):
+                continue
+            classes = set()
+            if class_attr := _HTML_CLASS.search(match.group(0)):
+                classes = set((class_attr.group(1) or class_attr.group(2) or "").split())
+            preserves = (
+                preserving
+                or tag in self._pre_tags
+                or bool(classes & self._pre_classes)
+                or bool(re.search(r"white-space\s*:\s*(pre|break-spaces)", attrs))
+            )
+            self._stack.append((tag, preserves))
+        return "".join(out)
+
+
+def optimize_report(html: str) -> str:
+    """Shake and minify the theme stylesheet of ``html``, then collapse its whitespace."""
+    match = _THEME_STYLE.search(html)
+    if not match:
+        return html
+    css = match.group(2)
+    shaken = shake_css(css, used_selectors(html))
+    html = html[: match.start(2)] + shaken + html[match.end(2) :]
+    return minify_html(html, css)
+
+
+# -- on disk and in email ------------------------------------------------------------
+
+
+def prepare_email_html(html: str, base_dir: str | Path | None = None) -> str:
+    """A self-contained, shaken copy of a report for use as an email body.
+
+    A shared stylesheet linked by ``report_writer`` is read from ``base_dir`` and
+    inlined; a missing sheet leaves the link as it is.
+    """
+    if match := _SHARED_LINK.search(html):
+        sheet = Path(base_dir or ".") / match.group(1)
+        try:
+            css = sheet.read_text(encoding="utf-8")
+        except OSError:
+            return html
+        html = html[: match.start()] + f'<style id="theme-styles">{css}</style>' + html[match.end() :]
+    return optimize_report(html)
@@ -0,0 +1,257 @@
+"""Atomic, streaming writes of rendered reports.
+
+Every report is written to a temporary file next to its destination, fsynced and
+renamed over it: a crash leaves the previous report, or none, never a truncated one.
+
+:func:`stream_report_html` also never holds the whole document. The renderer yields
+the body in pieces (``BaseRenderer.render_chunks``) and the template frame is written
+around them. In ``shaken`` CSS mode the stylesheet in the ``<head>`` depends on the
+whole body, so the body is first spooled to a temporary file while its selectors are
+collected, then copied after the head.
+
+``EPIC_REPORT_GZIP=true`` also writes ``<report>.html.gz`` from the same stream.
+"""
+
+from __future__ import annotations
+
+import gzip
+import hashlib
+import io
+import os
+import re
+import tempfile
+import uuid
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import contextmanager
+from itertools import chain
+from pathlib import Path
+from typing import IO, Any
+
+from loguru import logger
+
+from epic_news.utils.html.report_css import (
+    HtmlMinifier,
+    UsedSelectors,
+    minify_css,
+    minify_html,
+    report_css_mode,
+    shake_css,
+    used_selectors,
+)
+from epic_news.utils.html.template_manager import TemplateManager
+
+_FALSY = {"0", "false", "no", "off"}
+_THEME_STYLE = re.compile(r'(<style id="theme-styles">)(.*?)(</style>)', re.DOTALL)
+_COPY_BUFFER = 1 << 20
+_BATCH = 1 << 18
+
+
+def report_gzip_enabled() -> bool:
+    return os.getenv("EPIC_REPORT_GZIP", "false").strip().lower() not in _FALSY
+
+
+class _AtomicFile:
+    """A text file written under a temporary name and renamed over ``target`` on commit."""
+
+    def __init__(self, target: Path, compress: bool = False):
+        self.target = target
+        self.tmp = target.with_name(f".{target.name}.{uuid.uuid4().hex[:8]}.tmp")
+        self._raw = open(self.tmp, "wb")  # noqa: SIM115 - closed by commit() or discard()
+        self._gzip = gzip.GzipFile(target.stem, mode="wb", fileobj=self._raw, mtime=0) if compress else None
+        self.text = io.TextIOWrapper(self._gzip or self._raw, encoding="utf-8")
+
+    def commit(self) -> None:
+        self.text.flush()
+        self.text.detach()
+        if self._gzip is not None:
+            self._gzip.close()
+        self._raw.flush()
+        os.fsync(self._raw.fileno())
+        self._raw.close()
+        os.replace(self.tmp, self.target)
+
+    def discard(self) -> None:
+        for stream in (self.text, self._gzip, self._raw):
+            try:
+                if stream is not None and not stream.closed:
+                    stream.close()
+            except (OSError, ValueError):
+                pass
+        self.tmp.unlink(missing_ok=True)
+
+
+def _fsync_dir(directory: Path) -> None:
+    """Persist the renames in ``directory`` (not supported on every platform)."""
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+@contextmanager
+def atomic_output(path: str | Path, compress: bool = False) -> Iterator[Callable[[str], None]]:
+    """Yield a ``write(text)`` function whose output replaces ``path`` on success.
+
+    With ``compress`` the same text also replaces ``<path>.gz``. On error the
+    temporary files are removed and the existing files are left untouched.
+    """
+    out = Path(path)
+    out.parent.mkdir(parents=True, exist_ok=True)
+    files = [_AtomicFile(out)]
+    try:
+        if compress:
+            files.append(_AtomicFile(out.with_name(f"{out.name}.gz"), compress=True))
+
+        def write(text: str) -> None:
+            for f in files:
+                f.text.write(text)
+
+        yield write
+        for f in files:
+            f.commit()
+    except BaseException:
+        for f in files:
+            f.discard()
+        raise
+    _fsync_dir(out.parent)
+
+
+def write_report_chunks(chunks: Iterable[str], html_path: str | Path, compress: bool | None = None) -> Path:
+    """Write ``chunks`` atomically to ``html_path``, and to ``html_path.gz`` if enabled."""
+    out = Path(html_path)
+    with atomic_output(out, report_gzip_enabled() if compress is None else compress) as write:
+        for chunk in chunks:
+            write(chunk)
+    return out
+
+
+# -- shared stylesheet ---------------------------------------------------------------
+
+
+def _shared_dir() -> Path:
+    return Path(os.getenv("EPIC_SHARED_CSS_DIR", "output/assets"))
+
+
+def _write_shared_sheet(css: str) -> Path:
+    minified = minify_css(css)
+    digest = hashlib.sha1(minified.encode("utf-8")).hexdigest()[:12]
+    path = _shared_dir() / f"report-{digest}.css"
+    if not path.exists():
+        with atomic_output(path) as write:
+            write(minified)
+    return path
+
+
+def _shared_link(css: str, out: Path) -> str:
+    sheet = _write_shared_sheet(css)
+    href = Path(os.path.relpath(sheet.resolve(), out.parent.resolve())).as_posix()
+    return f'<link rel="stylesheet" id="theme-styles" href="{href}">'
+
+
+# -- reports -------------------------------------------------------------------------
+
+
+def write_report_html(html: str, html_path: str | Path) -> Path:
+    """Write a rendered report; in ``shared`` mode link the stylesheet instead of inlining it."""
+    out = Path(html_path)
+    if report_css_mode() == "shared" and (match := _THEME_STYLE.search(html)):
+        link = _shared_link(match.group(2), out)
+        html = minify_html(html[: match.start()] + link + html[match.end() :], match.group(2))
+    return write_report_chunks([html], out)
+
+
+def _batched(chunks: Iterable[str]) -> Iterator[str]:
+    """Join small pieces into blocks of about ``_BATCH`` characters, splitting only between them."""
+    batch: list[str] = []
+    size = 0
+    for chunk in chunks:
+        batch.append(chunk)
+        size += len(chunk)
+        if size >= _BATCH:
+            yield "".join(batch)
+            batch, size = [], 0
+    if batch:
+        yield "".join(batch)
+
+
+def _minified(parts: Iterable[str], minifier: HtmlMinifier) -> Iterator[str]:
+    for part in parts:
+        yield minifier.feed(part)
+    yield minifier.close()
+
+
+def _copy(spool: IO[str], write: Callable[[str], None]) -> None:
+    spool.seek(0)
+    while block := spool.read(_COPY_BUFFER):
+        write(block)
+
+
+def write_report_stream(head: str, body: Iterable[str], tail: str, html_path: str | Path) -> Path:
+    """Write ``head``, the ``body`` pieces and ``tail`` as one report, atomically.
+
+    The output is the one ``write_report_html`` gives for the joined document, in
+    every ``EPIC_REPORT_CSS`` mode. Body pieces must not split a tag.
+    """
+    out = Path(html_path)
+    match = _THEME_STYLE.search(head)
+    mode = report_css_mode()
+    if match is None or mode == "full":
+        return write_report_chunks(chain([head], _batched(body), [tail]), out)
+
+    css = match.group(2)
+    # One minifier for the whole document: a <pre> may span several body pieces.
+    minifier = HtmlMinifier(css)
+    if mode == "shared":
+        head = head[: match.start()] + _shared_link(css, out) + head[match.end() :]
+        parts = chain([head], _batched(body), [tail])
+        return write_report_chunks(_minified(parts, minifier), out)
+
+    out.parent.mkdir(parents=True, exist_ok=True)
+    tags, classes, ids = (set(found) for found in used_selectors(head + tail))
+    # The stylesheet is raw text, copied as is: minify the head without it and put the
+    # shaken sheet back once the body has been seen.
+    head = minifier.feed(head[: match.start(2)] + head[match.end(2) :])
+    sheet_at = head.index(match.group(1)) + len(match.group(1))
+    with tempfile.TemporaryFile("w+", encoding="utf-8", dir=out.parent) as spool:
+        for chunk in _batched(body):
+            found = used_selectors(chunk)
+            tags |= found.tags
+            classes |= found.classes
+            ids |= found.ids
+            spool.write(minifier.feed(chunk))
+        tail = minifier.feed(tail) + minifier.close()
+        used = UsedSelectors(frozenset(tags), frozenset(classes), frozenset(ids))
+        with atomic_output(out, report_gzip_enabled()) as write:
+            write(head[:sheet_at] + shake_css(css, used) + head[sheet_at:])
+            _copy(spool, write)
+            write(tail)
+    return out
+
+
+def stream_report_html(
+    selected_crew: str,
+    content_data: dict[str, Any],
+    html_path: str | Path,
+    template_manager: TemplateManager | None = None,
+) -> Path:
+    """Render a report piece by piece straight to ``html_path``.
+
+    If rendering fails the report is rendered again in memory with
+    ``TemplateManager.render_report``, which falls back to an error page.
+    """
+    manager = template_manager or TemplateManager()
+    try:
+        head, tail = manager.render_frame(selected_crew, content_data)
+        body = manager.generate_contextual_body_chunks(content_data, selected_crew)
+        return write_report_stream(head, body, tail, html_path)
+    except OSError:
+        raise
+    except Exception as e:
+        logger.warning("❌ Error streaming {} report, rendering it in memory: {}", selected_crew, e)
+        return write_report_html(manager.render_report(selected_crew, content_data), html_path)
@@ -5,6 +5,7 @@ Gère l'utilisation des templates HTML unifiés avec support du dark mode
 et expérience utilisateur cohérente.
 """
 
+from collections.abc import Iterator
 from datetime import datetime
 from functools import cache
 from pathlib import Path
@@ -14,6 +15,7 @@ from pydantic import BaseModel
 
 from epic_news.config.ui_theme import generate_theme_css
 from epic_news.models.crews.financial_report import FinancialReport
+from epic_news.utils.html.report_css import optimize_report, report_css_mode
 from epic_news.utils.html.template_renderers.renderer_factory import RendererFactory
 
 _CSS_PATH = Path(__file__).parent.parent.parent.parent.parent / "templates" / "css" / "report.css"
@@ -100,30 +102,42 @@ class TemplateManager:
 
         return base_title
 
+    def render_frame(self, selected_crew: str, content_data: dict[str, Any]) -> tuple[str, str]:
+        """The universal template filled in for this report, split where the body goes.
+
+        Returns:
+            (head, tail): the HTML before and after the report body
+        """
+        template_html = self.load_template("universal_report_template.html")
+        head, tail = template_html.split("{{ report_body|safe }}", 1)
+
+        title = self.generate_contextual_title(selected_crew, content_data)
+        replacements = {
+            "{{ theme_css_vars }}": generate_theme_css(),
+            "{{ static_css }}": _load_static_css(),
+            "{{ report_title }}": title,
+            "{{ generation_date }}": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            # Clean up any remaining Jinja2 template syntax
+            "{% if generation_date %}": "",
+            "{% endif %}": "",
+        }
+        for placeholder, value in replacements.items():
+            head = head.replace(placeholder, value)
+            tail = tail.replace(placeholder, value)
+        return head, tail
+
     def render_report(self, selected_crew: str, content_data: dict[str, Any]) -> str:
         """Main method to render a complete HTML report using the universal template."""
         try:
-            # Load the universal template
-            template_html = self.load_template("universal_report_template.html")
-
-            # Generate contextual title and body
-            title = self.generate_contextual_title(selected_crew, content_data)
+            head, tail = self.render_frame(selected_crew, content_data)
             body_content = self.generate_contextual_body(content_data, selected_crew)
+            html_content = head + body_content + tail
 
-            # Replace placeholders in the template
-            html_content = template_html.replace("{{ theme_css_vars }}", generate_theme_css())
-            html_content = html_content.replace("{{ static_css }}", _load_static_css())
-            html_content = html_content.replace("{{ report_title }}", title)
-            html_content = html_content.replace("{{ report_body|safe }}", body_content)
-            html_content = html_content.replace(
-                "{{ generation_date }}", datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            )
+            # Keep only the CSS this report uses (EPIC_REPORT_CSS, see report_css)
+            if report_css_mode() == "shaken":
+                html_content = optimize_report(html_content)
 
-            # Clean up any remaining Jinja2 template syntax
-            html_content = html_content.replace("{% if generation_date %}", "")
-            html_content = html_content.replace("{% endif %}", "")
-
-            return html_content  # noqa: RET504
+            return html_content
 
         except Exception as e:
             print(f"❌ Error rendering report: {e}")
@@ -144,6 +158,29 @@ class TemplateManager:
             </html>
             """
 
+    def generate_contextual_body_chunks(
+        self, content_data: dict[str, Any], selected_crew: str
+    ) -> Iterator[str]:
+        """Like ``generate_contextual_body``, in the pieces of ``BaseRenderer.render_chunks``.
+
+        Only crews with a specialized renderer are streamed; the others, and a
+        renderer that fails before its first piece, go through ``generate_contextual_body``.
+        """
+        if not RendererFactory.has_specialized_renderer(selected_crew):
+            yield self.generate_contextual_body(content_data, selected_crew)
+            return
+        renderer = RendererFactory.create_renderer(selected_crew)
+        data = content_data.model_dump() if hasattr(content_data, "model_dump") else content_data
+        chunks = renderer.render_chunks(data)
+        try:
+            first = next(chunks, "")
+        except Exception as e:
+            print(f"❌ Error using modular renderer for {selected_crew}: {e}")
+            yield self.generate_contextual_body(content_data, selected_crew)
+            return
+        yield first
+        yield from chunks
+
     def generate_contextual_body(self, content_data: dict[str, Any], selected_crew: str) -> str:
         """Génère le corps HTML contextualisé selon le type de crew."""
 
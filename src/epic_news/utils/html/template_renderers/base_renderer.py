@@ -14,10 +14,11 @@ Provides shared helper methods for common rendering patterns:
 import json
 import warnings
 from abc import ABC, abstractmethod
+from collections.abc import Callable, Iterable, Iterator
 from functools import lru_cache
 from typing import Any
 
-from bs4 import BeautifulSoup, MarkupResemblesLocatorWarning
+from bs4 import BeautifulSoup, MarkupResemblesLocatorWarning, Tag
 from markdown_it import MarkdownIt
 
 # A prose field whose entire value is a bare URL makes BeautifulSoup warn that we probably
@@ -54,6 +55,15 @@ class BaseRenderer(ABC):
             HTML string for the content body
         """
 
+    def render_chunks(self, data: dict[str, Any]) -> Iterator[str]:
+        """
+        Render content data to HTML in pieces that concatenate to ``render(data)``.
+
+        The default yields the whole body at once. Renderers of long reports override
+        it so that ``report_writer`` never holds the entire body in memory.
+        """
+        yield self.render(data)
+
     # -------------------------------------------------------------------------
     # Shared Helper Methods - Use these to reduce code duplication
     # -------------------------------------------------------------------------
@@ -362,6 +372,45 @@ class BaseRenderer(ABC):
         else:
             container.append(str(value))
 
+    def render_step(
+        self, step: Callable[[BeautifulSoup, Any, dict[str, Any]], None], data: dict[str, Any]
+    ) -> str:
+        """
+        Run one ``_add_*(soup, container, data)`` step on its own container.
+
+        Returns:
+            HTML of what the step appended, as ``render`` would serialize it
+        """
+        soup = BeautifulSoup("<div></div>", "html.parser")
+        container = soup.div
+        step(soup, container, data)
+        return container.decode_contents()  # type: ignore[union-attr]
+
+    @staticmethod
+    def serialize(element: Tag) -> str:
+        """
+        Return the HTML of a detached ``element`` and free its tree.
+
+        Decomposing breaks the parent/child reference cycles, so a streamed chunk is
+        freed at once instead of waiting for the cyclic garbage collector.
+        """
+        markup = str(element)
+        element.decompose()
+        return markup
+
+    @staticmethod
+    def stream_element(element: Tag, chunks: Iterable[str]) -> Iterator[str]:
+        """
+        Yield ``element`` up to its closing tag, then ``chunks``, then the closing tag.
+
+        ``chunks`` become the last children of ``element``.
+        """
+        markup = str(element)
+        split = markup.rindex("</")
+        yield markup[:split]
+        yield from chunks
+        yield markup[split:]
+
     def create_soup(self, tag: str = "div", **attrs) -> BeautifulSoup:
         """
         Create a new BeautifulSoup object with a root element.
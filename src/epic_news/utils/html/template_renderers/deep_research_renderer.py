@@ -6,9 +6,10 @@ Handles research sections, sources, and comprehensive analysis.
 """
 
 import logging
+from collections.abc import Iterator
 from typing import Any
 
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, Tag
 
 from .base_renderer import BaseRenderer
 
@@ -31,26 +32,7 @@ class DeepResearchRenderer(BaseRenderer):
         Returns:
             HTML string for deep research report content
         """
-        # Handle different input data formats to ensure we always have a proper dictionary
-
-        # Check if data is wrapped in any dictionary keys
-        if isinstance(data, dict):
-            if "deep_research_model" in data:
-                data = data["deep_research_model"]
-
-            if "deep_research_report" in data:
-                data = data["deep_research_report"]
-
-        # Convert Pydantic model to dict if needed
-        if hasattr(data, "model_dump"):
-            data = data.model_dump()
-        elif hasattr(data, "dict"):
-            data = data.dict()
-
-        # Ensure we have a dictionary to work with
-        if not isinstance(data, dict):
-            logger.error(f"Expected dict or Pydantic model, got {type(data)}. Using empty dict.")
-            data = {}
+        data = self._normalize(data)
 
         # Create main container
         soup = self.create_soup("div", class_="deep-research-report")
@@ -76,6 +58,54 @@ class DeepResearchRenderer(BaseRenderer):
 
         return str(soup)
 
+    def render_chunks(self, data: dict[str, Any]) -> Iterator[str]:
+        """Render deep research report data one research section at a time."""
+        data = self._normalize(data)
+        root = self.create_soup("div", class_="deep-research-report").div
+        yield from self.stream_element(root, self._chunks(data))  # type: ignore[arg-type]
+
+    def _chunks(self, data: dict[str, Any]) -> Iterator[str]:
+        yield self.render_step(self._add_header, data)
+        yield self.render_step(self._add_executive_summary, data)
+        yield self.render_step(self._add_key_findings, data)
+        sections = data.get("research_sections", [])
+        if sections:
+            soup = BeautifulSoup("", "html.parser")
+            main_section = self._research_sections_header(soup)
+            yield from self.stream_element(
+                main_section,
+                (
+                    self.serialize(self._research_section(soup, i, section))
+                    for i, section in enumerate(sections, 1)
+                ),
+            )
+        yield self.render_step(self._add_methodology, data)
+        yield self.render_step(self._add_report_metadata, data)
+
+    @staticmethod
+    def _normalize(data: Any) -> dict[str, Any]:
+        """Unwrap and convert the accepted input shapes to the report dictionary."""
+        # Check if data is wrapped in any dictionary keys
+        if isinstance(data, dict):
+            if "deep_research_model" in data:
+                data = data["deep_research_model"]
+
+            if "deep_research_report" in data:
+                data = data["deep_research_report"]
+
+        # Convert Pydantic model to dict if needed
+        if hasattr(data, "model_dump"):
+            data = data.model_dump()
+        elif hasattr(data, "dict"):
+            data = data.dict()
+
+        # Ensure we have a dictionary to work with
+        if not isinstance(data, dict):
+            logger.error(f"Expected dict or Pydantic model, got {type(data)}. Using empty dict.")
+            data = {}
+
+        return data
+
     def _add_header(self, soup: BeautifulSoup, container, data: dict[str, Any]) -> None:
         """Add report header with title and metadata."""
         header = soup.new_tag("div")
@@ -177,6 +207,14 @@ class DeepResearchRenderer(BaseRenderer):
         if not sections:
             return
 
+        main_section = self._research_sections_header(soup)
+        for i, section_data in enumerate(sections, 1):
+            main_section.append(self._research_section(soup, i, section_data))
+
+        container.append(main_section)
+
+    def _research_sections_header(self, soup: BeautifulSoup) -> Tag:
+        """The research sections wrapper with its title."""
         main_section = soup.new_tag("section")
         main_section.attrs["class"] = "research-sections"
 
@@ -184,83 +222,83 @@ class DeepResearchRenderer(BaseRenderer):
         title.attrs["class"] = "section-title"
         title.string = "🔍 Sections de Recherche"
         main_section.append(title)
-
-        for i, section_data in enumerate(sections, 1):
-            section_div = soup.new_tag("div")
-            section_div.attrs["class"] = "research-section"
-
-            # Section title
-            section_title = section_data.get("section_title", f"Section {i}")
-            title_tag = soup.new_tag("h3")
-            title_tag.attrs["class"] = "subsection-title"
-            title_tag.string = section_title
-            section_div.append(title_tag)
-
-            # Section content. Agents write Markdown (**bold**, "- " bullets) inside the
-            # JSON string fields, so render it rather than escaping it into the page.
-            content = section_data.get("content", "")
-            if content:
-                content_div = soup.new_tag("div")
-                content_div.attrs["class"] = "section-content"
-                self.render_markdown_block(content_div, content)
-                section_div.append(content_div)
-
-            # Add sources for this section
-            sources = section_data.get("sources", [])
-            if sources:
-                sources_div = soup.new_tag("div")
-                sources_div.attrs["class"] = "section-sources"
-                sources_title = soup.new_tag("h4")
-                sources_title.string = "📚 Sources"
-                sources_div.append(sources_title)
-
-                sources_list = soup.new_tag("ul")
-                sources_list.attrs["class"] = "sources-list"
-                for source in sources:
-                    li = soup.new_tag("li")
-                    li.attrs["class"] = "source-item"
-
-                    # Source title and URL. Kept literal on purpose: this text sits inside
-                    # an <a>, and the Markdown parser has linkify enabled, so rendering a
-                    # title containing a bare URL would nest an <a> inside an <a>.
-                    source_title = source.get("title", "Source")
-                    url = source.get("url", "")
-                    if url:
-                        link = soup.new_tag("a")
-                        link.attrs["href"] = url
-                        link.attrs["target"] = "_blank"
-                        link.string = source_title
-                        li.append(link)
-                    else:
-                        # Outside an anchor there is no nesting hazard.
-                        self.append_prose(li, source_title)
-
-                    # Source type and summary
-                    source_type = source.get("source_type", "")
-                    summary = source.get("summary", "")
-                    if source_type or summary:
-                        details = soup.new_tag("div")
-                        details.attrs["class"] = "source-details"
-                        if source_type:
-                            type_span = soup.new_tag("span")
-                            type_span.attrs["class"] = "source-type"
-                            type_span.string = f"({source_type})"
-                            details.append(type_span)
-                        if summary:
-                            summary_span = soup.new_tag("span")
-                            summary_span.attrs["class"] = "source-summary"
-                            summary_span.append(" - ")
-                            self.render_markdown_inline(summary_span, summary)
-                            details.append(summary_span)
-                        li.append(details)
-
-                    sources_list.append(li)
-                sources_div.append(sources_list)
-                section_div.append(sources_div)
-
-            main_section.append(section_div)
-
-        container.append(main_section)
+        return main_section
+
+    def _research_section(self, soup: BeautifulSoup, i: int, section_data: dict[str, Any]) -> Tag:
+        """One research section with its content and sources."""
+        section_div = soup.new_tag("div")
+        section_div.attrs["class"] = "research-section"
+
+        # Section title
+        section_title = section_data.get("section_title", f"Section {i}")
+        title_tag = soup.new_tag("h3")
+        title_tag.attrs["class"] = "subsection-title"
+        title_tag.string = section_title
+        section_div.append(title_tag)
+
+        # Section content. Agents write Markdown (**bold**, "- " bullets) inside the
+        # JSON string fields, so render it rather than escaping it into the page.
+        content = section_data.get("content", "")
+        if content:
+            content_div = soup.new_tag("div")
+            content_div.attrs["class"] = "section-content"
+            self.render_markdown_block(content_div, content)
+            section_div.append(content_div)
+
+        # Add sources for this section
+        sources = section_data.get("sources", [])
+        if sources:
+            sources_div = soup.new_tag("div")
+            sources_div.attrs["class"] = "section-sources"
+            sources_title = soup.new_tag("h4")
+            sources_title.string = "📚 Sources"
+            sources_div.append(sources_title)
+
+            sources_list = soup.new_tag("ul")
+            sources_list.attrs["class"] = "sources-list"
+            for source in sources:
+                li = soup.new_tag("li")
+                li.attrs["class"] = "source-item"
+
+                # Source title and URL. Kept literal on purpose: this text sits inside
+                # an <a>, and the Markdown parser has linkify enabled, so rendering a
+                # title containing a bare URL would nest an <a> inside an <a>.
+                source_title = source.get("title", "Source")
+                url = source.get("url", "")
+                if url:
+                    link = soup.new_tag("a")
+                    link.attrs["href"] = url
+                    link.attrs["target"] = "_blank"
+                    link.string = source_title
+                    li.append(link)
+                else:
+                    # Outside an anchor there is no nesting hazard.
+                    self.append_prose(li, source_title)
+
+                # Source type and summary
+                source_type = source.get("source_type", "")
+                summary = source.get("summary", "")
+                if source_type or summary:
+                    details = soup.new_tag("div")
+                    details.attrs["class"] = "source-details"
+                    if source_type:
+                        type_span = soup.new_tag("span")
+                        type_span.attrs["class"] = "source-type"
+                        type_span.string = f"({source_type})"
+                        details.append(type_span)
+                    if summary:
+                        summary_span = soup.new_tag("span")
+                        summary_span.attrs["class"] = "source-summary"
+                        summary_span.append(" - ")
+                        self.render_markdown_inline(summary_span, summary)
+                        details.append(summary_span)
+                    li.append(details)
+
+                sources_list.append(li)
+            sources_div.append(sources_list)
+            section_div.append(sources_div)
+
+        return section_div
 
     def _add_report_metadata(self, soup: BeautifulSoup, container, data: dict[str, Any]) -> None:
         """Add report metadata section."""
@@ -27,6 +27,17 @@ from .legal_analysis_renderer import LegalAnalysisRenderer
 from .tech_stack_renderer import TechStackRenderer
 from .web_presence_renderer import WebPresenceRenderer
 
+# (data key, section id, title, renderer), in report order
+SUB_REPORTS: tuple[tuple[str, str, str, type[BaseRenderer]], ...] = (
+    ("company_profile", "company-profile", "Profil de l'Entreprise", CompanyProfilerRenderer),
+    ("tech_stack", "tech-stack", "Stack Technologique", TechStackRenderer),
+    ("web_presence", "web-presence", "Presence Web", WebPresenceRenderer),
+    ("hr_intelligence", "hr-intelligence", "Intelligence RH", HRIntelligenceRenderer),
+    ("legal_analysis", "legal-analysis", "Analyse Juridique", LegalAnalysisRenderer),
+    ("geospatial_analysis", "geospatial", "Analyse Geospatiale", GeospatialAnalysisRenderer),
+    ("cross_reference", "cross-reference", "Rapport de Synthese", CrossReferenceReportRenderer),
+)
+
 
 class OSINTGlobalRenderer(BaseRenderer):
     """Render a comprehensive OSINT report from multiple sub-reports."""
@@ -35,10 +46,20 @@ class OSINTGlobalRenderer(BaseRenderer):
         """Initialize the OSINT global renderer."""
         super().__init__()  # type: ignore[safe-super]
 
-    def render(self, data: dict[str, Any], *_ignore: Any, **__ignore: Any) -> str:
+    def render(
+        self,
+        data: dict[str, Any],
+        *_ignore: Any,
+        rendered_sections: dict[str, str] | None = None,
+        **__ignore: Any,
+    ) -> str:
         """
         Return the rendered global OSINT report as an HTML string.
 
+        ``rendered_sections`` maps a data key to the body its sub-renderer already
+        produced (the flow renders each sub-report page first); those sections are
+        assembled from it instead of being rendered a second time.
+
         Expected data structure:
         {
             "company_name": str,
@@ -58,14 +79,19 @@ class OSINTGlobalRenderer(BaseRenderer):
         self._add_table_of_contents(soup, container, data)
         self._add_executive_summary(soup, container, data)
 
-        # Render each sub-report section
-        self._add_company_profile_section(soup, container, data.get("company_profile"))
-        self._add_tech_stack_section(soup, container, data.get("tech_stack"))
-        self._add_web_presence_section(soup, container, data.get("web_presence"))
-        self._add_hr_intelligence_section(soup, container, data.get("hr_intelligence"))
-        self._add_legal_analysis_section(soup, container, data.get("legal_analysis"))
-        self._add_geospatial_section(soup, container, data.get("geospatial_analysis"))
-        self._add_cross_reference_section(soup, container, data.get("cross_reference"))
+        # Render each sub-report section, reusing its body when already rendered
+        rendered_sections = rendered_sections or {}
+        for data_key, section_id, section_title, renderer_cls in SUB_REPORTS:
+            if section_data := data.get(data_key):
+                self._add_sub_report_section(
+                    soup,
+                    container,
+                    section_data,
+                    section_id,
+                    section_title,
+                    renderer_cls,
+                    rendered_sections.get(data_key),
+                )
 
         return str(soup)
 
@@ -87,26 +113,12 @@ class OSINTGlobalRenderer(BaseRenderer):
         title.string = "Table des Matieres"
         toc.append(title)
 
-        sections = [
-            ("executive-summary", "Resume Executif"),
-            ("company-profile", "Profil de l'Entreprise"),
-            ("tech-stack", "Stack Technologique"),
-            ("web-presence", "Presence Web"),
-            ("hr-intelligence", "Intelligence RH"),
-            ("legal-analysis", "Analyse Juridique"),
-            ("geospatial", "Analyse Geospatiale"),
-            ("cross-reference", "Rapport de Synthese"),
-        ]
-
-        # Some section ids don't map 1:1 onto their data key via a simple
-        # dash-to-underscore substitution (e.g. "geospatial" section holds
-        # the "geospatial_analysis" data). List those overrides here.
-        data_key_overrides = {"geospatial": "geospatial_analysis"}
+        sections = [("executive_summary", "executive-summary", "Resume Executif")]
+        sections += [(data_key, section_id, name) for data_key, section_id, name, _ in SUB_REPORTS]
 
         ul = soup.new_tag("ul")
-        for section_id, section_name in sections:
+        for data_key, section_id, section_name in sections:
             # Check if section has data
-            data_key = data_key_overrides.get(section_id, section_id.replace("-", "_"))
             if data_key == "executive_summary" or data.get(data_key):
                 li = soup.new_tag("li")
                 link = soup.new_tag("a", href=f"#{section_id}")
@@ -123,16 +135,7 @@ class OSINTGlobalRenderer(BaseRenderer):
         section.append(title)
 
         # Count available reports
-        reports = [
-            "company_profile",
-            "tech_stack",
-            "web_presence",
-            "hr_intelligence",
-            "legal_analysis",
-            "geospatial_analysis",
-            "cross_reference",
-        ]
-        available = sum(1 for r in reports if data.get(r))
+        available = sum(1 for data_key, *_ in SUB_REPORTS if data.get(data_key))
 
         summary_div = soup.new_tag("div", **{"class": "summary-stats"})  # type: ignore[arg-type]
 
@@ -150,75 +153,12 @@ class OSINTGlobalRenderer(BaseRenderer):
         strong = soup.new_tag("strong")
         strong.string = "Rapports disponibles: "
         p.append(strong)
-        p.append(f"{available} sur 7")
+        p.append(f"{available} sur {len(SUB_REPORTS)}")
         summary_div.append(p)
 
         section.append(summary_div)
         container.append(section)
 
-    def _add_company_profile_section(
-        self, soup: BeautifulSoup, container: Any, data: dict[str, Any] | None
-    ) -> None:
-        if not data:
-            return
-        self._add_sub_report_section(
-            soup, container, data, "company-profile", "Profil de l'Entreprise", CompanyProfilerRenderer()
-        )
-
-    def _add_tech_stack_section(
-        self, soup: BeautifulSoup, container: Any, data: dict[str, Any] | None
-    ) -> None:
-        if not data:
-            return
-        self._add_sub_report_section(
-            soup, container, data, "tech-stack", "Stack Technologique", TechStackRenderer()
-        )
-
-    def _add_web_presence_section(
-        self, soup: BeautifulSoup, container: Any, data: dict[str, Any] | None
-    ) -> None:
-        if not data:
-            return
-        self._add_sub_report_section(
-            soup, container, data, "web-presence", "Presence Web", WebPresenceRenderer()
-        )
-
-    def _add_hr_intelligence_section(
-        self, soup: BeautifulSoup, container: Any, data: dict[str, Any] | None
-    ) -> None:
-        if not data:
-            return
-        self._add_sub_report_section(
-            soup, container, data, "hr-intelligence", "Intelligence RH", HRIntelligenceRenderer()
-        )
-
-    def _add_legal_analysis_section(
-        self, soup: BeautifulSoup, container: Any, data: dict[str, Any] | None
-    ) -> None:
-        if not data:
-            return
-        self._add_sub_report_section(
-            soup, container, data, "legal-analysis", "Analyse Juridique", LegalAnalysisRenderer()
-        )
-
-    def _add_geospatial_section(
-        self, soup: BeautifulSoup, container: Any, data: dict[str, Any] | None
-    ) -> None:
-        if not data:
-            return
-        self._add_sub_report_section(
-            soup, container, data, "geospatial", "Analyse Geospatiale", GeospatialAnalysisRenderer()
-        )
-
-    def _add_cross_reference_section(
-        self, soup: BeautifulSoup, container: Any, data: dict[str, Any] | None
-    ) -> None:
-        if not data:
-            return
-        self._add_sub_report_section(
-            soup, container, data, "cross-reference", "Rapport de Synthese", CrossReferenceReportRenderer()
-        )
-
     def _add_sub_report_section(
         self,
         soup: BeautifulSoup,
@@ -226,9 +166,10 @@ class OSINTGlobalRenderer(BaseRenderer):
         data: dict[str, Any],
         section_id: str,
         section_title: str,
-        renderer: BaseRenderer,
+        renderer_cls: type[BaseRenderer],
+        body_html: str | None = None,
     ) -> None:
-        """Add a sub-report section using the appropriate renderer."""
+        """Add a sub-report section from ``body_html``, or render it with ``renderer_cls``."""
         section = soup.new_tag("section", **{"class": "sub-report-section", "id": section_id})  # type: ignore[arg-type]
 
         # Section header with navigation
@@ -243,7 +184,7 @@ class OSINTGlobalRenderer(BaseRenderer):
 
         # Render the sub-report content
         try:
-            sub_content_html = renderer.render(data)
+            sub_content_html = body_html if body_html is not None else renderer_cls().render(data)
             # Parse the sub-content and extract just the inner content
             sub_soup = BeautifulSoup(sub_content_html, "html.parser")
             # Find the main container and append its children
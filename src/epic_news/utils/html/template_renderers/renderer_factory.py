@@ -3,33 +3,15 @@ Renderer Factory
 
 Factory class to create appropriate renderers based on crew type.
 Centralizes renderer instantiation and provides fallback to generic renderer.
+
+Renderers are referenced by ``module:ClassName`` and imported on first use, so a run
+only loads the renderer of the crew it executes.
 """
 
+import importlib
+
 from .base_renderer import BaseRenderer
-from .book_summary_renderer import BookSummaryRenderer
-from .company_news_renderer import CompanyNewsRenderer
-from .company_profiler_renderer import CompanyProfilerRenderer
-from .cooking_renderer import CookingRenderer
-from .cross_reference_report_renderer import CrossReferenceReportRenderer
-from .deep_research_renderer import DeepResearchRenderer
-from .financial_renderer import FinancialRenderer
 from .generic_renderer import GenericRenderer
-from .geospatial_analysis_renderer import GeospatialAnalysisRenderer
-from .holiday_renderer import HolidayRenderer
-from .hr_intelligence_renderer import HRIntelligenceRenderer
-from .legal_analysis_renderer import LegalAnalysisRenderer
-from .meeting_prep_renderer import MeetingPrepRenderer
-from .menu_renderer import MenuRenderer
-from .news_daily_renderer import NewsDailyRenderer
-from .osint_global_renderer import OSINTGlobalRenderer
-from .pestel_renderer import PestelRenderer
-from .poem_renderer import PoemRenderer
-from .rss_weekly_renderer import RssWeeklyRenderer
-from .saint_renderer import SaintRenderer
-from .sales_prospecting_renderer import SalesProspectingRenderer
-from .shopping_renderer import ShoppingRenderer
-from .tech_stack_renderer import TechStackRenderer
-from .web_presence_renderer import WebPresenceRenderer
 
 
 class RendererFactory:
@@ -39,33 +21,33 @@ class RendererFactory:
         """Initialize the deep research renderer."""
         super().__init__()
 
-    # Mapping of crew types to their specific renderers
-    _RENDERER_MAP: dict[str, type[BaseRenderer]] = {
-        "BOOK_SUMMARY": BookSummaryRenderer,
-        "COMPANY_NEWS": CompanyNewsRenderer,
-        "COMPANY_PROFILE": CompanyProfilerRenderer,
-        "COOKING": CookingRenderer,
-        "CROSS_REFERENCE_REPORT": CrossReferenceReportRenderer,
-        "DEEPRESEARCH": DeepResearchRenderer,
-        "FINDAILY": FinancialRenderer,
-        "GENERIC": GenericRenderer,
-        "GEOSPATIAL_ANALYSIS": GeospatialAnalysisRenderer,
-        "HOLIDAY_PLANNER": HolidayRenderer,
-        "HR_INTELLIGENCE": HRIntelligenceRenderer,
-        "LEGAL_ANALYSIS": LegalAnalysisRenderer,
-        "MEETING_PREP": MeetingPrepRenderer,
-        "OSINT_GLOBAL": OSINTGlobalRenderer,
-        "MENU": MenuRenderer,
-        "NEWSDAILY": NewsDailyRenderer,
-        "PESTEL": PestelRenderer,
-        "POEM": PoemRenderer,
-        "RSS_WEEKLY": RssWeeklyRenderer,
-        "SAINT": SaintRenderer,
-        "SALES_PROSPECTING": SalesProspectingRenderer,
-        "SALESPROSPECTING": SalesProspectingRenderer,
-        "SHOPPING": ShoppingRenderer,
-        "TECH_STACK": TechStackRenderer,
-        "WEB_PRESENCE": WebPresenceRenderer,
+    # Mapping of crew types to their specific renderers (lazy ``module:Class`` references)
+    _RENDERER_MAP: dict[str, type[BaseRenderer] | str] = {
+        "BOOK_SUMMARY": "book_summary_renderer:BookSummaryRenderer",
+        "COMPANY_NEWS": "company_news_renderer:CompanyNewsRenderer",
+        "COMPANY_PROFILE": "company_profiler_renderer:CompanyProfilerRenderer",
+        "COOKING": "cooking_renderer:CookingRenderer",
+        "CROSS_REFERENCE_REPORT": "cross_reference_report_renderer:CrossReferenceReportRenderer",
+        "DEEPRESEARCH": "deep_research_renderer:DeepResearchRenderer",
+        "FINDAILY": "financial_renderer:FinancialRenderer",
+        "GENERIC": "generic_renderer:GenericRenderer",
+        "GEOSPATIAL_ANALYSIS": "geospatial_analysis_renderer:GeospatialAnalysisRenderer",
+        "HOLIDAY_PLANNER": "holiday_renderer:HolidayRenderer",
+        "HR_INTELLIGENCE": "hr_intelligence_renderer:HRIntelligenceRenderer",
+        "LEGAL_ANALYSIS": "legal_analysis_renderer:LegalAnalysisRenderer",
+        "MEETING_PREP": "meeting_prep_renderer:MeetingPrepRenderer",
+        "OSINT_GLOBAL": "osint_global_renderer:OSINTGlobalRenderer",
+        "MENU": "menu_renderer:MenuRenderer",
+        "NEWSDAILY": "news_daily_renderer:NewsDailyRenderer",
+        "PESTEL": "pestel_renderer:PestelRenderer",
+        "POEM": "poem_renderer:PoemRenderer",
+        "RSS_WEEKLY": "rss_weekly_renderer:RssWeeklyRenderer",
+        "SAINT": "saint_renderer:SaintRenderer",
+        "SALES_PROSPECTING": "sales_prospecting_renderer:SalesProspectingRenderer",
+        "SALESPROSPECTING": "sales_prospecting_renderer:SalesProspectingRenderer",
+        "SHOPPING": "shopping_renderer:ShoppingRenderer",
+        "TECH_STACK": "tech_stack_renderer:TechStackRenderer",
+        "WEB_PRESENCE": "web_presence_renderer:WebPresenceRenderer",
     }
 
     @classmethod
@@ -79,8 +61,18 @@ class RendererFactory:
         Returns:
             Renderer instance for the crew type
         """
-        renderer_class = cls._RENDERER_MAP.get(crew_type, GenericRenderer)
-        return renderer_class()
+        return cls._resolve(crew_type)()
+
+    @classmethod
+    def _resolve(cls, crew_type: str) -> type[BaseRenderer]:
+        """Return the renderer class for ``crew_type``, importing it on first use."""
+        entry = cls._RENDERER_MAP.get(crew_type, GenericRenderer)
+        if isinstance(entry, str):
+            module_name, class_name = entry.split(":")
+            module = importlib.import_module(f"{__package__}.{module_name}")
+            entry = getattr(module, class_name)
+            cls._RENDERER_MAP[crew_type] = entry
+        return entry
 
     @classmethod
     def get_supported_crew_types(cls) -> list[str]:
@@ -5,9 +5,10 @@ Renders weekly RSS feed content to structured HTML using BeautifulSoup.
 Handles article lists, source information, and category organization.
 """
 
+from collections.abc import Iterator
 from typing import Any
 
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, Tag
 
 from .base_renderer import BaseRenderer
 
@@ -50,6 +51,26 @@ class RssWeeklyRenderer(BaseRenderer):
 
         return str(soup)
 
+    def render_chunks(self, data: dict[str, Any]) -> Iterator[str]:
+        """Render RSS weekly data one article card (legacy shapes: one category) at a time."""
+        root = self.create_soup("div", **{"class": "rss-weekly-container"}).div
+        yield from self.stream_element(root, self._chunks(data))  # type: ignore[arg-type]
+
+    def _chunks(self, data: dict[str, Any]) -> Iterator[str]:
+        yield self.render_step(self._add_header, data)
+        yield self.render_step(self._add_summary, data)
+        if data.get("feeds"):
+            for feed in data["feeds"]:
+                yield from self._feed_chunks(feed)
+        elif data.get("categories"):
+            for category_name, articles in data["categories"].items():
+                yield self.render_step(
+                    self._add_articles_by_category, {"categories": {category_name: articles}}
+                )
+        else:
+            yield self.render_step(self._add_articles, data)
+        yield self.render_step(self._add_sources, data)
+
     def _add_feeds(self, soup: BeautifulSoup, container, data: dict[str, Any]) -> None:
         """Render each feed digest with its own header + articles list."""
         feeds = data.get("feeds", [])
@@ -57,41 +78,55 @@ class RssWeeklyRenderer(BaseRenderer):
             return
 
         for feed in feeds:
-            feed_url = feed.get("feed_url", "")
-            feed_name = feed.get("feed_name") or feed_url or "Unknown feed"
-            articles = feed.get("articles", [])
-
-            digest_section = soup.new_tag("section")
-            digest_section.attrs["class"] = ["feed-digest"]  # type: ignore[assignment]
-
-            feed_title = soup.new_tag("h3")
-            feed_title.append("📡 ")
-            self.append_prose(feed_title, feed_name)
-            digest_section.append(feed_title)
-
-            if feed_url:
-                url_p = soup.new_tag("p")
-                url_p.attrs["class"] = ["feed-url"]  # type: ignore[assignment]
-                a = soup.new_tag("a", href=feed_url)
-                a["target"] = "_blank"
-                a["rel"] = "noopener noreferrer"
-                a.string = feed_url
-                url_p.append(a)
-                digest_section.append(url_p)
-
-            count_div = soup.new_tag("div")
-            count_div.attrs["class"] = ["articles-count"]  # type: ignore[assignment]
-            count_div.string = f"{len(articles)} article(s)"
-            digest_section.append(count_div)
-
-            articles_div = soup.new_tag("div")
-            articles_div.attrs["class"] = ["articles-list"]  # type: ignore[assignment]
-            for article in articles:
+            digest_section, articles_div = self._feed_section(soup, feed)
+            for article in feed.get("articles", []):
                 articles_div.append(self._create_article_card(soup, article))
             digest_section.append(articles_div)
 
             container.append(digest_section)
 
+    def _feed_chunks(self, feed: dict[str, Any]) -> Iterator[str]:
+        """One feed digest, article card by article card."""
+        soup = BeautifulSoup("", "html.parser")
+        digest_section, articles_div = self._feed_section(soup, feed)
+        cards = (
+            self.serialize(self._create_article_card(soup, article)) for article in feed.get("articles", [])
+        )
+        yield from self.stream_element(digest_section, self.stream_element(articles_div, cards))
+
+    def _feed_section(self, soup: BeautifulSoup, feed: dict[str, Any]) -> tuple[Tag, Tag]:
+        """A feed digest header, and the empty articles list that ends it (not yet appended)."""
+        feed_url = feed.get("feed_url", "")
+        feed_name = feed.get("feed_name") or feed_url or "Unknown feed"
+        articles = feed.get("articles", [])
+
+        digest_section = soup.new_tag("section")
+        digest_section.attrs["class"] = ["feed-digest"]  # type: ignore[assignment]
+
+        feed_title = soup.new_tag("h3")
+        feed_title.append("📡 ")
+        self.append_prose(feed_title, feed_name)
+        digest_section.append(feed_title)
+
+        if feed_url:
+            url_p = soup.new_tag("p")
+            url_p.attrs["class"] = ["feed-url"]  # type: ignore[assignment]
+            a = soup.new_tag("a", href=feed_url)
+            a["target"] = "_blank"
+            a["rel"] = "noopener noreferrer"
+            a.string = feed_url
+            url_p.append(a)
+            digest_section.append(url_p)
+
+        count_div = soup.new_tag("div")
+        count_div.attrs["class"] = ["articles-count"]  # type: ignore[assignment]
+        count_div.string = f"{len(articles)} article(s)"
+        digest_section.append(count_div)
+
+        articles_div = soup.new_tag("div")
+        articles_div.attrs["class"] = ["articles-list"]  # type: ignore[assignment]
+        return digest_section, articles_div
+
     def _add_header(self, soup: BeautifulSoup, container, data: dict[str, Any]) -> None:
         """Add RSS weekly header with title."""
         header = soup.new_tag("header")
@@ -0,0 +1,57 @@
+"""Deferred imports for heavy modules.
+
+``import epic_news.main`` used to import every crew, every DOCX assembler and, through
+them, Composio, MCP and the custom tool packages -- about ten seconds before a single
+request was read, paid again by every CLI invocation, API worker and test importing
+``main``. Most runs touch one crew.
+
+:func:`lazy_import` returns a stand-in that imports its target on first use. It is
+callable (``PestelCrew()`` builds the real crew) and forwards attribute access, so
+call sites do not change, and module attributes holding it can still be monkeypatched
+in tests.
+"""
+
+from __future__ import annotations
+
+import importlib
+from typing import Any
+
+
+class LazyObject:
+    """Proxy resolving ``module:name`` on first call or attribute access."""
+
+    __slots__ = ("_module", "_name", "_target")
+
+    def __init__(self, module: str, name: str) -> None:
+        self._module = module
+        self._name = name
+        self._target: Any = None
+
+    def resolve(self) -> Any:
+        if self._target is None:
+            self._target = getattr(importlib.import_module(self._module), self._name)
+        return self._target
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._target is not None
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        return self.resolve()(*args, **kwargs)
+
+    def __getattr__(self, attr: str) -> Any:
+        return getattr(self.resolve(), attr)
+
+    def __repr__(self) -> str:
+        state = "loaded" if self.is_loaded else "deferred"
+        return f"<lazy {self._module}.{self._name} ({state})>"
+
+
+def lazy_import(module: str, name: str) -> Any:
+    """Return a proxy for ``module.name`` that imports the module on first use."""
+    return LazyObject(module, name)
+
+
+def resolve(obj: Any) -> Any:
+    """Return the real object behind a lazy proxy (or ``obj`` itself)."""
+    return obj.resolve() if isinstance(obj, LazyObject) else obj
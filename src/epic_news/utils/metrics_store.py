@@ -0,0 +1,376 @@
+"""Append-only metrics store: counters, gauges and fixed-bucket histograms.
+
+Every update is one JSON line appended to a log by the background writer thread (see
+``epic_news.utils.spans.BackgroundWriter``), so recording a metric never opens or
+rewrites a file on the caller's path. Every ``compact_every`` records the current
+state is written as a snapshot and the log is truncated; loading a store reads the
+snapshot and replays whatever the log holds after it.
+
+Histograms use fixed buckets and additionally keep their bucket counts per run (the
+trace id of the flow run) for the last ``MAX_RUNS`` runs, which is what answers
+"p50/p95 latency per crew over the last N runs" (:meth:`MetricsStore.latency_by_crew`).
+
+Crew, step and LLM metrics are fed from finished spans by :class:`MetricsSpanExporter`,
+which the default span tracer installs when ``EPIC_METRICS_FILE`` is set (default
+``output/dashboard_data/metrics.jsonl``; empty disables it).
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from bisect import bisect_left
+from collections import OrderedDict
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from loguru import logger
+
+from epic_news.utils.spans import BackgroundWriter, Span, get_background_writer
+
+DEFAULT_METRICS_FILE = os.path.join("output", "dashboard_data", "metrics.jsonl")
+DEFAULT_COMPACT_EVERY = 1000
+MAX_RUNS = 100
+SNAPSHOT_VERSION = 1
+
+# Upper bounds in seconds; the last bucket catches everything above.
+LATENCY_BUCKETS: tuple[float, ...] = (
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+    120.0,
+    300.0,
+    600.0,
+    1800.0,
+    3600.0,
+    float("inf"),
+)
+
+CREW_LATENCY = "crew_latency_seconds"
+STEP_LATENCY = "step_latency_seconds"
+
+
+def series_key(name: str, labels: dict[str, Any]) -> str:
+    """``crew_latency_seconds{crew=PoemCrew}``: one key per metric name and label set."""
+    if not labels:
+        return name
+    inner = ",".join(f"{k}={labels[k]}" for k in sorted(labels))
+    return f"{name}{{{inner}}}"
+
+
+def _quantile(bounds: tuple[float, ...], counts: list[int], q: float) -> float | None:
+    """Quantile ``q`` of a bucketed distribution, interpolated linearly inside the bucket."""
+    total = sum(counts)
+    if not total:
+        return None
+    target = q * total
+    seen = 0
+    for i, count in enumerate(counts):
+        if count and seen + count >= target:
+            lower = bounds[i - 1] if i else 0.0
+            upper = bounds[i]
+            if upper == float("inf"):
+                return lower
+            return lower + (upper - lower) * (target - seen) / count
+        seen += count
+    return bounds[-2]
+
+
+@dataclass(slots=True)
+class Histogram:
+    """Fixed-bucket histogram with the per-run counts of its most recent runs."""
+
+    bounds: tuple[float, ...] = LATENCY_BUCKETS
+    counts: list[int] = field(default_factory=list)
+    total: float = 0.0
+    count: int = 0
+    runs: OrderedDict[str, list[int]] = field(default_factory=OrderedDict)
+
+    def __post_init__(self) -> None:
+        if not self.counts:
+            self.counts = [0] * len(self.bounds)
+
+    def observe(self, value: float, run_id: str | None = None) -> None:
+        index = bisect_left(self.bounds, value)
+        self.counts[index] += 1
+        self.total += value
+        self.count += 1
+        if run_id is None:
+            return
+        per_run = self.runs.get(run_id)
+        if per_run is None:
+            per_run = self.runs[run_id] = [0] * len(self.bounds)
+            while len(self.runs) > MAX_RUNS:
+                self.runs.popitem(last=False)
+        per_run[index] += 1
+
+    def bucket_counts(self, last_runs: int | None = None) -> list[int]:
+        """All-time counts, or the counts of the ``last_runs`` most recent runs."""
+        if last_runs is None:
+            return list(self.counts)
+        merged = [0] * len(self.bounds)
+        for per_run in list(self.runs.values())[-last_runs:] if last_runs > 0 else []:
+            for i, n in enumerate(per_run):
+                merged[i] += n
+        return merged
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "bounds": [b if b != float("inf") else "inf" for b in self.bounds],
+            "counts": self.counts,
+            "sum": self.total,
+            "count": self.count,
+            "runs": dict(self.runs),
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> Histogram:
+        return cls(
+            bounds=tuple(float(b) for b in data["bounds"]),
+            counts=list(data["counts"]),
+            total=data.get("sum", 0.0),
+            count=data.get("count", 0),
+            runs=OrderedDict(data.get("runs", {})),
+        )
+
+
+class MetricsStore:
+    """Thread-safe metrics with an append-only log and periodic snapshot compaction.
+
+    Args:
+        path: The JSONL log updates are appended to.
+        snapshot_path: Where compaction writes the full state (defaults to ``path``
+            with a ``.json`` suffix).
+        compact_every: Log records between two compactions (``EPIC_METRICS_COMPACT_EVERY``).
+        writer: Background writer doing the file I/O (the shared one by default).
+        load: Read the existing snapshot and log on creation.
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        snapshot_path: str | os.PathLike[str] | None = None,
+        compact_every: int | None = None,
+        writer: BackgroundWriter | None = None,
+        load: bool = True,
+    ) -> None:
+        self.path = Path(path)
+        self.snapshot_path = Path(snapshot_path) if snapshot_path else self.path.with_suffix(".json")
+        self.compact_every = compact_every or int(
+            os.getenv("EPIC_METRICS_COMPACT_EVERY", str(DEFAULT_COMPACT_EVERY))
+        )
+        self.writer = writer or get_background_writer()
+        self.counters: dict[str, float] = {}
+        self.gauges: dict[str, Any] = {}
+        self.histograms: dict[str, Histogram] = {}
+        self._labels: dict[str, tuple[str, dict[str, Any]]] = {}
+        self._lock = threading.Lock()
+        self._pending = 0
+        if load:
+            self._load()
+
+    # --- recording ---------------------------------------------------------------
+
+    def inc(self, name: str, value: float = 1, /, **labels: Any) -> None:
+        """Add ``value`` to a counter."""
+        self._record({"op": "inc", "name": name, "labels": labels, "value": value})
+
+    def set(self, name: str, value: Any, /, **labels: Any) -> None:
+        """Set a gauge to ``value`` (any JSON-serializable value)."""
+        self._record({"op": "set", "name": name, "labels": labels, "value": value})
+
+    def observe(self, name: str, value: float, /, run_id: str | None = None, **labels: Any) -> None:
+        """Add ``value`` to a histogram, attributed to ``run_id`` when given."""
+        self._record({"op": "observe", "name": name, "labels": labels, "value": value, "run": run_id})
+
+    def _record(self, record: dict[str, Any]) -> None:
+        record["t"] = time.time()
+        with self._lock:
+            self._apply(record)
+            self.writer.append_json(self.path, record)
+            self._pending += 1
+            if self._pending >= self.compact_every:
+                self._compact_locked()
+
+    def _apply(self, record: dict[str, Any]) -> None:
+        name, labels = record["name"], record.get("labels") or {}
+        key = series_key(name, labels)
+        self._labels.setdefault(key, (name, labels))
+        op = record["op"]
+        if op == "inc":
+            self.counters[key] = self.counters.get(key, 0) + record["value"]
+        elif op == "set":
+            self.gauges[key] = record["value"]
+        elif op == "observe":
+            histogram = self.histograms.get(key)
+            if histogram is None:
+                histogram = self.histograms[key] = Histogram()
+            histogram.observe(record["value"], record.get("run"))
+
+    # --- queries -----------------------------------------------------------------
+
+    def counter(self, name: str, /, **labels: Any) -> float:
+        return self.counters.get(series_key(name, labels), 0)
+
+    def gauge(self, name: str, /, default: Any = None, **labels: Any) -> Any:
+        return self.gauges.get(series_key(name, labels), default)
+
+    def histogram(self, name: str, /, **labels: Any) -> Histogram | None:
+        return self.histograms.get(series_key(name, labels))
+
+    def series(self, name: str | None = None) -> Iterable[tuple[str, dict[str, Any]]]:
+        """(name, labels) of every recorded series, optionally for one metric name."""
+        with self._lock:
+            pairs = list(self._labels.values())
+        return [(n, labels) for n, labels in pairs if name is None or n == name]
+
+    def quantiles(
+        self,
+        name: str,
+        /,
+        quantiles: Iterable[float] = (0.5, 0.95),
+        last_runs: int | None = None,
+        **labels: Any,
+    ) -> dict[str, float | None]:
+        """``{"p50": ..., "p95": ..., "count": n}`` for one histogram series.
+
+        With ``last_runs`` only the observations of the most recent runs are used.
+        """
+        with self._lock:
+            histogram = self.histograms.get(series_key(name, labels))
+            counts = histogram.bucket_counts(last_runs) if histogram else []
+            bounds = histogram.bounds if histogram else LATENCY_BUCKETS
+        result: dict[str, float | None] = {
+            f"p{round(q * 100):g}": _quantile(bounds, counts, q) if counts else None for q in quantiles
+        }
+        result["count"] = sum(counts)
+        return result
+
+    def latency_by_crew(
+        self, last_runs: int | None = 20, quantiles: Iterable[float] = (0.5, 0.95)
+    ) -> dict[str, dict[str, float | None]]:
+        """p50/p95 crew latency in seconds, per crew, over the last ``last_runs`` runs."""
+        quantiles = tuple(quantiles)
+        return {
+            labels["crew"]: self.quantiles(CREW_LATENCY, quantiles, last_runs, **labels)
+            for _, labels in self.series(CREW_LATENCY)
+            if "crew" in labels
+        }
+
+    # --- persistence -------------------------------------------------------------
+
+    def snapshot(self) -> dict[str, Any]:
+        """The full state, as written to the snapshot file."""
+        with self._lock:
+            return self._snapshot_locked()
+
+    def _snapshot_locked(self) -> dict[str, Any]:
+        def entry(key: str, value: Any) -> dict[str, Any]:
+            name, labels = self._labels[key]
+            return {"name": name, "labels": labels, "value": value}
+
+        return {
+            "version": SNAPSHOT_VERSION,
+            "updated_at": time.time(),
+            "counters": [entry(k, v) for k, v in self.counters.items()],
+            "gauges": [entry(k, v) for k, v in self.gauges.items()],
+            "histograms": [entry(k, h.to_dict()) for k, h in self.histograms.items()],
+        }
+
+    def compact(self) -> None:
+        """Write a snapshot and truncate the log (both on the writer thread, in order)."""
+        with self._lock:
+            self._compact_locked()
+
+    def _compact_locked(self) -> None:
+        text = json.dumps(self._snapshot_locked(), default=str)
+        self.writer.replace(self.snapshot_path, text)
+        self.writer.replace(self.path, "")
+        self._pending = 0
+
+    def flush(self, timeout: float | None = 5.0) -> bool:
+        """Wait until every update so far is on disk."""
+        return self.writer.flush(timeout)
+
+    def _load(self) -> None:
+        if self.snapshot_path.exists():
+            try:
+                data = json.loads(self.snapshot_path.read_text(encoding="utf-8"))
+            except (OSError, ValueError) as exc:
+                logger.warning("⚠️ Ignoring unreadable metrics snapshot {}: {}", self.snapshot_path, exc)
+                data = {}
+            if data.get("version") == SNAPSHOT_VERSION:
+                self._load_snapshot(data)
+        if self.path.exists():
+            with open(self.path, encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        self._apply(json.loads(line))
+                        self._pending += 1
+                    except (ValueError, KeyError):
+                        continue  # a line cut short by a crash
+
+    def _load_snapshot(self, data: dict[str, Any]) -> None:
+        for kind, target in (("counters", self.counters), ("gauges", self.gauges)):
+            for entry in data.get(kind, []):
+                key = series_key(entry["name"], entry["labels"])
+                self._labels[key] = (entry["name"], entry["labels"])
+                target[key] = entry["value"]
+        for entry in data.get("histograms", []):
+            key = series_key(entry["name"], entry["labels"])
+            self._labels[key] = (entry["name"], entry["labels"])
+            self.histograms[key] = Histogram.from_dict(entry["value"])
+
+
+class MetricsSpanExporter:
+    """Span exporter turning finished crew, step and LLM spans into metrics."""
+
+    def __init__(self, store: MetricsStore) -> None:
+        self.store = store
+
+    def on_start(self, span: Span) -> None:
+        pass
+
+    def on_end(self, span: Span) -> None:
+        duration = span.duration or 0.0
+        if span.kind == "crew":
+            crew = span.attributes.get("crew") or span.name.removeprefix("crew:")
+            self.store.observe(CREW_LATENCY, duration, run_id=span.trace_id, crew=crew)
+            self.store.inc("crew_runs_total", crew=crew, status=span.status)
+        elif span.kind == "flow_step":
+            step = span.attributes.get("step") or span.name.removeprefix("step:")
+            self.store.observe(STEP_LATENCY, duration, run_id=span.trace_id, step=step)
+        elif span.kind == "llm":
+            model = span.attributes.get("model") or span.name.removeprefix("llm:")
+            self.store.inc("llm_calls_total", model=model, status=span.status)
+            tokens = span.attributes.get("total_tokens")
+            if isinstance(tokens, int | float):
+                self.store.inc("llm_tokens_total", tokens, model=model)
+
+
+_store: MetricsStore | None = None
+_store_lock = threading.Lock()
+
+
+def get_metrics_store() -> MetricsStore | None:
+    """Process-wide store at ``EPIC_METRICS_FILE``, or None when that is set empty."""
+    global _store
+    path = os.getenv("EPIC_METRICS_FILE", DEFAULT_METRICS_FILE)
+    if not path:
+        return None
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                _store = MetricsStore(path)
+    return _store
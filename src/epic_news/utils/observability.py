@@ -6,17 +6,24 @@ guardrails against hallucinations in AI agent outputs.
 """
 
 import hashlib
+import inspect
 import json
 import os
 import re
+import threading
 import time
 from datetime import datetime
 from functools import wraps
+from pathlib import Path
 from typing import Any
 
 from loguru import logger
 
 from epic_news.utils.directory_utils import ensure_output_directory
+from epic_news.utils.metrics_store import MetricsStore, series_key
+from epic_news.utils.profiling import profile_block
+from epic_news.utils.progress import emit as emit_progress
+from epic_news.utils.spans import Span, get_background_writer, get_span_tracer
 
 # Configure logging
 # logger = logging.getLogger("observability")
@@ -118,16 +125,14 @@ class Tracer:
 
     def _save_event(self, event: TraceEvent) -> None:
         """
-        Save an event to the trace file.
+        Queue an event for the trace file.
+
+        The background span writer appends it, so tracing never waits on file I/O.
 
         Args:
             event: The trace event to save
         """
-        event_dict = event.to_dict()
-
-        # Append to the trace file
-        with open(self.trace_file, "a") as f:
-            f.write(json.dumps(event_dict) + "\n")
+        get_background_writer().append_json(self.trace_file, event.to_dict())
 
     def get_events(self, event_type: str | None = None, source: str | None = None) -> list[TraceEvent]:
         """
@@ -163,6 +168,8 @@ class Tracer:
         """
         tracer = cls(trace_id)
         trace_file = os.path.join(TRACE_DIR, f"{trace_id}.json")
+        # Events may still be queued for the writer thread.
+        get_background_writer().flush()
 
         if os.path.exists(trace_file):
             with open(trace_file) as f:
@@ -297,6 +304,10 @@ class HallucinationGuard:
 class Dashboard:
     """
     Provides dashboard capabilities for monitoring system activity.
+
+    Updates are appended to ``<dashboard_id>.jsonl`` through a `MetricsStore`, which
+    periodically compacts them into the ``<dashboard_id>.json`` snapshot, instead of
+    rewriting the whole file on every update.
     """
 
     def __init__(self, dashboard_id: str | None = None):
@@ -315,6 +326,17 @@ class Dashboard:
             "tools": {},
             "system": {"start_time": time.time(), "events_count": 0},
         }
+        self._store: MetricsStore | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def store(self) -> MetricsStore:
+        """The metrics log backing this dashboard (follows ``data_file``)."""
+        data_file = Path(self.data_file)
+        if self._store is None or self._store.snapshot_path != data_file:
+            self._store = MetricsStore(data_file.with_suffix(".jsonl"), data_file, load=False)
+            self._store.set("start_time", self.metrics["system"]["start_time"], category="system")
+        return self._store
 
     def update_metric(self, category: str, name: str, metric: str, value: Any) -> None:
         """
@@ -326,22 +348,16 @@ class Dashboard:
             metric: Metric name
             value: Metric value
         """
-        if category not in self.metrics:
-            self.metrics[category] = {}
-
-        if name not in self.metrics[category]:
-            self.metrics[category][name] = {}
-
-        self.metrics[category][name][metric] = value
-        self.metrics["system"]["events_count"] += 1
-
-        # Save the updated metrics
-        self._save_metrics()
+        with self._lock:
+            self.metrics.setdefault(category, {}).setdefault(name, {})[metric] = value
+            self.metrics["system"]["events_count"] += 1
+            store = self.store
+        store.set(metric, value, category=category, name=name)
+        store.inc("events_count", category="system")
 
     def _save_metrics(self) -> None:
-        """Save the metrics to the data file."""
-        with open(self.data_file, "w") as f:
-            json.dump(self.metrics, f, indent=2)
+        """Compact the metrics log into the snapshot file."""
+        self.store.compact()
 
     def get_metrics(self, category: str | None = None, name: str | None = None) -> dict[str, Any]:
         """
@@ -363,7 +379,10 @@ class Dashboard:
     @classmethod
     def load_dashboard(cls, dashboard_id: str) -> "Dashboard":
         """
-        Load a dashboard from a file.
+        Load a dashboard from its snapshot and metrics log.
+
+        Snapshots written before the metrics log existed (the plain metrics dict) are
+        still read.
 
         Args:
             dashboard_id: ID of the dashboard to load
@@ -376,16 +395,67 @@ class Dashboard:
 
         if os.path.exists(data_file):
             with open(data_file) as f:
-                dashboard.metrics = json.load(f)
+                data = json.load(f)
+            if "version" not in data:
+                dashboard.metrics = data
+
+        store = MetricsStore(Path(data_file).with_suffix(".jsonl"), data_file)
+        for metric, labels in store.series():
+            category = labels.get("category")
+            if not category:
+                continue
+            key = series_key(metric, labels)
+            value = store.gauges[key] if key in store.gauges else store.counters.get(key)
+            bucket = dashboard.metrics.setdefault(category, {})
+            if "name" in labels:
+                bucket = bucket.setdefault(labels["name"], {})
+            bucket[metric] = value
+        dashboard._store = store
 
         return dashboard
 
 
 # Decorators for observability
+def _step_started(tracer: Tracer, task_name: str) -> Span:
+    step = get_span_tracer().start_span(f"step:{task_name}", "flow_step", step=task_name)
+    tracer.add_event(
+        TraceEvent("task_start", f"task:{task_name}", {"task_name": task_name, "span_id": step.span_id})
+    )
+    emit_progress("step_started", step=task_name)
+    return step
+
+
+def _step_finished(
+    tracer: Tracer, step: Span, task_name: str, result: Any, error: BaseException | None
+) -> None:
+    success = error is None
+    get_span_tracer().end_span(step, error=error)
+    if error is not None:
+        tracer.add_event(
+            TraceEvent("task_error", f"task:{task_name}", {"task_name": task_name, "error": str(error)})
+        )
+    end_details = {
+        "task_name": task_name,
+        "duration": step.duration,
+        "success": success,
+        "result_type": type(result).__name__ if success else None,
+    }
+    tracer.add_event(TraceEvent("task_end", f"task:{task_name}", end_details))
+    emit_progress("step_finished", step=task_name, duration=step.duration, success=success)
+
+
 def trace_task(tracer: Tracer):
     """
     Decorator to trace task execution.
 
+    Opens a ``flow_step`` span (see `epic_news.utils.spans`) around the call, so the
+    crews, tasks and LLM calls it triggers nest under it, and records the
+    ``task_start``/``task_end`` events on ``tracer``. Coroutine functions get an async
+    wrapper: the span covers the awaited run, not just the creation of the coroutine.
+    Arguments are never stringified: for flow methods that would serialize the whole
+    flow state on every step. With profiling on (``EPIC_PROFILE``), the step is also
+    sampled; see `epic_news.utils.profiling`.
+
     Args:
         tracer: The tracer to use
 
@@ -394,39 +464,43 @@ def trace_task(tracer: Tracer):
     """
 
     def decorator(func):
+        task_name = func.__name__
+
+        if inspect.iscoroutinefunction(func):
+
+            @wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                step = _step_started(tracer, task_name)
+                token = get_span_tracer().activate(step)
+                result = error = None
+                try:
+                    with profile_block(f"step:{task_name}"):
+                        result = await func(*args, **kwargs)
+                    return result
+                except Exception as e:
+                    error = e
+                    raise
+                finally:
+                    get_span_tracer().deactivate(token)
+                    _step_finished(tracer, step, task_name, result, error)
+
+            return async_wrapper
+
         @wraps(func)
         def wrapper(*args, **kwargs):
-            # Extract task information
-            task_name = func.__name__
-
-            # Record task start
-            start_details = {"task_name": task_name, "args": str(args), "kwargs": str(kwargs)}
-            tracer.add_event(TraceEvent("task_start", f"task:{task_name}", start_details))
-
-            # Execute the task
-            start_time = time.time()
+            step = _step_started(tracer, task_name)
+            token = get_span_tracer().activate(step)
+            result = error = None
             try:
-                success = False  # Initialize success to False
-                result = func(*args, **kwargs)
-                success = True
+                with profile_block(f"step:{task_name}"):
+                    result = func(*args, **kwargs)
+                return result
             except Exception as e:
-                result = str(e)
-                success = False
-                error_details = {"task_name": task_name, "error": str(e)}
-                tracer.add_event(TraceEvent("task_error", f"task:{task_name}", error_details))
+                error = e
                 raise
             finally:
-                # Record task end
-                end_time = time.time()
-                end_details = {
-                    "task_name": task_name,
-                    "duration": end_time - start_time,
-                    "success": success,
-                    "result_type": type(result).__name__ if success else None,
-                }
-                tracer.add_event(TraceEvent("task_end", f"task:{task_name}", end_details))
-
-            return result
+                get_span_tracer().deactivate(token)
+                _step_finished(tracer, step, task_name, result, error)
 
         return wrapper
 
@@ -0,0 +1,192 @@
+"""HTML → PDF rendering on a pool of warm WeasyPrint workers.
+
+Every report embeds the same ~50 KB of theme and report CSS in its
+``<style id="theme-styles">`` block, and ``HtmlToPdfTool`` re-parsed it, together with
+the font configuration, on every conversion. Each worker here imports WeasyPrint and
+builds one ``FontConfiguration`` when it starts, then parses each distinct stylesheet
+once (keyed by a hash of its text) and reuses the ``CSS`` object for every report.
+
+The flow calls this deterministically once the HTML is written, e.g. all OSINT reports
+at once with :func:`render_pdfs`; agents no longer convert files in their ReAct loop.
+
+- ``EPIC_PDF_WORKERS``: worker processes (default ``min(4, cpu count)``).
+- ``EPIC_PDF_RENDER=false`` turns the flow-side rendering off.
+
+The cached sheet is passed to WeasyPrint as a user stylesheet instead of staying in
+the document, so it is only lifted out of documents that link no other stylesheet;
+within it the cascade order is unchanged.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import atexit
+import hashlib
+import multiprocessing
+import os
+import re
+import threading
+from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any
+
+from loguru import logger
+
+from epic_news.utils.progress import emit
+
+_FALSY = {"0", "false", "no", "off"}
+_THEME_STYLE = re.compile(r'(<style id="theme-styles">)(.*?)(</style>)', re.DOTALL)
+_LINKED_STYLESHEET = re.compile(r"<link[^>]+rel=[\"']?stylesheet", re.IGNORECASE)
+_MAX_SHEETS = 16
+
+
+class PdfUnavailableError(RuntimeError):
+    """WeasyPrint or its system libraries (Pango, Cairo) cannot be loaded."""
+
+
+def pdf_rendering_enabled() -> bool:
+    return os.getenv("EPIC_PDF_RENDER", "true").strip().lower() not in _FALSY
+
+
+def split_stylesheet(html: str) -> tuple[str, str | None]:
+    """Lift the theme ``<style>`` block out of ``html``; return (html, its CSS or None).
+
+    Left in place when the document links another stylesheet: moving the block to a
+    user stylesheet would let that author sheet override it.
+    """
+    if _LINKED_STYLESHEET.search(html):
+        return html, None
+    match = _THEME_STYLE.search(html)
+    if not match:
+        return html, None
+    return html[: match.start(2)] + html[match.end(2) :], match.group(2)
+
+
+# -- worker process ----------------------------------------------------------------
+
+_font_config: Any = None
+_sheets: dict[str, Any] = {}
+
+
+def _init_worker() -> None:
+    global _font_config
+    try:
+        from weasyprint.text.fonts import FontConfiguration
+    except (ImportError, OSError):
+        return  # reported per job, where the caller can see it
+    _font_config = FontConfiguration()
+
+
+def _stylesheet(css: str) -> Any:
+    from weasyprint import CSS
+
+    key = hashlib.sha1(css.encode("utf-8")).hexdigest()
+    sheet = _sheets.get(key)
+    if sheet is None:
+        if len(_sheets) >= _MAX_SHEETS:
+            _sheets.pop(next(iter(_sheets)))
+        sheet = _sheets[key] = CSS(string=css, font_config=_font_config)
+    return sheet
+
+
+def _render_in_worker(html_path: str, pdf_path: str) -> str:
+    try:
+        from weasyprint import HTML
+    except (ImportError, OSError) as e:
+        raise PdfUnavailableError(f"WeasyPrint is not available: {e}") from None
+
+    html, css = split_stylesheet(Path(html_path).read_text(encoding="utf-8"))
+    Path(pdf_path).parent.mkdir(parents=True, exist_ok=True)
+    HTML(string=html, base_url=html_path).write_pdf(
+        pdf_path,
+        stylesheets=[_stylesheet(css)] if css is not None else None,
+        font_config=_font_config,
+    )
+    return pdf_path
+
+
+# -- parent process ----------------------------------------------------------------
+
+
+class PdfRenderer:
+    """Async front end to the worker pool; the pool starts on the first render."""
+
+    def __init__(self, workers: int | None = None):
+        self.workers = workers or int(os.getenv("EPIC_PDF_WORKERS", "0")) or min(4, os.cpu_count() or 1)
+        self._pool: ProcessPoolExecutor | None = None
+        self._lock = threading.Lock()
+        self._unavailable: str | None = None
+
+    def _executor(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._pool is None:
+                # spawn, not fork: the flow process already runs writer and provider threads.
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=_init_worker,
+                )
+            return self._pool
+
+    async def render(self, html_path: str | Path, pdf_path: str | Path | None = None) -> Path:
+        """Render ``html_path`` to ``pdf_path`` (default: same name, ``.pdf``)."""
+        if self._unavailable:
+            raise PdfUnavailableError(self._unavailable)
+        html = Path(html_path).resolve()
+        pdf = Path(pdf_path).resolve() if pdf_path else html.with_suffix(".pdf")
+        loop = asyncio.get_running_loop()
+        try:
+            await loop.run_in_executor(self._executor(), _render_in_worker, str(html), str(pdf))
+        except PdfUnavailableError as e:
+            self._unavailable = str(e)
+            raise
+        return pdf
+
+    async def render_all(self, html_paths: Iterable[str | Path]) -> list[Path | BaseException]:
+        """Render every file at once; each result is its PDF path or the exception it raised."""
+        return await asyncio.gather(*(self.render(p) for p in html_paths), return_exceptions=True)
+
+    def close(self) -> None:
+        with self._lock:
+            if self._pool is not None:
+                self._pool.shutdown(wait=True, cancel_futures=True)
+                self._pool = None
+
+
+_renderer: PdfRenderer | None = None
+
+
+def get_pdf_renderer() -> PdfRenderer:
+    """The process-wide renderer, so its workers stay warm across reports."""
+    global _renderer
+    if _renderer is None:
+        _renderer = PdfRenderer()
+        atexit.register(_renderer.close)
+    return _renderer
+
+
+async def render_pdfs(html_paths: Iterable[str | Path]) -> list[Path]:
+    """Render the existing files among ``html_paths`` to PDF next to them, in parallel.
+
+    Never raises: a failed conversion is logged and left out of the result, since a
+    missing PDF must not fail the report it belongs to.
+    """
+    if not pdf_rendering_enabled():
+        return []
+    paths = [Path(p) for p in html_paths if Path(p).exists()]
+    if not paths:
+        return []
+    results = await get_pdf_renderer().render_all(paths)
+    rendered: list[Path] = []
+    for html, result in zip(paths, results, strict=True):
+        if isinstance(result, PdfUnavailableError):
+            logger.warning("⚠️ PDF rendering skipped: {}", result)
+            return rendered
+        if isinstance(result, BaseException):
+            logger.warning("⚠️ PDF rendering failed for {}: {}", html, result)
+        else:
+            rendered.append(result)
+            emit("artefact_written", path=str(result), format="pdf")
+    logger.info("📑 Rendered {}/{} PDFs", len(rendered), len(paths))
+    return rendered
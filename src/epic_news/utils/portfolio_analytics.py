@@ -0,0 +1,279 @@
+"""Deterministic portfolio analytics computed before FinDailyCrew runs.
+
+The FinDaily analysts used to read ``data/stock.csv`` / ``data/etf.csv`` with
+FileReadTool and then call the Yahoo Finance tools one ticker at a time inside their
+ReAct loop: dozens of LLM round trips just to learn prices. This module loads both CSVs
+with pandas, fetches every price series (plus the FX pairs needed to value them) in one
+batched ``yfinance.download`` call and computes, as vectorized NumPy over the whole
+price matrix:
+
+- 1-day, 1-month and 1-year returns,
+- annualized volatility, maximum and current drawdown,
+- allocation weights (from a quantity column when the CSV has one, equal otherwise),
+- portfolio volatility from the covariance matrix, and the most correlated pairs.
+
+:func:`build_portfolio_context` renders that as a compact Markdown block the crew
+receives as ``{portfolio_analytics}``. It never raises: when prices cannot be fetched
+the block says so and the analysts fall back to their tools.
+"""
+
+from __future__ import annotations
+
+import os
+import warnings
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from loguru import logger
+
+TRADING_DAYS = 252
+MONTH_DAYS = 21
+DEFAULT_PERIOD = "1y"
+# Tickers missing more than this share of the price history are left out of the
+# correlation matrix (a recent listing would otherwise truncate every other series).
+MAX_MISSING_FOR_CORRELATION = 0.2
+QUANTITY_COLUMNS = ("Quantity", "Shares", "Units")
+# London quotes are in pence.
+_MINOR_UNITS = {"GBp": ("GBP", 0.01), "GBX": ("GBP", 0.01), "ZAc": ("ZAR", 0.01), "ILA": ("ILS", 0.01)}
+
+# tickers, period -> close prices (DatetimeIndex rows, one column per ticker)
+PriceLoader = Callable[[list[str], str], pd.DataFrame]
+
+
+@dataclass
+class PortfolioAnalytics:
+    """Per-holding metrics plus portfolio-level aggregates."""
+
+    holdings: pd.DataFrame
+    base_currency: str
+    portfolio_volatility: float | None
+    portfolio_return_1y: float | None
+    top_correlations: list[tuple[str, str, float]]
+    missing: list[str]
+
+    def to_markdown(self) -> str:
+        """Compact Markdown block handed to the agents as context."""
+        lines = [
+            f"Precomputed from {len(self.holdings)} holdings (values in {self.base_currency}). "
+            "Use these figures; do not fetch prices again.",
+            "",
+            "| Asset | Ticker | Class | Last | 1D % | 1M % | 1Y % | Vol % | Max DD % | DD now % | Weight % |",
+            "|---|---|---|---|---|---|---|---|---|---|---|",
+        ]
+        for row in self.holdings.itertuples(index=False):
+            lines.append(
+                f"| {row.name} | {row.ticker} | {row.asset_class} | {_num(row.last, 2)} {row.currency} "
+                f"| {_pct(row.return_1d)} | {_pct(row.return_1m)} | {_pct(row.return_1y)} "
+                f"| {_pct(row.volatility)} | {_pct(row.max_drawdown)} | {_pct(row.drawdown)} "
+                f"| {_pct(row.weight)} |"
+            )
+        lines.append("")
+        lines.append(
+            f"Portfolio: 1Y return {_pct(self.portfolio_return_1y)} %, "
+            f"annualized volatility {_pct(self.portfolio_volatility)} %."
+        )
+        if self.top_correlations:
+            pairs = ", ".join(f"{a}/{b} {c:.2f}" for a, b, c in self.top_correlations)
+            lines.append(f"Most correlated pairs (daily returns): {pairs}.")
+        if self.missing:
+            lines.append(f"No price data for: {', '.join(self.missing)} — research these with your tools.")
+        return "\n".join(lines)
+
+
+def _pct(value: float | None) -> str:
+    return "n/a" if value is None or not np.isfinite(value) else f"{value * 100:.1f}"
+
+
+def _num(value: float | None, digits: int) -> str:
+    return "n/a" if value is None or not np.isfinite(value) else f"{value:.{digits}f}"
+
+
+def load_portfolio(paths: dict[str, str | Path]) -> pd.DataFrame:
+    """Read the portfolio CSVs (``Name, Ticker, Currency`` [, quantity]) into one frame.
+
+    ``paths`` maps an asset class label (``"stock"``, ``"etf"``) to its CSV. Missing
+    files are skipped; ``Yahoo:`` prefixes are stripped and duplicate tickers dropped.
+    """
+    frames = []
+    for asset_class, path in paths.items():
+        if not Path(path).is_file():
+            logger.warning("⚠️ Portfolio file not found: {}", path)
+            continue
+        frame = pd.read_csv(path, dtype=str).rename(columns=str.strip)
+        if "Ticker" not in frame.columns:
+            logger.warning("⚠️ Portfolio file {} has no Ticker column", path)
+            continue
+        quantity_column = next((c for c in QUANTITY_COLUMNS if c in frame.columns), None)
+        frames.append(
+            pd.DataFrame(
+                {
+                    "name": frame.get("Name", frame["Ticker"]).fillna("").str.strip(),
+                    "ticker": frame["Ticker"].fillna("").str.strip().str.replace(r"^Yahoo:", "", regex=True),
+                    "currency": frame.get("Currency", pd.Series("", index=frame.index))
+                    .fillna("")
+                    .str.strip(),
+                    "quantity": pd.to_numeric(frame[quantity_column], errors="coerce")
+                    if quantity_column
+                    else np.nan,
+                    "asset_class": asset_class,
+                }
+            )
+        )
+    if not frames:
+        return pd.DataFrame(columns=["name", "ticker", "currency", "quantity", "asset_class"])
+    portfolio = pd.concat(frames, ignore_index=True)
+    portfolio = portfolio[portfolio["ticker"] != ""]
+    return portfolio.drop_duplicates(subset="ticker").reset_index(drop=True)
+
+
+def fx_ticker(currency: str, base_currency: str) -> str | None:
+    """Yahoo FX pair converting ``currency`` to ``base_currency`` (None when equal)."""
+    major, _ = _MINOR_UNITS.get(currency, (currency, 1.0))
+    if not major or major.upper() == base_currency.upper():
+        return None
+    return f"{major.upper()}{base_currency.upper()}=X"
+
+
+def download_close_prices(tickers: list[str], period: str = DEFAULT_PERIOD) -> pd.DataFrame:
+    """Close prices for every ticker in a single batched ``yfinance.download`` call."""
+    import yfinance as yf
+
+    data = yf.download(
+        tickers,
+        period=period,
+        interval="1d",
+        auto_adjust=True,
+        progress=False,
+        threads=True,
+        group_by="column",
+    )
+    if data is None or data.empty:
+        return pd.DataFrame()
+    close = data["Close"] if isinstance(data.columns, pd.MultiIndex) else data[["Close"]]
+    if isinstance(close, pd.Series):
+        close = close.to_frame(tickers[0])
+    if list(close.columns) == ["Close"]:
+        close.columns = tickers[:1]
+    return close
+
+
+def _window_return(prices: np.ndarray, days: int) -> np.ndarray:
+    """Return over the last ``days`` rows per column (NaN when the history is shorter)."""
+    start = np.full(prices.shape[1], np.nan) if prices.shape[0] <= days else prices[-days - 1]
+    return prices[-1] / start - 1.0
+
+
+def compute_portfolio_analytics(
+    portfolio: pd.DataFrame,
+    close: pd.DataFrame,
+    base_currency: str = "CHF",
+    top_pairs: int = 5,
+) -> PortfolioAnalytics:
+    """Compute the metrics for ``portfolio`` from a close-price frame (FX pairs included)."""
+    close = close.sort_index().ffill()
+    available = [t for t in portfolio["ticker"] if t in close.columns and close[t].notna().any()]
+    missing = [t for t in portfolio["ticker"] if t not in available]
+    holdings = portfolio[portfolio["ticker"].isin(available)].reset_index(drop=True).copy()
+
+    prices = close[list(holdings["ticker"])].to_numpy(dtype=float)  # T x N
+    returns = prices[1:] / prices[:-1] - 1.0
+    peak = np.fmax.accumulate(prices, axis=0)
+    drawdowns = prices / peak - 1.0
+
+    holdings["last"] = prices[-1] if len(prices) else np.nan
+    holdings["return_1d"] = _window_return(prices, 1)
+    holdings["return_1m"] = _window_return(prices, MONTH_DAYS)
+    first_valid = prices[np.argmax(~np.isnan(prices), axis=0), np.arange(prices.shape[1])]
+    holdings["return_1y"] = prices[-1] / first_valid - 1.0
+    with warnings.catch_warnings():
+        # Too short a history for a volatility is NaN ("n/a"), not a warning.
+        warnings.simplefilter("ignore", RuntimeWarning)
+        holdings["volatility"] = np.nanstd(returns, axis=0, ddof=1) * np.sqrt(TRADING_DAYS)
+    holdings["max_drawdown"] = np.nanmin(drawdowns, axis=0)
+    holdings["drawdown"] = drawdowns[-1]
+
+    # Value every position in the base currency: last price x FX x minor-unit factor.
+    factor = holdings["currency"].map(lambda c: _MINOR_UNITS.get(c, (c, 1.0))[1]).to_numpy(dtype=float)
+    fx = np.array(
+        [
+            close[pair].iloc[-1] if pair in close.columns else (1.0 if pair is None else np.nan)
+            for pair in (fx_ticker(c, base_currency) for c in holdings["currency"])
+        ],
+        dtype=float,
+    )
+    quantity = holdings["quantity"].to_numpy(dtype=float)
+    if np.isfinite(quantity).any():
+        value = np.nan_to_num(quantity) * holdings["last"].to_numpy(dtype=float) * factor * fx
+        value = np.where(np.isfinite(value), value, 0.0)
+        weights = value / value.sum() if value.sum() > 0 else np.full(len(holdings), np.nan)
+    else:
+        weights = np.full(len(holdings), 1.0 / len(holdings)) if len(holdings) else np.array([])
+    holdings["weight"] = weights
+
+    portfolio_volatility = portfolio_return = None
+    top_correlations: list[tuple[str, str, float]] = []
+    complete = np.isnan(returns).mean(axis=0) <= MAX_MISSING_FOR_CORRELATION if returns.size else []
+    if np.count_nonzero(complete) >= 2:
+        sub = returns[:, complete]
+        sub = sub[~np.isnan(sub).any(axis=1)]
+        tickers = holdings["ticker"].to_numpy()[complete]
+        w = np.nan_to_num(weights[complete])
+        if sub.shape[0] > 2 and w.sum() > 0:
+            w = w / w.sum()
+            covariance = np.cov(sub, rowvar=False)
+            portfolio_volatility = float(np.sqrt(w @ covariance @ w * TRADING_DAYS))
+            portfolio_return = float(np.prod(1.0 + sub @ w) - 1.0)
+            correlation = np.corrcoef(sub, rowvar=False)
+            upper_i, upper_j = np.triu_indices_from(correlation, k=1)
+            values = correlation[upper_i, upper_j]
+            order = np.argsort(-np.nan_to_num(values, nan=-2.0))[:top_pairs]
+            top_correlations = [
+                (str(tickers[upper_i[k]]), str(tickers[upper_j[k]]), float(values[k]))
+                for k in order
+                if np.isfinite(values[k])
+            ]
+
+    return PortfolioAnalytics(
+        holdings=holdings,
+        base_currency=base_currency,
+        portfolio_volatility=portfolio_volatility,
+        portfolio_return_1y=portfolio_return,
+        top_correlations=top_correlations,
+        missing=missing,
+    )
+
+
+def _unique(items: Iterable[str | None]) -> list[str]:
+    return list(dict.fromkeys(i for i in items if i))
+
+
+def build_portfolio_context(
+    stock_csv_path: str | Path,
+    etf_csv_path: str | Path,
+    loader: PriceLoader = download_close_prices,
+) -> str:
+    """Markdown analytics block for FinDaily, or a short note when it cannot be built."""
+    base_currency = os.getenv("PORTFOLIO_BASE_CURRENCY", "CHF")
+    portfolio = load_portfolio({"stock": stock_csv_path, "etf": etf_csv_path})
+    if portfolio.empty:
+        return "No precomputed portfolio analytics: the portfolio files are missing or empty."
+    symbols = _unique(
+        list(portfolio["ticker"]) + [fx_ticker(c, base_currency) for c in portfolio["currency"]]
+    )
+    try:
+        close = loader(symbols, os.getenv("PORTFOLIO_HISTORY_PERIOD", DEFAULT_PERIOD))
+        if close.empty:
+            raise ValueError("no prices returned")
+        analytics = compute_portfolio_analytics(portfolio, close, base_currency=base_currency)
+    except Exception as exc:
+        logger.warning("⚠️ Portfolio analytics unavailable, agents will use their tools: {}", exc)
+        return f"No precomputed portfolio analytics ({exc}); research prices with your tools."
+    logger.info(
+        "📈 Portfolio analytics: {} holdings priced, {} missing",
+        len(analytics.holdings),
+        len(analytics.missing),
+    )
+    return analytics.to_markdown()
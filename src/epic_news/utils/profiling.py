@@ -0,0 +1,347 @@
+"""Opt-in profiling of flow steps and crew kickoffs.
+
+Enabled with ``EPIC_PROFILE=1`` or ``kickoff --profile`` (off by default; every entry
+point here is a no-op then). While on, each ``@trace_task`` step and each
+``kickoff_flow``/``akickoff_flow`` call is wrapped in a :func:`profile_block`, which
+records:
+
+- a stack sample of the calling thread every ``EPIC_PROFILE_INTERVAL_MS`` (default 5),
+  taken by one shared sampler thread through ``sys._current_frames()``, so time spent
+  waiting on the LLM shows up as the blocking HTTP call it is;
+- wall time, CPU time of the calling thread and the ``tracemalloc`` peak
+  (``EPIC_PROFILE_TRACEMALLOC=0`` skips the allocation tracking, which is the costly part).
+
+Each block writes ``traces/<run_id>/<nn>-<block>.collapsed`` (Brendan Gregg's collapsed
+stacks, for ``flamegraph.pl``), ``.speedscope.json`` (open it at
+https://www.speedscope.app) and ``.stats.json``. When the run ends, :func:`profile_run`
+logs a per-step table and the top hotspots, by function and by package, and writes them
+to ``traces/<run_id>/hotspots.txt``.
+
+Async steps are sampled on the event loop thread, so their stacks include whatever else
+the loop runs meanwhile.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import re
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from pathlib import Path
+from types import CodeType, FrameType
+from typing import Any
+
+from loguru import logger
+
+from epic_news.utils.progress import current_run_id
+
+TRACE_DIR = "traces"
+DEFAULT_INTERVAL_MS = 5.0
+TOP_N = 15
+_TRUTHY = {"1", "true", "yes", "on"}
+
+_forced = False
+_owns_tracemalloc = False  # started by a block, so stopped once the run is over
+
+
+def enable_profiling(enabled: bool = True) -> None:
+    """Turn profiling on for this process (the ``--profile`` flag), whatever ``EPIC_PROFILE`` says."""
+    global _forced
+    _forced = enabled
+
+
+def profiling_enabled() -> bool:
+    return _forced or os.getenv("EPIC_PROFILE", "").strip().lower() in _TRUTHY
+
+
+def _interval() -> float:
+    try:
+        return max(float(os.getenv("EPIC_PROFILE_INTERVAL_MS", str(DEFAULT_INTERVAL_MS))), 0.5) / 1000
+    except ValueError:
+        return DEFAULT_INTERVAL_MS / 1000
+
+
+_labels: dict[CodeType, str] = {}
+
+
+def _frame_label(code: CodeType) -> str:
+    label = _labels.get(code)
+    if label is None:
+        path = code.co_filename
+        marker = path.rfind("site-packages" + os.sep)
+        if marker != -1:
+            path = path[marker + len("site-packages") + 1 :]
+        elif (marker := path.rfind(os.sep + "epic_news" + os.sep)) != -1:
+            path = path[marker + 1 :]
+        label = _labels[code] = f"{code.co_qualname} ({path}:{code.co_firstlineno})"
+    return label
+
+
+def _stack(frame: FrameType | None) -> tuple[str, ...]:
+    """Root-first frame labels of ``frame``'s stack."""
+    labels = []
+    while frame is not None:
+        labels.append(_frame_label(frame.f_code))
+        frame = frame.f_back
+    labels.reverse()
+    return tuple(labels)
+
+
+_PACKAGE = re.compile(r"\((?:(epic_news)[/\\]([^/\\:]+)|([^/\\:]+))")
+
+
+def _package(label: str) -> str:
+    """``litellm`` for a frame in litellm, ``epic_news.utils`` for one in epic_news/utils."""
+    match = _PACKAGE.search(label)
+    if not match:
+        return "?"
+    if match.group(1):
+        sub = match.group(2)
+        return f"epic_news.{sub.removesuffix('.py')}"
+    return match.group(3).removesuffix(".py")
+
+
+@dataclass
+class BlockProfile:
+    """Samples and counters of one profiled block."""
+
+    name: str
+    thread_id: int
+    interval: float
+    samples: Counter[tuple[str, ...]] = field(default_factory=Counter)
+    wall: float = 0.0
+    cpu: float = 0.0
+    alloc_peak: int | None = None
+    error: str | None = None
+    nested: bool = False  # inside another block on the same thread, which has its samples too
+
+    def collapsed(self) -> str:
+        return "".join(f"{';'.join(stack)} {count}\n" for stack, count in self.samples.most_common())
+
+    def speedscope(self) -> dict[str, Any]:
+        frames: dict[str, int] = {}
+        samples, weights = [], []
+        for stack, count in self.samples.items():
+            samples.append([frames.setdefault(label, len(frames)) for label in stack])
+            weights.append(count * self.interval)
+        return {
+            "$schema": "https://www.speedscope.app/file-format-schema.json",
+            "shared": {"frames": [{"name": label} for label in frames]},
+            "profiles": [
+                {
+                    "type": "sampled",
+                    "name": self.name,
+                    "unit": "seconds",
+                    "startValue": 0,
+                    "endValue": sum(weights),
+                    "samples": samples,
+                    "weights": weights,
+                }
+            ],
+            "name": self.name,
+            "activeProfileIndex": 0,
+            "exporter": "epic_news.utils.profiling",
+        }
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "name": self.name,
+            "wall_seconds": round(self.wall, 4),
+            "cpu_seconds": round(self.cpu, 4),
+            "alloc_peak_bytes": self.alloc_peak,
+            "samples": sum(self.samples.values()),
+            "interval_seconds": self.interval,
+            "error": self.error,
+        }
+
+
+class _Sampler:
+    """One daemon thread sampling the threads of every open block."""
+
+    def __init__(self) -> None:
+        self._blocks: list[BlockProfile] = []
+        self._lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+        self._wake = threading.Event()
+
+    def add(self, block: BlockProfile) -> None:
+        with self._lock:
+            self._blocks.append(block)
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="epic-profiler", daemon=True)
+                self._thread.start()
+        self._wake.set()
+
+    def remove(self, block: BlockProfile) -> None:
+        with self._lock:
+            self._blocks.remove(block)
+
+    def active(self) -> int:
+        with self._lock:
+            return len(self._blocks)
+
+    def _run(self) -> None:
+        own = threading.get_ident()
+        while True:
+            with self._lock:
+                blocks = list(self._blocks)
+                if not blocks:
+                    self._wake.clear()
+            if not blocks:
+                self._wake.wait(1.0)
+                continue
+            frames = sys._current_frames()
+            stacks: dict[int, tuple[str, ...]] = {}
+            for block in blocks:
+                if block.thread_id == own:
+                    continue
+                stack = stacks.get(block.thread_id)
+                if stack is None:
+                    stack = stacks[block.thread_id] = _stack(frames.get(block.thread_id))
+                if stack:
+                    block.samples[stack] += 1
+            del frames
+            time.sleep(blocks[0].interval)
+
+
+_sampler = _Sampler()
+_current_block: ContextVar[BlockProfile | None] = ContextVar("epic_news_profile_block", default=None)
+
+
+@dataclass
+class _RunProfile:
+    run_id: str
+    directory: Path
+    blocks: list[BlockProfile] = field(default_factory=list)
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+    def add(self, block: BlockProfile) -> int:
+        with self.lock:
+            self.blocks.append(block)
+            return len(self.blocks)
+
+
+_runs: dict[str, _RunProfile] = {}
+_runs_lock = threading.Lock()
+
+
+def _run_profile(run_id: str | None) -> _RunProfile:
+    run_id = run_id or current_run_id() or f"profile_{int(time.time())}"
+    with _runs_lock:
+        run = _runs.get(run_id)
+        if run is None:
+            run = _runs[run_id] = _RunProfile(run_id, Path(TRACE_DIR) / run_id)
+    return run
+
+
+def _safe_name(name: str) -> str:
+    return re.sub(r"[^\w.-]+", "_", name).strip("_") or "block"
+
+
+def _write_block(run: _RunProfile, index: int, block: BlockProfile) -> None:
+    run.directory.mkdir(parents=True, exist_ok=True)
+    stem = run.directory / f"{index:02d}-{_safe_name(block.name)}"
+    stem.with_suffix(".collapsed").write_text(block.collapsed(), encoding="utf-8")
+    Path(f"{stem}.speedscope.json").write_text(json.dumps(block.speedscope()), encoding="utf-8")
+    Path(f"{stem}.stats.json").write_text(json.dumps(block.stats(), indent=2), encoding="utf-8")
+
+
+@contextmanager
+def profile_block(name: str, run_id: str | None = None) -> Iterator[BlockProfile | None]:
+    """Profile the enclosed block on the calling thread; yields None when profiling is off."""
+    if not profiling_enabled():
+        yield None
+        return
+
+    run = _run_profile(run_id)
+    parent = _current_block.get()
+    block = BlockProfile(name, threading.get_ident(), _interval())
+    block.nested = parent is not None and parent.thread_id == block.thread_id
+    track_alloc = os.getenv("EPIC_PROFILE_TRACEMALLOC", "1").strip().lower() in _TRUTHY
+    if track_alloc:
+        if not tracemalloc.is_tracing():
+            global _owns_tracemalloc
+            tracemalloc.start()
+            _owns_tracemalloc = True
+        if not _sampler.active():
+            # The peak is process-wide: only reset it when no other block is measuring.
+            tracemalloc.reset_peak()
+        alloc_start = tracemalloc.get_traced_memory()[0]
+    wall_start, cpu_start = time.perf_counter(), time.thread_time()
+    _sampler.add(block)
+    token = _current_block.set(block)
+    try:
+        yield block
+    except BaseException as exc:
+        block.error = type(exc).__name__
+        raise
+    finally:
+        _current_block.reset(token)
+        _sampler.remove(block)
+        block.wall = time.perf_counter() - wall_start
+        block.cpu = time.thread_time() - cpu_start
+        if track_alloc:
+            block.alloc_peak = max(tracemalloc.get_traced_memory()[1] - alloc_start, 0)
+        try:
+            _write_block(run, run.add(block), block)
+        except OSError as exc:
+            logger.warning("⚠️ Could not write profile for {}: {}", name, exc)
+
+
+def hotspots(blocks: list[BlockProfile], top: int = TOP_N) -> str:
+    """Per-block counters, then the top functions (self time) and packages (inclusive)."""
+    lines = [f"{'block':<40} {'wall s':>9} {'cpu s':>9} {'alloc peak MB':>14}"]
+    for block in blocks:
+        alloc = f"{block.alloc_peak / 1e6:.1f}" if block.alloc_peak is not None else "-"
+        lines.append(f"{block.name[:40]:<40} {block.wall:>9.2f} {block.cpu:>9.2f} {alloc:>14}")
+
+    # A crew block inside its step on the same thread repeats the step's samples.
+    outer = [block for block in blocks if not block.nested]
+    self_time: Counter[str] = Counter()
+    packages: Counter[str] = Counter()
+    total = 0
+    for block in outer:
+        for stack, count in block.samples.items():
+            total += count
+            self_time[stack[-1]] += count
+            for package in {_package(label) for label in stack}:
+                packages[package] += count
+    if total:
+        lines += ["", f"Top {top} functions by self time ({total} samples):"]
+        lines += [f"{100 * n / total:6.1f}%  {label}" for label, n in self_time.most_common(top)]
+        lines += ["", f"Top {top} packages by inclusive time:"]
+        lines += [f"{100 * n / total:6.1f}%  {package}" for package, n in packages.most_common(top)]
+    return "\n".join(lines)
+
+
+@contextmanager
+def profile_run(run_id: str | None = None) -> Iterator[None]:
+    """Close a profiled run: log the hotspot summary and write ``hotspots.txt``."""
+    if not profiling_enabled():
+        yield
+        return
+    run_id = run_id or current_run_id()
+    try:
+        yield
+    finally:
+        global _owns_tracemalloc
+        with _runs_lock:
+            run = _runs.pop(run_id, None) if run_id else None
+            if _owns_tracemalloc and not _runs and not _sampler.active():
+                tracemalloc.stop()
+                _owns_tracemalloc = False
+        if run is not None and run.blocks:
+            summary = hotspots(run.blocks)
+            try:
+                (run.directory / "hotspots.txt").write_text(summary + "\n", encoding="utf-8")
+            except OSError as exc:
+                logger.warning("⚠️ Could not write hotspot summary: {}", exc)
+            logger.info("🔥 Profile of run {} (files in {}):\n{}", run.run_id, run.directory, summary)
@@ -0,0 +1,216 @@
+"""In-process progress event bus for live run updates.
+
+A run is identified by a ``run_id`` bound to a context variable for the duration of
+``kickoff``. Producers (``trace_task``, ``kickoff_flow``/``akickoff_flow``, crew task
+callbacks, the HTML/DOCX writers) call :func:`emit`; consumers (the FastAPI SSE
+endpoint, the Streamlit UI) :meth:`ProgressBus.subscribe` to one run and receive the
+events already published for it followed by the live ones.
+
+Event kinds:
+- ``run_started`` / ``run_finished``
+- ``step_started`` / ``step_finished`` (flow methods)
+- ``crew_attempt`` (one per kickoff attempt, including retries)
+- ``task_completed`` (crew task callback)
+- ``token_usage`` (totals reported by a finished crew)
+- ``artefact_written`` (HTML/DOCX report on disk)
+- ``report_ready`` (final report path, just before ``run_finished``)
+
+Emitting is a no-op outside a run, so library code can call :func:`emit` freely.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+import json
+import threading
+import time
+import uuid
+from collections import deque
+from collections.abc import AsyncIterator, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from queue import Empty, Queue
+from typing import Any
+
+RUN_FINISHED = "run_finished"
+
+# Events kept per run so a late subscriber (SSE client connecting after the POST
+# returned) still sees the beginning of the run.
+_HISTORY_LIMIT = 500
+# Finished runs kept around for late subscribers before being dropped.
+_FINISHED_RUNS_LIMIT = 50
+
+_current_run_id: ContextVar[str | None] = ContextVar("epic_news_run_id", default=None)
+
+
+@dataclass(frozen=True)
+class ProgressEvent:
+    """A single progress notification for one run."""
+
+    run_id: str
+    seq: int
+    kind: str
+    data: dict[str, Any] = field(default_factory=dict)
+    timestamp: float = field(default_factory=time.time)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "run_id": self.run_id,
+            "seq": self.seq,
+            "kind": self.kind,
+            "timestamp": self.timestamp,
+            "data": self.data,
+        }
+
+    def to_sse(self) -> str:
+        """Serialize as a Server-Sent Events frame."""
+        payload = json.dumps(self.to_dict(), ensure_ascii=False, default=str)
+        return f"id: {self.seq}\nevent: {self.kind}\ndata: {payload}\n\n"
+
+
+class Subscription:
+    """Blocking iterator over the events of one run; ends after ``run_finished``."""
+
+    def __init__(self, bus: ProgressBus, run_id: str) -> None:
+        self._bus = bus
+        self.run_id = run_id
+        self.queue: Queue[ProgressEvent] = Queue()
+        self.finished = False
+
+    def get(self, timeout: float | None = None) -> ProgressEvent | None:
+        """Return the next event, or None if none arrived within ``timeout``."""
+        if self.finished:
+            return None
+        try:
+            event = self.queue.get(timeout=timeout)
+        except Empty:
+            return None
+        if event.kind == RUN_FINISHED:
+            self.finished = True
+        return event
+
+    def __iter__(self) -> Iterator[ProgressEvent]:
+        while not self.finished:
+            event = self.get(timeout=0.5)
+            if event is not None:
+                yield event
+
+    def close(self) -> None:
+        self._bus._unsubscribe(self)
+
+
+class ProgressBus:
+    """Thread-safe publish/subscribe hub keyed by run id."""
+
+    def __init__(self, history_limit: int = _HISTORY_LIMIT) -> None:
+        self._lock = threading.Lock()
+        self._history_limit = history_limit
+        self._history: dict[str, deque[ProgressEvent]] = {}
+        self._subscribers: dict[str, list[Subscription]] = {}
+        self._finished: deque[str] = deque()
+        self._seq = itertools.count(1)
+
+    def open_run(self, run_id: str) -> None:
+        """Register a run so subscribers can attach before its first event."""
+        with self._lock:
+            self._history.setdefault(run_id, deque(maxlen=self._history_limit))
+
+    def has_run(self, run_id: str) -> bool:
+        with self._lock:
+            return run_id in self._history
+
+    def publish(self, run_id: str, kind: str, **data: Any) -> ProgressEvent:
+        with self._lock:
+            event = ProgressEvent(run_id=run_id, seq=next(self._seq), kind=kind, data=data)
+            self._history.setdefault(run_id, deque(maxlen=self._history_limit)).append(event)
+            subscribers = list(self._subscribers.get(run_id, ()))
+            if kind == RUN_FINISHED:
+                self._finished.append(run_id)
+                while len(self._finished) > _FINISHED_RUNS_LIMIT:
+                    self._history.pop(self._finished.popleft(), None)
+        for sub in subscribers:
+            sub.queue.put(event)
+        return event
+
+    def subscribe(self, run_id: str) -> Subscription:
+        """Subscribe to a run, replaying the events already published for it."""
+        sub = Subscription(self, run_id)
+        with self._lock:
+            for event in self._history.get(run_id, ()):
+                sub.queue.put(event)
+            self._subscribers.setdefault(run_id, []).append(sub)
+        return sub
+
+    def history(self, run_id: str) -> list[ProgressEvent]:
+        with self._lock:
+            return list(self._history.get(run_id, ()))
+
+    def _unsubscribe(self, sub: Subscription) -> None:
+        with self._lock:
+            subs = self._subscribers.get(sub.run_id, [])
+            if sub in subs:
+                subs.remove(sub)
+            if not subs:
+                self._subscribers.pop(sub.run_id, None)
+
+
+_bus = ProgressBus()
+
+
+def get_progress_bus() -> ProgressBus:
+    """Return the process-wide progress bus."""
+    return _bus
+
+
+def new_run_id() -> str:
+    return uuid.uuid4().hex[:12]
+
+
+def current_run_id() -> str | None:
+    return _current_run_id.get()
+
+
+@contextmanager
+def run_scope(run_id: str | None = None, **data: Any) -> Iterator[str]:
+    """Bind a run id for the enclosed block and bracket it with run_started/run_finished."""
+    run_id = run_id or new_run_id()
+    bus = get_progress_bus()
+    bus.open_run(run_id)
+    token = _current_run_id.set(run_id)
+    bus.publish(run_id, "run_started", **data)
+    status = "error"
+    try:
+        yield run_id
+        status = "ok"
+    finally:
+        bus.publish(run_id, RUN_FINISHED, status=status)
+        _current_run_id.reset(token)
+
+
+def emit(kind: str, run_id: str | None = None, **data: Any) -> None:
+    """Publish an event for the current run; silently ignored outside a run."""
+    run_id = run_id or _current_run_id.get()
+    if run_id is None:
+        return
+    _bus.publish(run_id, kind, **data)
+
+
+async def sse_stream(run_id: str, keepalive_seconds: float = 15.0) -> AsyncIterator[str]:
+    """Yield SSE frames for a run until it finishes, with periodic keep-alive comments."""
+    sub = get_progress_bus().subscribe(run_id)
+    try:
+        idle = 0.0
+        while not sub.finished:
+            event = await asyncio.to_thread(sub.get, 1.0)
+            if event is None:
+                idle += 1.0
+                if idle >= keepalive_seconds:
+                    idle = 0.0
+                    yield ": keep-alive\n\n"
+                continue
+            idle = 0.0
+            yield event.to_sse()
+    finally:
+        sub.close()
@@ -1,83 +1,36 @@
-import json
 import os
 import re
 from pathlib import Path
 from typing import Any
 
 from loguru import logger
-from pydantic import ValidationError
 
 from epic_news.models.content_state import FALLBACK_EMAIL
-from epic_news.models.crews.rss_weekly_report import (
-    ArticleSummary,
-    FeedDigest,
-    RssWeeklyReport,
-)
-from epic_news.models.rss_models import RssFeeds
+from epic_news.models.crews.rss_weekly_report import RssWeeklyReport
 from epic_news.utils.directory_utils import ensure_output_directory
-from epic_news.utils.html.template_manager import TemplateManager
-
-
-def _transform_rss_feeds_to_report(rss_feeds_model: RssFeeds, report_title: str) -> RssWeeklyReport:
-    """Convert a low-level RssFeeds payload into the RssWeeklyReport renderer model."""
-    report_feeds = []
-    for feed_data in rss_feeds_model.rss_feeds:
-        articles = [
-            ArticleSummary(
-                title=a.title,
-                link=a.link,
-                published=a.published if a.published else "",
-                summary=a.content or a.summary or "",
-                source_feed=feed_data.feed_url,
-            )
-            for a in feed_data.articles
-        ]
-        report_feeds.append(
-            FeedDigest(  # type: ignore[call-arg]
-                feed_url=feed_data.feed_url,
-                feed_name=getattr(feed_data, "feed_title", None)
-                or getattr(feed_data, "feed_name", "Unknown"),
-                articles=articles,
-            )
-        )
-    return RssWeeklyReport(  # type: ignore[call-arg]
-        title=report_title,
-        summary="Un résumé hebdomadaire des dernières nouvelles et articles de vos flux RSS.",
-        feeds=report_feeds,
-    )
+from epic_news.utils.html.report_writer import stream_report_html
+from epic_news.utils.rss_articles import ArticleTable
 
 
 def load_rss_weekly_report(
     json_file_path: str, report_title: str = "Veille Technologique Hebdomadaire"
 ) -> RssWeeklyReport:
-    """Load a translated RSS JSON file into an RssWeeklyReport.
+    """Load an RSS article file into an RssWeeklyReport.
 
-    Accepts either RssWeeklyReport-shaped JSON (used directly) or RssFeeds-shaped
-    JSON (transformed via _transform_rss_feeds_to_report). Raises on validation
-    errors matching neither shape.
+    Accepts the columnar ``ArticleTable`` file written by the flow as well as
+    RssWeeklyReport-, RssFeeds- or flat-articles-shaped JSON. The shape is read from
+    the keys, and the report model is validated once. Raises ``ValueError`` when the
+    file matches none of them.
     """
-    with open(json_file_path, encoding="utf-8") as f:
-        data = json.load(f)
-
-    try:
-        report_model = RssWeeklyReport.model_validate(data)
-        logger.info("✅ Data already in RssWeeklyReport shape, using directly")
-    except ValidationError as e_direct:
-        logger.info("Data not in RssWeeklyReport shape; trying RssFeeds + transform")
-        try:
-            rss_feeds_model = RssFeeds.model_validate(data)
-        except ValidationError as e_feeds:
-            logger.error(
-                "❌ JSON matches neither RssWeeklyReport nor RssFeeds.\n"
-                "  RssWeeklyReport errors: {}\n"
-                "  RssFeeds errors: {}",
-                e_direct,
-                e_feeds,
-            )
-            raise
-        report_model = _transform_rss_feeds_to_report(rss_feeds_model, report_title)
-
-    return report_model
+    table = ArticleTable.load(json_file_path)
+    logger.info("✅ Loaded {} RSS articles from {} feeds", len(table), len(table.feed_urls))
+    return table.to_report(report_title)
+
+
+def write_rss_weekly_html_report(report_model: RssWeeklyReport, output_html_path: str) -> None:
+    """Render an RssWeeklyReport to ``output_html_path``."""
+    stream_report_html("RSS_WEEKLY", report_model.model_dump(), output_html_path)
+    logger.info("✅ HTML report successfully generated at: {}", output_html_path)
 
 
 def generate_rss_weekly_html_report(
@@ -86,26 +39,14 @@ def generate_rss_weekly_html_report(
     report_title: str = "Veille Technologique Hebdomadaire",
 ) -> None:
     """
-    Reads translated RSS data from a JSON file, converts it to a Pydantic model,
-    then generates and saves a professional HTML report.
+    Reads an RSS article file (see ``load_rss_weekly_report``), converts it to a
+    Pydantic model, then generates and saves a professional HTML report.
 
-    Accepts two JSON shapes:
-    - RssWeeklyReport (preferred — what the translator produces): top-level keys
-      ``title``, ``feeds``, ``summary``, ...
-    - RssFeeds (low-level): ``{"rss_feeds": [{"feed_url": ..., "articles": [...]}]}``
-
-    Raises on validation errors so the caller can surface the failure rather
-    than silently swallowing it.
+    Raises on invalid data so the caller can surface the failure rather than
+    silently swallowing it.
     """
     logger.info("🚀 Generating HTML report from {}...", json_file_path)
-
-    report_model = load_rss_weekly_report(json_file_path, report_title)
-
-    tm = TemplateManager()
-    html = tm.render_report("RSS_WEEKLY", report_model.model_dump())
-    with open(output_html_path, "w", encoding="utf-8") as f:
-        f.write(html)
-    logger.info("✅ HTML report successfully generated at: {}", output_html_path)
+    write_rss_weekly_html_report(load_rss_weekly_report(json_file_path, report_title), output_html_path)
 
 
 # Guaranteed-valid final fallback so a missing/empty/typo'd MAIL env var never
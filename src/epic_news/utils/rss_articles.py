@@ -0,0 +1,252 @@
+"""Column-oriented table of the week's RSS articles.
+
+The RSS pipeline used to round-trip nested JSON at every stage: the fetched
+``report.json``, the translator's output, then ``load_rss_weekly_report`` validating
+the result against two Pydantic shapes in turn. :class:`ArticleTable` holds the
+articles as one list per field, with the feed of each article as an index into the
+feed columns and repeated strings (sources, dates) interned. It is read once from
+whichever JSON shape a stage produces, saved in a compact columnar form, and turned
+into an ``RssWeeklyReport`` once, when the report is rendered.
+
+The columnar file is a JSON object whose ``"format"`` key is :data:`FORMAT`.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sys
+import uuid
+from array import array
+from collections.abc import Iterator, Mapping
+from pathlib import Path
+from typing import Any, NamedTuple
+
+from epic_news.models.crews.rss_weekly_report import ArticleSummary, FeedDigest, RssWeeklyReport
+
+FORMAT = "epic-news/rss-articles-v1"
+_COLUMNS = ("title", "link", "published", "summary", "source")
+_REPORT_FIELDS = ("title", "summary", "generation_date")
+
+
+class ArticleRow(NamedTuple):
+    """One article, as read back from the table."""
+
+    feed: int
+    title: str
+    link: str
+    published: str
+    summary: str
+    source: str
+
+
+def _required(article: Mapping[str, Any], key: str, where: str) -> str:
+    value = article.get(key)
+    if value is None:
+        raise ValueError(f"{where} has no {key!r}")
+    return str(value)
+
+
+class ArticleTable:
+    """The articles of one weekly digest, stored column by column."""
+
+    __slots__ = ("feed_urls", "feed_names", "feed", "title", "link", "published", "summary", "source", "meta")
+
+    def __init__(self) -> None:
+        self.feed_urls: list[str] = []
+        self.feed_names: list[str | None] = []
+        self.feed = array("I")  # index into feed_urls, per article
+        self.title: list[str] = []
+        self.link: list[str] = []
+        self.published: list[str] = []
+        self.summary: list[str] = []
+        self.source: list[str] = []
+        self.meta: dict[str, Any] = {}  # report-level fields: title, summary, generation_date
+
+    def __len__(self) -> int:
+        return len(self.feed)
+
+    def add_feed(self, url: str, name: str | None = None) -> int:
+        self.feed_urls.append(sys.intern(url))
+        self.feed_names.append(name)
+        return len(self.feed_urls) - 1
+
+    def append(
+        self, feed: int, title: str, link: str, published: str, summary: str, source: str = ""
+    ) -> None:
+        self.feed.append(feed)
+        self.title.append(title)
+        self.link.append(link)
+        self.published.append(sys.intern(published))
+        self.summary.append(summary)
+        self.source.append(sys.intern(source or self.feed_urls[feed]))
+
+    def rows(self) -> Iterator[ArticleRow]:
+        return map(ArticleRow, self.feed, self.title, self.link, self.published, self.summary, self.source)
+
+    # -- reading ----------------------------------------------------------------------
+
+    @classmethod
+    def from_payload(cls, data: Mapping[str, Any]) -> ArticleTable:
+        """Read the articles of any JSON shape the pipeline produces.
+
+        - ``{"feeds": [...]}``: ``RssWeeklyReport``, as the translator is asked to return.
+        - ``{"rss_feeds": [...]}``: ``RssFeeds``, as fetched; ``content`` is preferred
+          over ``summary``.
+        - ``{"articles": [...]}``: a flat list, which translators sometimes return.
+
+        Raises:
+            ValueError: the payload matches none of these shapes, or an article lacks
+                a required field.
+        """
+        if not isinstance(data, Mapping):
+            raise ValueError(f"RSS payload must be a JSON object, got {type(data).__name__}")
+        table = cls()
+        weekly = isinstance(data.get("feeds"), list)
+        # A report-shaped payload keeps its own fields, even an empty summary.
+        table.meta = {
+            key: data[key] for key in _REPORT_FIELDS if key in data and (weekly or data[key] is not None)
+        }
+        if weekly:
+            for feed in data["feeds"]:
+                index = table.add_feed(str(feed.get("feed_url", "")), feed.get("feed_name"))
+                for article in feed.get("articles") or []:
+                    where = f"article of feed {table.feed_urls[index]!r}"
+                    table.append(
+                        index,
+                        _required(article, "title", where),
+                        _required(article, "link", where),
+                        _required(article, "published", where),
+                        _required(article, "summary", where),
+                        _required(article, "source_feed", where),
+                    )
+        elif isinstance(data.get("rss_feeds"), list):
+            for feed in data["rss_feeds"]:
+                url = _required(feed, "feed_url", "RSS feed")
+                index = table.add_feed(url, feed.get("feed_title") or feed.get("feed_name"))
+                for article in feed.get("articles") or []:
+                    where = f"article of feed {url!r}"
+                    table.append(
+                        index,
+                        _required(article, "title", where),
+                        _required(article, "link", where),
+                        str(article.get("published") or ""),
+                        str(article.get("content") or article.get("summary") or ""),
+                    )
+        elif isinstance(data.get("articles"), list):
+            sources: dict[str, int] = {}
+            for article in data["articles"]:
+                source = str(article.get("source_feed") or article.get("feed_url") or "")
+                if source not in sources:
+                    sources[source] = table.add_feed(source)
+                table.append(
+                    sources[source],
+                    _required(article, "title", "article"),
+                    str(article.get("link") or ""),
+                    str(article.get("published") or ""),
+                    str(article.get("content") or article.get("summary") or ""),
+                )
+        else:
+            raise ValueError("RSS payload has none of 'feeds', 'rss_feeds' or 'articles'")
+        return table
+
+    @classmethod
+    def from_columns(cls, data: Mapping[str, Any]) -> ArticleTable:
+        """Read a table saved by :meth:`save`."""
+        if data.get("format") != FORMAT:
+            raise ValueError(f"not an {FORMAT} file: format={data.get('format')!r}")
+        table = cls()
+        table.meta = dict(data.get("meta") or {})
+        for url, name in zip(data["feed_urls"], data["feed_names"], strict=True):
+            table.add_feed(url, name)
+        table.feed = array("I", data["feed"])
+        for column in _COLUMNS:
+            values = data[column]
+            if len(values) != len(table.feed):
+                raise ValueError(f"column {column!r} has {len(values)} rows, expected {len(table.feed)}")
+            setattr(table, column, values)
+        table.published = [sys.intern(p) for p in table.published]
+        table.source = [sys.intern(s) for s in table.source]
+        return table
+
+    @classmethod
+    def load(cls, path: str | Path) -> ArticleTable:
+        """Read a columnar file, or any JSON shape accepted by :meth:`from_payload`."""
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        if isinstance(data, Mapping) and "format" in data:
+            return cls.from_columns(data)
+        return cls.from_payload(data)
+
+    # -- writing ----------------------------------------------------------------------
+
+    def save(self, path: str | Path) -> Path:
+        """Write the table in its columnar form, atomically."""
+        target = Path(path)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        payload = {
+            "format": FORMAT,
+            "meta": self.meta,
+            "feed_urls": self.feed_urls,
+            "feed_names": self.feed_names,
+            "feed": self.feed.tolist(),
+            **{column: getattr(self, column) for column in _COLUMNS},
+        }
+        tmp = target.with_name(f".{target.name}.{uuid.uuid4().hex[:8]}.tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(payload, f, ensure_ascii=False, separators=(",", ":"), default=str)
+        os.replace(tmp, target)
+        return target
+
+    def fill_from(self, fetched: ArticleTable) -> None:
+        """Take the links, dates and feeds the translator dropped from the fetched rows.
+
+        Only when both tables hold the same number of articles, so that rows match by
+        position; a translated field that is present is never overwritten.
+        """
+        if len(self) != len(fetched) or not len(self):
+            return
+        feeds: dict[int, int] = {}
+        feed = array("I")
+        for i, row in enumerate(fetched.rows()):
+            if not self.link[i]:
+                self.link[i] = row.link
+            if not self.published[i]:
+                self.published[i] = row.published
+            if not self.feed_urls[self.feed[i]]:
+                if row.feed not in feeds:
+                    feeds[row.feed] = self.add_feed(fetched.feed_urls[row.feed], fetched.feed_names[row.feed])
+                self.source[i] = row.source
+                feed.append(feeds[row.feed])
+            else:
+                feed.append(self.feed[i])
+        self.feed = feed
+
+    # -- report -----------------------------------------------------------------------
+
+    def to_report(
+        self,
+        title: str = "Veille Technologique Hebdomadaire",
+        summary: str | None = "Un résumé hebdomadaire des dernières nouvelles et articles de vos flux RSS.",
+    ) -> RssWeeklyReport:
+        """Build the report model; the title and summary saved with the table win."""
+        articles: list[list[ArticleSummary]] = [[] for _ in self.feed_urls]
+        for row in self.rows():
+            articles[row.feed].append(
+                ArticleSummary(
+                    title=row.title,
+                    link=row.link,
+                    published=row.published,
+                    summary=row.summary,
+                    source_feed=row.source,
+                )
+            )
+        feeds = [
+            FeedDigest(
+                feed_url=url, feed_name=name, articles=feed_articles, total_articles=len(feed_articles)
+            )
+            for url, name, feed_articles in zip(self.feed_urls, self.feed_names, articles, strict=True)
+            if url or feed_articles
+        ]
+        fields: dict[str, Any] = {"title": title, "summary": summary, **self.meta}
+        return RssWeeklyReport(feeds=feeds, **fields)
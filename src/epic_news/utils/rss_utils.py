@@ -1,6 +1,7 @@
 import asyncio
+from pathlib import Path
 
-from crewai_custom_tools import UnifiedRssTool
+from epic_news.utils.cassette import get_cassette
 
 
 async def fetch_articles_from_opml(
@@ -12,6 +13,9 @@ async def fetch_articles_from_opml(
     Uses UnifiedRssTool to parse an OPML file, fetch recent articles,
     and save them to a JSON file.
 
+    Under a cassette the fetch is recorded or replayed together with the file it
+    writes, so a replayed RSS flow reads the recorded articles without fetching a feed.
+
     Args:
         opml_file_path: The path to the OPML file.
         output_file_path: The path to save the output JSON file.
@@ -19,17 +23,27 @@ async def fetch_articles_from_opml(
     """
     print(f"🚀 Starting article fetching from {opml_file_path} using UnifiedRssTool...")
 
-    rss_tool = UnifiedRssTool()
-
-    # The UnifiedRssTool._run method is synchronous, so we run it in a separate thread
-    # to avoid blocking the asyncio event loop.
-    loop = asyncio.get_running_loop()
-    result = await loop.run_in_executor(
-        None,  # Use the default thread pool executor
-        rss_tool._run,
-        opml_file_path,
-        days,
-        output_file_path,
-    )
+    def fetch() -> str:
+        # Imported here: the custom tool package is heavy and only the RSS crew needs it.
+        from crewai_custom_tools import UnifiedRssTool
+
+        return str(UnifiedRssTool()._run(opml_file_path, days, output_file_path))
+
+    def fetch_with_articles() -> dict[str, str]:
+        return {"result": fetch(), "articles": Path(output_file_path).read_text(encoding="utf-8")}
+
+    cassette = get_cassette()
+    if cassette is None:
+        # The UnifiedRssTool._run method is synchronous, so we run it in a separate thread
+        # to avoid blocking the asyncio event loop.
+        loop = asyncio.get_running_loop()
+        result = await loop.run_in_executor(None, fetch)  # Use the default thread pool executor
+    else:
+        request = {"opml": opml_file_path, "days": days}
+        fetched = await cassette.aplay(
+            "tool", "opml_fetch", request, lambda: asyncio.to_thread(fetch_with_articles)
+        )
+        Path(output_file_path).write_text(fetched["articles"], encoding="utf-8")
+        result = fetched["result"]
 
     print(f"✅ UnifiedRssTool execution finished. Result: {result}")
@@ -0,0 +1,493 @@
+"""Semantic cache of web search results, shared across runs.
+
+The information collectors of the deep-research, company-news and OSINT crews ask
+near-duplicate questions from one run to the next ("Temenos Group revenue 2026", then
+"Temenos revenue 2026"), and every one of them is a billed search call. Tools passed
+through :func:`cache_tool` look each query up by meaning first: the query is embedded,
+compared by cosine similarity with the queries already answered by the same tool, and
+the stored result is served when the best match is
+
+- at least ``EPIC_SEARCH_CACHE_THRESHOLD`` similar (default: the embedder's own),
+- younger than ``EPIC_SEARCH_CACHE_MAX_AGE_HOURS`` (default 24),
+- asking about the same numbers: "revenue 2025" never answers "revenue 2026",
+- naming the same entities, i.e. the capitalized words other than generic fillers
+  ("Latest", "Group", "AG", ...), compared without case, accents or plural:
+  "Finastra annual revenue" never answers "Temenos annual revenue",
+- made with the same non-query arguments (result count, subreddit, ...).
+
+Similarity alone cannot tell these apart: swapping the one word that names the
+company leaves a long query over 0.85 similar to the original. A query written
+without capitals gives no way to tell names from other words, so all of its words
+but stopwords and fillers count as entities. Everything else is the threshold's
+call: "Temenos annual revenue 2026" and "Temenos 2026 revenue figures" are answered
+by "Temenos Group revenue 2026"; "Temenos profit 2026" is not. A long query that
+changes one common word ("growth" for "decline") can stay above the threshold;
+such searches mostly return the same articles.
+
+``EPIC_SEARCH_CACHE_EMBEDDER`` picks the embedding: ``hashing`` (default) is a
+dependency-free hashing vectorizer over words and character trigrams, which catches
+reworded, reordered and qualified queries but not synonyms ("sales" for "revenue");
+``minilm`` is the small ONNX all-MiniLM-L6-v2 model that ships with chromadb, which
+also catches synonyms but downloads about 80 MB on first use (the hashing vectorizer
+is used when it cannot be loaded).
+
+The index is exact: one matrix of normalized vectors per tool, searched with a single
+matrix-vector product, which at the few thousand entries a cache holds takes well
+under a millisecond. Entries, their vectors included, are JSON lines appended to
+``<EPIC_SEARCH_CACHE_DIR>/<embedder>/entries.jsonl`` (default ``output/.cache/search``)
+by the background writer; loading drops expired entries and keeps the newest
+``EPIC_SEARCH_CACHE_MAX_ENTRIES`` (default 5000), rewriting the file when that removed
+more than it kept.
+
+Hits, misses and the estimated result tokens not paid for again are counted in the
+metrics store (``search_cache_hits_total``, ``search_cache_misses_total`` and
+``search_cache_tokens_avoided_total``, per tool).
+
+Disable with ``EPIC_SEARCH_CACHE=false`` or the ``--no-search-cache`` flag of
+``kickoff`` and ``kickoff-batch``.
+"""
+
+from __future__ import annotations
+
+import base64
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Protocol
+
+import numpy as np
+from loguru import logger
+from unidecode import unidecode
+
+from epic_news.utils.context_packer import estimate_tokens
+from epic_news.utils.metrics_store import get_metrics_store
+from epic_news.utils.spans import get_background_writer
+
+DEFAULT_CACHE_DIR = "output/.cache/search"
+CACHE_FILE = "entries.jsonl"
+_FALSY = {"0", "false", "no", "off"}
+
+# Argument names holding the query text, in the order they are looked for.
+QUERY_ARGS = ("query", "search_query", "q", "question", "keywords", "topic")
+
+_WORD_RE = re.compile(r"\w+")
+_CAPITALIZED_RE = re.compile(r"[A-Z]")
+_NUMBER_RE = re.compile(r"\d+(?:[.,]\d+)*")
+_STOPWORDS = frozenset(
+    {"a", "an", "and", "are", "about", "for", "in", "is", "of", "on", "or", "the", "to", "what", "with"}
+    | {"au", "aux", "de", "des", "du", "en", "et", "la", "le", "les", "sur", "un", "une"}
+)
+# Words that do not change what a query asks: corporate suffixes and search fillers.
+_GENERIC = frozenset(
+    {"ag", "co", "company", "corp", "corporation", "gmbh", "group", "holding", "inc", "llc", "ltd"}
+    | {"nv", "plc", "sa", "sas", "se", "current", "find", "info", "information", "latest"}
+    | {"news", "overview", "recent", "search", "today", "actualite", "derniere"}
+)
+_ERROR_PREFIXES = ("error", "erreur", "❌", "failed", "no results")
+
+_disabled = False
+
+
+def disable_search_cache(disabled: bool = True) -> None:
+    """Bypass the cache for this process (the ``--no-search-cache`` flag)."""
+    global _disabled
+    _disabled = disabled
+
+
+def search_cache_enabled() -> bool:
+    return not _disabled and os.getenv("EPIC_SEARCH_CACHE", "true").strip().lower() not in _FALSY
+
+
+# -- embedders -----------------------------------------------------------------------
+
+
+class Embedder(Protocol):
+    name: str
+    threshold: float
+
+    def __call__(self, texts: Sequence[str]) -> np.ndarray: ...
+
+
+def _normalize(text: str) -> str:
+    return unidecode(text).lower()
+
+
+def _words(text: str) -> list[str]:
+    return [w for w in _WORD_RE.findall(_normalize(text)) if w not in _STOPWORDS]
+
+
+def _numbers(text: str) -> str:
+    """The numbers a query asks about, order-free: part of what must match exactly."""
+    return " ".join(sorted(set(_NUMBER_RE.findall(text))))
+
+
+def _stem(word: str) -> str:
+    return word[:-1] if len(word) > 3 and word.endswith("s") and not word.endswith("ss") else word
+
+
+def _content_words(text: str) -> list[str]:
+    """The words that say what a query asks, without stopwords and generic fillers."""
+    return [w for w in _words(text) if w not in _GENERIC and _stem(w) not in _GENERIC]
+
+
+def _entities(text: str) -> str:
+    """The names a query asks about, order-free: part of what must match exactly.
+
+    Capitalized words name things (a capitalized first word too: a miss is cheaper than
+    another company's results). Without any capital, every content word does.
+    """
+    words = [w for w in _WORD_RE.findall(unidecode(text)) if _CAPITALIZED_RE.search(w)]
+    if not words:
+        return " ".join(sorted({_stem(w) for w in _content_words(text)}))
+    names = {_stem(w) for w in map(str.lower, words) if w not in _STOPWORDS and w not in _GENERIC}
+    return " ".join(sorted(n for n in names if n not in _GENERIC))
+
+
+def _unit(matrix: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    return np.divide(matrix, norms, out=np.zeros_like(matrix), where=norms > 0)
+
+
+class HashingEmbedder:
+    """Signed feature hashing of words and their character trigrams.
+
+    Words carry the meaning, generic fillers are left out; trigrams make plurals,
+    accents and small spelling differences land close to each other.
+    """
+
+    threshold = 0.8
+
+    def __init__(self, dim: int = 512):
+        self.dim = dim
+        self.name = f"hashing-v2-{dim}"
+
+    def _vector(self, text: str) -> np.ndarray:
+        vector = np.zeros(self.dim, dtype=np.float32)
+        for word in map(_stem, _content_words(text)):
+            padded = f" {word} "
+            grams = [padded[i : i + 3] for i in range(len(padded) - 2)]
+            weight = 0.7 / len(grams) ** 0.5
+            for feature, value in ((word, 1.0), *((f"#{g}", weight) for g in grams)):
+                h = int.from_bytes(hashlib.blake2b(feature.encode("utf-8"), digest_size=8).digest(), "little")
+                vector[h % self.dim] += value if h >> 63 else -value
+        return vector
+
+    def __call__(self, texts: Sequence[str]) -> np.ndarray:
+        return _unit(np.stack([self._vector(text) for text in texts]))
+
+
+class MiniLMEmbedder:
+    """all-MiniLM-L6-v2 through chromadb's bundled ONNX runtime (downloaded on first use)."""
+
+    name = "minilm"
+    threshold = 0.9
+
+    def __init__(self) -> None:
+        from chromadb.utils.embedding_functions import DefaultEmbeddingFunction
+
+        self._embed = DefaultEmbeddingFunction()
+        self._embed(["warm-up"])  # fail here, at selection time, if the model cannot load
+
+    def __call__(self, texts: Sequence[str]) -> np.ndarray:
+        return _unit(np.asarray(self._embed(list(texts)), dtype=np.float32))
+
+
+def get_embedder(name: str | None = None) -> Embedder:
+    """The embedder named by ``EPIC_SEARCH_CACHE_EMBEDDER``, falling back to hashing."""
+    name = (name or os.getenv("EPIC_SEARCH_CACHE_EMBEDDER", "hashing")).strip().lower()
+    if name == "minilm":
+        try:
+            return MiniLMEmbedder()
+        except Exception as e:
+            logger.warning("⚠️ Search cache cannot load the MiniLM model, using hashing: {}", e)
+    elif name != "hashing":
+        logger.warning("⚠️ Unknown EPIC_SEARCH_CACHE_EMBEDDER {!r}, using hashing", name)
+    return HashingEmbedder()
+
+
+# -- cache ---------------------------------------------------------------------------
+
+
+@dataclass(frozen=True)
+class SearchHit:
+    """A stored result served for a new query."""
+
+    query: str
+    result: Any
+    similarity: float
+    age_seconds: float
+
+
+class _Group:
+    """The entries one tool answered with the same arguments, numbers and entities."""
+
+    __slots__ = ("_rows", "entries")
+
+    def __init__(self, vectors: np.ndarray, entries: list[dict[str, Any]]):
+        self._rows = vectors  # capacity may exceed len(entries): grown by doubling
+        self.entries = entries
+
+    @property
+    def vectors(self) -> np.ndarray:
+        return self._rows[: len(self.entries)]
+
+    def add(self, vector: np.ndarray, entry: dict[str, Any]) -> None:
+        if len(self.entries) == len(self._rows):
+            grown = np.empty((2 * len(self._rows), self._rows.shape[1]), dtype=np.float32)
+            grown[: len(self._rows)] = self._rows
+            self._rows = grown
+        self._rows[len(self.entries)] = vector
+        self.entries.append(entry)
+
+
+def _group_key(tool: str, scope: str, query: str) -> str:
+    return "\x1f".join((tool, scope, _numbers(query), _entities(query)))
+
+
+def _encode_vector(vector: np.ndarray) -> str:
+    return base64.b64encode(vector.astype(np.float16).tobytes()).decode("ascii")
+
+
+def _decode_vector(text: str) -> np.ndarray:
+    return np.frombuffer(base64.b64decode(text), dtype=np.float16).astype(np.float32)
+
+
+class SearchCache:
+    """Search results on disk, looked up by the meaning of the query."""
+
+    def __init__(
+        self,
+        root: str | os.PathLike[str] | None = None,
+        embedder: Embedder | None = None,
+        threshold: float | None = None,
+        max_age_hours: float | None = None,
+        max_entries: int | None = None,
+    ):
+        self.embedder = embedder or get_embedder()
+        root = Path(root or os.getenv("EPIC_SEARCH_CACHE_DIR", DEFAULT_CACHE_DIR))
+        self.path = root / self.embedder.name / CACHE_FILE
+        if threshold is None:
+            threshold = float(os.getenv("EPIC_SEARCH_CACHE_THRESHOLD") or self.embedder.threshold)
+        if max_age_hours is None:
+            max_age_hours = float(os.getenv("EPIC_SEARCH_CACHE_MAX_AGE_HOURS", "24"))
+        if max_entries is None:
+            max_entries = int(os.getenv("EPIC_SEARCH_CACHE_MAX_ENTRIES", "5000"))
+        self.threshold = threshold
+        self.max_age = max_age_hours * 3600
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.tokens_avoided = 0
+        self._lock = threading.Lock()
+        self._groups: dict[str, _Group] = {}
+        self._load()
+
+    def __len__(self) -> int:
+        return sum(len(group.entries) for group in self._groups.values())
+
+    def _add(self, vector: np.ndarray, entry: dict[str, Any]) -> None:
+        key = _group_key(entry["tool"], entry["scope"], entry["query"])
+        if (group := self._groups.get(key)) is None:
+            self._groups[key] = _Group(vector[None, :], [entry])
+        else:
+            group.add(vector, entry)
+
+    def _load(self) -> None:
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                lines = f.readlines()
+        except FileNotFoundError:
+            return
+        except OSError as e:
+            logger.warning("⚠️ Could not read the search cache {}: {}", self.path, e)
+            return
+        cutoff = time.time() - self.max_age
+        live: list[tuple[np.ndarray, dict[str, Any]]] = []
+        for line in lines:
+            try:
+                entry = json.loads(line)
+                vector = _decode_vector(entry.pop("vector"))
+            except (ValueError, KeyError, TypeError):
+                continue  # a line cut short by a crash
+            if entry.get("created", 0) >= cutoff and (not live or vector.shape == live[0][0].shape):
+                live.append((vector, entry))
+        live = live[len(live) - self.max_entries :] if len(live) > self.max_entries else live
+        grouped: dict[str, tuple[list[np.ndarray], list[dict[str, Any]]]] = {}
+        for vector, entry in live:
+            vectors, entries = grouped.setdefault(
+                _group_key(entry["tool"], entry["scope"], entry["query"]), ([], [])
+            )
+            vectors.append(vector)
+            entries.append(entry)
+        self._groups = {
+            key: _Group(np.stack(vectors), entries) for key, (vectors, entries) in grouped.items()
+        }
+        if len(lines) - len(live) > len(live):
+            self._rewrite()
+
+    def _rewrite(self) -> None:
+        lines = []
+        for group in self._groups.values():
+            for vector, entry in zip(group.vectors, group.entries, strict=True):
+                lines.append((entry["created"], json.dumps({**entry, "vector": _encode_vector(vector)})))
+        lines.sort()
+        get_background_writer().replace(self.path, "".join(f"{line}\n" for _, line in lines))
+
+    def lookup(self, tool: str, query: str, scope: str = "") -> SearchHit | None:
+        """The freshest close-enough answer ``tool`` gave to a query like ``query``."""
+        vector = self.embedder([query])[0]
+        now = time.time()
+        hit = None
+        with self._lock:
+            group = self._groups.get(_group_key(tool, scope, query))
+            if group is not None:
+                similarities = group.vectors @ vector
+                for i in np.argsort(-similarities):
+                    if similarities[i] < self.threshold:
+                        break
+                    entry = group.entries[i]
+                    age = now - entry["created"]
+                    if age <= self.max_age:
+                        hit = SearchHit(entry["query"], entry["result"], float(similarities[i]), age)
+                        break
+            tokens = estimate_tokens(_as_text(hit.result)) if hit is not None else 0
+            if hit is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self.tokens_avoided += tokens
+        store = get_metrics_store()
+        if store is not None:
+            if hit is None:
+                store.inc("search_cache_misses_total", tool=tool)
+            else:
+                store.inc("search_cache_hits_total", tool=tool)
+                store.inc("search_cache_tokens_avoided_total", tokens, tool=tool)
+        if hit is None:
+            return None
+        logger.info(
+            "♻️ {} answered {!r} from the search cache ({!r}, similarity {:.2f}, {:.0f} min old)",
+            tool,
+            query,
+            hit.query,
+            hit.similarity,
+            hit.age_seconds / 60,
+        )
+        return hit
+
+    def store(self, tool: str, query: str, result: Any, scope: str = "") -> None:
+        vector = self.embedder([query])[0]
+        entry = {"tool": tool, "scope": scope, "query": query, "result": result, "created": time.time()}
+        try:
+            line = {**entry, "vector": _encode_vector(vector)}
+            json.dumps(line)
+        except (TypeError, ValueError):
+            return  # not JSON: served live every time
+        with self._lock:
+            self._add(vector, entry)
+        get_background_writer().append_json(self.path, line)
+
+    def flush(self, timeout: float | None = 5.0) -> bool:
+        return get_background_writer().flush(timeout)
+
+
+def _as_text(result: Any) -> str:
+    return result if isinstance(result, str) else json.dumps(result, ensure_ascii=False, default=str)
+
+
+_cache: SearchCache | None = None
+_configured: tuple[str, ...] | None = None
+_cache_lock = threading.Lock()
+
+
+def get_search_cache() -> SearchCache | None:
+    """The cache selected by ``EPIC_SEARCH_CACHE_*``, or None when it is disabled."""
+    global _cache, _configured
+    if not search_cache_enabled():
+        return None
+    settings = tuple(
+        os.getenv(name, "")
+        for name in (
+            "EPIC_SEARCH_CACHE_DIR",
+            "EPIC_SEARCH_CACHE_EMBEDDER",
+            "EPIC_SEARCH_CACHE_THRESHOLD",
+            "EPIC_SEARCH_CACHE_MAX_AGE_HOURS",
+            "EPIC_SEARCH_CACHE_MAX_ENTRIES",
+        )
+    )
+    if _configured != settings:
+        with _cache_lock:
+            if _configured != settings:
+                _cache = SearchCache()
+                _configured = settings
+    return _cache
+
+
+def reset_search_cache() -> None:
+    """Drop the current cache, so the next call reloads it from disk (tests)."""
+    global _cache, _configured
+    with _cache_lock:
+        _cache = None
+        _configured = None
+
+
+# -- tools ---------------------------------------------------------------------------
+
+
+def split_request(args: tuple[Any, ...], kwargs: dict[str, Any]) -> tuple[str | None, str]:
+    """The query text of a tool call and the rest of its arguments, canonically encoded."""
+    rest = dict(kwargs)
+    query = next((rest.pop(name) for name in QUERY_ARGS if isinstance(rest.get(name), str)), None)
+    positional = list(args)
+    if query is None and positional and isinstance(positional[0], str):
+        query = positional.pop(0)
+    scope = json.dumps([positional, rest], sort_keys=True, ensure_ascii=False, default=str)
+    return (query.strip() or None) if query else None, scope
+
+
+def cacheable(result: Any) -> bool:
+    """Whether a tool result is worth serving again: not empty, not an error report."""
+    if isinstance(result, str):
+        return bool(result.strip()) and not result.lstrip().lower().startswith(_ERROR_PREFIXES)
+    if isinstance(result, dict):
+        return bool(result) and result.get("successful", True) is not False and not result.get("error")
+    return isinstance(result, list) and bool(result)
+
+
+def cache_tool[T](tool: T) -> T:
+    """Route a search tool's ``_run`` through the cache; returns the tool unchanged when off.
+
+    Apply it before :func:`epic_news.utils.cassette.wrap_tool`, so that a replayed
+    cassette still answers every call.
+    """
+    cache = get_search_cache()
+    if cache is None or getattr(tool, "_epic_news_search_cache", False):
+        return tool
+    original_run: Callable[..., Any] = tool._run  # type: ignore[attr-defined]
+    name = getattr(tool, "name", type(tool).__name__)
+
+    def _run(*args: Any, **kwargs: Any) -> Any:
+        query, scope = split_request(args, kwargs)
+        if query is None:
+            return original_run(*args, **kwargs)
+        hit = cache.lookup(name, query, scope)
+        if hit is not None:
+            return hit.result
+        result = original_run(*args, **kwargs)
+        if cacheable(result):
+            cache.store(name, query, result, scope)
+        return result
+
+    object.__setattr__(tool, "_run", _run)
+    object.__setattr__(tool, "_epic_news_search_cache", True)
+    return tool
+
+
+def cache_tools[T](tools: list[T]) -> list[T]:
+    return [cache_tool(tool) for tool in tools]
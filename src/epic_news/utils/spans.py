@@ -0,0 +1,450 @@
+"""Span tracer: nested timing from flow step down to each LLM and tool call.
+
+A span is one timed unit of work with a parent: the flow run contains its steps, a step
+contains the crews it kicks off, a crew its tasks, a task its LLM and tool calls. The
+current span lives in a context variable, so nesting follows the code through
+``asyncio`` tasks and ``asyncio.to_thread`` (how CrewAI runs flow steps) without any
+plumbing; :func:`span` works the same in sync and async code.
+
+Tasks, LLM calls and tool calls happen inside CrewAI, so they are recorded from its
+event bus (:func:`install_crewai_listener`) and attached to the task or crew span that
+is open when the event fires.
+
+Recording is cheap: a span stores only scalar attributes (long strings truncated,
+objects reduced to their type name) and finished spans are handed to a background
+writer thread, which serializes them and appends them to ``traces/spans.jsonl``
+(``EPIC_SPAN_FILE``; empty disables it) and to Langfuse when it is configured (see
+``epic_news.utils.tracing``). Nothing on the traced path opens a file or stringifies
+flow state.
+"""
+
+from __future__ import annotations
+
+import atexit
+import json
+import os
+import queue
+import secrets
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Protocol
+
+from loguru import logger
+
+DEFAULT_SPAN_FILE = os.path.join("traces", "spans.jsonl")
+MAX_ATTRIBUTE_CHARS = 300
+MAX_OPEN_FILES = 16
+
+
+def _cheap(value: Any) -> Any:
+    """Reduce an attribute to something small and JSON-safe without walking it."""
+    if value is None or isinstance(value, bool | int | float):
+        return value
+    if isinstance(value, str):
+        return value if len(value) <= MAX_ATTRIBUTE_CHARS else value[:MAX_ATTRIBUTE_CHARS] + "…"
+    if isinstance(value, list | tuple) and len(value) <= 50 and all(isinstance(v, str) for v in value):
+        return [_cheap(v) for v in value]
+    return f"<{type(value).__name__}>"
+
+
+@dataclass(slots=True)
+class Span:
+    """One timed unit of work. Times are epoch seconds; ``duration`` is monotonic."""
+
+    name: str
+    kind: str
+    trace_id: str
+    span_id: str
+    parent_id: str | None
+    start_time: float
+    attributes: dict[str, Any] = field(default_factory=dict)
+    end_time: float | None = None
+    duration: float | None = None
+    status: str = "ok"
+    error: str | None = None
+    _t0: float = field(default_factory=time.perf_counter, repr=False)
+
+    def set(self, **attributes: Any) -> None:
+        for key, value in attributes.items():
+            self.attributes[key] = _cheap(value)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "name": self.name,
+            "kind": self.kind,
+            "start_time": self.start_time,
+            "end_time": self.end_time,
+            "duration": self.duration,
+            "status": self.status,
+            "error": self.error,
+            "attributes": self.attributes,
+        }
+
+
+class SpanExporter(Protocol):
+    """Receives spans on the background writer thread."""
+
+    def on_start(self, span: Span) -> None: ...
+
+    def on_end(self, span: Span) -> None: ...
+
+
+class BackgroundWriter:
+    """Single daemon thread that runs export work in submission order.
+
+    Callers only enqueue; the thread does the JSON encoding and file I/O, keeping the
+    files it appends to open between batches. Work submitted after a ``fork`` starts a
+    fresh thread in the child.
+    """
+
+    def __init__(self) -> None:
+        self._queue: queue.SimpleQueue[Callable[[], None] | threading.Event] = queue.SimpleQueue()
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+        self._files: dict[str, Any] = {}
+
+    def submit(self, work: Callable[[], None]) -> None:
+        self._ensure_thread()
+        self._queue.put(work)
+
+    def append_json(self, path: str | os.PathLike[str], payload: dict[str, Any]) -> None:
+        """Append ``payload`` as one JSON line to ``path`` (encoded on the writer thread)."""
+        self.submit(lambda: self._append(os.fspath(path), payload))
+
+    def replace(self, path: str | os.PathLike[str], text: str) -> None:
+        """Atomically replace ``path`` with ``text``, after everything submitted before it."""
+        self.submit(lambda: self._replace(os.fspath(path), text))
+
+    def flush(self, timeout: float | None = 5.0) -> bool:
+        """Wait until everything submitted so far is written. False on timeout."""
+        if self._thread is None or not self._thread.is_alive():
+            return True
+        done = threading.Event()
+        self._queue.put(done)
+        return done.wait(timeout)
+
+    def _ensure_thread(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="epic-span-writer", daemon=True)
+                self._thread.start()
+
+    def _append(self, path: str, payload: dict[str, Any]) -> None:
+        handle = self._files.get(path)
+        if handle is None:
+            if len(self._files) >= MAX_OPEN_FILES:
+                self._close_files()
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+            handle = self._files[path] = open(path, "a", encoding="utf-8")  # noqa: SIM115 - kept open across batches
+        handle.write(json.dumps(payload, default=str) + "\n")
+
+    def _replace(self, path: str, text: str) -> None:
+        handle = self._files.pop(path, None)
+        if handle is not None:
+            handle.close()
+        target = Path(path)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        tmp = target.with_name(f".{target.name}.tmp")
+        tmp.write_text(text, encoding="utf-8")
+        os.replace(tmp, target)
+
+    def _close_files(self) -> None:
+        for handle in self._files.values():
+            handle.close()
+        self._files.clear()
+
+    def _run(self) -> None:
+        while True:
+            item = self._queue.get()
+            batch = [item]
+            # Drain what is already queued so the files are flushed once per batch.
+            while True:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            waiters = []
+            for work in batch:
+                if isinstance(work, threading.Event):
+                    waiters.append(work)
+                    continue
+                try:
+                    work()
+                except Exception as exc:  # exporting must never take the writer down
+                    logger.debug("Span export failed: {}", exc)
+            for handle in self._files.values():
+                handle.flush()
+            for waiter in waiters:
+                waiter.set()
+
+    def _after_fork(self) -> None:
+        self._queue = queue.SimpleQueue()
+        self._thread = None
+        self._lock = threading.Lock()
+        self._files = {}
+
+
+_writer = BackgroundWriter()
+os.register_at_fork(after_in_child=_writer._after_fork)
+atexit.register(_writer.flush, 2.0)
+
+
+def get_background_writer() -> BackgroundWriter:
+    return _writer
+
+
+class JsonlSpanExporter:
+    """Appends every finished span as one JSON line (runs on the writer thread)."""
+
+    def __init__(self, path: str | os.PathLike[str], writer: BackgroundWriter | None = None) -> None:
+        self.path = os.fspath(path)
+        self.writer = writer or _writer
+
+    def on_start(self, span: Span) -> None:
+        pass
+
+    def on_end(self, span: Span) -> None:
+        self.writer._append(self.path, span.to_dict())
+
+
+_current_span: ContextVar[Span | None] = ContextVar("epic_news_current_span", default=None)
+
+
+def current_span() -> Span | None:
+    return _current_span.get()
+
+
+class SpanTracer:
+    """Creates spans and hands started/finished spans to the exporters."""
+
+    def __init__(self, exporters: list[SpanExporter] | None = None, writer: BackgroundWriter | None = None):
+        self.exporters: list[SpanExporter] = list(exporters or [])
+        self.writer = writer or _writer
+
+    def start_span(
+        self, name: str, kind: str = "internal", parent: Span | None = None, **attributes: Any
+    ) -> Span:
+        """Open a span without making it current (for callback-driven spans)."""
+        parent = parent if parent is not None else _current_span.get()
+        span = Span(
+            name=name,
+            kind=kind,
+            trace_id=parent.trace_id if parent else secrets.token_hex(16),
+            span_id=secrets.token_hex(8),
+            parent_id=parent.span_id if parent else None,
+            start_time=time.time(),
+        )
+        span.set(**attributes)
+        for exporter in self.exporters:
+            self.writer.submit(lambda e=exporter: e.on_start(span))
+        return span
+
+    def end_span(self, span: Span, error: BaseException | str | None = None) -> None:
+        if span.end_time is not None:
+            return
+        span.duration = time.perf_counter() - span._t0
+        span.end_time = span.start_time + span.duration
+        if error is not None:
+            span.status = "error"
+            span.error = _cheap(str(error))
+        for exporter in self.exporters:
+            self.writer.submit(lambda e=exporter: e.on_end(span))
+
+    def activate(self, span: Span) -> Token[Span | None]:
+        """Make ``span`` the current span; pass the token to :meth:`deactivate`."""
+        return _current_span.set(span)
+
+    def deactivate(self, token: Token[Span | None]) -> None:
+        _current_span.reset(token)
+
+    @contextmanager
+    def span(self, name: str, kind: str = "internal", **attributes: Any) -> Iterator[Span]:
+        """Open a span, make it current for the block, close it on exit."""
+        span = self.start_span(name, kind, **attributes)
+        token = self.activate(span)
+        try:
+            yield span
+        except BaseException as exc:
+            self.end_span(span, error=exc)
+            raise
+        finally:
+            self.deactivate(token)
+            self.end_span(span)
+
+    def flush(self, timeout: float | None = 5.0) -> bool:
+        return self.writer.flush(timeout)
+
+
+def _default_exporters() -> list[SpanExporter]:
+    exporters: list[SpanExporter] = []
+    span_file = os.getenv("EPIC_SPAN_FILE", DEFAULT_SPAN_FILE)
+    if span_file:
+        exporters.append(JsonlSpanExporter(span_file))
+    try:
+        from epic_news.utils.tracing import get_langfuse_exporter
+
+        langfuse = get_langfuse_exporter()
+    except Exception:  # pragma: no cover - tracing is optional
+        langfuse = None
+    if langfuse is not None:
+        exporters.append(langfuse)
+    from epic_news.utils.metrics_store import MetricsSpanExporter, get_metrics_store
+
+    store = get_metrics_store()
+    if store is not None:
+        exporters.append(MetricsSpanExporter(store))
+    return exporters
+
+
+_tracer: SpanTracer | None = None
+_tracer_lock = threading.Lock()
+
+
+def get_span_tracer() -> SpanTracer:
+    """Process-wide tracer with the default exporters."""
+    global _tracer
+    if _tracer is None:
+        with _tracer_lock:
+            if _tracer is None:
+                _tracer = SpanTracer(_default_exporters())
+    return _tracer
+
+
+def set_span_tracer(tracer: SpanTracer | None) -> None:
+    """Replace the process-wide tracer (tests, embedders); None restores the default."""
+    global _tracer
+    _tracer = tracer
+
+
+def span(name: str, kind: str = "internal", **attributes: Any):
+    """``with span("crew:PoemCrew", kind="crew"):`` on the process-wide tracer."""
+    return get_span_tracer().span(name, kind, **attributes)
+
+
+# --- CrewAI task / LLM / tool spans ------------------------------------------------
+
+
+class _CrewAISpans:
+    """Turns CrewAI start/finish event pairs into task, LLM and tool spans."""
+
+    def __init__(self) -> None:
+        self._open: dict[str, Span] = {}
+        self._lock = threading.Lock()
+
+    def _parent(self, event: Any) -> Span | None:
+        task_id = getattr(event, "task_id", None)
+        with self._lock:
+            task_span = self._open.get(f"task:{task_id}") if task_id else None
+        return task_span or _current_span.get()
+
+    def start(self, key: str, name: str, kind: str, event: Any, **attributes: Any) -> None:
+        tracer = get_span_tracer()
+        parent = self._parent(event) if kind != "task" else _current_span.get()
+        started = tracer.start_span(name, kind, parent=parent, **attributes)
+        with self._lock:
+            self._open[key] = started
+
+    def end(self, key: str, error: Any = None, **attributes: Any) -> None:
+        with self._lock:
+            finished = self._open.pop(key, None)
+        if finished is None:
+            return
+        finished.set(**attributes)
+        get_span_tracer().end_span(finished, error=str(error) if error else None)
+
+
+_crewai_spans = _CrewAISpans()
+_listener_installed = False
+
+
+def _tool_key(event: Any) -> str:
+    return f"tool:{getattr(event, 'agent_id', None)}:{getattr(event, 'tool_name', None)}"
+
+
+def install_crewai_listener() -> bool:
+    """Record CrewAI task, LLM and tool events as spans (idempotent). False if unavailable."""
+    global _listener_installed
+    if _listener_installed:
+        return True
+    try:
+        from crewai.events import crewai_event_bus
+        from crewai.events.types.llm_events import (
+            LLMCallCompletedEvent,
+            LLMCallFailedEvent,
+            LLMCallStartedEvent,
+        )
+        from crewai.events.types.task_events import TaskCompletedEvent, TaskFailedEvent, TaskStartedEvent
+        from crewai.events.types.tool_usage_events import (
+            ToolUsageErrorEvent,
+            ToolUsageFinishedEvent,
+            ToolUsageStartedEvent,
+        )
+    except Exception as exc:  # pragma: no cover - crewai missing or incompatible
+        logger.debug("CrewAI span listener not installed: {}", exc)
+        return False
+
+    spans = _crewai_spans
+
+    @crewai_event_bus.on(TaskStartedEvent)
+    def _task_started(source: Any, event: Any) -> None:
+        spans.start(
+            f"task:{event.task_id}",
+            f"task:{getattr(getattr(event, 'task', None), 'name', None) or 'task'}",
+            "task",
+            event,
+            task=event.task_name,
+            agent=event.agent_role,
+        )
+
+    @crewai_event_bus.on(TaskCompletedEvent)
+    def _task_completed(source: Any, event: Any) -> None:
+        spans.end(f"task:{event.task_id}")
+
+    @crewai_event_bus.on(TaskFailedEvent)
+    def _task_failed(source: Any, event: Any) -> None:
+        spans.end(f"task:{event.task_id}", error=event.error)
+
+    @crewai_event_bus.on(LLMCallStartedEvent)
+    def _llm_started(source: Any, event: Any) -> None:
+        spans.start(f"llm:{event.call_id}", f"llm:{event.model}", "llm", event, model=event.model)
+
+    @crewai_event_bus.on(LLMCallCompletedEvent)
+    def _llm_completed(source: Any, event: Any) -> None:
+        usage = event.usage if isinstance(event.usage, dict) else {}
+        spans.end(
+            f"llm:{event.call_id}",
+            call_type=getattr(event.call_type, "value", event.call_type),
+            finish_reason=event.finish_reason,
+            prompt_tokens=usage.get("prompt_tokens"),
+            completion_tokens=usage.get("completion_tokens"),
+            total_tokens=usage.get("total_tokens"),
+        )
+
+    @crewai_event_bus.on(LLMCallFailedEvent)
+    def _llm_failed(source: Any, event: Any) -> None:
+        spans.end(f"llm:{event.call_id}", error=event.error)
+
+    @crewai_event_bus.on(ToolUsageStartedEvent)
+    def _tool_started(source: Any, event: Any) -> None:
+        spans.start(_tool_key(event), f"tool:{event.tool_name}", "tool", event, tool=event.tool_name)
+
+    @crewai_event_bus.on(ToolUsageFinishedEvent)
+    def _tool_finished(source: Any, event: Any) -> None:
+        spans.end(_tool_key(event), from_cache=event.from_cache)
+
+    @crewai_event_bus.on(ToolUsageErrorEvent)
+    def _tool_error(source: Any, event: Any) -> None:
+        spans.end(_tool_key(event), error=event.error)
+
+    _listener_installed = True
+    return True
@@ -3,7 +3,10 @@ Tracing utilities for Epic News flows and tools.
 
 - Initializes an optional Langfuse client from environment variables if available.
 - Provides a `trace_span` context manager and `@traced` decorator to annotate
-  kickoff calls, agent runs, and tool invocations.
+  kickoff calls, agent runs, and tool invocations. Both record spans on the
+  process-wide span tracer (`epic_news.utils.spans`), which nests them under the
+  current flow step and exports them to `traces/spans.jsonl` and, when configured,
+  to Langfuse through `LangfuseSpanExporter`.
 
 Environment variables (optional):
 - LANGFUSE_PUBLIC_KEY
@@ -13,17 +16,19 @@ Environment variables (optional):
 
 from __future__ import annotations
 
+import inspect
 import os
-import time
 from collections.abc import Callable
-from contextlib import contextmanager, suppress
+from contextlib import suppress
+from functools import wraps
 from typing import Any, TypeVar
 
+from epic_news.utils.spans import Span, span
+
 T = TypeVar("T")
 
 # Soft dependency on langfuse
 _langfuse = None
-_langfuse_span_cls = None
 
 try:  # Attempt to initialize Langfuse if configured
     from langfuse import Langfuse
@@ -37,35 +42,74 @@ try:  # Attempt to initialize Langfuse if configured
 except Exception:
     _langfuse = None  # Not available or not configured
 
+# Span kinds Langfuse has a dedicated observation type for.
+_LANGFUSE_TYPES = {"llm": "generation", "tool": "tool", "crew": "agent", "task": "chain"}
+
+
+class LangfuseSpanExporter:
+    """Mirrors spans into Langfuse observations, parented like the local spans.
+
+    Runs on the span writer thread, so Langfuse calls never sit on the traced path. An
+    observation is opened when its span starts and ended with the span's own end time.
+    """
 
-@contextmanager
-def trace_span(name: str, attrs: dict[str, Any] | None = None):
+    def __init__(self, client: Any) -> None:
+        self.client = client
+        self._observations: dict[str, Any] = {}
+
+    def on_start(self, span: Span) -> None:
+        parent = self._observations.get(span.parent_id or "")
+        kwargs = {
+            "name": span.name,
+            "as_type": _LANGFUSE_TYPES.get(span.kind, "span"),
+            "metadata": dict(span.attributes),
+        }
+        if parent is not None:
+            observation = parent.start_observation(**kwargs)
+        else:
+            observation = self.client.start_observation(trace_context={"trace_id": span.trace_id}, **kwargs)
+        self._observations[span.span_id] = observation
+
+    def on_end(self, span: Span) -> None:
+        observation = self._observations.pop(span.span_id, None)
+        if observation is None:
+            return
+        with suppress(Exception):
+            observation.update(
+                metadata=dict(span.attributes),
+                level="ERROR" if span.status == "error" else "DEFAULT",
+                status_message=span.error,
+            )
+        end_ns = int(span.end_time * 1e9) if span.end_time else None
+        observation.end(end_time=end_ns)
+
+
+def get_langfuse_exporter() -> LangfuseSpanExporter | None:
+    """Exporter for the configured Langfuse client, or None when Langfuse is off."""
+    return LangfuseSpanExporter(_langfuse) if _langfuse else None
+
+
+def trace_span(name: str, attrs: dict[str, Any] | None = None, kind: str = "internal"):
     """
-    Context manager to trace spans via Langfuse when available; otherwise no-op.
+    Context manager recording a span, nested under the current one.
     """
-    start = time.perf_counter()
-    span = None
-    try:
-        if _langfuse:
-            span = _langfuse.span(name=name, input=attrs or {})  # type: ignore[attr-defined]
-        yield
-        if span is not None:
-            span.end(output={"status": "ok"})
-    except Exception as e:  # Ensure tracing never breaks app logic
-        if span is not None:
-            with suppress(Exception):
-                span.end(output={"status": "error", "error": str(e)})
-        raise
-    finally:
-        if not _langfuse:
-            # Fallback could log timing if needed; kept minimal by design
-            _ = time.perf_counter() - start
+    return span(name, kind, **(attrs or {}))
 
 
 def traced(name: str) -> Callable[[Callable[..., T]], Callable[..., T]]:
-    """Decorator to wrap a function within a trace_span named `name`."""
+    """Decorator to wrap a function (or coroutine function) within a trace_span named `name`."""
 
     def decorator(func: Callable[..., T]) -> Callable[..., T]:
+        if inspect.iscoroutinefunction(func):
+
+            @wraps(func)
+            async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+                with trace_span(name, {"func": func.__name__}):
+                    return await func(*args, **kwargs)
+
+            return async_wrapper  # type: ignore[return-value]
+
+        @wraps(func)
         def wrapper(*args: Any, **kwargs: Any) -> T:
             with trace_span(name, {"func": func.__name__}):
                 return func(*args, **kwargs)
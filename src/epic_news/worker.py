@@ -0,0 +1,172 @@
+"""Warm worker: a pre-imported interpreter that forks one child per request.
+
+Even with lazy imports, every ``kickoff`` still pays for CrewAI itself plus the crew it
+runs and that crew's tools. The worker imports all of it once, then forks a child per
+request; the child inherits the warm interpreter, runs ``kickoff`` and exits, so runs
+stay isolated from one another.
+
+Usage::
+
+    kickoff-worker                      # serve on $EPIC_WORKER_SOCKET
+    kickoff-submit "get the daily news report"
+
+Unix only (AF_UNIX sockets and ``os.fork``). Forking a process that already started
+threads is only safe because the child does nothing but run the flow and exit.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import socket
+import sys
+import tempfile
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from loguru import logger
+
+DEFAULT_SOCKET = os.path.join(tempfile.gettempdir(), "epic_news_worker.sock")
+
+Handler = Callable[[dict[str, Any]], dict[str, Any]]
+
+
+def socket_path() -> str:
+    return os.getenv("EPIC_WORKER_SOCKET", DEFAULT_SOCKET)
+
+
+def warm_up() -> int:
+    """Import the flow and resolve every lazily imported crew, model and assembler.
+
+    Returns the number of deferred imports resolved. A crew whose dependencies are
+    missing is logged and skipped: it would fail the same way in a cold run.
+    """
+    import dataclasses
+
+    import epic_news.main as main_module
+    from epic_news.config.crew_registry import CREW_REGISTRY
+    from epic_news.utils.lazy_import import LazyObject
+
+    deferred = [value for value in vars(main_module).values() if isinstance(value, LazyObject)]
+    for spec in CREW_REGISTRY.values():
+        deferred += [
+            value
+            for value in (getattr(spec, f.name) for f in dataclasses.fields(spec))
+            if isinstance(value, LazyObject)
+        ]
+
+    loaded = 0
+    for value in deferred:
+        try:
+            value.resolve()
+            loaded += 1
+        except Exception as exc:
+            logger.warning("⚠️ Worker could not preload {!r}: {}", value, exc)
+    logger.info("🔥 Worker warmed up: {} deferred imports resolved", loaded)
+    return loaded
+
+
+def _run_request(request: dict[str, Any]) -> dict[str, Any]:
+    from epic_news.main import kickoff
+    from epic_news.utils.progress import new_run_id
+
+    run_id = request.get("run_id") or new_run_id()
+    try:
+        kickoff(user_input=request.get("user_request"), run_id=run_id)
+    except Exception as exc:
+        return {"status": "error", "run_id": run_id, "error": str(exc)}
+    return {"status": "ok", "run_id": run_id}
+
+
+def _send(conn: socket.socket, message: dict[str, Any]) -> None:
+    conn.sendall(json.dumps(message).encode("utf-8") + b"\n")
+
+
+def _receive(conn: socket.socket) -> dict[str, Any]:
+    with conn.makefile("rb") as stream:
+        line = stream.readline()
+    if not line:
+        raise ConnectionError("worker connection closed without a message")
+    return json.loads(line)
+
+
+def _reap_children() -> None:
+    while True:
+        try:
+            pid, _ = os.waitpid(-1, os.WNOHANG)
+        except ChildProcessError:
+            return
+        if pid == 0:
+            return
+
+
+def serve(
+    path: str | None = None,
+    handler: Handler | None = None,
+    warm: bool = True,
+    max_requests: int | None = None,
+) -> None:
+    """Warm up, then serve requests on a Unix socket, forking one child per request."""
+    path = path or socket_path()
+    handler = handler or _run_request
+    if warm:
+        warm_up()
+
+    Path(path).unlink(missing_ok=True)
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    server.bind(path)
+    server.listen()
+    server.settimeout(1.0)
+    logger.info("🛎️ Worker listening on {}", path)
+
+    served = 0
+    try:
+        while max_requests is None or served < max_requests:
+            _reap_children()
+            try:
+                conn, _ = server.accept()
+            except TimeoutError:
+                continue
+            served += 1
+            pid = os.fork()
+            if pid == 0:
+                # Child: owns this request only.
+                server.close()
+                code = 1
+                try:
+                    response = handler(_receive(conn))
+                    _send(conn, response)
+                    code = 0 if response.get("status") == "ok" else 1
+                except Exception as exc:  # pragma: no cover - reported to the client when possible
+                    logger.exception("❌ Worker child failed: {}", exc)
+                finally:
+                    conn.close()
+                    # os._exit skips atexit: send what the run queued, the client has its answer.
+                    from epic_news.utils.email_outbox import drain_email_outbox
+
+                    drain_email_outbox()
+                    os._exit(code)
+            conn.close()
+    finally:
+        server.close()
+        Path(path).unlink(missing_ok=True)
+        _reap_children()
+
+
+def submit_request(user_request: str, path: str | None = None, run_id: str | None = None) -> dict[str, Any]:
+    """Send one request to a running worker and wait for its result."""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as conn:
+        conn.connect(path or socket_path())
+        _send(conn, {"user_request": user_request, "run_id": run_id})
+        return _receive(conn)
+
+
+def submit() -> int:
+    """Console entry point: ``kickoff-submit "<request>"``."""
+    if len(sys.argv) < 2:
+        print('usage: kickoff-submit "<request>"', file=sys.stderr)
+        return 2
+    result = submit_request(" ".join(sys.argv[1:]))
+    print(json.dumps(result, ensure_ascii=False))
+    return 0 if result.get("status") == "ok" else 1
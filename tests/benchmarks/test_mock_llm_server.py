@@ -0,0 +1,116 @@
+"""Tests for the mock OpenAI-compatible server and the load-test client (no network)."""
+
+import asyncio
+import json
+import random
+
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+
+from benchmarks.load_test import percentile, run_load
+from benchmarks.mock_llm_server import Latency, MockSettings, create_app, detect_output_model
+from epic_news.models.crews.classification_result import ClassificationResult
+
+
+def _client(**settings):
+    canned = {"ClassificationResult": {"selected_crew": "NEWS", "confidence": "HIGH"}}
+    return TestClient(create_app(MockSettings(seed=1, canned=canned, **settings)))
+
+
+def _chat(client, **body):
+    body.setdefault("messages", [{"role": "user", "content": "hi"}])
+    return client.post("/v1/chat/completions", json={"model": "mock/m", **body})
+
+
+def test_latency_specs():
+    rng = random.Random(0)
+    assert Latency("none").sample(rng) == 0.0
+    assert Latency("fixed:0.25").sample(rng) == 0.25
+    assert all(0.1 <= Latency("uniform:0.1,0.2").sample(rng) <= 0.2 for _ in range(50))
+    assert Latency("lognormal:1,0.5").sample(rng) > 0
+    with pytest.raises(ValueError):
+        Latency("uniform:1")
+
+
+def test_react_answer_carries_the_canned_output_model():
+    client = _client()
+    prompt = 'Return JSON matching {"title": "ClassificationResult", "type": "object"}'
+    response = _chat(client, messages=[{"role": "user", "content": prompt}])
+
+    content = response.json()["choices"][0]["message"]["content"]
+    final = content.split("Final Answer:", 1)[1]
+    assert ClassificationResult.model_validate_json(final).selected_crew == "NEWS"
+    assert client.get("/stats").json()["output_models"] == {"ClassificationResult": 1}
+
+
+def test_json_schema_response_format_is_synthesized():
+    schema = {
+        "type": "object",
+        "properties": {"items": {"type": "array", "items": {"type": "integer"}, "minItems": 3}},
+        "required": ["items"],
+    }
+    response = _chat(
+        _client(), response_format={"type": "json_schema", "json_schema": {"name": "X", "schema": schema}}
+    )
+
+    assert json.loads(response.json()["choices"][0]["message"]["content"]) == {"items": [1, 1, 1]}
+
+
+def test_tools_get_a_native_tool_call_until_a_result_comes_back():
+    tools = [{"type": "function", "function": {"name": "search", "parameters": {"type": "object"}}}]
+    first = _chat(_client(), tools=tools).json()["choices"][0]
+    assert first["finish_reason"] == "tool_calls"
+    assert first["message"]["tool_calls"][0]["function"]["name"] == "search"
+
+    messages = [
+        {"role": "user", "content": "hi"},
+        {"role": "tool", "tool_call_id": "call_1", "content": "results"},
+    ]
+    second = _chat(_client(), tools=tools, messages=messages).json()["choices"][0]
+    assert "Final Answer:" in second["message"]["content"]
+
+
+@pytest.mark.parametrize(
+    ("setting", "check"),
+    [
+        ("error_rate", lambda r: r.status_code == 503),
+        ("empty_rate", lambda r: r.json()["choices"][0]["message"]["content"] == ""),
+        ("none_choices_rate", lambda r: r.json()["choices"] is None),
+    ],
+)
+def test_failure_injection(setting, check):
+    assert check(_chat(_client(**{setting: 1.0})))
+
+
+def test_streaming_ends_with_done():
+    response = _chat(_client(), stream=True)
+    frames = [line for line in response.text.splitlines() if line.startswith("data:")]
+    assert frames[-1] == "data: [DONE]"
+    assert "Final Answer" in json.loads(frames[0][5:])["choices"][0]["delta"]["content"]
+
+
+def test_detect_output_model_prefers_last_schema_title():
+    known = {"Outer": {}, "Inner": {}}
+    messages = [{"role": "system", "content": '{"title": "Outer"} then {"title": "Inner"}'}]
+    assert detect_output_model(messages, known) == "Inner"
+    assert detect_output_model([{"role": "user", "content": "no schema"}], known) is None
+
+
+def test_percentile_nearest_rank():
+    values = [float(v) for v in range(1, 101)]
+    assert percentile(values, 50) == 50.0
+    assert percentile(values, 99) == 99.0
+    assert percentile([], 95) == 0.0
+
+
+def test_load_test_counts_statuses_against_the_mock():
+    app = create_app(MockSettings(seed=3, error_rate=0.5, canned={"M": {}}))
+    transport = httpx.ASGITransport(app=app)
+
+    report = asyncio.run(run_load("llm", "http://mock/v1", 40, 8, transport=transport))
+    summary = report.summary()
+
+    assert summary["requests"] == 40
+    assert set(summary["statuses"]) == {"ok", "http_503"}
+    assert summary["latency_seconds"]["p50"] <= summary["latency_seconds"]["p99"]
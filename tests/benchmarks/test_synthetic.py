@@ -0,0 +1,27 @@
+"""Tests for the schema-driven synthetic output models."""
+
+from benchmarks.synthetic import build, canned_outputs, resize
+from epic_news.models.crews.rss_weekly_report import RssWeeklyReport
+
+
+def test_build_fills_lists_to_the_requested_size():
+    report = build(RssWeeklyReport, 3)
+
+    assert len(report.feeds) == 3
+
+
+def test_resize_walks_wildcards_and_numbers_copies():
+    data = build(RssWeeklyReport, 1).model_dump(mode="json")
+    resize(data, "feeds", 4)
+    resize(data, "feeds.*.articles", 25)
+
+    report = RssWeeklyReport.model_validate(data)
+    assert [len(feed.articles) for feed in report.feeds] == [25] * 4
+    titles = {article.title for article in report.feeds[0].articles}
+    assert len(titles) == 25
+
+
+def test_most_output_models_get_a_canned_instance():
+    canned = canned_outputs()
+
+    assert {"ClassificationResult", "RssWeeklyReport", "HolidayPlannerReport"} <= set(canned)
@@ -0,0 +1,78 @@
+"""Contract tests for the declarative crew registry."""
+
+import pytest
+
+from epic_news.config.crew_registry import (
+    CREW_REGISTRY,
+    UNKNOWN_ROUTE,
+    report_methods,
+    route_for,
+    with_company_fallback,
+)
+from epic_news.main import ReceptionFlow
+from epic_news.models.content_state import CrewCategories
+from epic_news.utils.lazy_import import resolve
+
+
+def test_every_category_except_unknown_is_registered():
+    categories = set(CrewCategories.to_dict().values()) - {"UNKNOWN"}
+
+    assert set(CREW_REGISTRY) == categories
+
+
+def test_routes_and_methods_are_unique():
+    specs = list(CREW_REGISTRY.values())
+
+    assert len({s.route for s in specs}) == len(specs)
+    assert len({s.method for s in specs}) == len(specs)
+
+
+@pytest.mark.parametrize("spec", CREW_REGISTRY.values(), ids=lambda s: s.category)
+def test_registered_method_exists_on_flow(spec):
+    assert callable(getattr(ReceptionFlow, spec.method, None))
+
+
+@pytest.mark.parametrize(
+    "spec", [s for s in CREW_REGISTRY.values() if s.is_standard], ids=lambda s: s.category
+)
+def test_standard_specs_are_complete(spec):
+    assert spec.json_path and spec.json_path.endswith(".json")
+    assert spec.html_path and spec.html_path.endswith(".html")
+    assert spec.template
+    assert spec.label
+    # Models are cheap to import; resolving them catches typos in the lazy references.
+    assert hasattr(resolve(spec.model), "model_validate")
+
+
+def test_debug_dumps_keep_their_names():
+    dump_names = {s.category: s.dump_name for s in CREW_REGISTRY.values() if s.is_standard}
+
+    assert dump_names == {
+        "POEM": "POEM",
+        "COMPANY_NEWS": "NEWS_COMPANY",
+        "FINDAILY": "FIN_DAILY",
+        "NEWSDAILY": "NEWSDAILY",
+        "SAINT": "SAINT_DAILY",
+        "BOOK_SUMMARY": "BOOK_SUMMARY",
+        "MEETING_PREP": "MEETING_PREP",
+        "SALES_PROSPECTING": "SALES_PROSPECTING",
+    }
+
+
+def test_unregistered_category_routes_to_unknown():
+    assert route_for("NOT_A_CREW") == UNKNOWN_ROUTE
+    assert route_for(None) == UNKNOWN_ROUTE
+
+
+def test_send_email_waits_on_every_report_method():
+    assert set(report_methods()) == {s.method for s in CREW_REGISTRY.values()}
+
+
+def test_company_fallback_uses_topic_only_when_missing():
+    inputs = {"topic": "ACME"}
+    with_company_fallback(inputs)
+    assert inputs["company"] == "ACME"
+
+    inputs = {"topic": "ACME", "company": "Globex"}
+    with_company_fallback(inputs)
+    assert inputs["company"] == "Globex"
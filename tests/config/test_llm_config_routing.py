@@ -19,3 +19,9 @@ def test_native_provider_model_leaves_transport_to_litellm():
     llm = LLMConfig.get_openrouter_llm(model="gemini/gemini-3.7-flash")
     assert llm.base_url is None
     assert llm.is_litellm is True
+
+
+def test_openrouter_base_url_can_point_at_a_local_stand_in(monkeypatch):
+    monkeypatch.setenv("OPENROUTER_BASE_URL", "http://127.0.0.1:8765/v1")
+    llm = LLMConfig.get_openrouter_llm(model="openrouter/mistralai/mistral-small-2603")
+    assert llm.base_url == "http://127.0.0.1:8765/v1"
@@ -1,6 +1,27 @@
+import atexit
 import os
+import shutil
+import tempfile
 
 # crewai-custom-tools >=0.4.0: PerplexitySearchTool fails fast at construction
 # without a key. CI has no .env; give the suite a dummy so construction-time
 # wiring works. Tests that verify missing-key behavior monkeypatch.delenv.
 os.environ.setdefault("PERPLEXITY_API_KEY", "test-key")
+
+# Keep DOCX narration tests independent: a fragment cached by one test would turn the
+# next test's LLM call into a cache hit. Cache tests enable it on a tmp directory.
+os.environ.setdefault("EPIC_FRAGMENT_CACHE", "false")
+
+# send_email tests assert on a synchronous send; outbox tests build their own outbox.
+os.environ.setdefault("EPIC_EMAIL_OUTBOX", "false")
+
+# Search tools built by tests must reach their (mocked) providers, not a result cached by
+# an earlier test or run. Search cache tests build their own cache on a tmp directory.
+os.environ.setdefault("EPIC_SEARCH_CACHE", "false")
+
+# Spans and metrics recorded while flows run under test go to a scratch directory, not
+# into traces/ and output/dashboard_data/ of the working tree.
+_TELEMETRY_DIR = tempfile.mkdtemp(prefix="epic_news_tests_")
+atexit.register(shutil.rmtree, _TELEMETRY_DIR, ignore_errors=True)
+os.environ.setdefault("EPIC_SPAN_FILE", os.path.join(_TELEMETRY_DIR, "spans.jsonl"))
+os.environ.setdefault("EPIC_METRICS_FILE", os.path.join(_TELEMETRY_DIR, "metrics.jsonl"))
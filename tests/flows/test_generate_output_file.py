@@ -12,6 +12,7 @@ from pathlib import Path
 import pytest
 
 import epic_news.main as main_mod
+import epic_news.utils.portfolio_analytics as portfolio_analytics
 from epic_news.main import ReceptionFlow
 
 # method name -> expected rendered output path
@@ -40,6 +41,8 @@ def test_generate_sets_output_file_to_rendered_html(method, expected_html, monke
     monkeypatch.setattr(main_mod, "load_or_parse_model", lambda *a, **k: object())
     monkeypatch.setattr(main_mod, "render_and_write_html", lambda crew, model, path: Path(path))
     monkeypatch.setattr(main_mod, "assemble_holiday_docx", lambda *a, **k: None)
+    # FinDaily's input enricher would otherwise download a year of prices.
+    monkeypatch.setattr(portfolio_analytics, "build_portfolio_context", lambda *a, **k: "analytics")
     # Satisfy per-method preconditions (e.g. holiday needs a destination,
     # meeting_prep needs a company) without touching real crew inputs. The state
     # is a frozen Pydantic model, so patch the class method; defaultdict(str)
@@ -0,0 +1,36 @@
+"""Regression: when MenuDesignerService fails, the fallback hands the crew a plain dict.
+
+``to_crew_inputs()`` returns a read-only view, and ``kickoff_flow`` rejects anything
+that is not a dict, so the recovery path used to crash instead of recovering.
+"""
+
+import pytest
+
+import epic_news.main as main_mod
+from epic_news.main import ReceptionFlow
+
+
+class _KickoffReachedError(Exception):
+    pass
+
+
+def test_menu_designer_fallback_passes_a_dict_to_kickoff_flow(monkeypatch):
+    class FailingService:
+        def generate_menu_plan(self, **_kw):
+            raise RuntimeError("service down")
+
+    seen = []
+
+    def fake_kickoff(crew, context):
+        seen.append(context)
+        raise _KickoffReachedError
+
+    monkeypatch.setattr(main_mod, "MenuDesignerService", FailingService)
+    monkeypatch.setattr(main_mod, "MenuDesignerCrew", lambda: object())
+    monkeypatch.setattr(main_mod, "kickoff_flow", fake_kickoff)
+
+    flow = ReceptionFlow(user_request="menu de la semaine")
+    with pytest.raises(_KickoffReachedError):
+        flow.generate_menu_designer()
+
+    assert isinstance(seen[0], dict)
@@ -128,3 +128,22 @@ def test_recipient_is_never_a_placeholder(flow, monkeypatch):
 
     assert "@" in captured["recipient"]
     assert "[" not in captured["recipient"]
+
+
+def test_outbox_queues_and_does_not_claim_delivery(flow, monkeypatch, tmp_path):
+    """With the outbox on, send_email returns once the email is queued, not delivered."""
+    from epic_news.utils.email_outbox import QUEUED, EmailOutbox
+
+    outbox = EmailOutbox(tmp_path / "outbox", send=lambda **_kw: {})
+    monkeypatch.setenv("EPIC_EMAIL_OUTBOX", "true")
+    monkeypatch.setattr(main_mod, "get_email_outbox", lambda: outbox)
+
+    def fail(**_kw):  # pragma: no cover - must not be reached
+        raise AssertionError("the flow must not send synchronously")
+
+    monkeypatch.setattr(main_mod, "send_report_email", fail)
+
+    flow.send_email()
+
+    assert flow.state.email_sent is False
+    assert outbox.get(flow.state.email_outbox_key).status == QUEUED
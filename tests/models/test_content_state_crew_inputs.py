@@ -1,5 +1,14 @@
 """Characterization tests pinning to_crew_inputs() before refactoring."""
 
+import copy
+import datetime
+import json
+import pickle
+from types import SimpleNamespace
+
+import pytest
+
+from epic_news.models import content_state
 from epic_news.models.content_state import ContentState
 from epic_news.models.extracted_info import ExtractedInfo
 
@@ -92,3 +101,83 @@ def test_participants_and_product_field_mapping():
     assert inputs["our_product"] == "PowerFlex"
     assert inputs["context"] == "Quarterly review"
     assert inputs["objective"] == "Renew contract"
+
+
+def test_repeated_calls_reuse_one_read_only_view():
+    state = _state()
+    inputs = state.to_crew_inputs()
+    assert state.to_crew_inputs() is inputs
+    with pytest.raises(TypeError):
+        inputs["topic"] = "changed"  # type: ignore[index]
+
+    mutable = inputs.copy()
+    mutable["output_file"] = "x.json"
+    assert state.to_crew_inputs()["output_file"] == ""
+
+
+def test_nested_values_are_read_only_and_copy_to_plain_values():
+    state = ContentState(
+        user_request="Prep",
+        extracted_info=ExtractedInfo(participants=["Ana <ana@example.com> - CEO"]),
+    )
+    participants = state.to_crew_inputs()["participants"]
+    with pytest.raises(TypeError):
+        participants.append("Bob")
+    with pytest.raises(TypeError):
+        participants[0] = "Bob"
+
+    mine = participants.copy()
+    mine.append("Bob")
+    assert state.to_crew_inputs()["participants"] == ["Ana <ana@example.com> - CEO"]
+
+    inputs = state.to_crew_inputs()
+    for plain in (copy.deepcopy(inputs["participants"]), pickle.loads(pickle.dumps(inputs["participants"]))):
+        assert type(plain) is list and plain == participants
+    assert isinstance(inputs["participants"], list)  # CrewAI accepts only dict and list containers
+    assert json.loads(json.dumps(dict(inputs)))["participants"] == participants
+
+
+def test_field_assignment_invalidates_the_view():
+    state = _state()
+    before = state.to_crew_inputs()
+
+    state.selected_crew = "MENU"
+
+    after = state.to_crew_inputs()
+    assert after is not before
+    assert after["selected_crew"] == "MENU"
+    assert "menu_slug" in after
+
+
+def test_new_extracted_info_is_picked_up():
+    state = _state()
+    state.to_crew_inputs()
+
+    state.extracted_info = ExtractedInfo(main_subject_or_activity="Trip to Oslo")
+
+    assert state.to_crew_inputs()["topic"] == "Trip to Oslo"
+
+
+def test_model_copy_does_not_reuse_the_original_view():
+    state = _state()
+    state.to_crew_inputs()
+
+    copied = state.model_copy(update={"selected_crew": "POEM"})
+
+    assert copied.to_crew_inputs()["selected_crew"] == "POEM"
+
+
+def test_view_is_rebuilt_when_the_day_changes(monkeypatch):
+    state = _state()
+    today = state.to_crew_inputs()
+
+    class _Tomorrow(datetime.date):
+        @classmethod
+        def today(cls):
+            return datetime.date.today() + datetime.timedelta(days=1)
+
+    monkeypatch.setattr(
+        content_state, "datetime", SimpleNamespace(date=_Tomorrow, datetime=datetime.datetime)
+    )
+
+    assert state.to_crew_inputs() is not today
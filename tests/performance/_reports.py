@@ -0,0 +1,110 @@
+"""Synthetic, size-parameterized output models for the hot-path benchmarks."""
+
+from __future__ import annotations
+
+import importlib
+from functools import cache
+from typing import Any
+
+import pytest
+from pydantic import BaseModel
+
+from benchmarks.synthetic import build, resize
+
+# Renderer type → output model ("module:Class" under epic_news.models.crews).
+REPORT_MODELS = {
+    "BOOK_SUMMARY": "book_summary_report:BookSummaryReport",
+    "COMPANY_NEWS": "company_news_report:CompanyNewsReport",
+    "COMPANY_PROFILE": "company_profiler_report:CompanyProfileReport",
+    "COOKING": "cooking_recipe:PaprikaRecipe",
+    "CROSS_REFERENCE_REPORT": "cross_reference_report:CrossReferenceReport",
+    "DEEPRESEARCH": "deep_research:DeepResearchReport",
+    "FINDAILY": "financial_report:FinancialReport",
+    "GENERIC": "news_daily_report:NewsDailyReport",
+    "GEOSPATIAL_ANALYSIS": "geospatial_analysis_report:GeospatialAnalysisReport",
+    "HOLIDAY_PLANNER": "holiday_planner_report:HolidayPlannerReport",
+    "HR_INTELLIGENCE": "hr_intelligence_report:HRIntelligenceReport",
+    "LEGAL_ANALYSIS": "legal_analysis_report:LegalAnalysisReport",
+    "MEETING_PREP": "meeting_prep_report:MeetingPrepReport",
+    "MENU": "menu_designer_report:WeeklyMenuPlan",
+    "NEWSDAILY": "news_daily_report:NewsDailyReport",
+    "PESTEL": "pestel_report:PestelReport",
+    "POEM": "poem_report:PoemJSONOutput",
+    "RSS_WEEKLY": "rss_weekly_report:RssWeeklyReport",
+    "SAINT": "saint_daily_report:SaintData",
+    "SALES_PROSPECTING": "sales_prospecting_report:SalesProspectingReport",
+    "SHOPPING": "shopping_advice_report:ShoppingAdviceOutput",
+    "TECH_STACK": "tech_stack_report:TechStackReport",
+    "WEB_PRESENCE": "web_presence_report:WebPresenceReport",
+}
+
+# OSINT_GLOBAL renders the sub-reports of one OSINT run side by side.
+OSINT_SECTIONS = {
+    "company_profile": "COMPANY_PROFILE",
+    "tech_stack": "TECH_STACK",
+    "web_presence": "WEB_PRESENCE",
+    "hr_intelligence": "HR_INTELLIGENCE",
+    "legal_analysis": "LEGAL_ANALYSIS",
+    "geospatial_analysis": "GEOSPATIAL_ANALYSIS",
+    "cross_reference": "CROSS_REFERENCE_REPORT",
+}
+
+# List length of every top-level list field, per size.
+DEFAULT_SIZES = (5, 50, 500)
+# RSS: total articles, spread over RSS_FEEDS feeds. Deep research: sections.
+RSS_SIZES = (50, 500, 5000)
+RSS_FEEDS = 10
+DEEP_RESEARCH_SIZES = (10, 50, 200)
+
+LARGE = pytest.mark.perf_large
+
+
+def sizes(values: tuple[int, ...], *prefix: str) -> list[Any]:
+    """Parametrize ``(*prefix, size)``; all but the smallest size only run when timing."""
+    return [
+        pytest.param(*prefix, value, marks=[LARGE] if index else [], id="-".join((*prefix, str(value))))
+        for index, value in enumerate(values)
+    ]
+
+
+def sizes_for(crew_type: str) -> tuple[int, ...]:
+    if crew_type == "RSS_WEEKLY":
+        return RSS_SIZES
+    if crew_type == "DEEPRESEARCH":
+        return DEEP_RESEARCH_SIZES
+    return DEFAULT_SIZES
+
+
+def report_model(crew_type: str) -> type[BaseModel]:
+    module, _, name = REPORT_MODELS[crew_type].partition(":")
+    return getattr(importlib.import_module(f"epic_news.models.crews.{module}"), name)
+
+
+@cache
+def _report(crew_type: str, size: int) -> BaseModel:
+    model = report_model(crew_type)
+    if crew_type == "RSS_WEEKLY":
+        data = build(model, 1).model_dump(mode="json")
+        resize(data, "feeds", RSS_FEEDS)
+        resize(data, "feeds.*.articles", max(1, size // RSS_FEEDS))
+        return model.model_validate(data)
+    if crew_type == "DEEPRESEARCH":
+        data = build(model, 3).model_dump(mode="json")
+        resize(data, "research_sections", size)
+        return model.model_validate(data)
+    return build(model, size)
+
+
+def report(crew_type: str, size: int) -> BaseModel:
+    """A validated output model of ``size`` (see ``sizes_for``), built once per session."""
+    return _report(crew_type, size)
+
+
+def report_data(crew_type: str, size: int) -> dict[str, Any]:
+    """What ``TemplateManager.render_report`` receives: a fresh ``model_dump()``."""
+    if crew_type == "OSINT_GLOBAL":
+        data: dict[str, Any] = {"company_name": "Synthetic Corp"}
+        for key, section in OSINT_SECTIONS.items():
+            data[key] = report(section, size).model_dump()
+        return data
+    return report(crew_type, size).model_dump()
@@ -0,0 +1,66 @@
+"""Benchmarks: DOCX assembly (native writer and Pandoc) and HTML to PDF (WeasyPrint)."""
+
+import pytest
+
+from epic_news.tools import html_to_pdf_tool
+from epic_news.tools.html_to_pdf_tool import HtmlToPdfTool
+from epic_news.utils.docx_report.docx_builder import build_docx
+from epic_news.utils.html.template_manager import TemplateManager
+from tests.performance._reports import DEEP_RESEARCH_SIZES, report, report_data, sizes
+
+
+def _pandoc_available() -> bool:
+    try:
+        import pypandoc
+
+        pypandoc.get_pandoc_version()
+    except (ImportError, OSError):
+        return False
+    return True
+
+
+def _fragments(size: int) -> list[tuple[str, str]]:
+    deep_research = report("DEEPRESEARCH", size)
+    return [
+        (
+            section.title,
+            "\n\n".join(
+                [section.content, *(f"- {finding}" for finding in section.key_findings)]
+                + [f"[{source.title}]({source.url})" for source in section.sources]
+            ),
+        )
+        for section in deep_research.research_sections
+    ]
+
+
+@pytest.mark.parametrize(
+    "backend",
+    [
+        "native",
+        pytest.param(
+            "pandoc", marks=pytest.mark.skipif(not _pandoc_available(), reason="pandoc is not installed")
+        ),
+    ],
+)
+@pytest.mark.parametrize("size", sizes(DEEP_RESEARCH_SIZES))
+def test_build_docx(bench, tmp_path, size, backend):
+    fragments = _fragments(size)
+    output = tmp_path / "report.docx"
+    meta = {"title": "Synthetic report", "date": "2026-01-15"}
+
+    path = bench(build_docx, fragments, meta, str(output), backend=backend)
+
+    assert output.stat().st_size > 0
+    assert path == str(output)
+
+
+@pytest.mark.skipif(not html_to_pdf_tool.WEASYPRINT_AVAILABLE, reason="WeasyPrint system libraries missing")
+@pytest.mark.parametrize("size", sizes(DEEP_RESEARCH_SIZES))
+def test_html_to_pdf(bench, tmp_path, size):
+    html_path = tmp_path / "report.html"
+    html_path.write_text(TemplateManager().render_report("DEEPRESEARCH", report_data("DEEPRESEARCH", size)))
+    pdf_path = tmp_path / "report.pdf"
+
+    result = bench(HtmlToPdfTool()._run, str(html_path), str(pdf_path))
+
+    assert result.startswith("Successfully converted")
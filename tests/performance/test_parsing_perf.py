@@ -0,0 +1,111 @@
+"""Benchmarks: ``parse_crewai_output`` on malformed LLM JSON, ``make_serializable`` and
+``ContentState.to_crew_inputs``."""
+
+import json
+import re
+from types import SimpleNamespace
+
+import pytest
+
+from epic_news.models.content_state import ContentState
+from epic_news.utils.diagnostics.dumping import make_serializable
+from epic_news.utils.diagnostics.parsing import parse_crewai_output
+from tests.performance._reports import DEFAULT_SIZES, RSS_SIZES, report, report_model, sizes
+
+
+def _fenced(text: str) -> str:
+    """Preamble, Markdown fence and trailing chatter around the JSON."""
+    return f"Thought: I now know the final answer\nFinal Answer: ```json\n{text}\n```\nHope this helps!"
+
+
+def _missing_commas(text: str) -> str:
+    """Commas dropped at line ends, so only the repair pass can parse it."""
+    return re.sub(r",\n", "\n", text)
+
+
+def _smart_quotes(text: str) -> str:
+    """Curly quotes around every string value, plus 1,234-style numbers."""
+    text = re.sub(r': "([^"\\]*)"', r": “\1”", text)
+    return re.sub(r": (\d+)(,?)$", lambda m: f": {int(m[1]) * 1000:,}{m[2]}", text, flags=re.M)
+
+
+MALFORMATIONS = {"fenced": _fenced, "missing_commas": _missing_commas, "smart_quotes": _smart_quotes}
+
+
+@pytest.mark.parametrize("malformation", sorted(MALFORMATIONS))
+@pytest.mark.parametrize(
+    ("crew_type", "size"), sizes(RSS_SIZES, "RSS_WEEKLY") + sizes(DEFAULT_SIZES, "HOLIDAY_PLANNER")
+)
+def test_parse_crewai_output_malformed(bench, tmp_path, monkeypatch, crew_type, size, malformation):
+    monkeypatch.chdir(tmp_path)  # the repair path saves the failing JSON under debug/
+    model = report_model(crew_type)
+    raw = MALFORMATIONS[malformation](report(crew_type, size).model_dump_json(indent=2))
+    output = SimpleNamespace(raw=raw)
+
+    parsed = bench(parse_crewai_output, output, model)
+
+    assert isinstance(parsed, model)
+
+
+def _state(size: int) -> ContentState:
+    return ContentState(
+        user_request="Plan a week in Lisbon and summarise the RSS feeds",
+        selected_crew="RSS",
+        rss_weekly_report=report("RSS_WEEKLY", size * 10),
+        deep_research_report=report("DEEPRESEARCH", size),
+        holiday_plan=report("HOLIDAY_PLANNER", size),
+        news_daily_report=report("NEWSDAILY", size),
+    )
+
+
+@pytest.mark.parametrize("size", sizes(DEFAULT_SIZES))
+def test_to_crew_inputs(bench, size):
+    """A cold build: the assignment invalidates the cached view every round."""
+    state = _state(size)
+
+    def build():
+        state.output_file = "output/rss_weekly/report.html"
+        return state.to_crew_inputs()
+
+    inputs = bench(build)
+
+    assert inputs["selected_crew"] == "RSS"
+
+
+def _osint_run(state: ContentState, to_inputs) -> None:
+    """The to_crew_inputs() calls and state assignments of one OSINT run through the flow."""
+    to_inputs()  # classify
+    state.selected_crew = "OPEN_SOURCE_INTELLIGENCE"
+    to_inputs().get("company") or to_inputs().get("topic")  # generate_osint's log line
+    to_inputs().copy()  # _run_osint_parallel, copied per crew
+    state.output_file = "output/osint/global_report.html"
+    to_inputs()  # emit_report's docx assembler
+
+
+@pytest.mark.parametrize("mode", ["cached", "rebuilt"])
+@pytest.mark.parametrize("size", sizes(DEFAULT_SIZES))
+def test_to_crew_inputs_per_run(bench, size, mode):
+    """Per-run saving of the cached view; ``rebuilt`` is the old build-on-every-call cost."""
+    state = _state(size)
+    to_inputs = state.to_crew_inputs if mode == "cached" else state._build_crew_inputs
+
+    def run():
+        state.selected_crew = "RSS"
+        _osint_run(state, to_inputs)
+
+    bench(run)
+
+    assert to_inputs()["selected_crew"] == "OPEN_SOURCE_INTELLIGENCE"
+
+
+@pytest.mark.parametrize("size", sizes(DEFAULT_SIZES))
+def test_make_serializable(bench, size):
+    state_data = {
+        "state": _state(size),
+        "outputs": [report(crew_type, size) for crew_type in ("TECH_STACK", "WEB_PRESENCE", "PESTEL")],
+        "raw": {"tasks": [SimpleNamespace(name=f"task {i}", output="x" * 200) for i in range(size)]},
+    }
+
+    serializable = bench(make_serializable, state_data)
+
+    json.dumps(serializable, default=str)
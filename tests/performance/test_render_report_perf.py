@@ -0,0 +1,26 @@
+"""Benchmarks: ``TemplateManager.render_report`` for every renderer type."""
+
+import pytest
+
+from epic_news.utils.html.template_manager import TemplateManager
+from epic_news.utils.html.template_renderers.renderer_factory import RendererFactory
+from tests.performance._reports import REPORT_MODELS, report_data, sizes, sizes_for
+
+CASES = [case for crew_type in sorted(REPORT_MODELS) for case in sizes(sizes_for(crew_type), crew_type)]
+CASES += sizes((5, 50), "OSINT_GLOBAL")
+
+
+def test_every_renderer_type_has_a_benchmark():
+    covered = set(REPORT_MODELS) | {"OSINT_GLOBAL", "SALESPROSPECTING"}  # alias of SALES_PROSPECTING
+    assert set(RendererFactory.get_supported_crew_types()) <= covered
+
+
+@pytest.mark.parametrize(("crew_type", "size"), CASES)
+def test_render_report(bench, crew_type, size):
+    manager = TemplateManager()
+    data = report_data(crew_type, size)
+
+    html = bench(manager.render_report, crew_type, data)
+
+    assert "Erreur lors de la génération du rapport" not in html
+    assert len(html) > 1000
@@ -3,6 +3,7 @@ from unittest.mock import patch
 from fastapi.testclient import TestClient
 
 from epic_news.api import app
+from epic_news.utils.progress import get_progress_bus, run_scope
 
 client = TestClient(app)
 
@@ -18,11 +19,15 @@ def test_kickoff_endpoint_success(mock_kickoff):
 
     # Assert
     assert response.status_code == 202
-    assert response.json() == {
+    body = response.json()
+    run_id = body["run_id"]
+    assert body == {
         "message": "Crew kickoff initiated successfully.",
         "user_request": user_request,
+        "run_id": run_id,
+        "events_url": f"/runs/{run_id}/events",
     }
-    mock_kickoff.assert_called_once_with(user_input=user_request)
+    mock_kickoff.assert_called_once_with(user_input=user_request, run_id=run_id)
 
 
 def test_kickoff_endpoint_validation_error():
@@ -40,3 +45,40 @@ def test_health_endpoint():
 
     assert response.status_code == 200
     assert response.json() == {"status": "ok"}
+
+
+def test_run_events_streams_sse_until_run_finished():
+    """The SSE endpoint replays the run's events and closes after run_finished."""
+    with run_scope("sse-test-run", user_request="x"):
+        get_progress_bus().publish("sse-test-run", "step_started", step="classify")
+
+    with client.stream("GET", "/runs/sse-test-run/events") as response:
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/event-stream")
+        body = "".join(response.iter_text())
+
+    assert "event: run_started" in body
+    assert "event: step_started" in body
+    assert body.rstrip().splitlines()[1] == "event: run_started"
+    assert "event: run_finished" in body
+
+
+def test_run_events_unknown_run_returns_404():
+    response = client.get("/runs/does-not-exist/events")
+
+    assert response.status_code == 404
+
+
+def test_run_email_reports_outbox_status(monkeypatch, tmp_path):
+    from epic_news import api
+    from epic_news.utils.email_outbox import EmailOutbox
+
+    outbox = EmailOutbox(tmp_path / "outbox", send=lambda **_kw: {})
+    outbox.enqueue(recipient="someone@example.com", subject="s", html_body="<p>r</p>", run_id="run-1")
+    monkeypatch.setenv("EPIC_EMAIL_OUTBOX", "true")
+    monkeypatch.setattr(api, "get_email_outbox", lambda: outbox)
+
+    response = client.get("/runs/run-1/email")
+    assert response.status_code == 200
+    assert [e["status"] for e in response.json()["emails"]] == ["queued"]
+    assert client.get("/runs/unknown/email").status_code == 404
@@ -1,7 +1,17 @@
 from queue import Queue
-from unittest.mock import MagicMock, mock_open, patch
+from unittest.mock import mock_open, patch
 
-from epic_news.app import run_crew_thread
+from epic_news.app import format_progress_event, run_crew_thread
+from epic_news.utils.progress import ProgressEvent, get_progress_bus
+
+
+def _announce_report(output_file):
+    """kickoff stand-in that announces the report path on the progress bus like the real one."""
+
+    def _kickoff(user_input, run_id):
+        get_progress_bus().publish(run_id, "report_ready", output_file=output_file)
+
+    return _kickoff
 
 
 @patch("epic_news.app.kickoff")
@@ -12,18 +22,16 @@ def test_run_crew_thread_success(mock_file, mock_exists, mock_kickoff):
     # Arrange
     log_queue = Queue()
     user_request = "Test request"
-    mock_flow = MagicMock()
-    mock_flow.state.output_file = "/path/to/report.html"
-    mock_kickoff.return_value = mock_flow
+    mock_kickoff.side_effect = _announce_report("/path/to/report.html")
 
     # Act
-    run_crew_thread(user_request, log_queue)
+    run_crew_thread(user_request, log_queue, run_id="run-success")
 
     # Assert
     results = list(log_queue.queue)
     assert any(item[0] == "REPORT" and item[1] == "<html>Report</html>" for item in results)
     assert any(item[0] == "END" for item in results)
-    mock_kickoff.assert_called_once_with(user_input=user_request)
+    mock_kickoff.assert_called_once_with(user_input=user_request, run_id="run-success")
 
 
 @patch("epic_news.app.kickoff")
@@ -33,9 +41,7 @@ def test_run_crew_thread_no_output_file(mock_exists, mock_kickoff):
     # Arrange
     log_queue = Queue()
     user_request = "Test request"
-    mock_flow = MagicMock()
-    mock_flow.state.output_file = "/path/to/nonexistent_report.html"
-    mock_kickoff.return_value = mock_flow
+    mock_kickoff.side_effect = _announce_report("/path/to/nonexistent_report.html")
 
     # Act
     run_crew_thread(user_request, log_queue)
@@ -60,3 +66,23 @@ def test_run_crew_thread_exception(mock_kickoff):
     results = list(log_queue.queue)
     assert any(item[0] == "ERROR" and "Crew failed!" in item[1] for item in results)
     assert any(item[0] == "END" for item in results)
+
+
+@patch("epic_news.app.kickoff", return_value=None)
+def test_run_crew_thread_without_report_event(mock_kickoff):
+    """kickoff returns None; without a report_ready event there is nothing to show."""
+    log_queue = Queue()
+
+    run_crew_thread("Test request", log_queue)
+
+    results = list(log_queue.queue)
+    assert any(item[0] == "ERROR" and "N/A" in item[1] for item in results)
+
+
+def test_format_progress_event():
+    event = ProgressEvent(
+        run_id="r", seq=1, kind="step_finished", data={"step": "classify", "success": True, "duration": 1.25}
+    )
+
+    assert format_progress_event(event) == "✅ classify (1.2s)"
+    assert format_progress_event(ProgressEvent(run_id="r", seq=2, kind="run_started")) is None
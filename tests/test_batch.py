@@ -0,0 +1,152 @@
+"""Tests for batch mode (one process, many requests)."""
+
+import asyncio
+import json
+import threading
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from epic_news import batch
+
+
+def _flow(selected_crew, output_file=None):
+    return SimpleNamespace(state=SimpleNamespace(selected_crew=selected_crew, output_file=output_file))
+
+
+def test_read_requests_skips_blanks_and_comments(tmp_path):
+    path = tmp_path / "nightly.txt"
+    path.write_text(
+        "# nightly\nget the daily news report\n\n  Donne moi le saint du jour  \n", encoding="utf-8"
+    )
+
+    assert batch.read_requests(path) == ["get the daily news report", "Donne moi le saint du jour"]
+
+
+def test_read_requests_jsonl(tmp_path):
+    path = tmp_path / "nightly.jsonl"
+    path.write_text('{"request": "OSINT of Temenos"}\n\n{"request": "daily news"}\n', encoding="utf-8")
+
+    assert batch.read_requests(path) == ["OSINT of Temenos", "daily news"]
+
+    path.write_text('{"prompt": "oops"}\n', encoding="utf-8")
+    with pytest.raises(ValueError, match="nightly.jsonl:1"):
+        batch.read_requests(path)
+
+
+def test_duplicates_run_once_and_summary_is_written(tmp_path):
+    calls = []
+
+    def runner(request, run_id):
+        calls.append(request)
+        return _flow("NEWSDAILY")
+
+    summary = batch.run_batch(
+        ["get the daily news", "Get  the daily NEWS ", "saint du jour"],
+        runner=runner,
+        concurrency=2,
+        output_dir=tmp_path,
+    )
+
+    assert sorted(calls) == ["get the daily news", "saint du jour"]
+    statuses = [r["status"] for r in summary["results"]]
+    assert statuses == ["ok", "duplicate", "ok"]
+    assert summary["results"][1]["duplicate_of"] == 1
+    assert summary["counts"] == {"ok": 2, "duplicate": 1}
+    written = json.loads((tmp_path / summary["batch_id"] / "summary.json").read_text(encoding="utf-8"))
+    assert written["results"][0]["selected_crew"] == "NEWSDAILY"
+    assert written["results"][0]["duration_seconds"] >= 0
+
+
+def test_failures_are_recorded_not_raised(tmp_path):
+    def runner(request, run_id):
+        raise RuntimeError("provider down")
+
+    summary = batch.run_batch(["a"], runner=runner, concurrency=1, output_dir=tmp_path)
+
+    result = summary["results"][0]
+    assert result["status"] == "error"
+    assert result["error"] == "RuntimeError: provider down"
+    assert result["run_id"]
+
+
+def test_concurrency_is_bounded(tmp_path):
+    running = 0
+    peak = 0
+    guard = threading.Lock()
+
+    def runner(request, run_id):
+        nonlocal running, peak
+        with guard:
+            running += 1
+            peak = max(peak, running)
+        time.sleep(0.05)
+        with guard:
+            running -= 1
+        return _flow("POEM")
+
+    batch.run_batch([f"poem {i}" for i in range(6)], runner=runner, concurrency=2, output_dir=tmp_path)
+
+    assert peak == 2
+
+
+def test_requests_for_the_same_crew_do_not_overlap(tmp_path):
+    active: dict[str, int] = {}
+    overlaps = []
+    guard = threading.Lock()
+
+    def runner(request, run_id):
+        route = "go_generate_news_daily" if "news" in request else "go_generate_saint_daily"
+
+        # determine_crew runs in a worker thread of the flow's event loop.
+        async def flow_step():
+            await asyncio.to_thread(batch.claim_outputs, route)
+
+        asyncio.run(flow_step())
+        with guard:
+            active[route] = active.get(route, 0) + 1
+            if active[route] > 1:
+                overlaps.append(route)
+        time.sleep(0.03)
+        with guard:
+            active[route] -= 1
+        return _flow(route)
+
+    summary = batch.run_batch(
+        ["news 1", "news 2", "news 3", "saint 1", "saint 2"],
+        runner=runner,
+        concurrency=4,
+        output_dir=tmp_path,
+    )
+
+    assert overlaps == []
+    assert summary["counts"] == {"ok": 5}
+
+
+def test_report_is_archived_per_request(tmp_path):
+    report = tmp_path / "report.html"
+
+    def runner(request, run_id):
+        report.write_text(request, encoding="utf-8")
+        return _flow("POEM", str(report))
+
+    summary = batch.run_batch(
+        ["first", "second"], runner=runner, concurrency=1, output_dir=tmp_path / "batch"
+    )
+
+    archived = [r["archived_file"] for r in summary["results"]]
+    assert [Path(path).read_text(encoding="utf-8") for path in archived] == ["first", "second"]
+
+
+def test_claim_outputs_is_a_noop_outside_a_batch():
+    batch.claim_outputs("go_generate_poem")
+    batch.claim_outputs("go_generate_poem")  # would deadlock if it took the lock
+
+
+def test_batch_concurrency_env(monkeypatch):
+    monkeypatch.setenv("EPIC_BATCH_CONCURRENCY", "7")
+    assert batch.batch_concurrency() == 7
+    monkeypatch.setenv("EPIC_BATCH_CONCURRENCY", "nope")
+    assert batch.batch_concurrency() == batch.DEFAULT_CONCURRENCY
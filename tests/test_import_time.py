@@ -0,0 +1,66 @@
+"""Import-time budget for the orchestration entry point.
+
+``import epic_news.main`` runs on every CLI invocation, API worker start and flow test.
+Crews, DOCX assemblers and their tool packages are imported lazily; these tests keep
+it that way.
+"""
+
+import os
+import subprocess
+import sys
+
+# Module prefixes that must only be imported once a run actually needs them.
+DEFERRED_PREFIXES = (
+    "epic_news.crews.",
+    "epic_news.utils.docx_report.crews.",
+    "epic_news.services.menu_designer_service",
+    "composio",
+    "crewai_tools",
+    "crewai_custom_tools",
+    "weasyprint",
+    "mcp",
+)
+
+# Generous default: CrewAI alone takes several seconds on a cold CI runner.
+DEFAULT_BUDGET_SECONDS = 12.0
+
+
+def _importtime(module: str) -> dict[str, int]:
+    """Return {module: cumulative microseconds} as reported by ``-X importtime``."""
+    env = {**os.environ, "LITELLM_LOCAL_MODEL_COST_MAP": "True"}
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=True,
+    )
+    timings: dict[str, int] = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = (part.strip() for part in line.split("|"))
+        if cumulative.isdigit():
+            timings[name] = int(cumulative)
+    return timings
+
+
+def test_main_defers_crews_and_tool_packages():
+    timings = _importtime("epic_news.main")
+
+    eager = sorted(name for name in timings if name.startswith(DEFERRED_PREFIXES))
+    assert eager == []
+
+
+def test_main_import_within_budget():
+    budget = float(os.getenv("EPIC_IMPORT_BUDGET_SECONDS", DEFAULT_BUDGET_SECONDS))
+
+    cumulative = _importtime("epic_news.main")["epic_news.main"] / 1_000_000
+
+    assert cumulative <= budget, f"import epic_news.main took {cumulative:.2f}s (budget {budget}s)"
+
+
+def test_config_package_does_not_import_composio():
+    timings = _importtime("epic_news.config.ui_theme")
+
+    assert not any(name.startswith(("composio", "mcp")) for name in timings)
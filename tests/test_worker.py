@@ -0,0 +1,45 @@
+"""Tests for the warm fork-per-request worker."""
+
+import threading
+import time
+
+import pytest
+
+from epic_news import worker
+
+pytestmark = pytest.mark.skipif(not hasattr(worker.os, "fork"), reason="worker requires os.fork")
+
+
+def _wait_for(path, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not path.exists():
+        if time.monotonic() > deadline:
+            raise TimeoutError(path)
+        time.sleep(0.02)
+
+
+def test_worker_serves_request_in_forked_child(tmp_path):
+    sock = tmp_path / "w.sock"
+
+    def handler(request):
+        return {"status": "ok", "echo": request["user_request"], "run_id": request["run_id"]}
+
+    server = threading.Thread(
+        target=worker.serve,
+        kwargs={"path": str(sock), "handler": handler, "warm": False, "max_requests": 1},
+    )
+    server.start()
+    _wait_for(sock)
+
+    result = worker.submit_request("daily news", path=str(sock), run_id="r1")
+    server.join(timeout=10)
+
+    assert result == {"status": "ok", "echo": "daily news", "run_id": "r1"}
+    assert not sock.exists()
+
+
+def test_submit_without_request_prints_usage(monkeypatch, capsys):
+    monkeypatch.setattr(worker.sys, "argv", ["kickoff-submit"])
+
+    assert worker.submit() == 2
+    assert "usage" in capsys.readouterr().err
@@ -0,0 +1,135 @@
+"""Tests for bounded, background, compressed CrewAI state dumps."""
+
+import os
+import time
+
+import pytest
+from pydantic import BaseModel
+
+from epic_news.utils.diagnostics import dumping
+from epic_news.utils.diagnostics.dumping import (
+    DumpLimits,
+    dump_crewai_state,
+    load_crewai_state,
+    make_serializable,
+    prune_debug_dir,
+)
+from epic_news.utils.spans import get_background_writer
+
+
+class Report(BaseModel):
+    title: str
+    items: list[str]
+
+
+class Holder:
+    def __init__(self):
+        self.name = "holder"
+        self._client = object()
+        self.me = self
+
+
+@pytest.fixture
+def debug_on(monkeypatch):
+    monkeypatch.setenv("DEBUG_STATE", "true")
+    monkeypatch.setenv("EPIC_DEBUG_COMPRESSION", "gzip")
+
+
+def test_cycles_become_markers_and_private_attributes_are_skipped():
+    loop: dict = {"name": "root"}
+    loop["self"] = loop
+
+    assert make_serializable(loop) == {"name": "root", "self": "<cycle: dict>"}
+    assert make_serializable(Holder()) == {"name": "holder", "me": "<cycle: Holder>"}
+
+
+def test_shared_references_are_not_mistaken_for_cycles():
+    shared = {"x": 1}
+    assert make_serializable([shared, shared]) == [{"x": 1}, {"x": 1}]
+
+
+def test_limits_truncate_strings_lists_and_depth():
+    limits = DumpLimits(max_string=5, max_items=3, max_depth=3)
+    data = {"text": "abcdefgh", "items": [1, 2, 3, 4], "deep": {"a": {"b": {"c": 1}}}}
+
+    snapshot = make_serializable(data, limits)
+
+    assert snapshot["text"] == "abcde… [truncated 3 chars]"
+    assert snapshot["items"] == [1, 2, 3, "… 1 more items"]
+    assert snapshot["deep"]["a"]["b"] == "<dict, max depth reached>"
+
+
+def test_pydantic_models_use_the_json_dump_and_are_clipped():
+    report = Report(title="x" * 50, items=["a", "b", "c", "d"])
+
+    assert make_serializable(report) == report.model_dump(mode="json")
+    assert make_serializable(report, DumpLimits(max_string=10, max_items=2)) == {
+        "title": "xxxxxxxxxx… [truncated 40 chars]",
+        "items": ["a", "b", "… 2 more items"],
+    }
+
+
+def test_disabled_by_default(monkeypatch, tmp_path):
+    monkeypatch.delenv("DEBUG_STATE", raising=False)
+    assert dump_crewai_state({"a": 1}, "crew", debug_dir=str(tmp_path)) == ""
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_dump_is_written_in_the_background_compressed(debug_on, tmp_path, monkeypatch):
+    monkeypatch.setenv("EPIC_DEBUG_MAX_STRING", "4")
+    state = {"report": Report(title="long title", items=["one"]), "holder": Holder()}
+
+    path = dump_crewai_state(state, "Deep_Research", debug_dir=str(tmp_path))
+    assert get_background_writer().flush()
+
+    assert path.endswith(".json.gz")
+    assert load_crewai_state(path) == {
+        "report": {"title": "long… [truncated 6 chars]", "items": ["one"]},
+        "holder": {"name": "hold… [truncated 2 chars]", "me": "<cycle: Holder>"},
+    }
+
+
+def test_uncompressed_dumps_are_plain_json(debug_on, tmp_path, monkeypatch):
+    monkeypatch.setenv("EPIC_DEBUG_COMPRESSION", "none")
+
+    path = dump_crewai_state({"a": 1}, "crew", debug_dir=str(tmp_path))
+    get_background_writer().flush()
+
+    assert path.endswith(".json")
+    assert (tmp_path / os.path.basename(path)).read_text(encoding="utf-8") == '{"a": 1}'
+
+
+def test_zstd_is_preferred_when_available(monkeypatch):
+    monkeypatch.delenv("EPIC_DEBUG_COMPRESSION", raising=False)
+    monkeypatch.setattr(dumping, "ZSTD_AVAILABLE", False)
+    assert dumping._compression() == "gzip"
+    monkeypatch.setattr(dumping, "ZSTD_AVAILABLE", True)
+    assert dumping._compression() == "zstd"
+
+
+def test_prune_keeps_the_newest_dumps_within_count_age_and_size(tmp_path):
+    now = time.time()
+    for index in range(5):
+        dump = tmp_path / f"crewai_state_crew_{index}.json.gz"
+        dump.write_bytes(b"x" * 100)
+        os.utime(dump, (now - index * 60, now - index * 60))
+    stale = tmp_path / "crewai_state_old_0.json.gz"
+    stale.write_bytes(b"x")
+    os.utime(stale, (now - 10 * 86400, now - 10 * 86400))
+    unrelated = tmp_path / "failed_json_report.json"
+    unrelated.write_text("{}")
+
+    removed = prune_debug_dir(tmp_path, max_files=3, max_age_days=7, max_bytes=10_000)
+    assert {p.name for p in removed} == {
+        "crewai_state_crew_3.json.gz",
+        "crewai_state_crew_4.json.gz",
+        stale.name,
+    }
+
+    prune_debug_dir(tmp_path, max_files=10, max_age_days=7, max_bytes=250)
+    remaining = sorted(p.name for p in tmp_path.iterdir())
+    assert remaining == [
+        "crewai_state_crew_0.json.gz",
+        "crewai_state_crew_1.json.gz",
+        "failed_json_report.json",
+    ]
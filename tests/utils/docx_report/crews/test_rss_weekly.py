@@ -1,9 +1,7 @@
 import json
 import zipfile
-from unittest.mock import patch
 
 from epic_news.models.crews.rss_weekly_report import ArticleSummary, FeedDigest, RssWeeklyReport
-from epic_news.utils import report_utils
 from epic_news.utils.docx_report.crews.rss_weekly import assemble_rss_docx
 from epic_news.utils.report_utils import load_rss_weekly_report
 
@@ -88,31 +86,26 @@ def test_load_rss_weekly_report_both_shapes(tmp_path):
     direct_model = load_rss_weekly_report(str(direct_path))
     assert direct_model.title == "Veille-Directe"
 
-    # RssFeeds shape: transformed via _transform_rss_feeds_to_report.
-    #
-    # A bare {"rss_feeds": [...]} would NOT exercise the transform fallback:
-    # RssWeeklyReport has no required fields and Pydantic v2 extra="ignore" silently
-    # drops the unknown "rss_feeds" key, so it validates directly as an (empty)
-    # RssWeeklyReport and never reaches RssFeeds/_transform_rss_feeds_to_report. The
-    # invalid "feeds" type below makes RssWeeklyReport.model_validate raise, which
-    # forces the RssFeeds + transform fallback path to actually run.
+    # RssFeeds shape, as fetched: recognised by its key, not by failing the first shape
+    # (a bare {"rss_feeds": [...]} used to validate as an empty RssWeeklyReport).
     feeds_path = tmp_path / "feeds.json"
     feeds_path.write_text(
         json.dumps(
             {
-                "feeds": "not-a-list",
-                "rss_feeds": [{"feed_url": "u", "articles": []}],
+                "rss_feeds": [
+                    {
+                        "feed_url": "u",
+                        "articles": [{"title": "T", "link": "l", "published": "p", "content": "c"}],
+                    }
+                ]
             }
         ),
         encoding="utf-8",
     )
-    with patch(
-        "epic_news.utils.report_utils._transform_rss_feeds_to_report",
-        wraps=report_utils._transform_rss_feeds_to_report,
-    ) as spy_transform:
-        transformed_model = load_rss_weekly_report(str(feeds_path))
-    spy_transform.assert_called_once()
+    transformed_model = load_rss_weekly_report(str(feeds_path))
     assert isinstance(transformed_model, RssWeeklyReport)
+    assert transformed_model.total_articles == 1
+    assert transformed_model.feeds[0].articles[0].summary == "c"
 
 
 def test_assemble_rss_docx_feed_name_none_uses_feed_url(tmp_path):
@@ -0,0 +1,148 @@
+"""Visual diff: the native DOCX writer against Pandoc, on all 14 crew assemblers.
+
+Each assembler runs once per backend on the same synthetic model and stub narration.
+Both documents are reduced to what a reader sees, in order: block kind (title, heading
+level, list level, table, paragraph), its text and its bold spans. Style names may
+differ (a missing ``reference.docx`` means different templates); what they show may not.
+"""
+
+import importlib
+import zipfile
+
+import pytest
+from docx import Document
+from docx.oxml.ns import qn
+
+from epic_news.utils.docx_report import build_docx
+from tests.performance._reports import OSINT_SECTIONS, report
+
+
+def _pandoc_available() -> bool:
+    try:
+        import pypandoc
+
+        pypandoc.get_pandoc_version()
+    except (ImportError, OSError):
+        return False
+    return True
+
+
+pytestmark = pytest.mark.skipif(not _pandoc_available(), reason="pandoc is not installed")
+
+# (assembler module, function, renderer type of its model)
+ASSEMBLERS = [
+    ("book_summary", "assemble_book_summary_docx", "BOOK_SUMMARY"),
+    ("company_news", "assemble_company_news_docx", "COMPANY_NEWS"),
+    ("cooking", "assemble_cooking_docx", "COOKING"),
+    ("deep_research", "assemble_deep_research_docx", "DEEPRESEARCH"),
+    ("fin_daily", "assemble_fin_daily_docx", "FINDAILY"),
+    ("meeting_prep", "assemble_meeting_prep_docx", "MEETING_PREP"),
+    ("menu", "assemble_menu_docx", "MENU"),
+    ("news_daily", "assemble_news_daily_docx", "NEWSDAILY"),
+    ("osint", "assemble_osint_docx", None),
+    ("pestel", "assemble_pestel_docx", "PESTEL"),
+    ("rss_weekly", "assemble_rss_docx", "RSS_WEEKLY"),
+    ("saint", "assemble_saint_docx", "SAINT"),
+    ("sales_prospecting", "assemble_sales_prospecting_docx", "SALES_PROSPECTING"),
+    ("shopping", "assemble_shopping_docx", "SHOPPING"),
+]
+
+NARRATION = """Une **synthèse** avec *emphase*, du `code` et un [lien](https://example.com/a).
+L'analyse -- "prudente" -- continue...
+
+## Points clés
+
+- Premier point **important**
+- Second point
+  - Détail imbriqué
+
+1. Étape un
+2. Étape deux
+
+> Une citation.
+
+| Indicateur | Valeur |
+|---|---|
+| Croissance | 3.2 % |
+
+---
+
+Fin de section."""
+
+
+class _StubLLM:
+    model = "stub/model"
+
+    def call(self, messages):
+        return NARRATION
+
+
+def _blocks(path: str) -> list[tuple]:
+    doc = Document(path)
+    blocks: list[tuple] = []
+    for child in doc.element.body.iterchildren():
+        if child.tag == qn("w:tbl"):
+            table = next(t for t in doc.tables if t._tbl is child)
+            blocks.append(("table", tuple(tuple(c.text for c in row.cells) for row in table.rows)))
+            continue
+        if child.tag != qn("w:p"):
+            continue  # the TOC <w:sdt>, section properties
+        p = next(p for p in doc.paragraphs if p._p is child)
+        if not p.text.strip():
+            continue  # thematic breaks
+        style = p.style.name
+        num_pr = child.pPr.numPr if child.pPr is not None else None
+        if style == "Title":
+            kind = "title"
+        elif style in {"Author", "Date", "Subtitle"}:
+            kind = "meta"
+        elif style.startswith("Heading"):
+            kind = style
+        elif num_pr is not None:
+            kind = f"list-{num_pr.ilvl.val if num_pr.ilvl is not None else 0}"
+        else:
+            kind = "paragraph"
+        bold = tuple(r.text for r in p.runs if r.bold and r.text.strip())
+        blocks.append((kind, p.text.strip(), bold))
+    return blocks
+
+
+def _has_toc(path: str) -> bool:
+    with zipfile.ZipFile(path) as z:
+        return "TOC \\o" in z.read("word/document.xml").decode("utf-8")
+
+
+def _run(module: str, func: str, crew_type: str | None, output_path: str, tmp_path) -> str:
+    assemble = getattr(importlib.import_module(f"epic_news.utils.docx_report.crews.{module}"), func)
+    inputs = {"current_date": "2026-07-13", "topic": "Synthetic"}
+    if crew_type is None:
+        osint_dir = tmp_path / "osint"
+        if not osint_dir.exists():
+            osint_dir.mkdir()
+            for name, section in OSINT_SECTIONS.items():
+                filename = "global_report.json" if name == "cross_reference" else f"{name}.json"
+                (osint_dir / filename).write_text(report(section, 5).model_dump_json(), encoding="utf-8")
+        return assemble(inputs, output_path, _StubLLM(), osint_dir=str(osint_dir))
+    return assemble(report(crew_type, 5), inputs, output_path, _StubLLM())
+
+
+@pytest.mark.parametrize(("module", "func", "crew_type"), ASSEMBLERS, ids=[a[0] for a in ASSEMBLERS])
+def test_native_matches_pandoc(monkeypatch, tmp_path, module, func, crew_type):
+    outputs = {}
+    for backend in ("pandoc", "native"):
+        monkeypatch.setenv("EPIC_DOCX_BACKEND", backend)
+        outputs[backend] = _run(module, func, crew_type, str(tmp_path / f"{backend}.docx"), tmp_path)
+
+    assert _has_toc(outputs["pandoc"]) and _has_toc(outputs["native"])
+    assert _blocks(outputs["native"]) == _blocks(outputs["pandoc"])
+
+
+def test_native_failure_falls_back_to_pandoc(monkeypatch, tmp_path):
+    from epic_news.utils.docx_report import native_writer
+
+    def boom(*args, **kwargs):
+        raise ValueError("unsupported construct")
+
+    monkeypatch.setattr(native_writer, "write_docx", boom)
+    out = build_docx([("Intro", "Texte.")], {"title": "T"}, str(tmp_path / "r.docx"))
+    assert ("Heading 1", "Intro", ()) in _blocks(out)
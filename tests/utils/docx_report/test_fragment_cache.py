@@ -0,0 +1,101 @@
+import os
+import time
+
+import pytest
+
+from epic_news.utils.docx_report import FragmentCache, Section, assemble_fragments, generate_fragment
+from epic_news.utils.docx_report.fragment_cache import disable_fragment_cache
+from epic_news.utils.docx_report.fragments import placeholder_for
+
+
+class _CountingLLM:
+    model = "stub/model"
+
+    def __init__(self, reply="## Narrated\n\nprose"):
+        self.reply = reply
+        self.calls = 0
+
+    def call(self, messages):
+        self.calls += 1
+        return self.reply
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv("EPIC_FRAGMENT_CACHE", "true")
+    monkeypatch.setenv("EPIC_FRAGMENT_CACHE_DIR", str(tmp_path / "fragments"))
+    yield tmp_path / "fragments"
+    disable_fragment_cache(False)
+
+
+def test_unchanged_section_is_served_from_cache(cache_dir):
+    llm = _CountingLLM()
+    first = generate_fragment("Intro", "Présente.", "ctx", llm, "persona")
+    second = generate_fragment("Intro", "Présente.", "ctx", llm, "persona")
+    assert first == second == "## Narrated\n\nprose"
+    assert llm.calls == 1
+
+
+@pytest.mark.parametrize(
+    "changed",
+    [
+        {"heading": "Autre"},
+        {"instruction": "Résume."},
+        {"context": "ctx2"},
+        {"system": "autre persona"},
+    ],
+)
+def test_any_changed_input_misses(cache_dir, changed):
+    llm = _CountingLLM()
+    args = {"heading": "Intro", "instruction": "Présente.", "context": "ctx", "system": "persona"}
+    generate_fragment(llm=llm, **args)
+    generate_fragment(llm=llm, **{**args, **changed})
+    assert llm.calls == 2
+
+
+def test_model_is_part_of_the_key(cache_dir):
+    llm, other = _CountingLLM(), _CountingLLM()
+    other.model = "stub/other"
+    generate_fragment("Intro", "i", "c", llm, "s")
+    generate_fragment("Intro", "i", "c", other, "s")
+    assert other.calls == 1
+
+
+def test_placeholder_is_never_cached(cache_dir):
+    empty = _CountingLLM(reply="")
+    assert generate_fragment("Intro", "i", "c", empty, "s") == placeholder_for("Intro")
+    llm = _CountingLLM()
+    assert generate_fragment("Intro", "i", "c", llm, "s") == "## Narrated\n\nprose"
+    assert llm.calls == 1
+
+
+def test_disable_flag_bypasses_cache(cache_dir):
+    llm = _CountingLLM()
+    disable_fragment_cache()
+    generate_fragment("Intro", "i", "c", llm, "s")
+    generate_fragment("Intro", "i", "c", llm, "s")
+    assert llm.calls == 2
+    assert not cache_dir.exists()
+
+
+def test_reassembly_only_narrates_changed_sections(cache_dir, tmp_path):
+    llm = _CountingLLM()
+    meta = {"title": "T", "author": "Epic News", "date": ""}
+    sections = [Section("A", instruction="i", context="a"), Section("B", instruction="i", context="b")]
+    assemble_fragments(sections, meta, str(tmp_path / "1.docx"), llm, system="s")
+    sections[1] = Section("B", instruction="i", context="b, revised")
+    assemble_fragments(sections, meta, str(tmp_path / "2.docx"), llm, system="s")
+    assert llm.calls == 3
+
+
+def test_prune_evicts_least_recently_used_and_stale(tmp_path):
+    cache = FragmentCache(tmp_path)
+    keys = [FragmentCache.key("p", str(i), "i", "c", "m") for i in range(4)]
+    now = time.time()
+    for age, key in enumerate(keys):
+        cache.put(key, f"fragment {key}")
+        path = tmp_path / key[:2] / f"{key}.md"
+        os.utime(path, (now - age * 3600, now - age * 3600))
+    # The oldest is past the age limit; of the rest, only the two most recent fit.
+    assert cache.prune(max_entries=2, max_age_days=2.5 / 24) == 2
+    assert [cache.get(k) is not None for k in keys] == [True, True, False, False]
@@ -68,3 +68,31 @@ def test_assemble_caps_itinerary_days(tmp_path: Path):
         if p.style is not None and p.style.name == "Heading 1" and "Itinéraire — Jour" in p.text
     ]
     assert 0 < len(day_headings) <= MAX_ITINERARY_DAYS
+
+
+class RecordingStubLLM(ManyDaysStubLLM):
+    def __init__(self, num_days: int):
+        super().__init__(num_days)
+        self.prompts: list[str] = []
+
+    def call(self, messages):
+        self.prompts.append(messages[-1]["content"])
+        return super().call(messages)
+
+
+def test_day_fragments_get_only_their_slice_of_the_research(tmp_path: Path):
+    itinerary = "\n\n".join(f"## Jour {i}\n\nActivités détaillées du jour numéro {i}." for i in (1, 2, 3))
+    outs = ["destination research", "accommodation+dining", itinerary, "budget"]
+    llm = RecordingStubLLM(3)
+
+    assemble_holiday_docx(
+        SimpleNamespace(tasks_output=[SimpleNamespace(raw=o) for o in outs]),
+        _inputs(),
+        str(tmp_path / "guide.docx"),
+        llm=llm,
+    )
+
+    day_prompts = [p for p in llm.prompts if "Recherche pour ce jour" in p]
+    assert len(day_prompts) == 3
+    assert "jour numéro 1" in day_prompts[0] and "jour numéro 2" not in day_prompts[0]
+    assert "jour numéro 3" in day_prompts[2] and "jour numéro 1" not in day_prompts[2]
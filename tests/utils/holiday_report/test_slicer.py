@@ -0,0 +1,94 @@
+from epic_news.models.holiday_report import ItineraryDay
+from epic_news.utils.holiday_report.slicer import (
+    SliceStats,
+    slice_itinerary,
+    split_lodging_dining,
+    trip_outline,
+)
+
+RESEARCH = """# Itinéraire en Provence
+
+Conseils généraux: louer une voiture, éviter les autoroutes le samedi.
+
+## Jour 1 — Avignon
+
+Visite du Palais des Papes et du pont Saint-Bénézet.
+
+Soirée sur la place de l'Horloge.
+
+## Jour 2 — Gordes
+
+Village perché, abbaye de Sénanque et champs de lavande.
+
+## Jour 3 — Arles
+
+Arènes romaines et fondation Luma. Marché du samedi matin.
+
+Les Baux-de-Provence et les Carrières de Lumières sont à 20 minutes d'Arles."""
+
+DAYS = [
+    ItineraryDay(date="12/07", label="Avignon", stops=["Palais des Papes"]),
+    ItineraryDay(date="13/07", label="Gordes", stops=["Sénanque"]),
+    ItineraryDay(date="14/07", label="Arles", stops=["Arènes", "Baux-de-Provence"]),
+]
+
+
+def test_each_day_gets_its_own_block():
+    slices = slice_itinerary(RESEARCH, DAYS)
+
+    assert "Palais des Papes" in slices[0]
+    assert "place de l'Horloge" in slices[0]
+    assert "Sénanque" not in slices[0]
+    assert "Sénanque" in slices[1]
+    assert "Arènes romaines" in slices[2]
+    assert "Carrières de Lumières" in slices[2]
+    assert all(len(s) < len(RESEARCH) for s in slices)
+
+
+def test_lexical_match_without_day_markers():
+    research = "Le Palais des Papes ouvre à 9h.\n\nL'abbaye de Sénanque se visite le matin."
+    slices = slice_itinerary(research, DAYS[:2])
+    assert slices == ["Le Palais des Papes ouvre à 9h.", "L'abbaye de Sénanque se visite le matin."]
+
+
+def test_day_budget_caps_the_slice():
+    research = "\n\n".join(f"## Jour 1 — Avignon, paragraphe {i}. " + "mot " * 100 for i in range(20))
+    slices = slice_itinerary(research, DAYS, budget_tokens=300)
+    assert len(slices[0]) <= 300 * 4 + 200
+
+
+def test_unmatched_day_falls_back_to_the_head_of_the_research():
+    research = "Conseils généraux pour le voyage."
+    slices = slice_itinerary(research + "\n\nAvignon le soir.", [DAYS[0], ItineraryDay(label="Zzz")])
+    assert slices[1].startswith("Conseils généraux")
+
+
+def test_single_day_keeps_the_full_research():
+    assert slice_itinerary(RESEARCH, DAYS[:1]) == [RESEARCH]
+
+
+def test_outline_lists_every_day():
+    assert trip_outline(DAYS).splitlines()[2] == "J3 (14/07): Arles — Arènes, Baux-de-Provence"
+
+
+def test_lodging_and_dining_are_split_by_heading_and_keyword():
+    text = (
+        "## Hébergements\n\nMas des Oliviers, chambres dès 120 CHF, petit-déjeuner inclus.\n\n"
+        "## Restaurants\n\nLa Mirande, cuisine provençale.\n\n"
+        "Conseil: réserver en juillet."
+    )
+    lodging, dining = split_lodging_dining(text)
+
+    assert "Mas des Oliviers" in lodging and "Mas des Oliviers" not in dining
+    assert "La Mirande" in dining and "La Mirande" not in lodging
+
+
+def test_untagged_paragraphs_go_to_both_sections():
+    lodging, dining = split_lodging_dining("Réserver tôt en été.")
+    assert lodging == dining == "Réserver tôt en été."
+
+
+def test_slice_stats_report_saved_tokens():
+    stats = SliceStats()
+    stats.add("Jour 1", "x" * 4000, "x" * 400)
+    assert stats.saved_tokens == 900
@@ -230,8 +230,7 @@ def test_osint_global_full_data_renders_all_sections():
         assert f'id="{section_id}"' in html
 
     # Table of contents links to every section, including "geospatial" (whose
-    # data lives under the "geospatial_analysis" key -- see
-    # _add_table_of_contents' data_key_overrides mapping).
+    # data lives under the "geospatial_analysis" key -- see SUB_REPORTS).
     for section_id in _SECTION_IDS.values():
         assert f'href="#{section_id}"' in html
     assert 'href="#executive-summary"' in html
@@ -341,3 +340,22 @@ def test_osint_global_sub_renderer_exception_is_caught_and_reported():
     assert "Erreur lors du rendu de la section Profil de l'Entreprise" in html
     # The raw (invalid) payload is still dumped for debugging purposes
     assert "not-a-dict-payload" in html
+
+
+def test_osint_global_reuses_rendered_sub_report_bodies(monkeypatch):
+    """Bodies passed in ``rendered_sections`` are embedded as-is; their renderer never runs."""
+    from epic_news.utils.html.template_renderers import osint_global_renderer
+    from epic_news.utils.html.template_renderers.renderer_factory import RendererFactory
+
+    def _fail(*_args, **_kwargs):
+        raise AssertionError("sub-report rendered twice")
+
+    monkeypatch.setattr(osint_global_renderer.TechStackRenderer, "render", _fail)
+    data = _full_osint_dict("Reuse Corp")
+    body = RendererFactory.create_renderer(CREW_IDENTIFIER).render(
+        data, rendered_sections={"tech_stack": '<div><p class="reused">TECH-BODY</p></div>'}
+    )
+
+    assert '<p class="reused">TECH-BODY</p>' in body
+    assert "Erreur lors du rendu" not in body
+    assert "7 sur 7" in body
@@ -0,0 +1,128 @@
+import pytest
+import soupsieve
+from bs4 import BeautifulSoup
+
+from epic_news.utils.html import report_css
+from epic_news.utils.html.report_css import (
+    HtmlMinifier,
+    minify_css,
+    minify_html,
+    prepare_email_html,
+    shake_css,
+    used_selectors,
+)
+from epic_news.utils.html.report_writer import write_report_html
+from epic_news.utils.html.template_manager import TemplateManager, _load_static_css
+from tests.performance._reports import REPORT_MODELS, report_data
+
+CSS = """
+/* comment */
+:root { --accent: #007bff; }
+body { margin: 0; }
+h1, h2, .missing { color: red; }
+.card:hover::before { content: "a  b"; }
+a[href^="http:"] { color: blue; }
+#toc li { list-style: none; }
+.unused .card { color: green; }
+@media (min-width: 768px) {
+  .card { width: 50%; }
+  .unused { width: 10%; }
+}
+@media print { .unused { display: none; } }
+@keyframes fade { from { opacity: 0; } to { opacity: 1; } }
+"""
+
+PAGE = '<html><body><h1 class="card">T</h1><ul id="toc"><li><a href="x">l</a></li></ul></body></html>'
+
+
+def test_shake_keeps_only_rules_that_can_match():
+    css = shake_css(CSS, used_selectors(PAGE))
+    assert ":root{--accent:#007bff}" in css
+    assert "body{margin:0}" in css
+    assert "h1{color:red}" in css  # h2 and .missing dropped from the group
+    assert '.card:hover::before{content:"a  b"}' in css
+    assert 'a[href^="http:"]{color:blue}' in css
+    assert "#toc li{list-style:none}" in css
+    assert "@media (min-width:768px){.card{width:50%}}" in css
+    assert "@keyframes fade" in css
+    assert "unused" not in css and "print" not in css
+
+
+def test_minify_css_leaves_strings_alone():
+    assert minify_css('a::after { content: "x ; y"; /* c */ }') == 'a::after{content:"x ; y"}'
+
+
+def test_minify_html_keeps_preformatted_text():
+    html = (
+        '<div>\n   a   b\n</div><pre>\n  x  \n</pre><p class="menu-content">1\n  2</p>'
+        '<span style="white-space: pre">p  q</span><p>c\xa0 d</p><!-- note -->'
+    )
+    out = minify_html(html, ".menu-content { white-space: pre-wrap; }")
+    assert out == (
+        '<div>\na b\n</div><pre>\n  x  \n</pre><p class="menu-content">1\n  2</p>'
+        '<span style="white-space: pre">p  q</span><p>c\xa0 d</p>'
+    )
+
+
+def test_minifier_fed_in_pieces_matches_minify_html():
+    html = (
+        '<div>\n   a   b  </div><pre>\n  x  \n\n  y</pre>  <!-- note -->  <p class="menu-content">1\n  2</p>'
+        "<script>if (a < b) {  x(); }</script>  <textarea>  t  </textarea><!--[if mso]>m<![endif]--><p>c  d</p>"
+    )
+    css = ".menu-content { white-space: pre-wrap; }"
+    expected = minify_html(html, css)
+    for cut in range(len(html) + 1):
+        for second in (cut, min(cut + 7, len(html))):
+            minifier = HtmlMinifier(css)
+            pieces = (html[:cut], html[cut:second], html[second:])
+            assert "".join(minifier.feed(piece) for piece in pieces) + minifier.close() == expected, cut
+
+
+@pytest.mark.parametrize("crew_type", sorted(REPORT_MODELS))
+def test_shaken_report_keeps_every_rule_that_matches(monkeypatch, crew_type):
+    data = report_data(crew_type, 3)
+    monkeypatch.setenv("EPIC_REPORT_CSS", "full")
+    full = TemplateManager().render_report(crew_type, data)
+    monkeypatch.setenv("EPIC_REPORT_CSS", "shaken")
+    shaken = TemplateManager().render_report(crew_type, data)
+
+    assert len(shaken) < len(full) / 2
+    soup = BeautifulSoup(full, "html.parser")
+    kept = BeautifulSoup(shaken, "html.parser").find("style", id="theme-styles").string
+    for node in report_css._parse(_load_static_css()):
+        if not isinstance(node, report_css._Rule):
+            continue
+        for selector in node.selectors:
+            bare = report_css._PSEUDO.sub("", selector.text) or "*"
+            try:
+                matched = soup.select_one(bare) is not None
+            except soupsieve.SelectorSyntaxError:
+                continue
+            if matched:
+                assert selector.text in kept, selector.text
+
+
+def test_full_mode_inlines_the_stylesheet_as_written(monkeypatch):
+    monkeypatch.setenv("EPIC_REPORT_CSS", "full")
+    html = TemplateManager().render_report("POEM", report_data("POEM", 1))
+    assert _load_static_css() in html
+
+
+def test_shared_mode_links_one_sheet_and_email_inlines_it(monkeypatch, tmp_path):
+    monkeypatch.setenv("EPIC_REPORT_CSS", "shared")
+    monkeypatch.setenv("EPIC_SHARED_CSS_DIR", str(tmp_path / "assets"))
+    manager = TemplateManager()
+    for name in ("a", "b"):
+        html = manager.render_report("POEM", report_data("POEM", 1))
+        write_report_html(html, tmp_path / "osint" / f"{name}.html")
+
+    sheets = list((tmp_path / "assets").glob("report-*.css"))
+    assert len(sheets) == 1
+    written = (tmp_path / "osint" / "a.html").read_text(encoding="utf-8")
+    assert f'href="../assets/{sheets[0].name}"' in written
+    assert "<style" not in written
+
+    email = prepare_email_html(written, tmp_path / "osint")
+    assert "<link" not in email
+    assert '<style id="theme-styles">:root{' in email
+    assert len(email) < len(sheets[0].read_text(encoding="utf-8"))
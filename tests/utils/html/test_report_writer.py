@@ -0,0 +1,87 @@
+import gzip
+import re
+
+import pytest
+
+from epic_news.utils.html import report_writer
+from epic_news.utils.html.report_writer import (
+    atomic_output,
+    stream_report_html,
+    write_report_html,
+    write_report_stream,
+)
+from epic_news.utils.html.template_manager import TemplateManager
+from epic_news.utils.html.template_renderers.renderer_factory import RendererFactory
+from tests.performance._reports import report_data
+
+_DATE = re.compile(r"\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}")
+
+
+@pytest.mark.parametrize("crew_type", ["RSS_WEEKLY", "DEEPRESEARCH", "POEM"])
+def test_render_chunks_join_to_render(crew_type):
+    renderer = RendererFactory.create_renderer(crew_type)
+    data = report_data(crew_type, 20)
+    chunks = list(renderer.render_chunks(data))
+    assert "".join(chunks) == renderer.render(data)
+    if crew_type != "POEM":
+        assert len(chunks) > 10
+
+
+@pytest.mark.parametrize("mode", ["shaken", "full", "shared"])
+@pytest.mark.parametrize("crew_type", ["RSS_WEEKLY", "DEEPRESEARCH"])
+def test_streamed_report_matches_in_memory_render(monkeypatch, tmp_path, mode, crew_type):
+    monkeypatch.setenv("EPIC_REPORT_CSS", mode)
+    monkeypatch.setenv("EPIC_SHARED_CSS_DIR", str(tmp_path / "assets"))
+    data = report_data(crew_type, 20)
+    expected = write_report_html(TemplateManager().render_report(crew_type, data), tmp_path / "memory.html")
+    streamed = stream_report_html(crew_type, data, tmp_path / "streamed.html")
+
+    def read(path):
+        return _DATE.sub("DATE", path.read_text(encoding="utf-8"))
+
+    assert read(streamed) == read(expected)
+    assert not [p.name for p in tmp_path.iterdir() if p.name.startswith(".")]  # no temporary files left
+
+
+@pytest.mark.parametrize("mode", ["shaken", "shared"])
+def test_preformatted_text_split_across_body_pieces_keeps_its_whitespace(monkeypatch, tmp_path, mode):
+    monkeypatch.setenv("EPIC_REPORT_CSS", mode)
+    monkeypatch.setenv("EPIC_SHARED_CSS_DIR", str(tmp_path / "assets"))
+    monkeypatch.setattr(report_writer, "_BATCH", 1)  # every piece is written on its own
+    head = '<html><head><style id="theme-styles">pre { color: red; }  p { margin: 0; }</style></head><body>'
+    body = ["<p>a   b</p><pre>", "def f():\n", "    return  1\n", "</pre>", "<p>c   d</p>"]
+
+    streamed = write_report_stream(head, body, "</body></html>", tmp_path / "report.html").read_text()
+
+    assert "<pre>def f():\n    return  1\n</pre>" in streamed
+    assert "<p>a b</p>" in streamed and "<p>c d</p>" in streamed
+
+
+def test_failed_write_keeps_the_previous_report(tmp_path):
+    target = tmp_path / "report.html"
+    target.write_text("previous", encoding="utf-8")
+
+    def body():
+        yield "<p>partial</p>"
+        raise RuntimeError("renderer crashed")
+
+    with pytest.raises(RuntimeError):
+        write_report_stream("<html><body>", body(), "</body></html>", target)
+    assert target.read_text(encoding="utf-8") == "previous"
+    assert [p.name for p in tmp_path.iterdir()] == ["report.html"]
+
+
+def test_gzip_copy_is_written_from_the_same_stream(monkeypatch, tmp_path):
+    monkeypatch.setenv("EPIC_REPORT_GZIP", "true")
+    out = stream_report_html("RSS_WEEKLY", report_data("RSS_WEEKLY", 20), tmp_path / "rss.html")
+    packed = tmp_path / "rss.html.gz"
+    assert gzip.decompress(packed.read_bytes()).decode("utf-8") == out.read_text(encoding="utf-8")
+    assert packed.stat().st_size < out.stat().st_size / 2
+
+
+def test_atomic_output_replaces_only_on_success(tmp_path):
+    target = tmp_path / "a.txt"
+    with atomic_output(target) as write:
+        write("one")
+        assert not target.exists()
+    assert target.read_text(encoding="utf-8") == "one"
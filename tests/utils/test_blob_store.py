@@ -0,0 +1,157 @@
+"""Tests for the content-addressed blob store that keeps large crew outputs out of the state."""
+
+import os
+import time
+
+import pytest
+from crewai.crews.crew_output import CrewOutput
+from crewai.tasks.task_output import TaskOutput
+from pydantic import BaseModel
+
+from epic_news.models.content_state import ContentState
+from epic_news.models.crews.deep_research import DeepResearchReport
+from epic_news.utils.blob_store import BlobRef, BlobStore, prune_runs, resolve, spill
+from epic_news.utils.progress import run_scope
+
+
+class Finding(BaseModel):
+    title: str
+    body: str
+
+
+def _big(n: int = 200) -> Finding:
+    return Finding(title="Acme", body="Revenue grew 12% in 2025. " * n)
+
+
+@pytest.fixture(autouse=True)
+def blob_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv("EPIC_BLOB_DIR", str(tmp_path / "runs"))
+    monkeypatch.setenv("EPIC_BLOB_SPILL_BYTES", "1024")
+    return tmp_path / "runs"
+
+
+def test_put_is_content_addressed_and_deduplicated(tmp_path):
+    store = BlobStore(tmp_path / "blobs")
+
+    first = store.put(b"same bytes")
+    second = store.put(b"same bytes")
+
+    assert first == second
+    assert store.get(first) == b"same bytes"
+    assert len(list((tmp_path / "blobs").rglob("*.json.gz"))) == 1
+
+
+def test_small_values_and_non_models_stay_in_memory():
+    small = Finding(title="t", body="b")
+    assert spill(small) is small
+    assert spill("x" * 10_000) == "x" * 10_000
+
+
+def test_large_model_round_trips_through_its_handle(blob_dir):
+    with run_scope("run123"):
+        ref = spill(_big())
+
+    assert isinstance(ref, BlobRef)
+    assert ref.root == str(blob_dir / "run123" / "blobs")
+    assert ref.load() == _big()
+    assert resolve(ref) == _big()
+
+
+def test_crew_output_keeps_its_pydantic_payloads():
+    task = TaskOutput(description="d", raw="r", agent="analyst", pydantic=_big())
+    output = CrewOutput(raw="r" * 2000, pydantic=_big(), json_dict={"a": 1}, tasks_output=[task])
+
+    loaded = spill(output).load()
+
+    assert isinstance(loaded, CrewOutput)
+    assert loaded.pydantic == _big()
+    assert loaded.tasks_output[0].pydantic == _big()
+    assert loaded.raw == output.raw
+
+
+def test_threshold_zero_disables_spilling(monkeypatch):
+    monkeypatch.setenv("EPIC_BLOB_SPILL_BYTES", "0")
+    value = _big()
+    assert spill(value) is value
+
+
+def test_store_failure_keeps_the_value(monkeypatch):
+    def fail(self, data):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(BlobStore, "put", fail)
+    value = _big()
+    assert spill(value) is value
+
+
+def test_state_assignment_spills_report_fields():
+    state = ContentState(user_request="x")
+
+    state.osint_report = _big()
+    state.final_report = "y" * 5000  # not a report field: strings stay inline
+
+    assert isinstance(state.osint_report, BlobRef)
+    assert resolve(state.osint_report) == _big()
+    assert state.final_report == "y" * 5000
+    assert len(state.model_dump_json()) < 5000 + 2048
+    assert state.model_copy().osint_report == state.osint_report
+
+
+def _research_report() -> DeepResearchReport:
+    return DeepResearchReport(
+        title="Acme",
+        executive_summary="Revenue grew 12% in 2025. " * 100,
+        methodology="desk research",
+        research_sections=[{"title": "Market", "content": "Steady growth. " * 50}],
+        conclusions="Solid.",
+    )
+
+
+def test_spilled_fields_survive_a_dump_and_validate_round_trip():
+    report = _research_report()
+    state = ContentState(user_request="x")
+    state.deep_research_report = report
+    ref = state.deep_research_report
+    assert isinstance(ref, BlobRef)
+
+    dumped = state.model_dump()
+    assert dumped["deep_research_report"] == ref.model_dump()
+    assert state.to_crew_inputs()["deep_research_report"]["digest"] == ref.digest
+
+    restored = ContentState.model_validate(dumped)
+    assert restored.deep_research_report == ref
+    assert ContentState.model_validate_json(state.model_dump_json()).deep_research_report == ref
+    assert restored.report("deep_research_report") == report
+
+
+def test_inline_report_fields_still_validate_as_models():
+    restored = ContentState.model_validate({"user_request": "x", "osint_report": None})
+    assert restored.report("osint_report") is None
+
+    report = _research_report()
+    state = ContentState.model_validate({"user_request": "x", "deep_research_report": report.model_dump()})
+    assert isinstance(state.deep_research_report, DeepResearchReport)
+    assert state.report("deep_research_report") == report
+
+
+def test_prune_runs_removes_only_stale_run_stores(blob_dir):
+    for run in ("old", "fresh"):
+        with run_scope(run):
+            spill(_big())
+    week_ago = time.time() - 8 * 86400
+    for path in [blob_dir / "old", *(blob_dir / "old").rglob("*")]:
+        os.utime(path, (week_ago, week_ago))
+
+    assert prune_runs(max_age_days=7) == 1
+    assert not (blob_dir / "old").exists()
+    assert list((blob_dir / "fresh" / "blobs").rglob("*.json.gz"))
+
+
+def test_untyped_report_fields_keep_their_handle_too():
+    state = ContentState(user_request="x")
+    state.post_report = _big()
+    assert isinstance(state.post_report, BlobRef)
+
+    restored = ContentState.model_validate(state.model_dump())
+    assert restored.post_report == state.post_report
+    assert ContentState.model_validate({"user_request": "x", "post_report": {"a": 1}}).post_report == {"a": 1}
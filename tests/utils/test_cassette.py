@@ -0,0 +1,276 @@
+"""Tests for LLM/tool record-and-replay cassettes (no network)."""
+
+import asyncio
+import json
+import socket
+import sys
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+from pydantic import BaseModel
+
+from epic_news.config.llm_config import _wrap_call_for_react_safety
+from epic_news.utils import cassette as cassette_mod
+from epic_news.utils.cassette import (
+    Cassette,
+    CassetteMissError,
+    ReplayedError,
+    get_cassette,
+    reset_cassette,
+    wrap_tool,
+)
+
+_LIVE_CONNECT = socket.socket.connect
+
+
+class Verdict(BaseModel):
+    label: str
+    score: float
+
+
+@pytest.fixture
+def cassette_env(tmp_path, monkeypatch):
+    def use(mode, latency="0"):
+        monkeypatch.setenv("EPIC_CASSETTE_MODE", mode)
+        monkeypatch.setenv("EPIC_CASSETTE_DIR", str(tmp_path))
+        monkeypatch.setenv("EPIC_CASSETTE_LATENCY", latency)
+        reset_cassette()
+        return get_cassette()
+
+    yield use
+    reset_cassette()
+
+
+def _record(directory, interactions):
+    recorder = Cassette(directory, "record")
+    for kind, name, request, response in interactions:
+        recorder.play(kind, name, request, lambda r=response: r)
+    recorder.flush()
+
+
+def test_off_by_default(monkeypatch):
+    monkeypatch.delenv("EPIC_CASSETTE_MODE", raising=False)
+    reset_cassette()
+    assert get_cassette() is None
+
+
+def test_record_then_replay_in_order(tmp_path):
+    _record(
+        tmp_path,
+        [
+            ("llm", "m", {"q": 1}, "first"),
+            ("llm", "m", {"q": 1}, "second"),
+            ("tool", "search", {"q": "x"}, {"hits": 3}),
+            ("llm", "m", {"q": 2}, Verdict(label="ok", score=0.5)),
+        ],
+    )
+    player = Cassette(tmp_path, "replay")
+
+    def live():
+        raise AssertionError("replay must not call out")
+
+    assert player.play("llm", "m", {"q": 1}, live) == "first"
+    assert player.play("llm", "m", {"q": 1}, live) == "second"
+    assert player.play("tool", "search", {"q": "x"}, live) == {"hits": 3}
+    assert player.play("llm", "m", {"q": 2}, live) == Verdict(label="ok", score=0.5)
+    assert player.replayed_calls == {"llm": 3, "tool": 1}
+
+
+def test_unmatched_request_falls_back_to_same_call_site(tmp_path):
+    _record(tmp_path, [("llm", "m", {"prompt": "today is 2026-01-01"}, "answer")])
+    player = Cassette(tmp_path, "replay")
+
+    assert player.play("llm", "m", {"prompt": "today is 2026-10-18"}, lambda: "live") == "answer"
+    with pytest.raises(CassetteMissError):
+        player.play("llm", "other-model", {"prompt": "x"}, lambda: "live")
+
+
+def test_errors_are_recorded_and_raised_again(tmp_path):
+    recorder = Cassette(tmp_path, "record")
+
+    def failing():
+        raise TypeError("'NoneType' object is not iterable")
+
+    with pytest.raises(TypeError):
+        recorder.play("llm", "m", {"q": 1}, failing)
+    recorder.flush()
+
+    with pytest.raises(ReplayedError, match="'NoneType' object is not iterable"):
+        Cassette(tmp_path, "replay").play("llm", "m", {"q": 1}, failing)
+
+
+def test_replay_latency_is_simulated(tmp_path):
+    (tmp_path / cassette_mod.CASSETTE_FILE).write_text(
+        json.dumps(
+            {
+                "seq": 1,
+                "kind": "llm",
+                "name": "m",
+                "key": cassette_mod.request_key("llm", "m", {}),
+                "request": {},
+                "duration": 0.1,
+                "response": {"type": "str", "value": "slow"},
+            }
+        )
+        + "\n",
+        encoding="utf-8",
+    )
+    player = Cassette(tmp_path, "replay", latency_scale=0.5)
+
+    started = time.perf_counter()
+    assert asyncio.run(player.aplay("llm", "m", {}, lambda: None)) == "slow"
+    assert time.perf_counter() - started >= 0.05
+
+
+def test_recording_starts_a_fresh_cassette(tmp_path):
+    _record(tmp_path, [("llm", "m", {}, "old")])
+    _record(tmp_path, [("llm", "m", {}, "new")])
+
+    lines = (tmp_path / cassette_mod.CASSETTE_FILE).read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line)["response"]["value"] for line in lines] == ["new"]
+
+
+def test_llm_call_wrapper_records_and_replays(cassette_env):
+    calls = []
+
+    class FakeLLM:
+        model = "openrouter/test-model"
+
+        def call(self, messages, **kwargs):
+            calls.append(messages)
+            return f"echo {messages[-1]['content']}"
+
+        async def acall(self, messages, **kwargs):
+            return self.call(messages, **kwargs)
+
+    _wrap_call_for_react_safety(FakeLLM)
+    messages = [{"role": "user", "content": "hi"}]
+
+    cassette_env("record")
+    assert FakeLLM().call(messages) == "echo hi"
+    get_cassette().flush()
+
+    cassette_env("replay")
+    assert FakeLLM().call(messages) == "echo hi"
+    assert asyncio.run(FakeLLM().acall(messages)) == "echo hi"  # repeats the last answer
+    assert len(calls) == 1
+
+
+def test_wrap_tool_records_and_replays(cassette_env):
+    class FakeTool:
+        name = "scrape"
+
+        def __init__(self):
+            self.calls = 0
+
+        def _run(self, url):
+            self.calls += 1
+            return f"<html>{url}</html>"
+
+    cassette_env("record")
+    tool = wrap_tool(FakeTool())
+    assert tool._run(url="https://example.com") == "<html>https://example.com</html>"
+    get_cassette().flush()
+
+    cassette_env("replay")
+    replayed = wrap_tool(FakeTool())
+    assert replayed._run(url="https://example.com") == "<html>https://example.com</html>"
+    assert replayed.calls == 0
+
+
+def test_wrap_tool_is_a_noop_when_off(monkeypatch):
+    monkeypatch.delenv("EPIC_CASSETTE_MODE", raising=False)
+    reset_cassette()
+
+    class FakeTool:
+        def _run(self):
+            return "live"
+
+    tool = FakeTool()
+    assert wrap_tool(tool)._run() == "live"
+    assert "_run" not in vars(tool)
+
+
+def test_replayed_email_never_reaches_composio(cassette_env, monkeypatch):
+    from epic_news.utils import email_sender
+
+    class FakeClient:
+        class tools:  # noqa: N801 - mirrors the Composio client attribute
+            @staticmethod
+            def execute(*args, **kwargs):
+                return {"successful": True, "data": {"id": "msg-1"}}
+
+    cassette_env("record")
+    sent = email_sender.send_report_email(
+        recipient="a@example.com", subject="Report", html_body="<p>hi</p>", client=FakeClient()
+    )
+    get_cassette().flush()
+
+    cassette_env("replay")
+    monkeypatch.setattr(email_sender, "build_client", lambda: pytest.fail("replay must not build a client"))
+    replayed = email_sender.send_report_email(
+        recipient="a@example.com", subject="Report", html_body="<p>hi</p>"
+    )
+
+    assert replayed == sent == {"id": "msg-1"}
+
+
+def _replay_with(cassette_env, interactions):
+    cassette = cassette_env("record")
+    for kind, name, request, response in interactions:
+        cassette.play(kind, name, request, lambda r=response: r)
+    cassette.flush()
+    return cassette_env("replay")
+
+
+def test_replay_blocks_live_connections_but_not_loopback(cassette_env):
+    cassette = _replay_with(cassette_env, [])
+    with socket.socket() as server:
+        server.bind(("127.0.0.1", 0))
+        server.listen()
+        with socket.create_connection(server.getsockname(), timeout=1):
+            pass
+
+        with pytest.raises(CassetteMissError, match="203.0.113.7:443"), socket.socket() as client:
+            client.connect(("203.0.113.7", 443))
+        assert cassette.misses and "203.0.113.7" in cassette.misses[0]
+
+        reset_cassette()
+        assert socket.socket.connect is _LIVE_CONNECT
+
+
+def test_unrecorded_calls_are_kept_as_misses(cassette_env):
+    cassette = _replay_with(cassette_env, [("tool", "search", {"q": "x"}, "hit")])
+
+    assert cassette.play("tool", "search", {"q": "x"}, lambda: pytest.fail("live")) == "hit"
+    with pytest.raises(CassetteMissError):
+        cassette.play("tool", "scrape", {"url": "u"}, lambda: pytest.fail("live"))
+    assert len(cassette.misses) == 1
+
+
+def test_opml_fetch_replays_the_articles_file(cassette_env, monkeypatch, tmp_path):
+    from epic_news.utils.rss_utils import fetch_articles_from_opml
+
+    class UnifiedRssTool:
+        calls = 0
+
+        def _run(self, opml, days, output):
+            UnifiedRssTool.calls += 1
+            Path(output).write_text('{"articles": ["a"]}', encoding="utf-8")
+            return "1 article"
+
+    monkeypatch.setitem(sys.modules, "crewai_custom_tools", SimpleNamespace(UnifiedRssTool=UnifiedRssTool))
+    out = tmp_path / "report.json"
+
+    cassette_env("record")
+    asyncio.run(fetch_articles_from_opml("feeds.opml", str(out)))
+    get_cassette().flush()
+    out.unlink()
+
+    cassette_env("replay")
+    asyncio.run(fetch_articles_from_opml("feeds.opml", str(out)))
+
+    assert UnifiedRssTool.calls == 1
+    assert out.read_text(encoding="utf-8") == '{"articles": ["a"]}'
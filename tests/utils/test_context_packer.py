@@ -0,0 +1,145 @@
+"""Tests for the token-budgeted context packer wired between crew tasks."""
+
+import json
+
+from crewai import Task
+from crewai.tasks.task_output import TaskOutput
+from crewai.utilities.formatter import aggregate_raw_outputs_from_tasks
+
+from epic_news.utils.context_packer import (
+    PackedContextTask,
+    estimate_tokens,
+    is_protected,
+    pack,
+    split_passages,
+)
+
+FILLER = "The weather in the region was mild and nothing else happened that week. " * 4
+
+
+def _task(name: str, description: str = "Collect material.") -> Task:
+    return Task(name=name, description=description, expected_output="Notes.")
+
+
+def _finish(task: Task, raw: str) -> TaskOutput:
+    """What CrewAI does when a task completes: set its output."""
+    output = TaskOutput(description=task.description, raw=raw, agent="researcher")
+    task.output = output
+    return output
+
+
+def _consumer(context: list[Task], **kwargs) -> PackedContextTask:
+    return PackedContextTask(
+        name="report",
+        description="Write the report on lithium battery recycling.",
+        expected_output="Report.",
+        context=context,
+        **kwargs,
+    )
+
+
+def _run(task: Task, monkeypatch) -> str:
+    """Execute ``task`` as a crew would and return the context its agent was given."""
+    seen = []
+    monkeypatch.setattr(Task, "_execute_core", lambda self, agent, context, tools: seen.append(context))
+    task.execute_sync(context=aggregate_raw_outputs_from_tasks(task.context))
+    return seen[0]
+
+
+def test_split_passages_cuts_long_blocks_at_sentences():
+    passages = split_passages("Short one.\n\n" + "A sentence of words. " * 200, max_tokens=50)
+    assert passages[0] == "Short one."
+    assert all(estimate_tokens(p) <= 60 for p in passages)
+
+
+def test_text_under_budget_only_loses_duplicates():
+    text = "Alpha passage.\n\nBeta passage.\n\nalpha   PASSAGE."
+    result = pack(text, "anything", budget_tokens=1000)
+    assert result.text == "Alpha passage.\n\nBeta passage."
+    assert result.duplicates == 1
+    assert result.omitted == 0
+
+
+def test_over_budget_keeps_citations_figures_and_relevant_passages():
+    passages = [FILLER + f"({i})" for i in range(20)]
+    passages[5] = "Lithium battery recycling capacity doubled, according to the ministry."
+    passages[9] = "Revenue reached 4.2 bn EUR in 2025 [3]."
+    passages[14] = "Source: https://example.org/report"
+    text = "\n\n".join(passages)
+
+    result = pack(text, "lithium battery recycling", budget_tokens=120)
+
+    assert "Revenue reached 4.2 bn EUR" in result.text
+    assert "https://example.org/report" in result.text
+    assert "Lithium battery recycling" in result.text
+    assert result.text.index("Lithium") < result.text.index("Revenue")  # original order kept
+    assert "passages omitted" in result.text
+    assert result.packed_tokens <= 120 + 20
+    assert result.ratio < 0.2
+
+
+def test_protection_covers_citations_and_figures():
+    assert is_protected("See [12].")
+    assert is_protected("Margins reached 18%.")
+    assert not is_protected("A sentence without any of those.")
+
+
+def test_json_output_is_minified_not_cut():
+    data = {"items": [{"name": f"item {i}", "text": FILLER} for i in range(30)]}
+    result = pack(json.dumps(data, indent=4), "query", budget_tokens=10)
+    assert json.loads(result.text) == data
+    assert result.packed_tokens < result.original_tokens
+
+
+def test_upstream_outputs_are_packed_into_the_consumer_budget(monkeypatch):
+    first, second = _task("planning"), _task("collection")
+    consumer = _consumer([first, second], context_budget_tokens=400)
+
+    shared = "Recycling plants opened in 2024 across Europe."
+    _finish(first, f"{shared}\n\nPlan: search the web.")
+    _finish(second, "\n\n".join([shared] + [FILLER + f"({i})" for i in range(40)]))
+
+    context = _run(consumer, monkeypatch)
+    assert context.count(shared) == 1
+    assert estimate_tokens(context) <= 400 + 50
+
+
+def test_other_readers_of_an_upstream_task_get_its_full_output(monkeypatch):
+    collection = _task("collection")
+    consumer = _consumer([collection], context_budget_tokens=200)
+    analysis = _task("analysis")
+    analysis.context = [collection]
+    full = "\n\n".join(FILLER + f"({i})" for i in range(40))
+    _finish(collection, full)
+
+    assert len(_run(consumer, monkeypatch)) < len(full)
+    assert collection.output.raw == full
+    assert aggregate_raw_outputs_from_tasks(analysis.context) == full
+
+
+def test_packing_is_rebuilt_on_every_run(monkeypatch):
+    upstream = _task("collection")
+    consumer = _consumer([upstream], context_budget_tokens=1000)
+    _finish(upstream, "Same passage.")
+
+    assert _run(consumer, monkeypatch) == "Same passage."
+    assert _run(consumer, monkeypatch) == "Same passage."
+
+
+def test_copies_keep_the_packing(monkeypatch):
+    upstream = _task("collection")
+    consumer = _consumer([upstream], context_budget_tokens=123)
+
+    copied = consumer.copy(agents=[], task_mapping={upstream.key: upstream})
+
+    assert isinstance(copied, PackedContextTask) and copied.context_budget_tokens == 123
+
+
+def test_zero_budget_disables_packing(monkeypatch):
+    monkeypatch.setenv("EPIC_CONTEXT_BUDGET_TOKENS", "0")
+    upstream = _task("collection")
+    consumer = _consumer([upstream])
+    full = "\n\n".join(FILLER + f"({i})" for i in range(400))
+    _finish(upstream, full)
+
+    assert _run(consumer, monkeypatch) == full
@@ -1,5 +1,3 @@
-from unittest.mock import mock_open, patch
-
 from loguru import logger
 from pydantic import BaseModel
 
@@ -9,6 +7,8 @@ from epic_news.utils.debug_utils import (
     log_state_keys,
     parse_crewai_output,
 )
+from epic_news.utils.diagnostics import load_crewai_state
+from epic_news.utils.spans import get_background_writer
 
 
 class SampleModel(BaseModel):
@@ -16,19 +16,19 @@ class SampleModel(BaseModel):
     value: int
 
 
-def test_dump_crewai_state(caplog):
+def test_dump_crewai_state(caplog, tmp_path, monkeypatch):
     """Test the dump_crewai_state function."""
     logger.add(caplog.handler, format="{message}")
+    monkeypatch.setenv("DEBUG_STATE", "true")
     state_data = {"key": "value"}
-    with (
-        patch("builtins.open", mock_open()) as mock_file,
-        patch("os.environ.get", return_value="true"),
-        patch("epic_news.utils.directory_utils.ensure_output_directory"),
-    ):
-        dump_crewai_state(state_data, "test_crew")
-        # The exact filename is timestamped, so we check for a call rather than the exact filename
-        mock_file.assert_called()
-        assert "CrewAI state dumped to" in caplog.text
+
+    path = dump_crewai_state(state_data, "test_crew", debug_dir=str(tmp_path))
+    get_background_writer().flush()
+
+    # The exact filename is timestamped and written in the background
+    assert path.startswith(str(tmp_path / "crewai_state_test_crew_"))
+    assert load_crewai_state(path) == state_data
+    assert "CrewAI state dumped to" in caplog.text
 
 
 def test_log_state_keys(caplog):
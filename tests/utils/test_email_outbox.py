@@ -0,0 +1,146 @@
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from epic_news.utils.email_outbox import FAILED, QUEUED, SENT, EmailOutbox
+from epic_news.utils.email_sender import EmailDeliveryError
+
+BODY = "<html><body>report</body></html>"
+
+
+class _Sender:
+    """Records sends; fails the first ``failures`` calls."""
+
+    def __init__(self, failures: int = 0, delay: float = 0.0):
+        self.failures = failures
+        self.delay = delay
+        self.calls: list[dict] = []
+        self.active = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, **kwargs):
+        with self._lock:
+            self.calls.append(kwargs)
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(self.delay)
+        with self._lock:
+            self.active -= 1
+            if len(self.calls) <= self.failures:
+                raise EmailDeliveryError("HTTP 503")
+        return {"id": "abc"}
+
+
+def _outbox(tmp_path, sender, **kwargs) -> EmailOutbox:
+    return EmailOutbox(tmp_path / "outbox", send=sender, **kwargs)
+
+
+def _enqueue(outbox, subject="Rapport", **kwargs):
+    return outbox.enqueue(recipient="someone@example.com", subject=subject, html_body=BODY, **kwargs)
+
+
+def test_enqueue_returns_before_sending_and_sender_delivers(tmp_path):
+    sender = _Sender()
+    outbox = _outbox(tmp_path, sender)
+    entry = _enqueue(outbox, run_id="run-1")
+    assert entry.status == QUEUED and sender.calls == []
+
+    outbox.start()
+    assert outbox.drain(timeout=5)
+    outbox.close()
+    assert [e.status for e in outbox.status("run-1")] == [SENT]
+    assert sender.calls[0]["recipient"] == "someone@example.com"
+
+
+def test_same_email_is_queued_once(tmp_path):
+    outbox = _outbox(tmp_path, _Sender())
+    first = _enqueue(outbox, run_id="run-1")
+    second = _enqueue(outbox, run_id="run-1")
+    assert first.key == second.key
+    assert len(outbox.status("run-1")) == 1
+    assert _enqueue(outbox, run_id="run-2").key != first.key
+
+
+def test_transient_failure_is_retried_with_backoff(tmp_path):
+    sender = _Sender(failures=2)
+    outbox = _outbox(tmp_path, sender, retry_base_seconds=0.05).start()
+    entry = _enqueue(outbox)
+    deadline = time.monotonic() + 5
+    while outbox.get(entry.key).status != SENT and time.monotonic() < deadline:
+        time.sleep(0.02)
+    outbox.close()
+
+    done = outbox.get(entry.key)
+    assert done.status == SENT and done.attempts == 3
+    assert len(sender.calls) == 3
+
+
+def test_gives_up_after_max_attempts(tmp_path):
+    outbox = _outbox(tmp_path, _Sender(failures=99), max_attempts=2, retry_base_seconds=0.01).start()
+    entry = _enqueue(outbox)
+    deadline = time.monotonic() + 5
+    while outbox.get(entry.key).status != FAILED and time.monotonic() < deadline:
+        time.sleep(0.02)
+    outbox.close()
+    assert outbox.get(entry.key).last_error == "HTTP 503"
+
+
+def test_concurrency_is_bounded(tmp_path):
+    sender = _Sender(delay=0.05)
+    outbox = _outbox(tmp_path, sender, concurrency=2)
+    for i in range(6):
+        _enqueue(outbox, subject=f"Rapport {i}")
+    outbox.start()
+    assert outbox.drain(timeout=5)
+    outbox.close()
+    assert len(sender.calls) == 6 and sender.peak == 2
+
+
+def test_queue_survives_the_process(tmp_path):
+    _enqueue(_outbox(tmp_path, _Sender()), run_id="run-1")  # never started
+
+    sender = _Sender()
+    later = _outbox(tmp_path, sender).start()
+    assert later.drain(timeout=5)
+    later.close()
+    assert len(sender.calls) == 1 and later.status("run-1")[0].status == SENT
+
+
+def test_attachment_is_snapshotted_and_size_checked(tmp_path):
+    report = tmp_path / "report.html"
+    report.write_text(BODY, encoding="utf-8")
+    outbox = _outbox(tmp_path, _Sender(), max_attachment_bytes=1024)
+    entry = _enqueue(outbox, attachment_path=report)
+    report.write_text("overwritten by the next run", encoding="utf-8")
+    assert entry.attachment != str(report)
+    assert Path(entry.attachment).read_text(encoding="utf-8") == BODY
+
+    report.write_bytes(b"x" * 2048)
+    big = _enqueue(outbox, subject="Gros", attachment_path=report)
+    assert big.attachment is None and "over the size limit" in big.note
+
+
+def test_old_sent_and_failed_entries_are_pruned_with_their_files(tmp_path):
+    report = tmp_path / "report.html"
+    report.write_text(BODY, encoding="utf-8")
+    outbox = _outbox(tmp_path, _Sender(), retention_days=7)
+    sent = _enqueue(outbox, subject="Envoyé", attachment_path=report)
+    failed = _enqueue(outbox, subject="Échoué")
+    queued = _enqueue(outbox, subject="En attente")
+    outbox._update(sent.key, status=SENT)
+    outbox._update(failed.key, status=FAILED)
+
+    assert outbox.prune() == 0  # recent: kept
+    assert outbox.prune(now=time.time() + 8 * 86400) == 2
+    assert outbox.get(sent.key) is None and outbox.get(failed.key) is None
+    assert not Path(sent.attachment).parent.exists()
+    assert outbox.get(queued.key).status == QUEUED  # pending mail is never dropped
+
+
+@pytest.mark.parametrize(("recipient", "body"), [("[EMAIL]", BODY), ("someone@example.com", "  ")])
+def test_invalid_email_is_refused_at_enqueue(tmp_path, recipient, body):
+    with pytest.raises(EmailDeliveryError):
+        _outbox(tmp_path, _Sender()).enqueue(recipient=recipient, subject="s", html_body=body)
@@ -87,13 +87,15 @@ def test_load_or_parse_model_handles_empty_label(tmp_path: Path):
 
 
 def test_render_and_write_html_creates_parent_dir_and_writes(tmp_path: Path, monkeypatch):
-    # Stub TemplateManager.render_report to avoid loading real templates.
-    from epic_news.utils import flow_helpers
+    # Stub the TemplateManager frame and body to avoid loading real templates.
+    from epic_news.utils.html.template_manager import TemplateManager
 
-    def _fake_render(self, selected_crew, content_data):
-        return f"<html>{selected_crew}:{content_data['name']}</html>"
+    def _fake_body(self, content_data, selected_crew):
+        yield f"{selected_crew}:"
+        yield content_data["name"]
 
-    monkeypatch.setattr(flow_helpers.TemplateManager, "render_report", _fake_render)
+    monkeypatch.setattr(TemplateManager, "render_frame", lambda self, crew, data: ("<html>", "</html>"))
+    monkeypatch.setattr(TemplateManager, "generate_contextual_body_chunks", _fake_body)
 
     target = tmp_path / "nested" / "deep" / "report.html"
     result = render_and_write_html("POEM", _DummyModel(name="eve", value=1), target)
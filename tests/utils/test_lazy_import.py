@@ -0,0 +1,32 @@
+"""Tests for deferred imports."""
+
+import sys
+
+from epic_news.utils.lazy_import import LazyObject, lazy_import
+
+
+def test_lazy_import_defers_until_first_use():
+    sys.modules.pop("colorsys", None)
+    proxy = lazy_import("colorsys", "rgb_to_hsv")
+
+    assert isinstance(proxy, LazyObject)
+    assert not proxy.is_loaded
+    assert "colorsys" not in sys.modules
+
+    assert proxy(1.0, 0.0, 0.0) == (0.0, 1.0, 1.0)
+    assert proxy.is_loaded
+
+
+def test_lazy_import_forwards_attributes():
+    proxy = lazy_import("pathlib", "PurePosixPath")
+
+    assert proxy.__name__ == "PurePosixPath"
+    assert proxy("a", "b").as_posix() == "a/b"
+
+
+def test_renderer_factory_resolves_lazily():
+    from epic_news.utils.html.template_renderers.poem_renderer import PoemRenderer
+    from epic_news.utils.html.template_renderers.renderer_factory import RendererFactory
+
+    assert isinstance(RendererFactory.create_renderer("POEM"), PoemRenderer)
+    assert RendererFactory._RENDERER_MAP["POEM"] is PoemRenderer
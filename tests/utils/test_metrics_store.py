@@ -0,0 +1,155 @@
+"""Tests for the append-only metrics store and the Dashboard built on it."""
+
+import json
+import threading
+
+import pytest
+
+from epic_news.utils import observability
+from epic_news.utils.metrics_store import (
+    CREW_LATENCY,
+    Histogram,
+    MetricsSpanExporter,
+    MetricsStore,
+    series_key,
+)
+from epic_news.utils.observability import Dashboard
+from epic_news.utils.spans import BackgroundWriter, Span
+
+
+@pytest.fixture
+def writer():
+    return BackgroundWriter()
+
+
+def _lines(path):
+    return [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+
+
+def test_updates_are_appended_not_rewritten(tmp_path, writer):
+    store = MetricsStore(tmp_path / "m.jsonl", writer=writer)
+    store.inc("runs_total", crew="PoemCrew")
+    store.inc("runs_total", 2, crew="PoemCrew")
+    store.set("queue_depth", 3)
+    store.observe(CREW_LATENCY, 1.5, run_id="r1", crew="PoemCrew")
+    store.flush()
+
+    assert [r["op"] for r in _lines(tmp_path / "m.jsonl")] == ["inc", "inc", "set", "observe"]
+    assert store.counter("runs_total", crew="PoemCrew") == 3
+    assert store.gauge("queue_depth") == 3
+    assert not (tmp_path / "m.json").exists()
+
+
+def test_compaction_writes_snapshot_and_truncates_log(tmp_path, writer):
+    store = MetricsStore(tmp_path / "m.jsonl", compact_every=3, writer=writer)
+    for _ in range(4):
+        store.inc("events")
+    store.flush()
+
+    assert len(_lines(tmp_path / "m.jsonl")) == 1
+    snapshot = json.loads((tmp_path / "m.json").read_text(encoding="utf-8"))
+    assert snapshot["counters"] == [{"name": "events", "labels": {}, "value": 3}]
+
+    reloaded = MetricsStore(tmp_path / "m.jsonl", writer=writer)
+    assert reloaded.counter("events") == 4
+
+
+def test_histogram_survives_reload(tmp_path, writer):
+    store = MetricsStore(tmp_path / "m.jsonl", writer=writer)
+    for value in (0.2, 0.7, 3.0):
+        store.observe(CREW_LATENCY, value, run_id="r1", crew="A")
+    store.compact()
+    store.observe(CREW_LATENCY, 40.0, run_id="r2", crew="A")
+    store.flush()
+
+    reloaded = MetricsStore(tmp_path / "m.jsonl", writer=writer)
+    histogram = reloaded.histogram(CREW_LATENCY, crew="A")
+    assert histogram.count == 4
+    assert list(histogram.runs) == ["r1", "r2"]
+
+
+def test_quantiles_interpolate_inside_buckets():
+    histogram = Histogram(bounds=(1.0, 2.0, float("inf")))
+    for value in (0.5, 1.5, 1.5, 1.5):
+        histogram.observe(value)
+
+    assert histogram.counts == [1, 3, 0]
+    store = MetricsStore("unused.jsonl", load=False)
+    store.histograms[series_key("h", {})] = histogram
+
+    result = store.quantiles("h", (0.5, 0.95))
+    assert result["p50"] == pytest.approx(1 + 1 / 3)
+    assert result["p95"] == pytest.approx(1 + 2.8 / 3)
+    assert result["count"] == 4
+
+
+def test_latency_by_crew_over_last_runs(tmp_path, writer):
+    store = MetricsStore(tmp_path / "m.jsonl", writer=writer)
+    for run in range(10):
+        store.observe(CREW_LATENCY, 100.0 if run < 5 else 0.3, run_id=f"run{run}", crew="SlowThenFast")
+    store.observe(CREW_LATENCY, 2.0, run_id="run9", crew="Other")
+
+    recent = store.latency_by_crew(last_runs=5)
+    everything = store.latency_by_crew(last_runs=None)
+
+    assert recent["SlowThenFast"]["count"] == 5
+    assert 0.25 <= recent["SlowThenFast"]["p95"] <= 0.5
+    assert everything["SlowThenFast"]["p95"] >= 60
+    assert recent["Other"]["count"] == 1
+
+
+def test_concurrent_updates_are_all_counted(tmp_path, writer):
+    store = MetricsStore(tmp_path / "m.jsonl", compact_every=250, writer=writer)
+
+    def work():
+        for _ in range(200):
+            store.inc("hits")
+
+    threads = [threading.Thread(target=work) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    store.flush()
+
+    assert store.counter("hits") == 1600
+    assert MetricsStore(tmp_path / "m.jsonl", writer=writer).counter("hits") == 1600
+
+
+def test_span_exporter_records_crew_latency(tmp_path, writer):
+    store = MetricsStore(tmp_path / "m.jsonl", writer=writer)
+    exporter = MetricsSpanExporter(store)
+    crew = Span("crew:PoemCrew", "crew", "trace1", "s1", None, 0.0, attributes={"crew": "PoemCrew"})
+    crew.duration = 4.0
+    llm = Span("llm:gpt", "llm", "trace1", "s2", "s1", 0.0, attributes={"model": "gpt", "total_tokens": 12})
+    llm.duration = 1.0
+
+    exporter.on_end(crew)
+    exporter.on_end(llm)
+
+    assert store.latency_by_crew()["PoemCrew"]["count"] == 1
+    assert store.counter("crew_runs_total", crew="PoemCrew", status="ok") == 1
+    assert store.counter("llm_tokens_total", model="gpt") == 12
+
+
+def test_dashboard_appends_and_reloads(tmp_path, monkeypatch):
+    monkeypatch.setattr(observability, "DASHBOARD_DATA_DIR", str(tmp_path))
+    dashboard = Dashboard("appending")
+    dashboard.update_metric("agents", "researcher", "calls", 1)
+    dashboard.update_metric("agents", "researcher", "calls", 2)
+    dashboard.store.flush()
+
+    assert len(_lines(tmp_path / "appending.jsonl")) == 5  # start_time + 2 x (value, events_count)
+    loaded = Dashboard.load_dashboard("appending")
+    assert loaded.get_metrics("agents", "researcher") == {"calls": 2}
+    assert loaded.metrics["system"]["events_count"] == 2
+
+
+def test_dashboard_reads_legacy_snapshots(tmp_path, monkeypatch):
+    monkeypatch.setattr(observability, "DASHBOARD_DATA_DIR", str(tmp_path))
+    legacy = {"agents": {"writer": {"calls": 7}}, "system": {"start_time": 1.0, "events_count": 7}}
+    (tmp_path / "legacy.json").write_text(json.dumps(legacy), encoding="utf-8")
+
+    loaded = Dashboard.load_dashboard("legacy")
+
+    assert loaded.get_metrics("agents", "writer") == {"calls": 7}
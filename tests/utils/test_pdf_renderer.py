@@ -0,0 +1,66 @@
+import asyncio
+
+import pytest
+
+from epic_news.tools import html_to_pdf_tool
+from epic_news.utils import pdf_renderer
+from epic_news.utils.pdf_renderer import PdfRenderer, PdfUnavailableError, render_pdfs, split_stylesheet
+
+PAGE = '<html><head><style id="theme-styles">h1 { color: red; }</style></head><body><h1>T</h1></body></html>'
+
+
+def test_split_stylesheet_lifts_theme_block():
+    html, css = split_stylesheet(PAGE)
+    assert css == "h1 { color: red; }"
+    assert '<style id="theme-styles"></style>' in html
+    assert "<h1>T</h1>" in html
+
+
+def test_split_stylesheet_keeps_block_when_a_sheet_is_linked():
+    linked = PAGE.replace("<head>", '<head><link rel="stylesheet" href="x.css">')
+    assert split_stylesheet(linked) == (linked, None)
+
+
+def test_split_stylesheet_without_theme_block():
+    assert split_stylesheet("<p>x</p>") == ("<p>x</p>", None)
+
+
+def test_render_pdfs_is_off_when_disabled(monkeypatch, tmp_path):
+    monkeypatch.setenv("EPIC_PDF_RENDER", "false")
+    (tmp_path / "r.html").write_text(PAGE, encoding="utf-8")
+    assert asyncio.run(render_pdfs([tmp_path / "r.html"])) == []
+
+
+def test_render_pdfs_skips_missing_files(tmp_path):
+    assert asyncio.run(render_pdfs([tmp_path / "absent.html"])) == []
+
+
+@pytest.mark.skipif(html_to_pdf_tool.WEASYPRINT_AVAILABLE, reason="WeasyPrint is available")
+def test_unavailable_weasyprint_is_reported_once(tmp_path):
+    html = tmp_path / "r.html"
+    html.write_text(PAGE, encoding="utf-8")
+    renderer = PdfRenderer(workers=1)
+    try:
+        with pytest.raises(PdfUnavailableError):
+            asyncio.run(renderer.render(html))
+        with pytest.raises(PdfUnavailableError):  # remembered: no second round trip
+            asyncio.run(renderer.render(html))
+        assert renderer._pool is not None
+    finally:
+        renderer.close()
+
+
+@pytest.mark.skipif(not html_to_pdf_tool.WEASYPRINT_AVAILABLE, reason="WeasyPrint system libraries missing")
+def test_renders_every_report_in_parallel(tmp_path, monkeypatch):
+    monkeypatch.setattr(pdf_renderer, "_renderer", PdfRenderer(workers=2))
+    paths = []
+    for i in range(3):
+        path = tmp_path / f"r{i}.html"
+        path.write_text(PAGE, encoding="utf-8")
+        paths.append(path)
+    try:
+        rendered = asyncio.run(render_pdfs(paths))
+    finally:
+        pdf_renderer._renderer.close()
+    assert rendered == [p.with_suffix(".pdf").resolve() for p in paths]
+    assert all(p.read_bytes().startswith(b"%PDF") for p in rendered)
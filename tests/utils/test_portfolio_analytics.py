@@ -0,0 +1,111 @@
+"""Tests for the FinDaily portfolio analytics pre-stage (no network)."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from epic_news.utils.portfolio_analytics import (
+    build_portfolio_context,
+    compute_portfolio_analytics,
+    fx_ticker,
+    load_portfolio,
+)
+
+
+@pytest.fixture
+def csvs(tmp_path):
+    stock = tmp_path / "stock.csv"
+    stock.write_text(
+        "Name,Ticker,Currency\nApple,Yahoo:AAPL,USD\nNestle,NESN.SW,CHF\nApple again,AAPL,USD\n",
+        encoding="utf-8",
+    )
+    etf = tmp_path / "etf.csv"
+    etf.write_text("Name,Ticker,Currency\nVanguard S&P 500,VOO,USD\n", encoding="utf-8")
+    return stock, etf
+
+
+def _close(days=30):
+    index = pd.bdate_range("2026-01-01", periods=days)
+    steps = np.arange(days, dtype=float)
+    return pd.DataFrame(
+        {
+            "AAPL": 100.0 * 1.01**steps,
+            "NESN.SW": np.r_[np.full(days // 2, 100.0), np.full(days - days // 2, 80.0)],
+            "VOO": 400.0 * 1.01**steps,
+            "USDCHF=X": np.full(days, 0.9),
+        },
+        index=index,
+    )
+
+
+def test_load_portfolio_strips_prefix_and_dedupes(csvs):
+    portfolio = load_portfolio({"stock": csvs[0], "etf": csvs[1], "missing": "nope.csv"})
+
+    assert list(portfolio["ticker"]) == ["AAPL", "NESN.SW", "VOO"]
+    assert list(portfolio["asset_class"]) == ["stock", "stock", "etf"]
+
+
+def test_fx_ticker():
+    assert fx_ticker("USD", "CHF") == "USDCHF=X"
+    assert fx_ticker("CHF", "CHF") is None
+    assert fx_ticker("GBp", "CHF") == "GBPCHF=X"
+
+
+def test_metrics_are_computed_per_holding(csvs):
+    portfolio = load_portfolio({"stock": csvs[0], "etf": csvs[1]})
+    analytics = compute_portfolio_analytics(portfolio, _close())
+    rows = analytics.holdings.set_index("ticker")
+
+    assert rows.loc["AAPL", "return_1d"] == pytest.approx(0.01)
+    assert rows.loc["AAPL", "return_1y"] == pytest.approx(1.01**29 - 1)
+    assert rows.loc["AAPL", "max_drawdown"] == pytest.approx(0.0)
+    assert rows.loc["NESN.SW", "max_drawdown"] == pytest.approx(-0.2)
+    assert rows.loc["NESN.SW", "drawdown"] == pytest.approx(-0.2)
+    # No quantity column: equal weights.
+    assert rows["weight"].tolist() == pytest.approx([1 / 3] * 3)
+    assert analytics.top_correlations[0][:2] == ("AAPL", "VOO")
+    assert analytics.top_correlations[0][2] == pytest.approx(1.0)
+    assert analytics.portfolio_volatility is not None
+
+
+def test_weights_use_quantities_and_fx(tmp_path):
+    stock = tmp_path / "stock.csv"
+    stock.write_text("Name,Ticker,Currency,Quantity\nApple,AAPL,USD,10\nNestle,NESN.SW,CHF,10\n")
+    portfolio = load_portfolio({"stock": stock})
+    close = _close(2)
+    close["NESN.SW"] = 90.0  # 10 x 90 CHF vs 10 x 101 USD x 0.9 = 909 CHF
+
+    analytics = compute_portfolio_analytics(portfolio, close, base_currency="CHF")
+
+    weights = analytics.holdings.set_index("ticker")["weight"]
+    assert weights["AAPL"] == pytest.approx(909 / (909 + 900))
+
+
+def test_context_uses_one_bulk_fetch(csvs):
+    calls = []
+
+    def loader(tickers, period):
+        calls.append(tickers)
+        return _close()
+
+    text = build_portfolio_context(*csvs, loader=loader)
+
+    assert calls == [["AAPL", "NESN.SW", "VOO", "USDCHF=X"]]
+    assert "| Apple | AAPL | stock |" in text
+    assert "Most correlated pairs" in text
+
+
+def test_missing_tickers_are_reported(csvs):
+    text = build_portfolio_context(*csvs, loader=lambda tickers, period: _close().drop(columns=["VOO"]))
+
+    assert "No price data for: VOO" in text
+
+
+def test_context_degrades_when_prices_are_unavailable(csvs):
+    def loader(tickers, period):
+        raise ConnectionError("offline")
+
+    text = build_portfolio_context(*csvs, loader=loader)
+
+    assert "No precomputed portfolio analytics" in text
+    assert "offline" in text
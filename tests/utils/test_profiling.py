@@ -0,0 +1,96 @@
+"""Tests for the opt-in step profiler."""
+
+import asyncio
+import json
+import time
+
+import pytest
+
+from epic_news.utils import profiling
+from epic_news.utils.observability import Tracer, trace_task
+from epic_news.utils.progress import run_scope
+
+
+@pytest.fixture
+def profiled(tmp_path, monkeypatch):
+    monkeypatch.setattr(profiling, "TRACE_DIR", str(tmp_path))
+    monkeypatch.setenv("EPIC_PROFILE_INTERVAL_MS", "1")
+    profiling.enable_profiling()
+    yield tmp_path
+    profiling.enable_profiling(False)
+
+
+def _busy(seconds):
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        sum(range(100))
+
+
+def test_disabled_by_default(monkeypatch):
+    monkeypatch.delenv("EPIC_PROFILE", raising=False)
+    assert not profiling.profiling_enabled()
+    with profiling.profile_block("step:x") as block:
+        assert block is None
+
+
+def test_env_var_enables(monkeypatch):
+    monkeypatch.setenv("EPIC_PROFILE", "1")
+    assert profiling.profiling_enabled()
+
+
+def test_block_writes_collapsed_speedscope_and_stats(profiled):
+    with run_scope("run-a"), profiling.profile_run(), profiling.profile_block("step:render") as block:
+        _busy(0.1)
+        _ = [bytearray(1_000_000) for _ in range(3)]
+
+    run_dir = profiled / "run-a"
+    collapsed = (run_dir / "01-step_render.collapsed").read_text(encoding="utf-8")
+    assert "_busy" in collapsed
+    speedscope = json.loads((run_dir / "01-step_render.speedscope.json").read_text(encoding="utf-8"))
+    assert speedscope["profiles"][0]["type"] == "sampled"
+    assert len(speedscope["profiles"][0]["samples"]) == len(speedscope["profiles"][0]["weights"])
+    stats = json.loads((run_dir / "01-step_render.stats.json").read_text(encoding="utf-8"))
+    assert stats["wall_seconds"] >= 0.1
+    assert stats["cpu_seconds"] > 0
+    assert stats["alloc_peak_bytes"] >= 3_000_000
+    assert block.samples
+    assert "Top 15 functions by self time" in (run_dir / "hotspots.txt").read_text(encoding="utf-8")
+
+
+def test_trace_task_profiles_sync_and_async_steps(profiled, tmp_path):
+    tracer = Tracer(trace_id="profiled")
+    tracer.trace_file = tmp_path / "profiled.json"
+
+    @trace_task(tracer)
+    def parse_step():
+        _busy(0.02)
+
+    @trace_task(tracer)
+    async def async_step():
+        await asyncio.to_thread(_busy, 0.02)
+
+    with run_scope("run-b"), profiling.profile_run():
+        parse_step()
+        asyncio.run(async_step())
+
+    names = sorted(p.name for p in (profiled / "run-b").glob("*.stats.json"))
+    assert names == ["01-step_parse_step.stats.json", "02-step_async_step.stats.json"]
+
+
+def test_nested_block_on_same_thread_is_not_double_counted(profiled):
+    with run_scope("run-c"), profiling.profile_run():
+        with profiling.profile_block("step:outer"), profiling.profile_block("crew:Inner"):
+            _busy(0.05)
+        # Blocks are recorded as they close: the inner one first.
+        blocks = list(profiling._runs["run-c"].blocks)
+
+    assert [b.nested for b in blocks] == [True, False]
+    summary = profiling.hotspots(blocks)
+    outer_samples = sum(blocks[1].samples.values())
+    assert f"({outer_samples} samples)" in summary
+
+
+def test_package_names():
+    assert profiling._package("completion (litellm/main.py:10)") == "litellm"
+    assert profiling._package("render (epic_news/utils/html/x.py:3)") == "epic_news.utils"
+    assert profiling._package("load (json_repair/json_repair.py:1)") == "json_repair"
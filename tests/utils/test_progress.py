@@ -0,0 +1,90 @@
+"""Tests for the in-process progress event bus."""
+
+import asyncio
+import json
+import threading
+
+import pytest
+
+from epic_news.utils.progress import (
+    ProgressBus,
+    current_run_id,
+    emit,
+    get_progress_bus,
+    run_scope,
+    sse_stream,
+)
+
+
+def test_emit_outside_run_is_noop():
+    bus = get_progress_bus()
+    before = bus.history("never-opened")
+
+    emit("step_started", step="x")
+
+    assert bus.history("never-opened") == before == []
+
+
+def test_run_scope_brackets_events_and_binds_run_id():
+    with run_scope("scope-run", user_request="hello") as run_id:
+        assert current_run_id() == run_id == "scope-run"
+        emit("step_started", step="classify")
+
+    assert current_run_id() is None
+    kinds = [e.kind for e in get_progress_bus().history("scope-run")]
+    assert kinds == ["run_started", "step_started", "run_finished"]
+    assert get_progress_bus().history("scope-run")[-1].data == {"status": "ok"}
+
+
+def test_run_scope_reports_error_status():
+    with pytest.raises(RuntimeError), run_scope("failing-run"):
+        raise RuntimeError("boom")
+
+    assert get_progress_bus().history("failing-run")[-1].data == {"status": "error"}
+
+
+def test_subscribe_replays_history_then_receives_live_events():
+    bus = ProgressBus()
+    bus.publish("r1", "run_started")
+    sub = bus.subscribe("r1")
+
+    def producer():
+        bus.publish("r1", "step_started", step="a")
+        bus.publish("r1", "run_finished", status="ok")
+
+    threading.Thread(target=producer).start()
+    kinds = [event.kind for event in sub]
+
+    assert kinds == ["run_started", "step_started", "run_finished"]
+    sub.close()
+
+
+def test_events_are_isolated_per_run():
+    bus = ProgressBus()
+    sub = bus.subscribe("a")
+    bus.publish("b", "step_started")
+
+    assert sub.get(timeout=0) is None
+
+
+def test_history_is_bounded():
+    bus = ProgressBus(history_limit=3)
+    for i in range(10):
+        bus.publish("r", "tick", i=i)
+
+    assert [e.data["i"] for e in bus.history("r")] == [7, 8, 9]
+
+
+def test_sse_stream_yields_frames_until_finished():
+    with run_scope("sse-run"):
+        emit("artefact_written", path="output/report.html", format="html")
+
+    async def collect():
+        return [frame async for frame in sse_stream("sse-run")]
+
+    frames = asyncio.run(collect())
+
+    assert len(frames) == 3
+    event_line, data_line = frames[1].splitlines()[1:3]
+    assert event_line == "event: artefact_written"
+    assert json.loads(data_line.removeprefix("data: "))["data"]["path"] == "output/report.html"
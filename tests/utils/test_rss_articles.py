@@ -0,0 +1,97 @@
+import json
+
+import pytest
+
+from epic_news.models.crews.rss_weekly_report import RssWeeklyReport
+from epic_news.utils.rss_articles import FORMAT, ArticleTable
+from tests.performance._reports import report_data
+
+
+def _fetched(feeds: int = 2, per_feed: int = 3) -> dict:
+    return {
+        "rss_feeds": [
+            {
+                "feed_url": f"https://feed{f}.example/rss",
+                "articles": [
+                    {
+                        "title": f"Title {f}.{i}",
+                        "link": f"https://feed{f}.example/{i}",
+                        "published": "2026-10-12",
+                        "summary": "short",
+                        "content": f"Body {f}.{i}",
+                    }
+                    for i in range(per_feed)
+                ],
+            }
+            for f in range(feeds)
+        ]
+    }
+
+
+def test_fetched_payload_becomes_columns_with_interned_strings():
+    table = ArticleTable.from_payload(_fetched())
+    assert len(table) == 6 and table.feed_urls == ["https://feed0.example/rss", "https://feed1.example/rss"]
+    assert list(table.feed) == [0, 0, 0, 1, 1, 1]
+    assert table.summary[0] == "Body 0.0"  # content preferred over summary
+    assert table.source[0] is table.source[1]
+    assert table.published[0] is table.published[5]
+
+
+def test_columnar_file_round_trips_and_is_smaller(tmp_path):
+    payload = _fetched(feeds=5, per_feed=40)
+    nested = tmp_path / "report.json"
+    nested.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
+
+    table = ArticleTable.load(nested)
+    columns = table.save(tmp_path / "final-report.json")
+    assert json.loads(columns.read_text(encoding="utf-8"))["format"] == FORMAT
+    assert columns.stat().st_size < nested.stat().st_size / 2
+
+    again = ArticleTable.load(columns)
+    assert list(again.rows()) == list(table.rows())
+    assert again.to_report().model_dump(exclude={"generation_date"}) == table.to_report().model_dump(
+        exclude={"generation_date"}
+    )
+
+
+def test_report_shaped_payload_builds_the_same_report():
+    data = report_data("RSS_WEEKLY", 50)
+    data["generation_date"] = "2026-10-12T08:00:00"
+    expected = RssWeeklyReport.model_validate(data)
+    assert ArticleTable.from_payload(data).to_report().model_dump() == expected.model_dump()
+
+
+def test_translated_flat_articles_take_links_dates_and_feeds_from_the_fetch():
+    fetched = ArticleTable.from_payload(_fetched(feeds=2, per_feed=1))
+    translated = ArticleTable.from_payload(
+        {
+            "articles": [
+                {"title": "Titre 0", "summary": "Résumé 0"},
+                {"title": "Titre 1", "summary": "Résumé 1"},
+            ]
+        }
+    )
+    translated.fill_from(fetched)
+
+    report = translated.to_report()
+    assert [feed.feed_url for feed in report.feeds] == fetched.feed_urls
+    article = report.feeds[1].articles[0]
+    assert (article.title, article.link, article.published) == (
+        "Titre 1",
+        "https://feed1.example/0",
+        "2026-10-12",
+    )
+    assert article.source_feed == "https://feed1.example/rss"
+
+
+@pytest.mark.parametrize(
+    "payload",
+    [
+        {"unexpected": []},
+        {"rss_feeds": [{"feed_url": "u", "articles": [{"link": "l"}]}]},
+        {"feeds": [{"feed_url": "u", "articles": [{"title": "t", "link": "l"}]}]},
+    ],
+)
+def test_invalid_payload_is_refused(payload):
+    with pytest.raises(ValueError):
+        ArticleTable.from_payload(payload)
@@ -0,0 +1,185 @@
+import json
+import time
+
+import pytest
+
+from epic_news.utils import search_cache as search_cache_mod
+from epic_news.utils.metrics_store import MetricsStore
+from epic_news.utils.search_cache import (
+    HashingEmbedder,
+    SearchCache,
+    cache_tool,
+    reset_search_cache,
+    split_request,
+)
+
+
+class _SearchTool:
+    """Counts provider calls; answers with the query it was given."""
+
+    name = "hybrid_search"
+
+    def __init__(self, answer=None):
+        self.answer = answer
+        self.calls: list[str] = []
+
+    def _run(self, query: str, max_results: int = 5):
+        self.calls.append(query)
+        return self.answer if self.answer is not None else f"results for {query} ({max_results})"
+
+
+@pytest.fixture
+def cache_env(tmp_path, monkeypatch):
+    monkeypatch.setenv("EPIC_SEARCH_CACHE", "true")
+    monkeypatch.setenv("EPIC_SEARCH_CACHE_DIR", str(tmp_path))
+    store = MetricsStore(tmp_path / "metrics.jsonl")
+    monkeypatch.setattr(search_cache_mod, "get_metrics_store", lambda: store)
+    reset_search_cache()
+    yield store
+    reset_search_cache()
+
+
+def _cache(tmp_path, **kwargs) -> SearchCache:
+    return SearchCache(tmp_path, embedder=HashingEmbedder(), **kwargs)
+
+
+def test_reworded_query_is_served_from_the_cache(tmp_path):
+    cache = _cache(tmp_path)
+    cache.store("search", "Temenos Group revenue 2026", "R")
+    hit = cache.lookup("search", "Temenos revenue 2026")
+    assert hit is not None and hit.result == "R" and hit.similarity >= cache.threshold
+    assert cache.hits == 1 and cache.tokens_avoided == 1
+
+
+@pytest.mark.parametrize(
+    ("tool", "query", "scope"),
+    [
+        ("search", "Temenos Group revenue 2025", ""),  # other year
+        ("search", "Avaloq Group revenue 2026", ""),  # other company
+        ("news", "Temenos Group revenue 2026", ""),  # other tool
+        ("search", "Temenos Group revenue 2026", '[[], {"max_results": 20}]'),  # other arguments
+    ],
+)
+def test_different_questions_miss(tmp_path, tool, query, scope):
+    cache = _cache(tmp_path)
+    cache.store("search", "Temenos Group revenue 2026", "R")
+    assert cache.lookup(tool, query, scope) is None
+    assert cache.misses == 1
+
+
+@pytest.mark.parametrize(
+    ("stored", "asked"),
+    [
+        (
+            "Temenos Group annual revenue financial results press release",
+            "Finastra annual revenue financial results press release",
+        ),
+        (
+            "temenos annual revenue financial results press release",
+            "finastra annual revenue financial results press release",
+        ),
+        (
+            "latest news about Nestle acquisitions and strategic partnerships",
+            "latest news about Novartis acquisitions and strategic partnerships",
+        ),
+        ("UBS chief executive officer biography", "Credit Suisse chief executive officer biography"),
+        ("UBS CEO", "Nestle CEO"),
+    ],
+)
+def test_long_queries_about_another_entity_miss(tmp_path, stored, asked):
+    cache = _cache(tmp_path)
+    cache.store("search", stored, "R")
+    assert cache.lookup("search", asked) is None
+
+
+@pytest.mark.parametrize(
+    "asked", ["Temenos annual revenue 2026", "Temenos 2026 revenue figures", "revenue of Temenos in 2026"]
+)
+def test_reworded_and_qualified_queries_hit(tmp_path, asked):
+    cache = _cache(tmp_path)
+    cache.store("search", "Temenos Group revenue 2026", "R")
+    assert cache.lookup("search", asked).result == "R"
+
+
+def test_the_threshold_decides_between_queries_about_the_same_entity(tmp_path):
+    cache = _cache(tmp_path)
+    cache.store("search", "Temenos Group revenue 2026", "R")
+    assert cache.lookup("search", "Temenos profit 2026") is None
+    assert cache.misses == 1
+
+
+def test_fillers_suffixes_order_and_plurals_still_hit(tmp_path):
+    cache = _cache(tmp_path)
+    cache.store("search", "latest news about Nestlé acquisitions", "R")
+    assert cache.lookup("search", "Nestle Group acquisition news").result == "R"
+
+
+def test_stale_entries_are_not_served_and_dropped_on_load(tmp_path):
+    cache = _cache(tmp_path, max_age_hours=1)
+    cache.store("search", "old question", "old")
+    cache.store("search", "new question", "new")
+    assert cache.flush()
+    two_hours_ago = time.time() - 7200
+    for group in cache._groups.values():
+        for entry in group.entries:
+            if entry["query"] == "old question":
+                entry["created"] = two_hours_ago
+    assert cache.lookup("search", "old question") is None
+
+    lines = [json.loads(line) for line in cache.path.read_text(encoding="utf-8").splitlines()]
+    lines[0]["created"] = two_hours_ago
+    cache.path.write_text("".join(json.dumps(line) + "\n" for line in lines), encoding="utf-8")
+    reloaded = _cache(tmp_path, max_age_hours=1)
+    assert len(reloaded) == 1
+    assert reloaded.lookup("search", "new question").result == "new"
+
+
+def test_entries_survive_the_process_and_are_capped(tmp_path):
+    cache = _cache(tmp_path)
+    for i in range(5):
+        cache.store("search", f"question number {i}", f"answer {i}")
+    assert cache.flush()
+
+    reloaded = _cache(tmp_path, max_entries=3)
+    assert len(reloaded) == 3
+    assert reloaded.lookup("search", "question number 4").result == "answer 4"
+    assert reloaded.lookup("search", "question number 0") is None
+
+
+def test_cached_tool_calls_the_provider_once_for_close_queries(cache_env):
+    tool = cache_tool(_SearchTool())
+    first = tool._run(query="Temenos Group revenue 2026")
+    assert tool._run(query="Temenos revenue 2026") == first
+    tool._run(query="Temenos revenue 2026", max_results=20)
+    tool._run("Temenos Group revenue 2025")
+    assert tool.calls == ["Temenos Group revenue 2026", "Temenos revenue 2026", "Temenos Group revenue 2025"]
+
+    assert cache_env.counter("search_cache_hits_total", tool="hybrid_search") == 1
+    assert cache_env.counter("search_cache_misses_total", tool="hybrid_search") == 3
+    assert (
+        cache_env.counter("search_cache_tokens_avoided_total", tool="hybrid_search") == (len(first) + 3) // 4
+    )
+
+
+@pytest.mark.parametrize(
+    "answer", ["Error: rate limited by provider", "", {"successful": False, "error": "x"}]
+)
+def test_failed_searches_are_not_cached(cache_env, answer):
+    tool = cache_tool(_SearchTool(answer=answer))
+    tool._run(query="Temenos revenue 2026")
+    tool._run(query="Temenos revenue 2026")
+    assert len(tool.calls) == 2
+
+
+def test_disabled_cache_leaves_the_tool_alone(monkeypatch):
+    monkeypatch.setenv("EPIC_SEARCH_CACHE", "false")
+    reset_search_cache()
+    tool = _SearchTool()
+    original = tool._run
+    assert cache_tool(tool)._run == original
+
+
+def test_split_request_keeps_other_arguments_in_the_scope():
+    assert split_request((), {"query": " q ", "max_results": 3}) == ("q", '[[], {"max_results": 3}]')
+    assert split_request(("q",), {}) == ("q", "[[], {}]")
+    assert split_request((), {"url": "https://x"})[0] is None
@@ -0,0 +1,175 @@
+"""Tests for the span tracer (nesting, async steps, background export)."""
+
+import asyncio
+import json
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from epic_news.utils import spans
+from epic_news.utils.observability import TraceEvent, Tracer, trace_task
+
+
+class _Collect:
+    def __init__(self):
+        self.started = []
+        self.ended = []
+
+    def on_start(self, span):
+        self.started.append(span)
+
+    def on_end(self, span):
+        self.ended.append(span)
+
+
+@pytest.fixture
+def collected():
+    exporter = _Collect()
+    tracer = spans.SpanTracer([exporter])
+    spans.set_span_tracer(tracer)
+    yield exporter
+    tracer.flush()
+    spans.set_span_tracer(None)
+
+
+def _by_name(exporter):
+    exporter_spans = exporter.ended
+    return {s.name: s for s in exporter_spans}
+
+
+def test_spans_nest_through_threads_and_tasks(collected):
+    async def crew(name):
+        with spans.span(f"crew:{name}", "crew"):
+            await asyncio.sleep(0)
+
+    def step():
+        with spans.span("step:sync", "flow_step"):
+            pass
+
+    async def flow():
+        with spans.span("flow", "flow"):
+            await asyncio.to_thread(step)
+            await asyncio.gather(crew("a"), crew("b"))
+
+    asyncio.run(flow())
+    spans.get_span_tracer().flush()
+
+    named = _by_name(collected)
+    root = named["flow"]
+    assert root.parent_id is None
+    for child in ("step:sync", "crew:a", "crew:b"):
+        assert named[child].parent_id == root.span_id
+        assert named[child].trace_id == root.trace_id
+    assert spans.current_span() is None
+
+
+def test_error_marks_span(collected):
+    with pytest.raises(ValueError), spans.span("boom"):
+        raise ValueError("kaboom")
+    spans.get_span_tracer().flush()
+
+    (span,) = collected.ended
+    assert span.status == "error"
+    assert span.error == "kaboom"
+
+
+def test_attributes_are_cheap():
+    span = spans.Span("s", "internal", "t", "s1", None, 0.0)
+    span.set(text="x" * 1000, obj=object(), keys=["a", "b"], n=3)
+
+    assert len(span.attributes["text"]) == spans.MAX_ATTRIBUTE_CHARS + 1
+    assert span.attributes["obj"] == "<object>"
+    assert span.attributes["keys"] == ["a", "b"]
+    assert span.attributes["n"] == 3
+
+
+def test_trace_task_times_the_awaited_coroutine(collected, tmp_path):
+    tracer = Tracer(trace_id="async_step")
+    tracer.trace_file = tmp_path / "async_step.json"
+
+    @trace_task(tracer)
+    async def generate_osint():
+        with spans.span("crew:CompanyProfilerCrew", "crew"):
+            await asyncio.sleep(0.05)
+        return "done"
+
+    assert asyncio.run(generate_osint()) == "done"
+    spans.get_span_tracer().flush()
+
+    named = _by_name(collected)
+    step = named["step:generate_osint"]
+    assert step.duration >= 0.05
+    assert named["crew:CompanyProfilerCrew"].parent_id == step.span_id
+    end = tracer.get_events(event_type="task_end")[0]
+    assert end.details["duration"] >= 0.05
+    assert end.details["result_type"] == "str"
+
+
+def test_trace_task_does_not_stringify_arguments(collected, tmp_path):
+    class HugeState:
+        def __str__(self):
+            raise AssertionError("flow state must not be stringified")
+
+        __repr__ = __str__
+
+    tracer = Tracer(trace_id="no_str")
+    tracer.trace_file = tmp_path / "no_str.json"
+
+    @trace_task(tracer)
+    def step(state):
+        return 1
+
+    assert step(HugeState()) == 1
+
+
+def test_writer_appends_jsonl(tmp_path):
+    writer = spans.BackgroundWriter()
+    path = tmp_path / "nested" / "spans.jsonl"
+    tracer = spans.SpanTracer([spans.JsonlSpanExporter(path, writer=writer)], writer=writer)
+
+    with tracer.span("outer"), tracer.span("inner", "crew", crew="PoemCrew"):
+        pass
+    assert tracer.flush()
+
+    rows = [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+    assert [r["name"] for r in rows] == ["inner", "outer"]
+    assert rows[0]["parent_id"] == rows[1]["span_id"]
+    assert rows[0]["attributes"] == {"crew": "PoemCrew"}
+
+
+def test_tracer_events_are_written_in_the_background(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    tracer = Tracer(trace_id="buffered")
+    tracer.trace_file = str(tmp_path / "buffered.json")
+
+    started = time.perf_counter()
+    for i in range(200):
+        tracer.add_event(TraceEvent("task_start", "task:x", {"i": i}))
+    enqueue_seconds = time.perf_counter() - started
+    spans.get_background_writer().flush()
+
+    assert len((tmp_path / "buffered.json").read_text(encoding="utf-8").splitlines()) == 200
+    assert enqueue_seconds < 1.0
+
+
+def test_crewai_events_nest_llm_and_tool_calls_under_their_task(collected):
+    recorder = spans._CrewAISpans()
+    task_event = SimpleNamespace(task_id="t1")
+    llm_event = SimpleNamespace(task_id="t1")
+
+    with spans.span("crew:PoemCrew", "crew") as crew_span:
+        recorder.start("task:t1", "task:write", "task", task_event)
+        recorder.start("llm:c1", "llm:openrouter/x", "llm", llm_event, model="openrouter/x")
+        recorder.end("llm:c1", total_tokens=42)
+        recorder.start("tool:a:search", "tool:search", "tool", llm_event)
+        recorder.end("tool:a:search", error="timeout")
+        recorder.end("task:t1")
+    spans.get_span_tracer().flush()
+
+    named = _by_name(collected)
+    task = named["task:write"]
+    assert task.parent_id == crew_span.span_id
+    assert named["llm:openrouter/x"].parent_id == task.span_id
+    assert named["llm:openrouter/x"].attributes["total_tokens"] == 42
+    assert named["tool:search"].status == "error"